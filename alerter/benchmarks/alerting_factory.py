@@ -0,0 +1,77 @@
+"""
+Measures the time the AlertingFactory takes to classify a round of metrics for
+thousands of nodes, with the alert rules compiled once per configuration and
+with the rules re-compiled at every evaluation, as they used to be parsed.
+
+Run from the alerter directory with:
+    python -m benchmarks.alerting_factory [number_of_nodes] [rounds]
+"""
+import logging
+import sys
+import timeit
+from datetime import datetime
+
+from src.alerter.alerts.node.chainlink import (
+    MaxUnconfirmedBlocksIncreasedAboveThresholdAlert,
+    MaxUnconfirmedBlocksDecreasedBelowThresholdAlert)
+from src.alerter.factory.chainlink_node_alerting_factory import \
+    ChainlinkNodeAlertingFactory
+from src.alerter.grouped_alerts_metric_code.node.chainlink_node_metric_code \
+    import GroupedChainlinkNodeAlertsMetricCode as AlertsMetricCode
+from src.configs.alerts.node.chainlink import ChainlinkNodeAlertsConfig
+
+PARENT_ID = 'benchmark_parent_id'
+METRIC_NAME = AlertsMetricCode.MaxUnconfirmedBlocksThreshold.value
+
+
+def _metric_config(name: str) -> dict:
+    return {
+        'name': name, 'parent_id': PARENT_ID, 'enabled': 'true',
+        'warning_threshold': '3', 'warning_time_window': '3',
+        'warning_enabled': 'true', 'critical_threshold': '5',
+        'critical_time_window': '7', 'critical_repeat': '5',
+        'critical_enabled': 'true', 'critical_repeat_enabled': 'true',
+    }
+
+
+def _create_factory(no_of_nodes: int) -> ChainlinkNodeAlertingFactory:
+    config = ChainlinkNodeAlertsConfig(
+        PARENT_ID, *[_metric_config(str(index)) for index in range(10)])
+    factory = ChainlinkNodeAlertingFactory(logging.getLogger('benchmark'))
+    for index in range(no_of_nodes):
+        factory.create_alerting_state(PARENT_ID, 'node_{}'.format(index),
+                                      config)
+    return factory
+
+
+def _classify_round(factory: ChainlinkNodeAlertingFactory, config: dict,
+                    no_of_nodes: int, recompile: bool) -> None:
+    timestamp = datetime.now().timestamp()
+    data_for_alerting = []
+    for index in range(no_of_nodes):
+        if recompile:
+            factory.remove_compiled_rules(PARENT_ID)
+        factory.classify_thresholded_alert(
+            1, config, MaxUnconfirmedBlocksIncreasedAboveThresholdAlert,
+            MaxUnconfirmedBlocksDecreasedBelowThresholdAlert,
+            data_for_alerting, PARENT_ID, 'node_{}'.format(index),
+            METRIC_NAME, 'node_{}'.format(index), timestamp)
+
+
+def main() -> None:
+    no_of_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    config = _metric_config('max_unconfirmed_blocks')
+
+    for recompile in (True, False):
+        factory = _create_factory(no_of_nodes)
+        seconds = min(timeit.repeat(
+            lambda: _classify_round(factory, config, no_of_nodes, recompile),
+            repeat=rounds, number=1))
+        print("{:<24} {} nodes: {:.2f} ms per round".format(
+            'parsed per evaluation' if recompile else 'compiled once',
+            no_of_nodes, seconds * 1000))
+
+
+if __name__ == '__main__':
+    main()
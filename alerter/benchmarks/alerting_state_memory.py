@@ -0,0 +1,71 @@
+"""
+Measures the memory taken by the alerting state of the node alerting
+factories, which keep trackers and limiters for every metric of every node.
+
+Run from the alerter directory with:
+    python -m benchmarks.alerting_state_memory [number_of_nodes]
+"""
+import logging
+import sys
+import tracemalloc
+
+from src.alerter.factory.chainlink_node_alerting_factory import \
+    ChainlinkNodeAlertingFactory
+from src.alerter.factory.cosmos_node_alerting_factory import \
+    CosmosNodeAlertingFactory
+from src.configs.alerts.node.chainlink import ChainlinkNodeAlertsConfig
+from src.configs.alerts.node.cosmos import CosmosNodeAlertsConfig
+
+PARENT_ID = 'benchmark_parent_id'
+
+
+def _metric_config(name: str) -> dict:
+    return {
+        'name': name, 'parent_id': PARENT_ID, 'enabled': 'true',
+        'warning_threshold': '3', 'warning_time_window': '3',
+        'warning_enabled': 'true', 'critical_threshold': '5',
+        'critical_time_window': '7', 'critical_repeat': '5',
+        'critical_enabled': 'true', 'critical_repeat_enabled': 'true',
+    }
+
+
+def _chainlink_state(factory: ChainlinkNodeAlertingFactory,
+                     no_of_nodes: int) -> None:
+    config = ChainlinkNodeAlertsConfig(
+        PARENT_ID, *[_metric_config(str(index)) for index in range(10)])
+    for index in range(no_of_nodes):
+        factory.create_alerting_state(PARENT_ID, 'node_{}'.format(index),
+                                      config)
+
+
+def _cosmos_state(factory: CosmosNodeAlertingFactory,
+                  no_of_nodes: int) -> None:
+    config = CosmosNodeAlertsConfig(
+        PARENT_ID, *[_metric_config(str(index)) for index in range(19)])
+    for index in range(no_of_nodes):
+        factory.create_alerting_state(PARENT_ID, 'node_{}'.format(index),
+                                      config, index % 2 == 0)
+
+
+def _measure(factory_type, create_state, no_of_nodes: int) -> int:
+    tracemalloc.start()
+    factory = factory_type(logging.getLogger('benchmark'))
+    create_state(factory, no_of_nodes)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main() -> None:
+    no_of_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    for name, factory_type, create_state in [
+        ('chainlink', ChainlinkNodeAlertingFactory, _chainlink_state),
+        ('cosmos', CosmosNodeAlertingFactory, _cosmos_state),
+    ]:
+        size = _measure(factory_type, create_state, no_of_nodes)
+        print("{:<10} {} nodes: {:.1f} MiB, {:.0f} bytes per node".format(
+            name, no_of_nodes, size / 2 ** 20, size / no_of_nodes))
+
+
+if __name__ == '__main__':
+    main()
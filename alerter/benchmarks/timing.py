@@ -0,0 +1,55 @@
+"""
+Microbenchmarks of the timing primitives, which are used on every metric
+evaluation of every alerter. Each operation is timed with a datetime and
+with an epoch timestamp as input.
+
+Run from the alerter directory with:
+    python -m benchmarks.timing [number]
+"""
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+from src.utils.timing import (TimedTaskLimiter, TimedTaskTracker,
+                              TimedOccurrenceTracker,
+                              OccurrencesInTimePeriodTracker)
+
+INTERVAL = timedelta(seconds=60)
+
+
+def _benchmarks(time):
+    limiter = TimedTaskLimiter(INTERVAL)
+    tracker = TimedTaskTracker(INTERVAL)
+    tracker.start_timer(time)
+    occurrence_tracker = TimedOccurrenceTracker(5, INTERVAL)
+    period_tracker = OccurrencesInTimePeriodTracker(INTERVAL)
+
+    return [
+        ('TimedTaskLimiter.can_do_task', lambda: limiter.can_do_task(time)),
+        ('TimedTaskLimiter.set_last_time_that_did_task',
+         lambda: limiter.set_last_time_that_did_task(time)),
+        ('TimedTaskTracker.start_timer', lambda: tracker.start_timer(time)),
+        ('TimedTaskTracker.can_do_task', lambda: tracker.can_do_task(time)),
+        ('TimedOccurrenceTracker.action_happened',
+         lambda: occurrence_tracker.action_happened(time)),
+        ('TimedOccurrenceTracker.too_many_occurrences',
+         lambda: occurrence_tracker.too_many_occurrences(time)),
+        ('OccurrencesInTimePeriodTracker.add_occurrence',
+         lambda: period_tracker.add_occurrence(time)),
+        ('OccurrencesInTimePeriodTracker.no_of_occurrences',
+         period_tracker.no_of_occurrences),
+    ]
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    now = datetime.now()
+    for input_name, time in [('datetime', now), ('timestamp', now.timestamp())]:
+        for name, function in _benchmarks(time):
+            seconds = min(timeit.repeat(function, repeat=5, number=number))
+            print("{:<50} {:<10} {:.3f} us".format(
+                name, input_name, seconds / number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
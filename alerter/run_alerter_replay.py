@@ -0,0 +1,101 @@
+"""
+Replays recorded transformed data through an alerter outside the live
+pipeline, and prints the alerts raised and the evaluation latency per message.
+
+Run from the alerter directory with:
+    python run_alerter_replay.py <alerter> <recording> [alerts_output]
+
+where <alerter> is one of the keys of ALERTER_CREATORS, <recording> is a file
+in the format read by load_records, and the raised alerts are written to
+[alerts_output] as one JSON object per line if given.
+"""
+import json
+import logging
+import sys
+from typing import Callable, Dict
+
+from src.alerter.alerters.alerter import Alerter
+from src.alerter.alerters.contract.chainlink import ChainlinkContractAlerter
+from src.alerter.alerters.dockerhub import DockerhubAlerter
+from src.alerter.alerters.github import GithubAlerter
+from src.alerter.alerters.network.cosmos import CosmosNetworkAlerter
+from src.alerter.alerters.network.substrate import SubstrateNetworkAlerter
+from src.alerter.alerters.node.chainlink import ChainlinkNodeAlerter
+from src.alerter.alerters.node.cosmos import CosmosNodeAlerter
+from src.alerter.alerters.node.evm import EVMNodeAlerter
+from src.alerter.alerters.node.substrate import SubstrateNodeAlerter
+from src.alerter.alerters.system import SystemAlerter
+from src.alerter.replay.replay_engine import AlerterReplayEngine, load_records
+from src.alerter.replay.replay_rabbitmq_api import ReplayRabbitMQApi
+from src.configs.factory.alerts.chainlink_alerts import (
+    ChainlinkNodeAlertsConfigsFactory, ChainlinkContractAlertsConfigsFactory)
+from src.configs.factory.alerts.cosmos_alerts import (
+    CosmosNodeAlertsConfigsFactory, CosmosNetworkAlertsConfigsFactory)
+from src.configs.factory.alerts.evm_alerts import EVMNodeAlertsConfigsFactory
+from src.configs.factory.alerts.substrate_alerts import (
+    SubstrateNodeAlertsConfigsFactory, SubstrateNetworkAlertsConfigsFactory)
+from src.configs.factory.alerts.system_alerts import SystemAlertsConfigsFactory
+from src.utils.constants.names import (
+    SYSTEM_ALERTER_NAME, GITHUB_ALERTER_NAME, DOCKERHUB_ALERTER_NAME,
+    CHAINLINK_NODE_ALERTER_NAME, CHAINLINK_CONTRACT_ALERTER_NAME,
+    EVM_NODE_ALERTER_NAME, COSMOS_NODE_ALERTER_NAME,
+    COSMOS_NETWORK_ALERTER_NAME, SUBSTRATE_NODE_ALERTER_NAME,
+    SUBSTRATE_NETWORK_ALERTER_NAME)
+
+AlerterCreator = Callable[[logging.Logger, ReplayRabbitMQApi], Alerter]
+
+ALERTER_CREATORS: Dict[str, AlerterCreator] = {
+    'system': lambda logger, rabbitmq: SystemAlerter(
+        SYSTEM_ALERTER_NAME, logger, SystemAlertsConfigsFactory(), rabbitmq),
+    'github': lambda logger, rabbitmq: GithubAlerter(
+        GITHUB_ALERTER_NAME, logger, rabbitmq),
+    'dockerhub': lambda logger, rabbitmq: DockerhubAlerter(
+        DOCKERHUB_ALERTER_NAME, logger, rabbitmq),
+    'chainlink_node': lambda logger, rabbitmq: ChainlinkNodeAlerter(
+        CHAINLINK_NODE_ALERTER_NAME, logger, rabbitmq,
+        ChainlinkNodeAlertsConfigsFactory()),
+    'chainlink_contract': lambda logger, rabbitmq: ChainlinkContractAlerter(
+        CHAINLINK_CONTRACT_ALERTER_NAME, logger, rabbitmq,
+        ChainlinkContractAlertsConfigsFactory()),
+    'evm_node': lambda logger, rabbitmq: EVMNodeAlerter(
+        EVM_NODE_ALERTER_NAME, logger, EVMNodeAlertsConfigsFactory(),
+        rabbitmq),
+    'cosmos_node': lambda logger, rabbitmq: CosmosNodeAlerter(
+        COSMOS_NODE_ALERTER_NAME, logger, rabbitmq,
+        CosmosNodeAlertsConfigsFactory()),
+    'cosmos_network': lambda logger, rabbitmq: CosmosNetworkAlerter(
+        COSMOS_NETWORK_ALERTER_NAME, logger, rabbitmq,
+        CosmosNetworkAlertsConfigsFactory()),
+    'substrate_node': lambda logger, rabbitmq: SubstrateNodeAlerter(
+        SUBSTRATE_NODE_ALERTER_NAME, logger, rabbitmq,
+        SubstrateNodeAlertsConfigsFactory()),
+    'substrate_network': lambda logger, rabbitmq: SubstrateNetworkAlerter(
+        SUBSTRATE_NETWORK_ALERTER_NAME, logger, rabbitmq,
+        SubstrateNetworkAlertsConfigsFactory()),
+}
+
+
+def main() -> None:
+    if len(sys.argv) < 3 or sys.argv[1] not in ALERTER_CREATORS:
+        print(__doc__)
+        print("Alerters: {}".format(', '.join(ALERTER_CREATORS)))
+        sys.exit(1)
+
+    # Processing errors are logged by the alerter, so only warnings and errors
+    # are printed to keep the output readable.
+    logging.basicConfig(level=logging.WARNING)
+    logger = logging.getLogger('AlerterReplay')
+    rabbitmq = ReplayRabbitMQApi(logger.getChild(ReplayRabbitMQApi.__name__))
+    alerter = ALERTER_CREATORS[sys.argv[1]](logger, rabbitmq)
+
+    report = AlerterReplayEngine(alerter).replay(load_records(sys.argv[2]))
+    print(report.summary())
+
+    if len(sys.argv) > 3:
+        with open(sys.argv[3], 'w') as alerts_output:
+            for alert in report.alerts:
+                alerts_output.write(json.dumps(alert) + '\n')
+
+
+if __name__ == '__main__':
+    main()
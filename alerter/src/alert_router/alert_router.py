@@ -2,11 +2,11 @@ import json
 import sys
 from configparser import (ConfigParser, NoOptionError, NoSectionError,
                           SectionProxy)
-from datetime import datetime
+from datetime import datetime, timedelta
 from json import JSONDecodeError
 from logging import Logger
 from types import FrameType
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -43,7 +43,10 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
         self._name = name
         self._redis = RedisApi(logger.getChild(RedisApi.__name__),
                                host=redis_ip, db=redis_db, port=redis_port,
-                               namespace=unique_alerter_identifier)
+                               namespace=unique_alerter_identifier,
+                               read_cache_size=env.REDIS_READ_CACHE_SIZE,
+                               read_cache_ttl=timedelta(
+                                   seconds=env.REDIS_READ_CACHE_TTL_SECONDS))
         self._enable_console_alerts = enable_console_alerts
         self._enable_log_alerts = enable_log_alerts
 
@@ -180,57 +183,52 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
                        method: pika.spec.Basic.Deliver,
                        properties: pika.spec.BasicProperties,
                        body: bytes) -> None:
-        recv_alert: Dict = {}
+        """
+        Routes a received alert, or an envelope {'alerts': [...]} with all the
+        alerts an alerter raised while processing an input. The alerts of an
+        envelope are acknowledged once and routed as a batch, and the mute
+        status of a severity and a chain is read only once per envelope.
+        """
+        recv_alerts: List[Dict] = []
         has_error: bool = False
-        send_to_ids: List[str] = []
+        routed_alerts: List[Tuple[Dict, List[str]]] = []
         try:
             # Placed in try-except in case of malformed JSON
-            recv_alert = json.loads(body)
-
-            if recv_alert and 'severity' in recv_alert:
-                self._logger.debug("Received an alert to route")
-                self._logger.debug("recv_alert = %s", recv_alert)
-                # Where to route this alert to
-
-                self._logger.debug("Checking if alert is muted")
-                is_all_muted = self.is_all_muted(recv_alert.get('severity'))
-                is_chain_severity_muted = self.is_chain_severity_muted(
-                    recv_alert.get('parent_id'), recv_alert.get('severity'))
-
-                if is_all_muted or is_chain_severity_muted:
-                    self._logger.info("This alert has been muted")
-                    self._logger.info(
-                        "is_all_muted=%s, is_chain_severity_muted=%s",
-                        is_all_muted, is_chain_severity_muted)
-                else:
-                    self._logger.info("Obtaining list of channels to alert")
-                    self._logger.info([
-                        channel.get('id') for channel_type in
-                        self._config.values() for channel in
-                        channel_type.values()
-                    ])
-                    send_to_ids = [
-                        channel.get('id') for channel_type in
-                        self._config.values()
-                        for channel in channel_type.values()
-                        if channel.get(recv_alert.get('severity').lower()) and
-                           recv_alert.get('parent_id') in channel.get(
-                            'parent_ids')
-                    ]
-
-                    self._logger.debug("send_to_ids = %s", send_to_ids)
+            recv_data = json.loads(body)
+            if recv_data and 'alerts' in recv_data:
+                recv_alerts = recv_data['alerts']
+                self._logger.debug("Received a batch of %s alerts to route",
+                                   len(recv_alerts))
+            else:
+                recv_alerts = [recv_data]
         except JSONDecodeError as json_e:
             self._logger.error("Alert was not a valid JSON object")
             self._logger.exception(json_e)
             has_error = True
         except Exception as e:
-            self._logger.error("Error when processing alert: %s", recv_alert)
+            self._logger.error("Error when processing alert: %s", body)
             self._logger.exception(e)
             has_error = True
 
+        if not has_error:
+            mute_statuses: Dict[Tuple[str, str], bool] = {}
+            for recv_alert in recv_alerts:
+                try:
+                    send_to_ids = []
+                    if recv_alert and 'severity' in recv_alert:
+                        send_to_ids = self._route_alert(recv_alert,
+                                                        mute_statuses)
+                    routed_alerts.append((recv_alert, send_to_ids))
+                except Exception as e:
+                    # Only this alert is dropped, the rest of the batch is
+                    # still routed.
+                    self._logger.error("Error when processing alert: %s",
+                                       recv_alert)
+                    self._logger.exception(e)
+
         self._rabbitmq.basic_ack(method.delivery_tag, False)
 
-        if not has_error:
+        for recv_alert, send_to_ids in routed_alerts:
             # This will be empty if the alert was muted
             for channel_id in send_to_ids:
                 send_alert: Dict = {**recv_alert,
@@ -277,6 +275,56 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
             # publisher queue.
             self._logger.exception(e)
 
+    def _route_alert(self, recv_alert: Dict,
+                     mute_statuses: Dict[Tuple[str, str], bool]) -> List[str]:
+        """
+        Returns the ids of the channels an alert must be sent to, which is
+        empty if the alert is muted.
+        :param recv_alert: The alert to route
+        :param mute_statuses: The mute statuses already read for the batch the
+        alert belongs to, indexed by (parent_id, severity). A parent_id of None
+        stands for the mute status of all chains.
+        :return: The ids of the channels to send the alert to
+        """
+        self._logger.debug("Received an alert to route")
+        self._logger.debug("recv_alert = %s", recv_alert)
+        # Where to route this alert to
+
+        self._logger.debug("Checking if alert is muted")
+        severity = recv_alert.get('severity')
+        parent_id = recv_alert.get('parent_id')
+        if (None, severity) not in mute_statuses:
+            mute_statuses[(None, severity)] = self.is_all_muted(severity)
+        if (parent_id, severity) not in mute_statuses:
+            mute_statuses[(parent_id, severity)] = \
+                self.is_chain_severity_muted(parent_id, severity)
+        is_all_muted = mute_statuses[(None, severity)]
+        is_chain_severity_muted = mute_statuses[(parent_id, severity)]
+
+        if is_all_muted or is_chain_severity_muted:
+            self._logger.info("This alert has been muted")
+            self._logger.info(
+                "is_all_muted=%s, is_chain_severity_muted=%s",
+                is_all_muted, is_chain_severity_muted)
+            return []
+
+        self._logger.info("Obtaining list of channels to alert")
+        self._logger.info([
+            channel.get('id') for channel_type in
+            self._config.values() for channel in
+            channel_type.values()
+        ])
+        send_to_ids = [
+            channel.get('id') for channel_type in
+            self._config.values()
+            for channel in channel_type.values()
+            if channel.get(severity.lower()) and
+               parent_id in channel.get('parent_ids')
+        ]
+
+        self._logger.debug("send_to_ids = %s", send_to_ids)
+        return send_to_ids
+
     def _send_heartbeat(self, data_to_send: dict) -> None:
         self._rabbitmq.basic_publish_confirm(
             exchange=HEALTH_CHECK_EXCHANGE,
@@ -1,5 +1,6 @@
 from src.alerter.alert_code.alert_code import AlertCode
 from src.alerter.alert_code.dockerhub_alert_code import DockerhubAlertCode
+from src.alerter.alert_code.flapping_alert_code import FlappingAlertCode
 from src.alerter.alert_code.github_alert_code import GithubAlertCode
 from src.alerter.alert_code.internal_alert_code import InternalAlertCode
 from src.alerter.alert_code.system_alert_code import SystemAlertCode
@@ -15,7 +15,9 @@ class AlertCode(str, Enum):
         for class_ in [cls] + cls.__subclasses__():
             try:
                 return class_(value)
-            except ValueError:
+            except (ValueError, TypeError):
+                # Calling an enum without members, such as this base class,
+                # raises a TypeError on newer Python versions
                 continue
 
         raise ValueError(
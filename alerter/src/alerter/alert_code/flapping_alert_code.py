@@ -0,0 +1,6 @@
+from .alert_code import AlertCode
+
+
+class FlappingAlertCode(AlertCode):
+    MetricFlappingAlert = 'flapping_alert_1'
+    MetricStoppedFlappingAlert = 'flapping_alert_2'
@@ -1,5 +1,6 @@
 import logging
 import time
+from datetime import timedelta
 
 import pika.exceptions
 
@@ -14,6 +15,7 @@ from src.alerter.alerters.node.cosmos import CosmosNodeAlerter
 from src.alerter.alerters.node.evm import EVMNodeAlerter
 from src.alerter.alerters.node.substrate import SubstrateNodeAlerter
 from src.alerter.alerters.system import SystemAlerter
+from src.alerter.factory.alerting_factory import AlertingFactory
 from src.configs.factory.alerts.chainlink_alerts import (
     ChainlinkNodeAlertsConfigsFactory, ChainlinkContractAlertsConfigsFactory)
 from src.configs.factory.alerts.cosmos_alerts import (
@@ -33,8 +35,10 @@ from src.utils.constants.starters import (
     RE_INITIALISE_SLEEPING_PERIOD, RESTART_SLEEPING_PERIOD)
 from src.utils.env import (
     ALERTERS_LOG_FILE_TEMPLATE, LOGGING_LEVEL, RABBIT_IP,
-    ALERTER_PUBLISHING_QUEUE_SIZE)
+    ALERTER_PUBLISHING_QUEUE_SIZE, ALERTS_FLAP_THRESHOLD,
+    ALERTS_FLAP_WINDOW_SECONDS, ALERTER_WORKERS_PER_TYPE)
 from src.utils.logging import create_logger, log_and_print
+from src.utils.routing_key import get_alerter_worker_name
 from src.utils.starters import (
     get_initialisation_error_message, get_stopped_message)
 
@@ -61,11 +65,18 @@ def _initialise_alerter_logger(alerter_display_name: str,
     return alerter_logger
 
 
+def _initialise_flap_detection(alerting_factory: AlertingFactory) -> None:
+    alerting_factory.set_flap_detection(
+        ALERTS_FLAP_THRESHOLD, timedelta(seconds=ALERTS_FLAP_WINDOW_SECONDS))
+
+
 def _initialise_system_alerter(
-        system_alerts_configs_factory: SystemAlertsConfigsFactory
+        system_alerts_configs_factory: SystemAlertsConfigsFactory,
+        worker_index: int = 0
 ) -> SystemAlerter:
     # Alerter display name based on system
-    alerter_display_name = SYSTEM_ALERTER_NAME
+    alerter_display_name = get_alerter_worker_name(
+        SYSTEM_ALERTER_NAME, worker_index, ALERTER_WORKERS_PER_TYPE)
 
     system_alerter_logger = _initialise_alerter_logger(alerter_display_name,
                                                        SystemAlerter.__name__)
@@ -81,6 +92,8 @@ def _initialise_system_alerter(
                 system_alerts_configs_factory, rabbitmq,
                 ALERTER_PUBLISHING_QUEUE_SIZE
             )
+            _initialise_flap_detection(system_alerter.alerting_factory)
+            system_alerter.set_worker(worker_index, ALERTER_WORKERS_PER_TYPE)
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), system_alerter_logger)
             break
@@ -150,9 +163,11 @@ def _initialise_dockerhub_alerter() -> DockerhubAlerter:
 
 
 def _initialise_chainlink_node_alerter(
-        chainlink_alerts_configs_factory: ChainlinkNodeAlertsConfigsFactory
+        chainlink_alerts_configs_factory: ChainlinkNodeAlertsConfigsFactory,
+        worker_index: int = 0
 ) -> ChainlinkNodeAlerter:
-    alerter_display_name = CHAINLINK_NODE_ALERTER_NAME
+    alerter_display_name = get_alerter_worker_name(
+        CHAINLINK_NODE_ALERTER_NAME, worker_index, ALERTER_WORKERS_PER_TYPE)
 
     chainlink_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, ChainlinkNodeAlerter.__name__)
@@ -168,6 +183,9 @@ def _initialise_chainlink_node_alerter(
                 rabbitmq, chainlink_alerts_configs_factory,
                 ALERTER_PUBLISHING_QUEUE_SIZE
             )
+            _initialise_flap_detection(chainlink_alerter.alerting_factory)
+            chainlink_alerter.set_worker(worker_index,
+                                         ALERTER_WORKERS_PER_TYPE)
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), chainlink_alerter_logger)
             break
@@ -181,9 +199,12 @@ def _initialise_chainlink_node_alerter(
 
 
 def _initialise_chainlink_contract_alerter(
-        chainlink_alerts_configs_factory: ChainlinkContractAlertsConfigsFactory
+        chainlink_alerts_configs_factory: ChainlinkContractAlertsConfigsFactory,
+        worker_index: int = 0
 ) -> ChainlinkContractAlerter:
-    alerter_display_name = CHAINLINK_CONTRACT_ALERTER_NAME
+    alerter_display_name = get_alerter_worker_name(
+        CHAINLINK_CONTRACT_ALERTER_NAME, worker_index,
+        ALERTER_WORKERS_PER_TYPE)
 
     chainlink_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, ChainlinkContractAlerter.__name__)
@@ -198,6 +219,9 @@ def _initialise_chainlink_contract_alerter(
                 alerter_display_name, chainlink_alerter_logger, rabbitmq,
                 chainlink_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE
             )
+            _initialise_flap_detection(chainlink_alerter.alerting_factory)
+            chainlink_alerter.set_worker(worker_index,
+                                         ALERTER_WORKERS_PER_TYPE)
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), chainlink_alerter_logger)
             break
@@ -211,9 +235,11 @@ def _initialise_chainlink_contract_alerter(
 
 
 def _initialise_evm_node_alerter(
-        evm_alerts_configs_factory: EVMNodeAlertsConfigsFactory
+        evm_alerts_configs_factory: EVMNodeAlertsConfigsFactory,
+        worker_index: int = 0
 ) -> EVMNodeAlerter:
-    alerter_display_name = EVM_NODE_ALERTER_NAME
+    alerter_display_name = get_alerter_worker_name(
+        EVM_NODE_ALERTER_NAME, worker_index, ALERTER_WORKERS_PER_TYPE)
 
     evm_node_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, EVMNodeAlerter.__name__)
@@ -229,6 +255,8 @@ def _initialise_evm_node_alerter(
                 evm_alerts_configs_factory, rabbitmq,
                 ALERTER_PUBLISHING_QUEUE_SIZE
             )
+            _initialise_flap_detection(evm_node_alerter.alerting_factory)
+            evm_node_alerter.set_worker(worker_index, ALERTER_WORKERS_PER_TYPE)
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), evm_node_alerter_logger)
             break
@@ -242,9 +270,11 @@ def _initialise_evm_node_alerter(
 
 
 def _initialise_cosmos_node_alerter(
-        cosmos_alerts_configs_factory: CosmosNodeAlertsConfigsFactory
+        cosmos_alerts_configs_factory: CosmosNodeAlertsConfigsFactory,
+        worker_index: int = 0
 ) -> CosmosNodeAlerter:
-    alerter_display_name = COSMOS_NODE_ALERTER_NAME
+    alerter_display_name = get_alerter_worker_name(
+        COSMOS_NODE_ALERTER_NAME, worker_index, ALERTER_WORKERS_PER_TYPE)
 
     cosmos_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, CosmosNodeAlerter.__name__)
@@ -259,6 +289,8 @@ def _initialise_cosmos_node_alerter(
                 alerter_display_name, cosmos_alerter_logger, rabbitmq,
                 cosmos_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE
             )
+            _initialise_flap_detection(cosmos_alerter.alerting_factory)
+            cosmos_alerter.set_worker(worker_index, ALERTER_WORKERS_PER_TYPE)
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), cosmos_alerter_logger)
             break
@@ -272,9 +304,11 @@ def _initialise_cosmos_node_alerter(
 
 
 def _initialise_cosmos_network_alerter(
-        cosmos_alerts_configs_factory: CosmosNetworkAlertsConfigsFactory
+        cosmos_alerts_configs_factory: CosmosNetworkAlertsConfigsFactory,
+        worker_index: int = 0
 ) -> CosmosNetworkAlerter:
-    alerter_display_name = COSMOS_NETWORK_ALERTER_NAME
+    alerter_display_name = get_alerter_worker_name(
+        COSMOS_NETWORK_ALERTER_NAME, worker_index, ALERTER_WORKERS_PER_TYPE)
 
     cosmos_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, CosmosNetworkAlerter.__name__)
@@ -289,6 +323,8 @@ def _initialise_cosmos_network_alerter(
                 alerter_display_name, cosmos_alerter_logger, rabbitmq,
                 cosmos_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE
             )
+            _initialise_flap_detection(cosmos_alerter.alerting_factory)
+            cosmos_alerter.set_worker(worker_index, ALERTER_WORKERS_PER_TYPE)
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), cosmos_alerter_logger)
             break
@@ -302,9 +338,11 @@ def _initialise_cosmos_network_alerter(
 
 
 def _initialise_substrate_node_alerter(
-        substrate_alerts_configs_factory: SubstrateNodeAlertsConfigsFactory
+        substrate_alerts_configs_factory: SubstrateNodeAlertsConfigsFactory,
+        worker_index: int = 0
 ) -> SubstrateNodeAlerter:
-    alerter_display_name = SUBSTRATE_NODE_ALERTER_NAME
+    alerter_display_name = get_alerter_worker_name(
+        SUBSTRATE_NODE_ALERTER_NAME, worker_index, ALERTER_WORKERS_PER_TYPE)
 
     substrate_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, SubstrateNodeAlerter.__name__)
@@ -319,6 +357,9 @@ def _initialise_substrate_node_alerter(
                 alerter_display_name, substrate_alerter_logger, rabbitmq,
                 substrate_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE
             )
+            _initialise_flap_detection(substrate_alerter.alerting_factory)
+            substrate_alerter.set_worker(worker_index,
+                                         ALERTER_WORKERS_PER_TYPE)
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), substrate_alerter_logger)
             break
@@ -332,9 +373,11 @@ def _initialise_substrate_node_alerter(
 
 
 def _initialise_substrate_network_alerter(
-        substrate_alerts_configs_factory: SubstrateNetworkAlertsConfigsFactory
+        substrate_alerts_configs_factory: SubstrateNetworkAlertsConfigsFactory,
+        worker_index: int = 0
 ) -> SubstrateNetworkAlerter:
-    alerter_display_name = SUBSTRATE_NETWORK_ALERTER_NAME
+    alerter_display_name = get_alerter_worker_name(
+        SUBSTRATE_NETWORK_ALERTER_NAME, worker_index, ALERTER_WORKERS_PER_TYPE)
 
     substrate_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, SubstrateNetworkAlerter.__name__)
@@ -349,6 +392,9 @@ def _initialise_substrate_network_alerter(
                 alerter_display_name, substrate_alerter_logger, rabbitmq,
                 substrate_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE
             )
+            _initialise_flap_detection(substrate_alerter.alerting_factory)
+            substrate_alerter.set_worker(worker_index,
+                                         ALERTER_WORKERS_PER_TYPE)
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), substrate_alerter_logger)
             break
@@ -362,8 +408,11 @@ def _initialise_substrate_network_alerter(
 
 
 def start_system_alerter(
-        system_alerts_configs_factory: SystemAlertsConfigsFactory) -> None:
-    system_alerter = _initialise_system_alerter(system_alerts_configs_factory)
+        system_alerts_configs_factory: SystemAlertsConfigsFactory,
+        worker_index: int = 0
+) -> None:
+    system_alerter = _initialise_system_alerter(
+        system_alerts_configs_factory, worker_index)
     start_alerter(system_alerter)
 
 
@@ -378,55 +427,65 @@ def start_dockerhub_alerter() -> None:
 
 
 def start_chainlink_node_alerter(
-        chainlink_alerts_configs_factory: ChainlinkNodeAlertsConfigsFactory
+        chainlink_alerts_configs_factory: ChainlinkNodeAlertsConfigsFactory,
+        worker_index: int = 0
 ) -> None:
     chainlink_alerter = _initialise_chainlink_node_alerter(
-        chainlink_alerts_configs_factory)
+        chainlink_alerts_configs_factory, worker_index)
     start_alerter(chainlink_alerter)
 
 
 def start_chainlink_contract_alerter(
-        chainlink_alerts_configs_factory: ChainlinkContractAlertsConfigsFactory
+        chainlink_alerts_configs_factory: ChainlinkContractAlertsConfigsFactory,
+        worker_index: int = 0
 ) -> None:
     chainlink_contract_alerter = _initialise_chainlink_contract_alerter(
-        chainlink_alerts_configs_factory)
+        chainlink_alerts_configs_factory, worker_index)
     start_alerter(chainlink_contract_alerter)
 
 
 def start_evm_node_alerter(
-        evm_alerts_configs_factory: EVMNodeAlertsConfigsFactory) -> None:
-    evm_alerter = _initialise_evm_node_alerter(evm_alerts_configs_factory)
+        evm_alerts_configs_factory: EVMNodeAlertsConfigsFactory,
+        worker_index: int = 0
+) -> None:
+    evm_alerter = _initialise_evm_node_alerter(
+        evm_alerts_configs_factory, worker_index)
     start_alerter(evm_alerter)
 
 
 def start_cosmos_node_alerter(
-        cosmos_alerts_configs_factory: CosmosNodeAlertsConfigsFactory) -> None:
+        cosmos_alerts_configs_factory: CosmosNodeAlertsConfigsFactory,
+        worker_index: int = 0
+) -> None:
     cosmos_alerter = _initialise_cosmos_node_alerter(
-        cosmos_alerts_configs_factory)
+        cosmos_alerts_configs_factory, worker_index)
     start_alerter(cosmos_alerter)
 
 
 def start_cosmos_network_alerter(
-        cosmos_alerts_configs_factory: CosmosNetworkAlertsConfigsFactory
+        cosmos_alerts_configs_factory: CosmosNetworkAlertsConfigsFactory,
+        worker_index: int = 0
 ) -> None:
     cosmos_alerter = _initialise_cosmos_network_alerter(
-        cosmos_alerts_configs_factory)
+        cosmos_alerts_configs_factory, worker_index)
     start_alerter(cosmos_alerter)
 
 
 def start_substrate_node_alerter(
-        substrate_alerts_configs_factory: SubstrateNodeAlertsConfigsFactory
+        substrate_alerts_configs_factory: SubstrateNodeAlertsConfigsFactory,
+        worker_index: int = 0
 ) -> None:
     substrate_alerter = _initialise_substrate_node_alerter(
-        substrate_alerts_configs_factory)
+        substrate_alerts_configs_factory, worker_index)
     start_alerter(substrate_alerter)
 
 
 def start_substrate_network_alerter(
-        substrate_alerts_configs_factory: SubstrateNetworkAlertsConfigsFactory
+        substrate_alerts_configs_factory: SubstrateNetworkAlertsConfigsFactory,
+        worker_index: int = 0
 ) -> None:
     substrate_alerter = _initialise_substrate_network_alerter(
-        substrate_alerts_configs_factory)
+        substrate_alerts_configs_factory, worker_index)
     start_alerter(substrate_alerter)
 
 
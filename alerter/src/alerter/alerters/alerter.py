@@ -1,8 +1,9 @@
+import copy
 import logging
 import sys
 from abc import abstractmethod
 from types import FrameType
-from typing import Any
+from typing import Any, List, Dict
 
 import pika.exceptions
 
@@ -10,9 +11,13 @@ from src.abstract.publisher_subscriber import (
     QueuingPublisherSubscriberComponent)
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
-                                          HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
+                                          HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
+                                          ALERT_EXCHANGE)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
+from src.utils.routing_key import (get_alerter_worker_queue_name,
+                                   get_alerter_worker_routing_key,
+                                   get_alerter_worker_index)
 
 
 class Alerter(QueuingPublisherSubscriberComponent):
@@ -23,6 +28,12 @@ class Alerter(QueuingPublisherSubscriberComponent):
 
         self._alerter_name = alerter_name
 
+        # The chains of an alerter type may be split between multiple workers.
+        # A worker only consumes the transformed data of the chains assigned to
+        # it, which is published with a routing key identifying the worker.
+        self._worker_index = 0
+        self._no_of_workers = 1
+
     def __str__(self) -> str:
         return self.alerter_name
 
@@ -30,6 +41,77 @@ class Alerter(QueuingPublisherSubscriberComponent):
     def alerter_name(self) -> str:
         return self._alerter_name
 
+    @property
+    def worker_index(self) -> int:
+        return self._worker_index
+
+    @property
+    def no_of_workers(self) -> int:
+        return self._no_of_workers
+
+    def set_worker(self, worker_index: int, no_of_workers: int) -> None:
+        """
+        Sets which of the workers of the alerter type this alerter is. This
+        must be set before the alerter is started, as it determines the queue
+        and routing key the alerter consumes from.
+        :param worker_index: The index of this worker
+        :param no_of_workers: The number of workers of the alerter type
+        :return: None
+        """
+        if not 0 <= worker_index < no_of_workers:
+            raise ValueError(
+                "Invalid worker index {} for {} workers".format(
+                    worker_index, no_of_workers))
+
+        self._worker_index = worker_index
+        self._no_of_workers = no_of_workers
+
+    def _get_worker_queue_name(self, queue_name: str) -> str:
+        return get_alerter_worker_queue_name(queue_name, self.worker_index,
+                                             self.no_of_workers)
+
+    def _get_worker_routing_key(self, routing_key: str) -> str:
+        return get_alerter_worker_routing_key(routing_key, self.worker_index,
+                                              self.no_of_workers)
+
+    def _delete_single_worker_queue(self, queue_name: str) -> None:
+        """
+        If the alerter type is split into multiple workers, the input queue
+        used when the type had a single worker is no longer consumed from.
+        Since it is durable and still bound to the configs exchange, it is
+        deleted so that it does not keep collecting configs.
+        :param queue_name: The input queue name of the alerter type
+        :return: None
+        """
+        if self.no_of_workers > 1:
+            self.logger.info("Deleting unused queue '%s'", queue_name)
+            self.rabbitmq.queue_delete(queue_name)
+
+    def _configs_of_other_worker(self, sent_configs: Dict) -> bool:
+        """
+        Config routing keys identify a chain by its name, therefore every
+        worker of an alerter type receives the configs of all chains. This
+        function checks whether the received configs belong to a chain which
+        is assigned to another worker, so that they are not processed. Empty
+        configs, which remove a chain, are always processed.
+        :param sent_configs: The received configs without the DEFAULT section
+        :return: True if the configs belong to a chain of another worker
+               : False otherwise
+        """
+        if self.no_of_workers <= 1:
+            return False
+
+        parent_ids = {
+            configuration.get('parent_id')
+            for configuration in sent_configs.values()
+            if isinstance(configuration, dict)
+        }
+        if len(parent_ids) != 1 or None in parent_ids:
+            return False
+
+        return get_alerter_worker_index(
+            parent_ids.pop(), self.no_of_workers) != self.worker_index
+
     @staticmethod
     def _greater_than_condition_function(current: Any, previous: Any) -> bool:
         return current > previous
@@ -65,6 +147,33 @@ class Alerter(QueuingPublisherSubscriberComponent):
     def _process_data(self, *args) -> None:
         pass
 
+    def _place_alerts_on_queue(self, data_list: List,
+                               routing_key: str) -> None:
+        """
+        Places all the alerts raised while processing an input on the
+        publishing queue as a single envelope {'alerts': [...]}, so that they
+        are published, acknowledged and routed together by the alert router.
+        If the queue is full, old data is removed.
+        :param data_list: The alerts raised while processing an input
+        :param routing_key: The routing key to publish the envelope with
+        :return: None
+        """
+        if not data_list:
+            return
+
+        envelope = {'alerts': copy.deepcopy(data_list)}
+        self.logger.debug("Adding %s to the publishing queue.", envelope)
+        if self.publishing_queue.full():
+            self.publishing_queue.get()
+        self.publishing_queue.put({
+            'exchange': ALERT_EXCHANGE,
+            'routing_key': routing_key,
+            'data': envelope,
+            'properties': pika.BasicProperties(delivery_mode=2),
+            'mandatory': True})
+        self.logger.debug("%s added to the publishing queue successfully.",
+                          envelope)
+
     def _send_heartbeat(self, data_to_send: dict) -> None:
         self.rabbitmq.basic_publish_confirm(
             exchange=HEALTH_CHECK_EXCHANGE,
@@ -1,4 +1,3 @@
-import copy
 import json
 import logging
 from datetime import datetime
@@ -59,37 +58,44 @@ class ChainlinkContractAlerter(Alerter):
         # An alerter is both a consumer and producer, therefore we need to
         # initialise both the consuming and producing configurations.
         self.rabbitmq.connect_till_successful()
+        self._delete_single_worker_queue(
+            CL_CONTRACT_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
+
+        # Only the data of the chains assigned to this worker is consumed
+        input_queue_name = self._get_worker_queue_name(
+            CL_CONTRACT_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
+        transformed_data_routing_key = self._get_worker_routing_key(
+            CL_CONTRACT_TRANSFORMED_DATA_ROUTING_KEY)
 
         # Set alerts consuming configuration
         self.logger.info("Creating '%s' exchange", ALERT_EXCHANGE)
         self.rabbitmq.exchange_declare(
             exchange=ALERT_EXCHANGE, exchange_type=TOPIC, passive=False,
             durable=True, auto_delete=False, internal=False)
-        self.logger.info("Creating queue '%s'",
-                         CL_CONTRACT_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
+        self.logger.info("Creating queue '%s'", input_queue_name)
         self.rabbitmq.queue_declare(
-            CL_CONTRACT_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+            input_queue_name,
             passive=False, durable=True,
             exclusive=False, auto_delete=False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing "
                          "key '%s'",
-                         CL_CONTRACT_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+                         input_queue_name,
                          ALERT_EXCHANGE,
-                         CL_CONTRACT_TRANSFORMED_DATA_ROUTING_KEY)
+                         transformed_data_routing_key)
         self.rabbitmq.queue_bind(
-            queue=CL_CONTRACT_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+            queue=input_queue_name,
             exchange=ALERT_EXCHANGE,
-            routing_key=CL_CONTRACT_TRANSFORMED_DATA_ROUTING_KEY)
+            routing_key=transformed_data_routing_key)
 
         # Set configs consuming configuration
         self.logger.info("Creating exchange '%s'", CONFIG_EXCHANGE)
         self.rabbitmq.exchange_declare(CONFIG_EXCHANGE, TOPIC, False, True,
                                        False, False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing key "
-                         "%s'", CL_CONTRACT_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+                         "%s'", input_queue_name,
                          CONFIG_EXCHANGE, CL_ALERTS_CONFIGS_ROUTING_KEY)
         self.rabbitmq.queue_bind(
-            CL_CONTRACT_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+            input_queue_name,
             CONFIG_EXCHANGE, CL_ALERTS_CONFIGS_ROUTING_KEY)
 
         # Pre-fetch count is 5 times less the maximum queue size
@@ -97,7 +103,7 @@ class ChainlinkContractAlerter(Alerter):
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
         self.rabbitmq.basic_consume(
-            queue=CL_CONTRACT_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+            queue=input_queue_name,
             on_message_callback=self._process_data, auto_ack=False,
             exclusive=False, consumer_tag=None)
 
@@ -121,7 +127,8 @@ class ChainlinkContractAlerter(Alerter):
         :param body: The message
         :return:
         """
-        if method.routing_key == CL_CONTRACT_TRANSFORMED_DATA_ROUTING_KEY:
+        if method.routing_key == self._get_worker_routing_key(
+                CL_CONTRACT_TRANSFORMED_DATA_ROUTING_KEY):
             self._process_transformed_data(method, body)
         elif 'alerts_config' in method.routing_key:
             self._process_configs(method, body)
@@ -388,6 +395,12 @@ class ChainlinkContractAlerter(Alerter):
         if 'DEFAULT' in sent_configs:
             del sent_configs['DEFAULT']
 
+        if self._configs_of_other_worker(sent_configs):
+            self.logger.debug("Ignoring configs of a chain assigned to "
+                              "another worker")
+            self.rabbitmq.basic_ack(method.delivery_tag, False)
+            return
+
         parsed_routing_key = method.routing_key.split('.')
         chain = parsed_routing_key[1] + ' ' + parsed_routing_key[2]
 
@@ -425,17 +438,6 @@ class ChainlinkContractAlerter(Alerter):
         self.rabbitmq.basic_ack(method.delivery_tag, False)
 
     def _place_latest_data_on_queue(self, data_list: List) -> None:
-        # Place the latest alert data on the publishing queue. If the queue is
-        # full, remove old data.
-        for alert in data_list:
-            self.logger.debug("Adding %s to the publishing queue.", alert)
-            if self.publishing_queue.full():
-                self.publishing_queue.get()
-            self.publishing_queue.put({
-                'exchange': ALERT_EXCHANGE,
-                'routing_key': CL_CONTRACT_ALERT_ROUTING_KEY,
-                'data': copy.deepcopy(alert),
-                'properties': pika.BasicProperties(delivery_mode=2),
-                'mandatory': True})
-            self.logger.debug("%s added to the publishing queue successfully.",
-                              alert)
+        # Place the alerts raised for the processed input on the publishing
+        # queue as a single envelope.
+        self._place_alerts_on_queue(data_list, CL_CONTRACT_ALERT_ROUTING_KEY)
@@ -1,4 +1,3 @@
-import copy
 import json
 import logging
 from datetime import datetime
@@ -285,17 +284,6 @@ class DockerhubAlerter(Alerter):
             raise e
 
     def _place_latest_data_on_queue(self, data_list: List) -> None:
-        # Place the latest alert data on the publishing queue. If the
-        # queue is full, remove old data.
-        for alert in data_list:
-            self.logger.debug("Adding %s to the publishing queue.", alert)
-            if self.publishing_queue.full():
-                self.publishing_queue.get()
-            self.publishing_queue.put({
-                'exchange': ALERT_EXCHANGE,
-                'routing_key': DOCKERHUB_ALERT_ROUTING_KEY,
-                'data': copy.deepcopy(alert),
-                'properties': pika.BasicProperties(delivery_mode=2),
-                'mandatory': True})
-            self.logger.debug("%s added to the publishing queue successfully.",
-                              alert)
+        # Place the alerts raised for the processed input on the publishing
+        # queue as a single envelope.
+        self._place_alerts_on_queue(data_list, DOCKERHUB_ALERT_ROUTING_KEY)
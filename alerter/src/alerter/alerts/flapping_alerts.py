@@ -0,0 +1,47 @@
+from datetime import timedelta
+from typing import List, Union
+
+from src.alerter.alert_code import FlappingAlertCode
+from src.alerter.alerts.alert import Alert
+from src.alerter.grouped_alerts_metric_code import GroupedAlertsMetricCode
+from src.utils.datetime import strfdelta
+
+"""
+Flapping alerts replace the alerts of a metric whose alert state keeps changing
+within a short period, such as a metric oscillating around a threshold. They
+are raised under the metric of the alerts they replace, so that the metric's
+state is still shown correctly in the UI.
+"""
+
+
+class MetricFlappingAlert(Alert):
+    def __init__(self, origin_name: str, no_of_changes: int,
+                 time_window: timedelta, severity: str, timestamp: float,
+                 parent_id: str, origin_id: str,
+                 metric_code: GroupedAlertsMetricCode,
+                 metric_state_args: List[Union[str, int]]) -> None:
+        time_window_pretty = strfdelta(time_window,
+                                       "{hours}h, {minutes}m, {seconds}s")
+        super().__init__(
+            FlappingAlertCode.MetricFlappingAlert,
+            "{}: {} is flapping, its alert state changed {} times within {}. "
+            "Its alerts are suppressed until it does not change state for "
+            "{}.".format(origin_name, metric_code.value, no_of_changes,
+                         time_window_pretty, time_window_pretty),
+            severity, timestamp, parent_id, origin_id, metric_code,
+            metric_state_args)
+
+
+class MetricStoppedFlappingAlert(Alert):
+    def __init__(self, origin_name: str, no_of_suppressed_alerts: int,
+                 last_message: str, severity: str, timestamp: float,
+                 parent_id: str, origin_id: str,
+                 metric_code: GroupedAlertsMetricCode,
+                 metric_state_args: List[Union[str, int]]) -> None:
+        super().__init__(
+            FlappingAlertCode.MetricStoppedFlappingAlert,
+            "{}: {} stopped flapping, {} alerts were suppressed. Latest "
+            "alert: {}".format(origin_name, metric_code.value,
+                               no_of_suppressed_alerts, last_message),
+            severity, timestamp, parent_id, origin_id, metric_code,
+            metric_state_args)
@@ -1,12 +1,15 @@
 import logging
 from abc import abstractmethod, ABC
-from datetime import datetime, timezone
-from typing import Dict, List, Any, Type, Callable, Optional
+from datetime import timezone, timedelta
+from typing import Dict, List, Any, Type, Callable, Optional, Tuple
 
 from src.alerter.alert_severities import Severity
-from src.utils.types import (NoChangeInAlert, ChangeInAlert, str_to_bool,
+from src.alerter.factory.alerting_rule import CompiledAlertRule
+from src.alerter.factory.chain_height_index import ChainHeightIndex
+from src.alerter.factory.flap_detector import FlapDetector
+from src.utils.types import (NoChangeInAlert, ChangeInAlert,
                              IncreasedAboveThresholdAlert,
-                             DecreasedBelowThresholdAlert, convert_to_float,
+                             DecreasedBelowThresholdAlert,
                              ErrorAlert, ErrorSolvedAlert,
                              ConditionalAlert, DownAlert,
                              StillDownAlert, BackUpAlert)
@@ -56,6 +59,18 @@ class AlertingFactory(ABC):
         self._alerting_state = {}
         self._component_logger = component_logger
 
+        # Alert configurations compiled into rules, indexed by
+        # (parent_id, monitorable_id, metric_name)
+        self._compiled_rules: Dict[Tuple[str, str, str],
+                                   CompiledAlertRule] = {}
+
+        # The block heights of the nodes of every chain, indexed by parent_id
+        self._chain_heights: Dict[str, ChainHeightIndex] = {}
+
+        # Flap detection of the thresholded alerts, disabled by default
+        self._flap_threshold = 0
+        self._flap_time_window = timedelta(0)
+
     @property
     def alerting_state(self) -> Dict:
         return self._alerting_state
@@ -68,6 +83,148 @@ class AlertingFactory(ABC):
     def create_alerting_state(self, *args) -> None:
         pass
 
+    def set_flap_detection(self, threshold: int,
+                           time_window: timedelta) -> None:
+        """
+        Enables flap detection for the thresholded alerts. A metric whose alert
+        state changes `threshold` times within `time_window` raises a single
+        flapping alert, and its alerts are suppressed until its state does not
+        change for `time_window`. A threshold of 0 disables flap detection.
+        Rules which are already compiled are re-compiled so that the new
+        settings apply to them.
+        :param threshold: The number of state changes after which a metric is
+                        : flapping
+        :param time_window: The time window within which the changes happen
+        :return: None
+        """
+        self._flap_threshold = threshold
+        self._flap_time_window = time_window
+        self._compiled_rules.clear()
+
+    def compiled_rule(self, config: Dict, parent_id: str, monitorable_id: str,
+                      metric_name: str) -> CompiledAlertRule:
+        """
+        Returns the rule compiled from the configuration of a metric. A config
+        is compiled only the first time it is used for a metric, so that the
+        thresholds are not parsed and the trackers are not looked up at every
+        evaluation. A rule is re-compiled whenever a new configuration is
+        received or the alerting state of the monitorable is re-created.
+        :param config: The metric's configuration
+        :param parent_id: The id of the base chain
+        :param monitorable_id: The id of the monitorable
+        :param metric_name: The name of the metric
+        :return: The compiled rule
+        """
+        key = (parent_id, monitorable_id, metric_name)
+        monitorable_state = self.alerting_state[parent_id][monitorable_id]
+        compiled = self._compiled_rules.get(key)
+        if (compiled is None or compiled.config is not config
+                or compiled.monitorable_state is not monitorable_state):
+            flap_detector = FlapDetector(
+                self._flap_threshold, self._flap_time_window) \
+                if self._flap_threshold > 0 else None
+            compiled = CompiledAlertRule.compile(config, monitorable_state,
+                                                 metric_name, flap_detector)
+            self._compiled_rules[key] = compiled
+
+        return compiled
+
+    def remove_compiled_rules(self, parent_id: str) -> None:
+        """
+        Removes the compiled rules of a chain, so that the configurations and
+        alerting state of a removed chain are not kept alive.
+        :param parent_id: The id of the chain
+        :return: None
+        """
+        for key in [key for key in self._compiled_rules
+                    if key[0] == parent_id]:
+            del self._compiled_rules[key]
+
+    def update_current_height(self, parent_id: str, monitorable_id: str,
+                              current_height: Optional[int]) -> None:
+        """
+        Stores the current block height of a node in its alerting state and in
+        the chain's height index.
+        :param parent_id: The id of the base chain
+        :param monitorable_id: The id of the node
+        :param current_height: The node's current height
+        :return: None
+        """
+        self.alerting_state[parent_id][monitorable_id][
+            'current_height'] = current_height
+        if parent_id not in self._chain_heights:
+            self._chain_heights[parent_id] = ChainHeightIndex()
+        self._chain_heights[parent_id].update(monitorable_id, current_height)
+
+    def get_chain_max_height(self, parent_id: str) -> Optional[int]:
+        """
+        :param parent_id: The id of the base chain
+        :return: The maximum block height of the nodes of the chain, or None
+               : if no height was stored for the chain
+        """
+        if parent_id not in self._chain_heights:
+            return None
+        return self._chain_heights[parent_id].max_height
+
+    def remove_chain_heights(self, parent_id: str) -> None:
+        """
+        Removes the block heights stored for the nodes of a chain.
+        :param parent_id: The id of the chain
+        :return: None
+        """
+        self._chain_heights.pop(parent_id, None)
+
+    @staticmethod
+    def _raised_alerts_list(compiled: CompiledAlertRule,
+                            data_for_alerting: List) -> List:
+        """
+        :return: The list the alerts of a thresholded rule are raised into.
+               : This is data_for_alerting unless flap detection is enabled, in
+               : which case the alerts are first given to the flap detector.
+        """
+        return data_for_alerting if compiled.flap_detector is None else []
+
+    @staticmethod
+    def _filter_flapping(compiled: CompiledAlertRule, raised_alerts: List,
+                         data_for_alerting: List, monitorable_name: str,
+                         monitoring_timestamp: float) -> None:
+        if compiled.flap_detector is not None:
+            compiled.flap_detector.filter(raised_alerts, data_for_alerting,
+                                          monitorable_name,
+                                          monitoring_timestamp)
+
+    @staticmethod
+    def _in_steady_state(compiled: CompiledAlertRule, metric_name: str,
+                         current: Any, reverse: bool = False) -> bool:
+        """
+        :param compiled: The compiled rule of the metric
+        :param metric_name: The name of the metric
+        :param current: Current metric value
+        :param reverse: True if the thresholds are breached by a decrease
+        :return: True if no alert was raised for the metric and the current
+               : value breaches none of the enabled thresholds, in which case
+               : evaluating the rule cannot change the metric's state. False
+               : otherwise, or if the value or an enabled threshold is None.
+        """
+        if (compiled.warning_sent[metric_name]
+                or compiled.critical_sent[metric_name] or current is None):
+            return False
+
+        rule = compiled.rule
+        for enabled, threshold in [
+                (rule.warning_enabled, rule.warning_threshold),
+                (rule.critical_enabled, rule.critical_threshold)]:
+            if not enabled:
+                continue
+            if threshold is None:
+                return False
+            if reverse and current <= threshold:
+                return False
+            if not reverse and current >= threshold:
+                return False
+
+        return True
+
     def classify_no_change_in_alert(
             self, current: Any, previous: Any, config: Dict,
             no_change_alert: Type[NoChangeInAlert],
@@ -94,24 +251,21 @@ class AlertingFactory(ABC):
         :param monitoring_timestamp: The data timestamp
         :return: None
         """
-        # Parse warning thresholds and limiters
-        warning_enabled = str_to_bool(config['warning_enabled'])
-        warning_window_timer = self.alerting_state[parent_id][monitorable_id][
-            'warning_window_timer'][metric_name]
-        warning_sent = self.alerting_state[parent_id][monitorable_id][
-            'warning_sent']
+        compiled = self.compiled_rule(config, parent_id, monitorable_id,
+                                      metric_name)
+        rule = compiled.rule
 
-        # Parse critical thresholds and limiters
-        critical_enabled = str_to_bool(config['critical_enabled'])
-        critical_repeat_enabled = str_to_bool(config['critical_repeat_enabled'])
-        critical_repeat_limiter = self.alerting_state[parent_id][
-            monitorable_id]['critical_repeat_timer'][metric_name]
-        critical_window_timer = self.alerting_state[parent_id][monitorable_id][
-            'critical_window_timer'][metric_name]
-        critical_sent = self.alerting_state[parent_id][monitorable_id][
-            'critical_sent']
+        # Warning thresholds and limiters
+        warning_enabled = rule.warning_enabled
+        warning_window_timer = compiled.warning_window_timer
+        warning_sent = compiled.warning_sent
 
-        monitoring_datetime = datetime.fromtimestamp(monitoring_timestamp)
+        # Critical thresholds and limiters
+        critical_enabled = rule.critical_enabled
+        critical_repeat_enabled = rule.critical_repeat_enabled
+        critical_repeat_limiter = compiled.critical_repeat_timer
+        critical_window_timer = compiled.critical_window_timer
+        critical_sent = compiled.critical_sent
 
         if current == previous:
             # We do not want to raise a warning alert if we are immediately in
@@ -119,8 +273,8 @@ class AlertingFactory(ABC):
             # alert can be raised, and if it can we don't raise a warning alert.
             if critical_enabled:
                 if not critical_window_timer.timer_started:
-                    critical_window_timer.start_timer(monitoring_datetime)
-                elif critical_window_timer.can_do_task(monitoring_datetime):
+                    critical_window_timer.start_timer(monitoring_timestamp)
+                elif critical_window_timer.can_do_task(monitoring_timestamp):
                     duration = (monitoring_timestamp -
                                 critical_window_timer.start_time.replace(
                                     tzinfo=timezone.utc).timestamp())
@@ -131,15 +285,14 @@ class AlertingFactory(ABC):
                     data_for_alerting.append(alert.alert_data)
                     self.component_logger.debug(
                         "Successfully classified alert %s", alert.alert_data)
-                    self.alerting_state[parent_id][monitorable_id][
-                        'critical_sent'][metric_name] = True
+                    critical_sent[metric_name] = True
                     critical_window_timer.do_task()
                     critical_repeat_limiter.set_last_time_that_did_task(
-                        monitoring_datetime)
+                        monitoring_timestamp)
                 elif (critical_sent[metric_name]
                       and critical_repeat_enabled
                       and critical_repeat_limiter.can_do_task(
-                            monitoring_datetime)):
+                            monitoring_timestamp)):
                     duration = (monitoring_timestamp -
                                 critical_window_timer.start_time.replace(
                                     tzinfo=timezone.utc).timestamp())
@@ -151,14 +304,14 @@ class AlertingFactory(ABC):
                     self.component_logger.debug(
                         "Successfully classified alert %s", alert.alert_data)
                     critical_repeat_limiter.set_last_time_that_did_task(
-                        monitoring_datetime)
+                        monitoring_timestamp)
 
             if warning_enabled:
                 if not warning_window_timer.timer_started:
-                    warning_window_timer.start_timer(monitoring_datetime)
+                    warning_window_timer.start_timer(monitoring_timestamp)
                 elif (not critical_sent[metric_name]
                       and warning_window_timer.can_do_task(
-                            monitoring_datetime)):
+                            monitoring_timestamp)):
                     duration = (monitoring_timestamp -
                                 warning_window_timer.start_time.replace(
                                     tzinfo=timezone.utc).timestamp())
@@ -170,8 +323,7 @@ class AlertingFactory(ABC):
                     self.component_logger.debug(
                         "Successfully classified alert %s", alert.alert_data)
                     warning_window_timer.do_task()
-                    self.alerting_state[parent_id][monitorable_id][
-                        'warning_sent'][metric_name] = True
+                    warning_sent[metric_name] = True
         else:
             warning_window_timer.reset()
             critical_window_timer.reset()
@@ -183,10 +335,8 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug(
                     "Successfully classified alert %s", alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'warning_sent'][metric_name] = False
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = False
+                warning_sent[metric_name] = False
+                critical_sent[metric_name] = False
 
     def classify_thresholded_time_window_alert(
             self, current: Any, config: Dict,
@@ -219,27 +369,23 @@ class AlertingFactory(ABC):
         :param monitoring_timestamp: The data timestamp
         :return: None
         """
-        # Parse warning thresholds and limiters
-        warning_enabled = str_to_bool(config['warning_enabled'])
-        warning_threshold = convert_to_float(config['warning_threshold'], None)
-        warning_window_timer = self.alerting_state[parent_id][monitorable_id][
-            'warning_window_timer'][metric_name]
-        warning_sent = self.alerting_state[parent_id][monitorable_id][
-            'warning_sent']
+        compiled = self.compiled_rule(config, parent_id, monitorable_id,
+                                      metric_name)
+        rule = compiled.rule
 
-        # Parse critical thresholds and limiters
-        critical_enabled = str_to_bool(config['critical_enabled'])
-        critical_threshold = convert_to_float(config['critical_threshold'],
-                                              None)
-        critical_repeat_enabled = str_to_bool(config['critical_repeat_enabled'])
-        critical_repeat_limiter = self.alerting_state[parent_id][
-            monitorable_id]['critical_repeat_timer'][metric_name]
-        critical_window_timer = self.alerting_state[parent_id][monitorable_id][
-            'critical_window_timer'][metric_name]
-        critical_sent = self.alerting_state[parent_id][monitorable_id][
-            'critical_sent']
+        # Warning thresholds and limiters
+        warning_enabled = rule.warning_enabled
+        warning_threshold = rule.warning_threshold
+        warning_window_timer = compiled.warning_window_timer
+        warning_sent = compiled.warning_sent
 
-        monitoring_datetime = datetime.fromtimestamp(monitoring_timestamp)
+        # Critical thresholds and limiters
+        critical_enabled = rule.critical_enabled
+        critical_threshold = rule.critical_threshold
+        critical_repeat_enabled = rule.critical_repeat_enabled
+        critical_repeat_limiter = compiled.critical_repeat_timer
+        critical_window_timer = compiled.critical_window_timer
+        critical_sent = compiled.critical_sent
 
         # First check for a decrease below critical threshold and then check for
         # a decrease below warning threshold as
@@ -256,16 +402,14 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug(
                     "Successfully classified alert %s", alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = False
+                critical_sent[metric_name] = False
 
                 # If this is the case we still need to raise a warning alert to
                 # show the correct metric state in the UI.
                 if warning_sent[metric_name] and current >= warning_threshold:
                     warning_window_timer.start_timer(
                         warning_window_timer.start_time)
-                    self.alerting_state[parent_id][monitorable_id][
-                        'warning_sent'][metric_name] = False
+                    warning_sent[metric_name] = False
 
         if current < warning_threshold:
             warning_window_timer.reset()
@@ -277,15 +421,14 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug(
                     "Successfully classified alert %s", alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id]['warning_sent'][
-                    metric_name] = False
+                warning_sent[metric_name] = False
 
         # Now check if any of the thresholds are surpassed. We will not generate
         # a warning alert if we are immediately in critical state.
         if critical_enabled and current >= critical_threshold:
             if not critical_window_timer.timer_started:
-                critical_window_timer.start_timer(monitoring_datetime)
-            elif critical_window_timer.can_do_task(monitoring_datetime):
+                critical_window_timer.start_timer(monitoring_timestamp)
+            elif critical_window_timer.can_do_task(monitoring_timestamp):
                 duration = monitoring_timestamp - \
                            critical_window_timer.start_time.replace(
                                tzinfo=timezone.utc).timestamp()
@@ -296,14 +439,14 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug(
                     "Successfully classified alert %s", alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = True
+                critical_sent[metric_name] = True
                 critical_window_timer.do_task()
                 critical_repeat_limiter.set_last_time_that_did_task(
-                    monitoring_datetime)
+                    monitoring_timestamp)
             elif (critical_sent[metric_name]
                   and critical_repeat_enabled
-                  and critical_repeat_limiter.can_do_task(monitoring_datetime)):
+                  and critical_repeat_limiter.can_do_task(
+                          monitoring_timestamp)):
                 duration = monitoring_timestamp - \
                            critical_window_timer.start_time.replace(
                                tzinfo=timezone.utc).timestamp()
@@ -315,13 +458,13 @@ class AlertingFactory(ABC):
                 self.component_logger.debug(
                     "Successfully classified alert %s", alert.alert_data)
                 critical_repeat_limiter.set_last_time_that_did_task(
-                    monitoring_datetime)
+                    monitoring_timestamp)
 
         if warning_enabled and current >= warning_threshold:
             if not warning_window_timer.timer_started:
-                warning_window_timer.start_timer(monitoring_datetime)
+                warning_window_timer.start_timer(monitoring_timestamp)
             elif (not critical_sent[metric_name]
-                  and warning_window_timer.can_do_task(monitoring_datetime)):
+                  and warning_window_timer.can_do_task(monitoring_timestamp)):
                 duration = monitoring_timestamp - \
                            warning_window_timer.start_time.replace(
                                tzinfo=timezone.utc).timestamp()
@@ -333,8 +476,7 @@ class AlertingFactory(ABC):
                 self.component_logger.debug(
                     "Successfully classified alert %s", alert.alert_data)
                 warning_window_timer.do_task()
-                self.alerting_state[parent_id][monitorable_id][
-                    'warning_sent'][metric_name] = True
+                warning_sent[metric_name] = True
 
     def classify_thresholded_in_time_period_alert(
             self, current: Any, previous: Any, config: Dict,
@@ -368,31 +510,25 @@ class AlertingFactory(ABC):
         :param monitoring_timestamp: The data timestamp
         :return: None
         """
-        # Parse warning thresholds and limiters
-        warning_enabled = str_to_bool(config['warning_enabled'])
-        warning_threshold = convert_to_float(config['warning_threshold'], None)
-        warning_occurrences_tracker = self.alerting_state[parent_id][
-            monitorable_id]['warning_occurrences_in_period_tracker'][
-            metric_name]
-        warning_sent = self.alerting_state[parent_id][monitorable_id][
-            'warning_sent']
-        warning_period = convert_to_float(config['warning_time_window'], None)
-
-        # Parse critical thresholds and limiters
-        critical_enabled = str_to_bool(config['critical_enabled'])
-        critical_threshold = convert_to_float(config['critical_threshold'],
-                                              None)
-        critical_repeat_enabled = str_to_bool(config['critical_repeat_enabled'])
-        critical_repeat_limiter = self.alerting_state[parent_id][
-            monitorable_id]['critical_repeat_timer'][metric_name]
-        critical_occurrences_tracker = self.alerting_state[parent_id][
-            monitorable_id]['critical_occurrences_in_period_tracker'][
-            metric_name]
-        critical_sent = self.alerting_state[parent_id][monitorable_id][
-            'critical_sent']
-        critical_period = convert_to_float(config['critical_time_window'], None)
-
-        monitoring_datetime = datetime.fromtimestamp(monitoring_timestamp)
+        compiled = self.compiled_rule(config, parent_id, monitorable_id,
+                                      metric_name)
+        rule = compiled.rule
+
+        # Warning thresholds and limiters
+        warning_enabled = rule.warning_enabled
+        warning_threshold = rule.warning_threshold
+        warning_occurrences_tracker = compiled.warning_occurrences_tracker
+        warning_sent = compiled.warning_sent
+        warning_period = rule.warning_time_window
+
+        # Critical thresholds and limiters
+        critical_enabled = rule.critical_enabled
+        critical_threshold = rule.critical_threshold
+        critical_repeat_enabled = rule.critical_repeat_enabled
+        critical_repeat_limiter = compiled.critical_repeat_timer
+        critical_occurrences_tracker = compiled.critical_occurrences_tracker
+        critical_sent = compiled.critical_sent
+        critical_period = rule.critical_time_window
 
         # First calculate how many occurrences have occurred in a time period,
         # then alert accordingly.
@@ -400,13 +536,14 @@ class AlertingFactory(ABC):
         if occurrences > 0:
             for i in range(occurrences):
                 # add_occurrence calls remove_old_occurrences
-                warning_occurrences_tracker.add_occurrence(monitoring_datetime)
-                critical_occurrences_tracker.add_occurrence(monitoring_datetime)
+                warning_occurrences_tracker.add_occurrence(monitoring_timestamp)
+                critical_occurrences_tracker.add_occurrence(
+                    monitoring_timestamp)
         else:
             warning_occurrences_tracker.remove_old_occurrences(
-                monitoring_datetime)
+                monitoring_timestamp)
             critical_occurrences_tracker.remove_old_occurrences(
-                monitoring_datetime)
+                monitoring_timestamp)
 
         warning_occurrences = warning_occurrences_tracker.no_of_occurrences()
         critical_occurrences = critical_occurrences_tracker.no_of_occurrences()
@@ -425,15 +562,13 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = False
+                critical_sent[metric_name] = False
 
                 # If this is the case we still need to raise a warning alert to
                 # show the correct metric state in the UI.
                 if (warning_sent[metric_name]
                         and warning_occurrences >= warning_threshold):
-                    self.alerting_state[parent_id][monitorable_id][
-                        'warning_sent'][metric_name] = False
+                    warning_sent[metric_name] = False
 
         if (warning_sent[metric_name]
                 and warning_occurrences < warning_threshold):
@@ -444,8 +579,7 @@ class AlertingFactory(ABC):
             data_for_alerting.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id]['warning_sent'][
-                metric_name] = False
+            warning_sent[metric_name] = False
 
         # Now check if any of the thresholds are surpassed within the time
         # period. First check for critical and do not raise a warning alert if
@@ -461,12 +595,12 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = True
+                critical_sent[metric_name] = True
                 critical_repeat_limiter.set_last_time_that_did_task(
-                    monitoring_datetime)
+                    monitoring_timestamp)
             elif (critical_repeat_enabled
-                  and critical_repeat_limiter.can_do_task(monitoring_datetime)):
+                  and critical_repeat_limiter.can_do_task(
+                          monitoring_timestamp)):
                 alert = increased_above_threshold_alert(
                     monitorable_name, critical_occurrences,
                     Severity.CRITICAL.value, monitoring_timestamp,
@@ -476,7 +610,7 @@ class AlertingFactory(ABC):
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
                 critical_repeat_limiter.set_last_time_that_did_task(
-                    monitoring_datetime)
+                    monitoring_timestamp)
 
         if (warning_enabled
                 and not warning_sent[metric_name]
@@ -489,8 +623,7 @@ class AlertingFactory(ABC):
             data_for_alerting.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id][
-                'warning_sent'][metric_name] = True
+            warning_sent[metric_name] = True
 
     def classify_conditional_alert(
             self, condition_true_alert: Type[ConditionalAlert],
@@ -569,23 +702,30 @@ class AlertingFactory(ABC):
         :param monitoring_timestamp: The data timestamp
         :return: None
         """
-        # Parse warning thresholds and limiters
-        warning_enabled = str_to_bool(config['warning_enabled'])
-        warning_threshold = convert_to_float(config['warning_threshold'], None)
-        warning_sent = self.alerting_state[parent_id][monitorable_id][
-            'warning_sent']
+        compiled = self.compiled_rule(config, parent_id, monitorable_id,
+                                      metric_name)
+        rule = compiled.rule
+        raised_alerts = self._raised_alerts_list(compiled, data_for_alerting)
+
+        # Warning thresholds and limiters
+        warning_enabled = rule.warning_enabled
+        warning_threshold = rule.warning_threshold
+        warning_sent = compiled.warning_sent
 
-        # Parse critical thresholds and limiters
-        critical_enabled = str_to_bool(config['critical_enabled'])
-        critical_threshold = convert_to_float(config['critical_threshold'],
-                                              None)
-        critical_repeat_enabled = str_to_bool(config['critical_repeat_enabled'])
-        critical_repeat_limiter = self.alerting_state[parent_id][
-            monitorable_id]['critical_repeat_timer'][metric_name]
-        critical_sent = self.alerting_state[parent_id][monitorable_id][
-            'critical_sent']
+        # Critical thresholds and limiters
+        critical_enabled = rule.critical_enabled
+        critical_threshold = rule.critical_threshold
+        critical_repeat_enabled = rule.critical_repeat_enabled
+        critical_repeat_limiter = compiled.critical_repeat_timer
+        critical_sent = compiled.critical_sent
 
-        monitoring_datetime = datetime.fromtimestamp(monitoring_timestamp)
+        # Most values are below the enabled thresholds with no alert raised for
+        # them. In that case the state cannot change, so evaluation stops early.
+        if self._in_steady_state(compiled, metric_name, current):
+            critical_repeat_limiter.reset()
+            self._filter_flapping(compiled, raised_alerts, data_for_alerting,
+                                  monitorable_name, monitoring_timestamp)
+            return
 
         # First check for a decrease below critical threshold and then check for
         # a decrease below warning threshold as
@@ -597,28 +737,25 @@ class AlertingFactory(ABC):
                     monitorable_name, current, Severity.INFO.value,
                     monitoring_timestamp, Severity.CRITICAL.value, parent_id,
                     monitorable_id)
-                data_for_alerting.append(alert.alert_data)
+                raised_alerts.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = False
+                critical_sent[metric_name] = False
 
                 # If this is the case we still need to raise a warning alert to
                 # show the correct metric state in the UI.
                 if warning_sent[metric_name] and current >= warning_threshold:
-                    self.alerting_state[parent_id][monitorable_id][
-                        'warning_sent'][metric_name] = False
+                    warning_sent[metric_name] = False
 
         if warning_sent[metric_name] and current < warning_threshold:
             alert = decreased_below_threshold_alert(
                 monitorable_name, current, Severity.INFO.value,
                 monitoring_timestamp, Severity.WARNING.value, parent_id,
                 monitorable_id)
-            data_for_alerting.append(alert.alert_data)
+            raised_alerts.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id]['warning_sent'][
-                metric_name] = False
+            warning_sent[metric_name] = False
 
         # Now check if the current value is smaller than any of the thresholds.
         # First check for critical and do not raise a warning alert if we are
@@ -629,24 +766,24 @@ class AlertingFactory(ABC):
                     monitorable_name, current, Severity.CRITICAL.value,
                     monitoring_timestamp, Severity.CRITICAL.value, parent_id,
                     monitorable_id)
-                data_for_alerting.append(alert.alert_data)
+                raised_alerts.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = True
+                critical_sent[metric_name] = True
                 critical_repeat_limiter.set_last_time_that_did_task(
-                    monitoring_datetime)
+                    monitoring_timestamp)
             elif (critical_repeat_enabled
-                  and critical_repeat_limiter.can_do_task(monitoring_datetime)):
+                  and critical_repeat_limiter.can_do_task(
+                          monitoring_timestamp)):
                 alert = increased_above_threshold_alert(
                     monitorable_name, current, Severity.CRITICAL.value,
                     monitoring_timestamp, Severity.CRITICAL.value, parent_id,
                     monitorable_id)
-                data_for_alerting.append(alert.alert_data)
+                raised_alerts.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
                 critical_repeat_limiter.set_last_time_that_did_task(
-                    monitoring_datetime)
+                    monitoring_timestamp)
 
         if (warning_enabled
                 and not warning_sent[metric_name]
@@ -656,11 +793,13 @@ class AlertingFactory(ABC):
                 monitorable_name, current, Severity.WARNING.value,
                 monitoring_timestamp, Severity.WARNING.value, parent_id,
                 monitorable_id)
-            data_for_alerting.append(alert.alert_data)
+            raised_alerts.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id][
-                'warning_sent'][metric_name] = True
+            warning_sent[metric_name] = True
+
+        self._filter_flapping(compiled, raised_alerts, data_for_alerting,
+                              monitorable_name, monitoring_timestamp)
 
     def classify_thresholded_alert_reverse(
             self, current: Any, config: Dict,
@@ -693,23 +832,29 @@ class AlertingFactory(ABC):
         :param monitoring_timestamp: The data timestamp
         :return: None
         """
-        # Parse warning thresholds and limiters
-        warning_enabled = str_to_bool(config['warning_enabled'])
-        warning_threshold = convert_to_float(config['warning_threshold'], None)
-        warning_sent = self.alerting_state[parent_id][monitorable_id][
-            'warning_sent']
+        compiled = self.compiled_rule(config, parent_id, monitorable_id,
+                                      metric_name)
+        rule = compiled.rule
+        raised_alerts = self._raised_alerts_list(compiled, data_for_alerting)
+
+        # Warning thresholds and limiters
+        warning_enabled = rule.warning_enabled
+        warning_threshold = rule.warning_threshold
+        warning_sent = compiled.warning_sent
 
-        # Parse critical thresholds and limiters
-        critical_enabled = str_to_bool(config['critical_enabled'])
-        critical_threshold = convert_to_float(config['critical_threshold'],
-                                              None)
-        critical_repeat_enabled = str_to_bool(config['critical_repeat_enabled'])
-        critical_repeat_limiter = self.alerting_state[parent_id][
-            monitorable_id]['critical_repeat_timer'][metric_name]
-        critical_sent = self.alerting_state[parent_id][monitorable_id][
-            'critical_sent']
+        # Critical thresholds and limiters
+        critical_enabled = rule.critical_enabled
+        critical_threshold = rule.critical_threshold
+        critical_repeat_enabled = rule.critical_repeat_enabled
+        critical_repeat_limiter = compiled.critical_repeat_timer
+        critical_sent = compiled.critical_sent
 
-        monitoring_datetime = datetime.fromtimestamp(monitoring_timestamp)
+        # Most values are above the enabled thresholds with no alert raised for
+        # them. In that case the state cannot change, so evaluation stops early.
+        if self._in_steady_state(compiled, metric_name, current, reverse=True):
+            self._filter_flapping(compiled, raised_alerts, data_for_alerting,
+                                  monitorable_name, monitoring_timestamp)
+            return
 
         # First check if there was an increase so that an info alert is raised.
         # First check for critical as it is expected that
@@ -720,29 +865,26 @@ class AlertingFactory(ABC):
                 monitorable_name, current, Severity.INFO.value,
                 monitoring_timestamp, Severity.CRITICAL.value, parent_id,
                 monitorable_id)
-            data_for_alerting.append(alert.alert_data)
+            raised_alerts.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id][
-                'critical_sent'][metric_name] = False
+            critical_sent[metric_name] = False
             critical_repeat_limiter.reset()
 
             # If this is the case we still need to raise a warning alert to
             # show the correct metric state in the UI.
             if warning_sent[metric_name] and current <= warning_threshold:
-                self.alerting_state[parent_id][monitorable_id]['warning_sent'][
-                    metric_name] = False
+                warning_sent[metric_name] = False
 
         if warning_sent[metric_name] and current > warning_threshold:
             alert = increased_above_threshold_alert(
                 monitorable_name, current, Severity.INFO.value,
                 monitoring_timestamp, Severity.WARNING.value, parent_id,
                 monitorable_id)
-            data_for_alerting.append(alert.alert_data)
+            raised_alerts.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id]['warning_sent'][
-                metric_name] = False
+            warning_sent[metric_name] = False
 
         # Now check if the current value is greater than any of the thresholds.
         # First check for critical and do not raise a warning alert if we are
@@ -754,24 +896,24 @@ class AlertingFactory(ABC):
                     monitorable_name, current, Severity.CRITICAL.value,
                     monitoring_timestamp, Severity.CRITICAL.value, parent_id,
                     monitorable_id)
-                data_for_alerting.append(alert.alert_data)
+                raised_alerts.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = True
+                critical_sent[metric_name] = True
                 critical_repeat_limiter.set_last_time_that_did_task(
-                    monitoring_datetime)
+                    monitoring_timestamp)
             elif (critical_repeat_enabled
-                  and critical_repeat_limiter.can_do_task(monitoring_datetime)):
+                  and critical_repeat_limiter.can_do_task(
+                          monitoring_timestamp)):
                 alert = decreased_below_threshold_alert(
                     monitorable_name, current, Severity.CRITICAL.value,
                     monitoring_timestamp, Severity.CRITICAL.value, parent_id,
                     monitorable_id)
-                data_for_alerting.append(alert.alert_data)
+                raised_alerts.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
                 critical_repeat_limiter.set_last_time_that_did_task(
-                    monitoring_datetime)
+                    monitoring_timestamp)
 
         if (warning_enabled
                 and not warning_sent[metric_name]
@@ -781,11 +923,13 @@ class AlertingFactory(ABC):
                 monitorable_name, current, Severity.WARNING.value,
                 monitoring_timestamp, Severity.WARNING.value, parent_id,
                 monitorable_id)
-            data_for_alerting.append(alert.alert_data)
+            raised_alerts.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id][
-                'warning_sent'][metric_name] = True
+            warning_sent[metric_name] = True
+
+        self._filter_flapping(compiled, raised_alerts, data_for_alerting,
+                              monitorable_name, monitoring_timestamp)
 
     def classify_error_alert(
             self, error_code_to_detect: int,
@@ -850,24 +994,21 @@ class AlertingFactory(ABC):
             parent_id: str, monitorable_id: str, metric_name: str,
             monitorable_name: str, monitoring_timestamp: float,
     ) -> None:
-        # Parse warning thresholds and limiters
-        warning_enabled = str_to_bool(config['warning_enabled'])
-        warning_window_timer = self.alerting_state[parent_id][monitorable_id][
-            'warning_window_timer'][metric_name]
-        warning_sent = self.alerting_state[parent_id][monitorable_id][
-            'warning_sent']
+        compiled = self.compiled_rule(config, parent_id, monitorable_id,
+                                      metric_name)
+        rule = compiled.rule
 
-        # Parse critical thresholds and limiters
-        critical_enabled = str_to_bool(config['critical_enabled'])
-        critical_repeat_enabled = str_to_bool(config['critical_repeat_enabled'])
-        critical_repeat_limiter = self.alerting_state[parent_id][
-            monitorable_id]['critical_repeat_timer'][metric_name]
-        critical_window_timer = self.alerting_state[parent_id][monitorable_id][
-            'critical_window_timer'][metric_name]
-        critical_sent = self.alerting_state[parent_id][monitorable_id][
-            'critical_sent']
+        # Warning thresholds and limiters
+        warning_enabled = rule.warning_enabled
+        warning_window_timer = compiled.warning_window_timer
+        warning_sent = compiled.warning_sent
 
-        monitoring_datetime = datetime.fromtimestamp(monitoring_timestamp)
+        # Critical thresholds and limiters
+        critical_enabled = rule.critical_enabled
+        critical_repeat_enabled = rule.critical_repeat_enabled
+        critical_repeat_limiter = compiled.critical_repeat_timer
+        critical_window_timer = compiled.critical_window_timer
+        critical_sent = compiled.critical_sent
 
         if current_went_down is None:
             warning_window_timer.reset()
@@ -881,31 +1022,27 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'warning_sent'][metric_name] = False
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = False
+                warning_sent[metric_name] = False
+                critical_sent[metric_name] = False
         else:
-            went_down_datetime = datetime.fromtimestamp(current_went_down)
             if critical_enabled:
                 if not critical_window_timer.timer_started:
-                    critical_window_timer.start_timer(went_down_datetime)
-                elif critical_window_timer.can_do_task(monitoring_datetime):
+                    critical_window_timer.start_timer(current_went_down)
+                elif critical_window_timer.can_do_task(monitoring_timestamp):
                     alert = went_down_at_alert(
                         monitorable_name, Severity.CRITICAL.value,
                         monitoring_timestamp, parent_id, monitorable_id)
                     data_for_alerting.append(alert.alert_data)
                     self.component_logger.debug(
                         "Successfully classified alert %s", alert.alert_data)
-                    self.alerting_state[parent_id][monitorable_id][
-                        'critical_sent'][metric_name] = True
+                    critical_sent[metric_name] = True
                     critical_window_timer.do_task()
                     critical_repeat_limiter.set_last_time_that_did_task(
-                        monitoring_datetime)
+                        monitoring_timestamp)
                 elif (critical_sent[metric_name]
                       and critical_repeat_enabled
                       and critical_repeat_limiter.can_do_task(
-                            monitoring_datetime)):
+                            monitoring_timestamp)):
                     difference = monitoring_timestamp - current_went_down
                     alert = still_down_alert(
                         monitorable_name, difference, Severity.CRITICAL.value,
@@ -914,13 +1051,13 @@ class AlertingFactory(ABC):
                     self.component_logger.debug(
                         "Successfully classified alert %s", alert.alert_data)
                     critical_repeat_limiter.set_last_time_that_did_task(
-                        monitoring_datetime)
+                        monitoring_timestamp)
 
             if warning_enabled:
                 if not warning_window_timer.timer_started:
-                    warning_window_timer.start_timer(went_down_datetime)
+                    warning_window_timer.start_timer(current_went_down)
                 elif not critical_sent[metric_name] and \
-                        warning_window_timer.can_do_task(monitoring_datetime):
+                        warning_window_timer.can_do_task(monitoring_timestamp):
                     alert = went_down_at_alert(
                         monitorable_name, Severity.WARNING.value,
                         monitoring_timestamp, parent_id, monitorable_id)
@@ -928,8 +1065,7 @@ class AlertingFactory(ABC):
                     self.component_logger.debug(
                         "Successfully classified alert %s", alert.alert_data)
                     warning_window_timer.do_task()
-                    self.alerting_state[parent_id][monitorable_id][
-                        'warning_sent'][metric_name] = True
+                    warning_sent[metric_name] = True
 
     def classify_source_downtime_alert(
             self, condition_true_alert: Type[ConditionalAlert],
@@ -0,0 +1,81 @@
+from typing import Dict, NamedTuple, Optional, Any
+
+from src.alerter.factory.flap_detector import FlapDetector
+from src.utils.timing import (TimedTaskTracker, TimedTaskLimiter,
+                              OccurrencesInTimePeriodTracker)
+from src.utils.types import str_to_bool, convert_to_float
+
+
+class AlertRule(NamedTuple):
+    """
+    The parsed thresholds of a metric's alert configuration. Values which are
+    not part of the configuration are None.
+    """
+    warning_enabled: bool
+    warning_threshold: Optional[float]
+    warning_time_window: Optional[float]
+    critical_enabled: bool
+    critical_threshold: Optional[float]
+    critical_time_window: Optional[float]
+    critical_repeat_enabled: bool
+
+    @staticmethod
+    def from_config(config: Dict) -> 'AlertRule':
+        return AlertRule(
+            warning_enabled=str_to_bool(config['warning_enabled']),
+            warning_threshold=convert_to_float(
+                config.get('warning_threshold'), None),
+            warning_time_window=convert_to_float(
+                config.get('warning_time_window'), None),
+            critical_enabled=str_to_bool(config['critical_enabled']),
+            critical_threshold=convert_to_float(
+                config.get('critical_threshold'), None),
+            critical_time_window=convert_to_float(
+                config.get('critical_time_window'), None),
+            critical_repeat_enabled=str_to_bool(
+                config.get('critical_repeat_enabled', 'False')),
+        )
+
+
+class CompiledAlertRule(NamedTuple):
+    """
+    An alert rule bound to the alerting state of a metric of a monitorable. It
+    keeps the configuration and the monitorable state it was compiled from so
+    that it can be checked whether it is still valid. The trackers are those
+    stored in the monitorable state, and the `sent` dicts are those of the
+    monitorable, therefore updating them updates the alerting state.
+    """
+    config: Dict
+    monitorable_state: Dict
+    rule: AlertRule
+    warning_sent: Optional[Dict[str, bool]]
+    critical_sent: Optional[Dict[str, bool]]
+    warning_window_timer: Optional[TimedTaskTracker]
+    critical_window_timer: Optional[TimedTaskTracker]
+    critical_repeat_timer: Optional[TimedTaskLimiter]
+    warning_occurrences_tracker: Optional[OccurrencesInTimePeriodTracker]
+    critical_occurrences_tracker: Optional[OccurrencesInTimePeriodTracker]
+    flap_detector: Optional[FlapDetector]
+
+    @staticmethod
+    def compile(config: Dict, monitorable_state: Dict, metric_name: str,
+                flap_detector: Optional[FlapDetector] = None
+                ) -> 'CompiledAlertRule':
+        def tracker(name: str) -> Any:
+            return monitorable_state.get(name, {}).get(metric_name)
+
+        return CompiledAlertRule(
+            config=config,
+            monitorable_state=monitorable_state,
+            rule=AlertRule.from_config(config),
+            warning_sent=monitorable_state.get('warning_sent'),
+            critical_sent=monitorable_state.get('critical_sent'),
+            warning_window_timer=tracker('warning_window_timer'),
+            critical_window_timer=tracker('critical_window_timer'),
+            critical_repeat_timer=tracker('critical_repeat_timer'),
+            warning_occurrences_tracker=tracker(
+                'warning_occurrences_in_period_tracker'),
+            critical_occurrences_tracker=tracker(
+                'critical_occurrences_in_period_tracker'),
+            flap_detector=flap_detector,
+        )
@@ -0,0 +1,53 @@
+from typing import Dict, Optional
+
+
+class ChainHeightIndex:
+    """
+    Keeps the block heights of the nodes of a chain together with the maximum
+    height, so that the chain's maximum is not recomputed from all the nodes
+    whenever a node's height is received. The maximum is re-computed only if
+    the node which had the maximum height goes back or is removed, which is
+    rare as heights normally only increase.
+    """
+
+    def __init__(self) -> None:
+        self._heights: Dict[str, int] = {}
+        self._max_height: Optional[int] = None
+
+        # Whether the node which had the maximum height went back or was
+        # removed, in which case _max_height is only an upper bound.
+        self._max_height_outdated = False
+
+    @property
+    def max_height(self) -> Optional[int]:
+        if self._max_height_outdated:
+            self._max_height = max(self._heights.values(), default=None)
+            self._max_height_outdated = False
+
+        return self._max_height
+
+    def __len__(self) -> int:
+        return len(self._heights)
+
+    def update(self, node_id: str, height: Optional[int]) -> None:
+        """
+        Sets the height of a node. A None height removes the node's height from
+        the index, like a node which is removed.
+        :param node_id: The id of the node
+        :param height: The current height of the node
+        :return: None
+        """
+        previous_height = self._heights.pop(node_id, None)
+        if height is not None:
+            self._heights[node_id] = height
+
+        if height is not None and (self._max_height is None
+                                   or height >= self._max_height):
+            self._max_height = height
+            self._max_height_outdated = False
+        elif (previous_height is not None
+              and previous_height == self._max_height):
+            self._max_height_outdated = True
+
+    def remove(self, node_id: str) -> None:
+        self.update(node_id, None)
@@ -1,5 +1,5 @@
 import logging
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Dict, List, Any, Type, Callable
 
 from src.alerter.alert_severities import Severity
@@ -134,6 +134,7 @@ class ChainlinkContractAlertingFactory(AlertingFactory):
         """
         if parent_id in self.alerting_state:
             del self.alerting_state[parent_id]
+        self.remove_compiled_rules(parent_id)
 
     def classify_thresholded_and_conditional_alert(
             self, current: Any, config: Dict,
@@ -194,8 +195,6 @@ class ChainlinkContractAlertingFactory(AlertingFactory):
         critical_sent = self.alerting_state[parent_id][monitorable_id][
             contract_proxy_address]['critical_sent']
 
-        monitoring_datetime = datetime.fromtimestamp(monitoring_timestamp)
-
         if ((critical_sent[metric_name] or warning_sent[metric_name]) and
                 condition_function(*condition_fn_args)):
             alert = condition_true_alert(
@@ -224,9 +223,9 @@ class ChainlinkContractAlertingFactory(AlertingFactory):
                 self.alerting_state[parent_id][monitorable_id][
                     contract_proxy_address]['critical_sent'][metric_name] = True
                 critical_repeat_limiter.set_last_time_that_did_task(
-                    monitoring_datetime)
+                    monitoring_timestamp)
             elif (critical_enabled and critical_sent[metric_name] and
-                  critical_repeat_limiter.can_do_task(monitoring_datetime) and
+                  critical_repeat_limiter.can_do_task(monitoring_timestamp) and
                   critical_repeat_enabled):
                 alert = increased_above_threshold_alert(
                     monitorable_name, current, Severity.CRITICAL.value,
@@ -237,7 +236,7 @@ class ChainlinkContractAlertingFactory(AlertingFactory):
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
                 critical_repeat_limiter.set_last_time_that_did_task(
-                    monitoring_datetime)
+                    monitoring_timestamp)
             elif (warning_enabled and not critical_sent[metric_name] and
                   not warning_sent[metric_name] and
                   current >= warning_threshold):
@@ -307,8 +306,6 @@ class ChainlinkContractAlertingFactory(AlertingFactory):
         critical_sent = self.alerting_state[parent_id][monitorable_id][
             contract_proxy_address]['critical_sent']
 
-        monitoring_datetime = datetime.fromtimestamp(monitoring_timestamp)
-
         # First check for an increase above critical threshold and then check
         # for an increase above warning threshold as
         # warning_threshold <= critical_threshold
@@ -357,9 +354,10 @@ class ChainlinkContractAlertingFactory(AlertingFactory):
                 self.alerting_state[parent_id][monitorable_id][
                     contract_proxy_address]['critical_sent'][metric_name] = True
                 critical_repeat_limiter.set_last_time_that_did_task(
-                    monitoring_datetime)
+                    monitoring_timestamp)
             elif (critical_repeat_enabled
-                  and critical_repeat_limiter.can_do_task(monitoring_datetime)):
+                  and critical_repeat_limiter.can_do_task(
+                          monitoring_timestamp)):
                 alert = increased_above_threshold_alert(
                     monitorable_name, current, Severity.CRITICAL.value,
                     monitoring_timestamp, Severity.CRITICAL.value, parent_id,
@@ -369,7 +367,7 @@ class ChainlinkContractAlertingFactory(AlertingFactory):
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
                 critical_repeat_limiter.set_last_time_that_did_task(
-                    monitoring_datetime)
+                    monitoring_timestamp)
 
         if (warning_enabled
                 and not warning_sent[metric_name]
@@ -1,5 +1,5 @@
 import logging
-from datetime import timedelta, datetime
+from datetime import timedelta
 from typing import Any, Dict, Type, List
 
 from src.alerter.alert_severities import Severity
@@ -10,8 +10,8 @@ from src.configs.alerts.node.chainlink import ChainlinkNodeAlertsConfig
 from src.utils.configs import parse_alert_time_thresholds
 from src.utils.timing import (TimedTaskTracker, TimedTaskLimiter,
                               OccurrencesInTimePeriodTracker)
-from src.utils.types import (IncreasedAboveThresholdAlert, convert_to_float,
-                             DecreasedBelowThresholdAlert, str_to_bool)
+from src.utils.types import (IncreasedAboveThresholdAlert,
+                             DecreasedBelowThresholdAlert)
 
 
 class ChainlinkNodeAlertingFactory(AlertingFactory):
@@ -216,6 +216,7 @@ class ChainlinkNodeAlertingFactory(AlertingFactory):
         """
         if parent_id in self.alerting_state:
             del self.alerting_state[parent_id]
+        self.remove_compiled_rules(parent_id)
 
     def classify_thresholded_alert_reverse_chainlink_node(
             self, current: Any, config: Dict, symbol: str,
@@ -251,23 +252,29 @@ class ChainlinkNodeAlertingFactory(AlertingFactory):
         :param monitoring_timestamp: The data timestamp
         :return: None
         """
-        # Parse warning thresholds and limiters
-        warning_enabled = str_to_bool(config['warning_enabled'])
-        warning_threshold = convert_to_float(config['warning_threshold'], None)
-        warning_sent = self.alerting_state[parent_id][monitorable_id][
-            'warning_sent']
+        compiled = self.compiled_rule(config, parent_id, monitorable_id,
+                                      metric_name)
+        rule = compiled.rule
+        raised_alerts = self._raised_alerts_list(compiled, data_for_alerting)
 
-        # Parse critical thresholds and limiters
-        critical_enabled = str_to_bool(config['critical_enabled'])
-        critical_threshold = convert_to_float(config['critical_threshold'],
-                                              None)
-        critical_repeat_enabled = str_to_bool(config['critical_repeat_enabled'])
-        critical_repeat_limiter = self.alerting_state[parent_id][
-            monitorable_id]['critical_repeat_timer'][metric_name]
-        critical_sent = self.alerting_state[parent_id][monitorable_id][
-            'critical_sent']
+        # Warning thresholds and limiters
+        warning_enabled = rule.warning_enabled
+        warning_threshold = rule.warning_threshold
+        warning_sent = compiled.warning_sent
 
-        monitoring_datetime = datetime.fromtimestamp(monitoring_timestamp)
+        # Critical thresholds and limiters
+        critical_enabled = rule.critical_enabled
+        critical_threshold = rule.critical_threshold
+        critical_repeat_enabled = rule.critical_repeat_enabled
+        critical_repeat_limiter = compiled.critical_repeat_timer
+        critical_sent = compiled.critical_sent
+
+        # Most values are above the enabled thresholds with no alert raised for
+        # them. In that case the state cannot change, so evaluation stops early.
+        if self._in_steady_state(compiled, metric_name, current, reverse=True):
+            self._filter_flapping(compiled, raised_alerts, data_for_alerting,
+                                  monitorable_name, monitoring_timestamp)
+            return
 
         # First check if there was an increase so that an info alert is raised.
         # First check for critical as it is expected that
@@ -278,29 +285,26 @@ class ChainlinkNodeAlertingFactory(AlertingFactory):
                 monitorable_name, current, symbol, Severity.INFO.value,
                 monitoring_timestamp, Severity.CRITICAL.value, parent_id,
                 monitorable_id)
-            data_for_alerting.append(alert.alert_data)
+            raised_alerts.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id][
-                'critical_sent'][metric_name] = False
+            critical_sent[metric_name] = False
             critical_repeat_limiter.reset()
 
             # If this is the case we still need to raise a warning alert to
             # show the correct metric state in the UI.
             if warning_sent[metric_name] and current <= warning_threshold:
-                self.alerting_state[parent_id][monitorable_id]['warning_sent'][
-                    metric_name] = False
+                warning_sent[metric_name] = False
 
         if warning_sent[metric_name] and current > warning_threshold:
             alert = increased_above_threshold_alert(
                 monitorable_name, current, symbol, Severity.INFO.value,
                 monitoring_timestamp, Severity.WARNING.value, parent_id,
                 monitorable_id)
-            data_for_alerting.append(alert.alert_data)
+            raised_alerts.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id]['warning_sent'][
-                metric_name] = False
+            warning_sent[metric_name] = False
 
         # Now check if the current value is greater than any of the thresholds.
         # First check for critical and do not raise a warning alert if we are
@@ -312,24 +316,24 @@ class ChainlinkNodeAlertingFactory(AlertingFactory):
                     monitorable_name, current, symbol, Severity.CRITICAL.value,
                     monitoring_timestamp, Severity.CRITICAL.value, parent_id,
                     monitorable_id)
-                data_for_alerting.append(alert.alert_data)
+                raised_alerts.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = True
+                critical_sent[metric_name] = True
                 critical_repeat_limiter.set_last_time_that_did_task(
-                    monitoring_datetime)
+                    monitoring_timestamp)
             elif (critical_repeat_enabled
-                  and critical_repeat_limiter.can_do_task(monitoring_datetime)):
+                  and critical_repeat_limiter.can_do_task(
+                          monitoring_timestamp)):
                 alert = decreased_below_threshold_alert(
                     monitorable_name, current, symbol, Severity.CRITICAL.value,
                     monitoring_timestamp, Severity.CRITICAL.value, parent_id,
                     monitorable_id)
-                data_for_alerting.append(alert.alert_data)
+                raised_alerts.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
                 critical_repeat_limiter.set_last_time_that_did_task(
-                    monitoring_datetime)
+                    monitoring_timestamp)
 
         if (warning_enabled
                 and not warning_sent[metric_name]
@@ -339,8 +343,10 @@ class ChainlinkNodeAlertingFactory(AlertingFactory):
                 monitorable_name, current, symbol, Severity.WARNING.value,
                 monitoring_timestamp, Severity.WARNING.value, parent_id,
                 monitorable_id)
-            data_for_alerting.append(alert.alert_data)
+            raised_alerts.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id][
-                'warning_sent'][metric_name] = True
+            warning_sent[metric_name] = True
+
+        self._filter_flapping(compiled, raised_alerts, data_for_alerting,
+                              monitorable_name, monitoring_timestamp)
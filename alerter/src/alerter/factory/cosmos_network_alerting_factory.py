@@ -77,6 +77,7 @@ class CosmosNetworkAlertingFactory(AlertingFactory):
         """
         if parent_id in self.alerting_state:
             del self.alerting_state[parent_id]
+        self.remove_compiled_rules(parent_id)
 
     @staticmethod
     def _proposal_id_valid(proposal_id: Any) -> bool:
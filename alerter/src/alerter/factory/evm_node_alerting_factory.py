@@ -138,3 +138,5 @@ class EVMNodeAlertingFactory(AlertingFactory):
         """
         if parent_id in self.alerting_state:
             del self.alerting_state[parent_id]
+        self.remove_compiled_rules(parent_id)
+        self.remove_chain_heights(parent_id)
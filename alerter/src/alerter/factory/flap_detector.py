@@ -0,0 +1,102 @@
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from src.alerter.alert_severities import Severity
+from src.alerter.alerts.flapping_alerts import (MetricFlappingAlert,
+                                                MetricStoppedFlappingAlert)
+from src.alerter.grouped_alerts_metric_code import GroupedAlertsMetricCode
+from src.utils.timing import OccurrencesInTimePeriodTracker
+
+
+class FlapDetector:
+    """
+    Detects whether the alert state of a metric of a monitorable keeps changing,
+    for example when the metric oscillates around a threshold. The alerts
+    raised for the metric are passed through the detector, which counts the
+    alerts changing the metric's state within a time window. Once there are
+    `threshold` changes within the window a single flapping alert is raised
+    instead, and the metric's alerts are suppressed. The metric stops flapping
+    only when its state does not change for a whole window, in which case an
+    alert with the latest state of the metric and the number of suppressed
+    alerts is raised. Entering and leaving the flapping state at different
+    numbers of changes avoids that the flapping state itself flaps.
+    """
+    __slots__ = ('_threshold', '_state_changes', '_flapping', '_last_alert',
+                 '_no_of_suppressed_alerts')
+
+    def __init__(self, threshold: int, time_window: timedelta) -> None:
+        self._threshold = threshold
+        self._state_changes = OccurrencesInTimePeriodTracker(time_window)
+        self._flapping = False
+
+        # The last alert raised for the metric, whether it was suppressed or
+        # not, which gives the current state of the metric.
+        self._last_alert: Optional[Dict] = None
+        self._no_of_suppressed_alerts = 0
+
+    @property
+    def flapping(self) -> bool:
+        return self._flapping
+
+    @property
+    def no_of_suppressed_alerts(self) -> int:
+        return self._no_of_suppressed_alerts
+
+    def _is_state_change(self, alert: Dict) -> bool:
+        # A repeated alert, such as a critical repeat, has the same code and
+        # severity as the previous alert and does not change the state.
+        return (self._last_alert is None
+                or alert['alert_code'] != self._last_alert['alert_code']
+                or alert['severity'] != self._last_alert['severity'])
+
+    def filter(self, raised_alerts: List[Dict], data_for_alerting: List,
+               monitorable_name: str, monitoring_timestamp: float) -> None:
+        """
+        Appends the alerts raised for the metric in an evaluation to
+        data_for_alerting, unless the metric is flapping. This must be called
+        on every evaluation of the metric, even if no alert was raised, so that
+        it is detected when the metric stops flapping.
+        :param raised_alerts: The alerts raised for the metric
+        :param data_for_alerting: The list to be appended with alerts
+        :param monitorable_name: The name of the monitorable
+        :param monitoring_timestamp: The data timestamp
+        :return: None
+        """
+        for alert in raised_alerts:
+            if self._is_state_change(alert):
+                self._state_changes.add_occurrence(monitoring_timestamp)
+            self._last_alert = alert
+
+            if self._flapping:
+                self._no_of_suppressed_alerts += 1
+            elif self._state_changes.no_of_occurrences() >= self._threshold:
+                self._flapping = True
+                self._no_of_suppressed_alerts = 1
+                flapping_alert = MetricFlappingAlert(
+                    monitorable_name, self._state_changes.no_of_occurrences(),
+                    self._state_changes.time_period, Severity.WARNING.value,
+                    monitoring_timestamp, alert['parent_id'],
+                    alert['origin_id'],
+                    GroupedAlertsMetricCode.get_enum_by_value(alert['metric']),
+                    alert['metric_state_args'])
+                data_for_alerting.append(flapping_alert.alert_data)
+            else:
+                data_for_alerting.append(alert)
+
+        if not self._flapping:
+            return
+
+        self._state_changes.remove_old_occurrences(monitoring_timestamp)
+        if self._state_changes.no_of_occurrences() == 0:
+            last_alert = self._last_alert
+            stopped_alert = MetricStoppedFlappingAlert(
+                monitorable_name, self._no_of_suppressed_alerts,
+                last_alert['message'], last_alert['severity'],
+                monitoring_timestamp, last_alert['parent_id'],
+                last_alert['origin_id'],
+                GroupedAlertsMetricCode.get_enum_by_value(
+                    last_alert['metric']),
+                last_alert['metric_state_args'])
+            data_for_alerting.append(stopped_alert.alert_data)
+            self._flapping = False
+            self._no_of_suppressed_alerts = 0
@@ -60,6 +60,7 @@ class SubstrateNetworkAlertingFactory(AlertingFactory):
         """
         if parent_id in self.alerting_state:
             del self.alerting_state[parent_id]
+        self.remove_compiled_rules(parent_id)
 
     def classify_error_alert(
             self, error_code_to_detect: int, error_alert: Type[ErrorAlert],
@@ -1,5 +1,5 @@
 import logging
-from datetime import timedelta, datetime, timezone
+from datetime import timedelta, timezone
 from typing import Dict, List, Type, Callable, Any, Optional
 
 from src.alerter.alert_severities import Severity
@@ -340,6 +340,7 @@ class SubstrateNodeAlertingFactory(AlertingFactory):
         """
         if parent_id in self.alerting_state:
             del self.alerting_state[parent_id]
+        self.remove_compiled_rules(parent_id)
 
     def create_era_alerting_state(self, parent_id: str, node_id: str,
                                   era_index: int):
@@ -518,24 +519,21 @@ class SubstrateNodeAlertingFactory(AlertingFactory):
         :param monitoring_timestamp: The data timestamp
         :return: None
         """
-        # Parse warning thresholds and limiters
-        warning_enabled = str_to_bool(config['warning_enabled'])
-        warning_window_timer = self.alerting_state[parent_id][monitorable_id][
-            'warning_window_timer'][metric_name]
-        warning_sent = self.alerting_state[parent_id][monitorable_id][
-            'warning_sent']
+        compiled = self.compiled_rule(config, parent_id, monitorable_id,
+                                      metric_name)
+        rule = compiled.rule
 
-        # Parse critical thresholds and limiters
-        critical_enabled = str_to_bool(config['critical_enabled'])
-        critical_repeat_enabled = str_to_bool(config['critical_repeat_enabled'])
-        critical_repeat_limiter = self.alerting_state[parent_id][
-            monitorable_id]['critical_repeat_timer'][metric_name]
-        critical_window_timer = self.alerting_state[parent_id][monitorable_id][
-            'critical_window_timer'][metric_name]
-        critical_sent = self.alerting_state[parent_id][monitorable_id][
-            'critical_sent']
+        # Warning thresholds and limiters
+        warning_enabled = rule.warning_enabled
+        warning_window_timer = compiled.warning_window_timer
+        warning_sent = compiled.warning_sent
 
-        monitoring_datetime = datetime.fromtimestamp(monitoring_timestamp)
+        # Critical thresholds and limiters
+        critical_enabled = rule.critical_enabled
+        critical_repeat_enabled = rule.critical_repeat_enabled
+        critical_repeat_limiter = compiled.critical_repeat_timer
+        critical_window_timer = compiled.critical_window_timer
+        critical_sent = compiled.critical_sent
 
         if current == previous and condition_function(*condition_fn_args):
             # We do not want to raise a warning alert if we are immediately in
@@ -543,8 +541,8 @@ class SubstrateNodeAlertingFactory(AlertingFactory):
             # alert can be raised, and if it can we don't raise a warning alert.
             if critical_enabled:
                 if not critical_window_timer.timer_started:
-                    critical_window_timer.start_timer(monitoring_datetime)
-                elif critical_window_timer.can_do_task(monitoring_datetime):
+                    critical_window_timer.start_timer(monitoring_timestamp)
+                elif critical_window_timer.can_do_task(monitoring_timestamp):
                     duration = (monitoring_timestamp -
                                 critical_window_timer.start_time.replace(
                                     tzinfo=timezone.utc).timestamp())
@@ -555,15 +553,14 @@ class SubstrateNodeAlertingFactory(AlertingFactory):
                     data_for_alerting.append(alert.alert_data)
                     self.component_logger.debug(
                         "Successfully classified alert %s", alert.alert_data)
-                    self.alerting_state[parent_id][monitorable_id][
-                        'critical_sent'][metric_name] = True
+                    critical_sent[metric_name] = True
                     critical_window_timer.do_task()
                     critical_repeat_limiter.set_last_time_that_did_task(
-                        monitoring_datetime)
+                        monitoring_timestamp)
                 elif (critical_sent[metric_name]
                       and critical_repeat_enabled
                       and critical_repeat_limiter.can_do_task(
-                            monitoring_datetime)):
+                            monitoring_timestamp)):
                     duration = (monitoring_timestamp -
                                 critical_window_timer.start_time.replace(
                                     tzinfo=timezone.utc).timestamp())
@@ -575,14 +572,14 @@ class SubstrateNodeAlertingFactory(AlertingFactory):
                     self.component_logger.debug(
                         "Successfully classified alert %s", alert.alert_data)
                     critical_repeat_limiter.set_last_time_that_did_task(
-                        monitoring_datetime)
+                        monitoring_timestamp)
 
             if warning_enabled:
                 if not warning_window_timer.timer_started:
-                    warning_window_timer.start_timer(monitoring_datetime)
+                    warning_window_timer.start_timer(monitoring_timestamp)
                 elif (not critical_sent[metric_name]
                       and warning_window_timer.can_do_task(
-                            monitoring_datetime)):
+                            monitoring_timestamp)):
                     duration = (monitoring_timestamp -
                                 warning_window_timer.start_time.replace(
                                     tzinfo=timezone.utc).timestamp())
@@ -594,16 +591,13 @@ class SubstrateNodeAlertingFactory(AlertingFactory):
                     self.component_logger.debug(
                         "Successfully classified alert %s", alert.alert_data)
                     warning_window_timer.do_task()
-                    self.alerting_state[parent_id][monitorable_id][
-                        'warning_sent'][metric_name] = True
+                    warning_sent[metric_name] = True
         elif current != previous:
             warning_window_timer.reset()
             critical_window_timer.reset()
             critical_repeat_limiter.reset()
-            self.alerting_state[parent_id][monitorable_id]['warning_sent'][
-                metric_name] = False
-            self.alerting_state[parent_id][monitorable_id]['critical_sent'][
-                metric_name] = False
+            warning_sent[metric_name] = False
+            critical_sent[metric_name] = False
         else:
             warning_window_timer.reset()
             critical_window_timer.reset()
@@ -615,10 +609,8 @@ class SubstrateNodeAlertingFactory(AlertingFactory):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug(
                     "Successfully classified alert %s", alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'warning_sent'][metric_name] = False
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = False
+                warning_sent[metric_name] = False
+                critical_sent[metric_name] = False
 
     def classify_websocket_error_alert(
             self, error_code_to_detect: int,
@@ -18,7 +18,9 @@ class GroupedAlertsMetricCode(str, Enum):
         for class_ in [cls] + cls.__subclasses__():
             try:
                 return class_(value)
-            except ValueError:
+            except (ValueError, TypeError):
+                # Calling an enum without members, such as this base class,
+                # raises a TypeError on newer Python versions
                 continue
 
         raise ValueError(
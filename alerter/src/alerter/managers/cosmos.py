@@ -3,7 +3,6 @@ import json
 import logging
 import sys
 from datetime import datetime
-from multiprocessing import Process
 from types import FrameType
 from typing import Dict
 
@@ -40,7 +39,6 @@ class CosmosAlertersManager(AlertersManager):
         self._node_alerts_config_factory = CosmosNodeAlertsConfigsFactory()
         self._network_alerts_config_factory = \
             CosmosNetworkAlertsConfigsFactory()
-        self._alerter_process_dict = {}
         self._configs_processor_helper = {
             COSMOS_NODE_ALERTER_NAME: {
                 'alerterClass': CosmosNodeAlerter,
@@ -58,10 +56,6 @@ class CosmosAlertersManager(AlertersManager):
             }
         }
 
-    @property
-    def alerter_process_dict(self) -> Dict:
-        return self._alerter_process_dict
-
     @property
     def node_alerts_config_factory(self) -> CosmosNodeAlertsConfigsFactory:
         return self._node_alerts_config_factory
@@ -176,8 +170,7 @@ class CosmosAlertersManager(AlertersManager):
         """
         for alerter_name, alerter_details in \
                 self.configs_processor_helper.items():
-            if (alerter_name not in self.alerter_process_dict or
-                    not self.alerter_process_dict[alerter_name].is_alive()):
+            if not self._alerter_workers_are_alive(alerter_name):
                 """
                 We must clear out all the metrics which are found in Redis.
                 Sending this alert to the alert router and then the data store
@@ -191,18 +184,13 @@ class CosmosAlertersManager(AlertersManager):
                     alert.alert_data, alerter_details['routing_key'])
 
                 """
-                Start the Alerter process with the factory being updated by this
-                manager. This factory should hold all the configurations, if
-                any.
+                Start the Alerter workers with the factory being updated by
+                this manager. This factory should hold all the configurations,
+                if any.
                 """
-                log_and_print("Attempting to start the {}.".format(
-                    alerter_name), self.logger)
-                alerter_process = Process(target=alerter_details['starter'],
-                                          args=(alerter_details['factory'],))
-                alerter_process.daemon = True
-                alerter_process.start()
-
-                self._alerter_process_dict[alerter_name] = alerter_process
+                self._start_alerter_workers(alerter_name,
+                                            alerter_details['starter'],
+                                            alerter_details['factory'])
 
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
@@ -3,7 +3,6 @@ import json
 import logging
 import sys
 from datetime import datetime
-from multiprocessing import Process
 from types import FrameType
 from typing import Dict
 
@@ -31,11 +30,6 @@ class EVMNodeAlerterManager(AlertersManager):
                  rabbitmq: RabbitMQApi) -> None:
         super().__init__(logger, manager_name, rabbitmq)
         self._alerts_config_factory = EVMNodeAlertsConfigsFactory()
-        self._alerter_process_dict = {}
-
-    @property
-    def alerter_process_dict(self) -> Dict:
-        return self._alerter_process_dict
 
     @property
     def alerts_config_factory(self) -> EVMNodeAlertsConfigsFactory:
@@ -139,9 +133,7 @@ class EVMNodeAlerterManager(AlertersManager):
         started or it is not alive. This must be done in case of a restart of
         the manager.
         """
-        if (EVM_NODE_ALERTER_NAME not in self.alerter_process_dict or
-                not self.alerter_process_dict[
-                    EVM_NODE_ALERTER_NAME].is_alive()):
+        if not self._alerter_workers_are_alive(EVM_NODE_ALERTER_NAME):
             """
             We must clear out all the metrics which are found in Redis.
             Sending this alert to the alert router and then the data store will
@@ -154,19 +146,13 @@ class EVMNodeAlerterManager(AlertersManager):
             self._push_latest_data_to_queue_and_send(alert.alert_data)
 
             """
-            Start the EVM Node Alerter process with the factory being updated by
-            this manager. This factory should hold all the configurations, if 
-            any.
+            Start the EVM Node Alerter workers with the factory being updated
+            by this manager. This factory should hold all the configurations,
+            if any.
             """
-            log_and_print("Attempting to start the {}.".format(
-                EVM_NODE_ALERTER_NAME), self.logger)
-            evm_alerter_process = Process(target=start_evm_node_alerter,
-                                          args=(self.alerts_config_factory,))
-            evm_alerter_process.daemon = True
-            evm_alerter_process.start()
-
-            self._alerter_process_dict[EVM_NODE_ALERTER_NAME] = \
-                evm_alerter_process
+            self._start_alerter_workers(EVM_NODE_ALERTER_NAME,
+                                        start_evm_node_alerter,
+                                        self.alerts_config_factory)
 
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
@@ -1,7 +1,8 @@
 import logging
 from abc import abstractmethod
+from multiprocessing import Process
 from types import FrameType
-from typing import Dict
+from typing import Dict, List, Callable, Any
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -11,6 +12,9 @@ from src.abstract.publisher_subscriber import (
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
                                           HEARTBEAT_OUTPUT_MANAGER_ROUTING_KEY)
+from src.utils.env import ALERTER_WORKERS_PER_TYPE
+from src.utils.logging import log_and_print
+from src.utils.routing_key import get_alerter_worker_name
 
 
 class AlertersManager(QueuingPublisherSubscriberComponent):
@@ -18,6 +22,7 @@ class AlertersManager(QueuingPublisherSubscriberComponent):
                  rabbitmq: RabbitMQApi) -> None:
         super().__init__(logger, rabbitmq)
         self._name = name
+        self._alerter_process_dict = {}
 
     def __str__(self) -> str:
         return self.name
@@ -26,6 +31,65 @@ class AlertersManager(QueuingPublisherSubscriberComponent):
     def name(self) -> str:
         return self._name
 
+    @property
+    def alerter_process_dict(self) -> Dict:
+        return self._alerter_process_dict
+
+    @staticmethod
+    def _get_alerter_worker_names(alerter_name: str) -> List[str]:
+        return [
+            get_alerter_worker_name(alerter_name, worker_index,
+                                    ALERTER_WORKERS_PER_TYPE)
+            for worker_index in range(ALERTER_WORKERS_PER_TYPE)
+        ]
+
+    def _alerter_workers_are_alive(self, alerter_name: str) -> bool:
+        """
+        Checks whether all the workers of an alerter type were started and are
+        still alive.
+        :param alerter_name: The name of the alerter type
+        :return: True if all the workers are alive
+               : False otherwise
+        """
+        return all(
+            worker_name in self.alerter_process_dict
+            and self.alerter_process_dict[worker_name].is_alive()
+            for worker_name in self._get_alerter_worker_names(alerter_name)
+        )
+
+    def _start_alerter_workers(self, alerter_name: str, starter: Callable,
+                               alerts_configs_factory: Any) -> None:
+        """
+        Starts the workers of an alerter type, each in a separate process. The
+        chains are split between the workers by their parent_id, so a busy
+        chain does not delay the alerts of the chains of the other workers.
+        This is called after a reset alert for the whole alerter type is sent,
+        therefore workers which are still alive are restarted so that no
+        worker keeps an alerting state for metrics which were reset.
+        :param alerter_name: The name of the alerter type
+        :param starter: The function which starts an alerter of this type
+        :param alerts_configs_factory: The factory being updated by this
+               : manager, which should hold all the configurations, if any.
+        :return: None
+        """
+        for worker_index, worker_name in enumerate(
+                self._get_alerter_worker_names(alerter_name)):
+            if worker_name in self.alerter_process_dict:
+                old_process = self.alerter_process_dict[worker_name]
+                if old_process.is_alive():
+                    old_process.terminate()
+                    old_process.join()
+
+            log_and_print("Attempting to start the {}.".format(worker_name),
+                          self.logger)
+            alerter_process = Process(target=starter,
+                                      args=(alerts_configs_factory,),
+                                      kwargs={'worker_index': worker_index})
+            alerter_process.daemon = True
+            alerter_process.start()
+
+            self._alerter_process_dict[worker_name] = alerter_process
+
     def _listen_for_data(self) -> None:
         self.rabbitmq.start_consuming()
 
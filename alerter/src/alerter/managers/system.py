@@ -3,7 +3,6 @@ import json
 import logging
 import sys
 from datetime import datetime
-from multiprocessing import Process
 from types import FrameType
 from typing import Dict
 
@@ -33,7 +32,6 @@ class SystemAlertersManager(AlertersManager):
                  rabbitmq: RabbitMQApi) -> None:
         super().__init__(logger, manager_name, rabbitmq)
         self._system_alerts_config_factory = SystemAlertsConfigsFactory()
-        self._alerter_process_dict = {}
         self._configs_processor_helper = {
             SYSTEM_ALERTER_NAME: {
                 'alerterClass': SystemAlerter,
@@ -43,10 +41,6 @@ class SystemAlertersManager(AlertersManager):
             }
         }
 
-    @property
-    def alerter_process_dict(self) -> Dict:
-        return self._alerter_process_dict
-
     @property
     def system_alerts_config_factory(self) -> SystemAlertsConfigsFactory:
         return self._system_alerts_config_factory
@@ -163,8 +157,7 @@ class SystemAlertersManager(AlertersManager):
         """
         for alerter_name, alerter_details in \
                 self.configs_processor_helper.items():
-            if (alerter_name not in self.alerter_process_dict or
-                    not self.alerter_process_dict[alerter_name].is_alive()):
+            if not self._alerter_workers_are_alive(alerter_name):
                 """
                 We must clear out all the metrics which are found in Redis.
                 Sending this alert to the alert router and then the data store
@@ -178,18 +171,13 @@ class SystemAlertersManager(AlertersManager):
                     alert.alert_data, alerter_details['routing_key'])
 
                 """
-                Start the Alerter process with the factory being updated by 
+                Start the Alerter workers with the factory being updated by
                 this manager. This factory should hold all the configurations,
                 if any.
                 """
-                log_and_print("Attempting to start the {}.".format(
-                    alerter_name), self.logger)
-                alerter_process = Process(target=alerter_details['starter'],
-                                          args=(alerter_details['factory'],))
-                alerter_process.daemon = True
-                alerter_process.start()
-
-                self._alerter_process_dict[alerter_name] = alerter_process
+                self._start_alerter_workers(alerter_name,
+                                            alerter_details['starter'],
+                                            alerter_details['factory'])
 
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
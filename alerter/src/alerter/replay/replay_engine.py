@@ -0,0 +1,224 @@
+import json
+import time
+from collections import Counter
+from typing import Dict, List, Iterable, Iterator, Optional
+
+import pika
+
+from src.alerter.alerters.alerter import Alerter
+from src.alerter.replay.replay_rabbitmq_api import ReplayRabbitMQApi
+from src.alerter.replay.simulated_clock import SimulatedClock
+from src.utils.constants.rabbitmq import ALERT_EXCHANGE
+from src.utils.timing import set_time_source
+
+
+def load_records(file_path: str) -> Iterator[Dict]:
+    """
+    Reads recorded messages from a file with one JSON object per line, of the
+    form {"routing_key": <routing key>, "body": <message>}. Alert configs are
+    recorded as messages with their config routing key, so that they are
+    received by the alerter before the data they apply to. Empty lines are
+    skipped.
+    :param file_path: The path of the recording
+    :return: An iterator over the recorded messages
+    """
+    with open(file_path, 'r') as recording:
+        for line in recording:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _data_timestamp(data: Dict) -> Optional[float]:
+    """
+    Returns the latest time at which the data in a transformed data message
+    was monitored. The time is given in the 'meta_data' of the result or error
+    of every source, which is nested at a different depth for every alerter.
+    :param data: The transformed data
+    :return: The time the data was monitored at, or None if not found
+    """
+    timestamps = []
+    to_check = [data]
+    while to_check:
+        value = to_check.pop()
+        if not isinstance(value, dict):
+            continue
+
+        meta_data = value.get('meta_data')
+        if isinstance(meta_data, dict):
+            for key in ['last_monitored', 'time']:
+                if isinstance(meta_data.get(key), (int, float)):
+                    timestamps.append(meta_data[key])
+
+        to_check.extend(value.values())
+
+    return max(timestamps, default=None)
+
+
+class ReplayReport:
+    """
+    The outcome of a replay: the alerts raised by the alerter, and how long
+    the alerter took to evaluate each recorded data message.
+    """
+
+    def __init__(self) -> None:
+        self._alerts: List[Dict] = []
+        self._latencies: List[float] = []
+        self._no_of_configs = 0
+        self._total_time = 0.0
+
+    @property
+    def alerts(self) -> List[Dict]:
+        return self._alerts
+
+    @property
+    def latencies(self) -> List[float]:
+        return self._latencies
+
+    @property
+    def no_of_messages(self) -> int:
+        return len(self._latencies)
+
+    @property
+    def no_of_configs(self) -> int:
+        return self._no_of_configs
+
+    @property
+    def total_time(self) -> float:
+        return self._total_time
+
+    @property
+    def messages_per_second(self) -> float:
+        evaluation_time = sum(self._latencies)
+        return self.no_of_messages / evaluation_time if evaluation_time else 0.0
+
+    def add_alerts(self, alerts: List[Dict]) -> None:
+        self._alerts.extend(alerts)
+
+    def add_latency(self, latency: float) -> None:
+        self._latencies.append(latency)
+
+    def add_config(self) -> None:
+        self._no_of_configs += 1
+
+    def set_total_time(self, total_time: float) -> None:
+        self._total_time = total_time
+
+    def alerts_by_severity(self) -> Dict[str, int]:
+        return dict(Counter(alert['severity'] for alert in self._alerts))
+
+    def alerts_by_code(self) -> Dict[str, int]:
+        return dict(Counter(alert['alert_code']['name']
+                            for alert in self._alerts))
+
+    def latency_percentile(self, percentile: float) -> float:
+        """
+        :param percentile: The percentile between 0 and 100
+        :return: The evaluation latency in seconds at the given percentile,
+               : using the nearest-rank method, or 0 if nothing was evaluated
+        """
+        if not self._latencies:
+            return 0.0
+
+        latencies = sorted(self._latencies)
+        rank = max(int(round(percentile / 100 * len(latencies))), 1)
+        return latencies[min(rank, len(latencies)) - 1]
+
+    def summary(self) -> str:
+        lines = [
+            "Messages evaluated: {}".format(self.no_of_messages),
+            "Configs received: {}".format(self.no_of_configs),
+            "Total replay time: {:.3f} s".format(self.total_time),
+            "Throughput: {:.1f} messages/s".format(self.messages_per_second),
+            "Latency p50/p95/p99/max: {:.1f}/{:.1f}/{:.1f}/{:.1f} us".format(
+                *[self.latency_percentile(percentile) * 1e6
+                  for percentile in [50, 95, 99, 100]]),
+            "Alerts raised: {}".format(len(self.alerts)),
+        ]
+        for severity, count in sorted(self.alerts_by_severity().items()):
+            lines.append("  {}: {}".format(severity, count))
+        for alert_code, count in sorted(self.alerts_by_code().items()):
+            lines.append("  {}: {}".format(alert_code, count))
+
+        return '\n'.join(lines)
+
+
+class AlerterReplayEngine:
+    """
+    Drives an alerter with recorded messages outside the live pipeline. The
+    alerter must have been created with a ReplayRabbitMQApi, so that the
+    messages are given to it directly and the alerts it publishes are
+    collected in memory. The times used by the alerting state are taken from
+    a simulated clock which is moved to the time each message was monitored
+    at, so that a recording is replayed as fast as the alerter can process it.
+    """
+
+    def __init__(self, alerter: Alerter,
+                 clock: Optional[SimulatedClock] = None) -> None:
+        if not isinstance(alerter.rabbitmq, ReplayRabbitMQApi):
+            raise ValueError(
+                "{} must be created with a {} to be replayed".format(
+                    alerter, ReplayRabbitMQApi.__name__))
+
+        self._alerter = alerter
+        self._clock = clock if clock is not None else SimulatedClock()
+
+    @property
+    def alerter(self) -> Alerter:
+        return self._alerter
+
+    @property
+    def clock(self) -> SimulatedClock:
+        return self._clock
+
+    def _collect_alerts(self) -> List[Dict]:
+        rabbitmq: ReplayRabbitMQApi = self._alerter.rabbitmq
+        alerts = []
+        for message in rabbitmq.published:
+            if message['exchange'] == ALERT_EXCHANGE:
+                alerts.extend(message['body'].get('alerts', []))
+        rabbitmq.clear_published()
+
+        return alerts
+
+    def replay(self, records: Iterable[Dict]) -> ReplayReport:
+        """
+        Gives the recorded messages to the alerter in order, and reports the
+        alerts raised and how long each data message took to evaluate.
+        :param records: The recorded messages, as returned by load_records
+        :return: The report of the replay
+        """
+        report = ReplayReport()
+        properties = pika.spec.BasicProperties()
+
+        set_time_source(self._clock.now)
+        start = time.perf_counter()
+        try:
+            for delivery_tag, record in enumerate(records, start=1):
+                routing_key = record['routing_key']
+                body = record['body']
+                is_config = 'alerts_config' in routing_key
+
+                timestamp = None if is_config else _data_timestamp(body)
+                if timestamp is not None:
+                    self._clock.set_time(timestamp)
+
+                method = pika.spec.Basic.Deliver(delivery_tag=delivery_tag,
+                                                 routing_key=routing_key)
+                encoded_body = json.dumps(body).encode()
+
+                evaluation_start = time.perf_counter()
+                self._alerter._process_data(None, method, properties,
+                                            encoded_body)
+                latency = time.perf_counter() - evaluation_start
+
+                if is_config:
+                    report.add_config()
+                else:
+                    report.add_latency(latency)
+                report.add_alerts(self._collect_alerts())
+        finally:
+            set_time_source(None)
+            report.set_total_time(time.perf_counter() - start)
+
+        return report
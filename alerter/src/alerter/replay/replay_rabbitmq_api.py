@@ -0,0 +1,49 @@
+import logging
+from typing import Union, Dict, List, Optional
+
+import pika
+
+from src.message_broker.rabbitmq import RabbitMQApi
+
+
+class ReplayRabbitMQApi(RabbitMQApi):
+    """
+    A RabbitMQApi which never connects to RabbitMQ, used to drive an alerter
+    with recorded data. Acknowledgements are ignored, and published messages
+    are kept in memory until they are collected by the replay engine.
+    """
+
+    def __init__(self, logger: logging.Logger) -> None:
+        super().__init__(logger)
+
+        self._published: List[Dict] = []
+
+    @property
+    def published(self) -> List[Dict]:
+        return self._published
+
+    def clear_published(self) -> None:
+        self._published = []
+
+    def basic_ack(self, delivery_tag: int = 0, multiple: bool = False) \
+            -> Optional[int]:
+        return None
+
+    def basic_publish(self, exchange: str, routing_key: str,
+                      body: Union[str, Dict, bytes], is_body_dict: bool = False,
+                      properties: pika.spec.BasicProperties = None,
+                      mandatory: bool = False) -> Optional[int]:
+        self._published.append({
+            'exchange': exchange,
+            'routing_key': routing_key,
+            'body': body,
+        })
+        return None
+
+    def basic_publish_confirm(self, exchange: str, routing_key: str,
+                              body: Union[str, Dict, bytes],
+                              is_body_dict: bool = False,
+                              properties: pika.spec.BasicProperties = None,
+                              mandatory: bool = False) -> Optional[int]:
+        return self.basic_publish(exchange, routing_key, body, is_body_dict,
+                                  properties, mandatory)
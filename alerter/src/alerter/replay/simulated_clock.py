@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import Optional, Union
+
+
+class SimulatedClock:
+    """
+    A clock which is moved by the replay engine instead of following the
+    system clock, so that recorded data can be replayed as fast as possible
+    while the alerters still see the time at which the data was recorded.
+    The clock never goes back, so data recorded out of order does not move
+    the time of the alerters backwards.
+    """
+
+    def __init__(self, start_time: Optional[float] = None) -> None:
+        self._time = start_time if start_time is not None else 0.0
+
+    @property
+    def time(self) -> float:
+        return self._time
+
+    def now(self) -> float:
+        return self._time
+
+    def now_datetime(self) -> datetime:
+        return datetime.fromtimestamp(self._time)
+
+    def set_time(self, time: Union[datetime, float]) -> None:
+        if isinstance(time, datetime):
+            time = time.timestamp()
+
+        self._time = max(self._time, float(time))
+
+    def advance(self, seconds: float) -> None:
+        self._time += max(seconds, 0.0)
@@ -1,9 +1,17 @@
 import smtplib
+import time
 from datetime import datetime
 from email.message import EmailMessage, Message
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Optional
+from typing import List, Optional, Union
+
+from src.utils.constants.channels import (EMAIL_SMTP_TIMEOUT_SECONDS,
+                                          EMAIL_SMTP_SESSION_MAX_IDLE_SECONDS)
+
+# Errors which mean that the SMTP session was lost rather than that the email
+# was refused, so that it can be sent again over a new session
+_DISCONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError)
 
 
 class EmailApi:
@@ -21,21 +29,32 @@ class EmailApi:
         self._password = password
         self._port = port
 
-    def send_email(self, subject: str, message: str, to: str) -> None:
+        # An authenticated session is kept open and re-used across emails
+        self._session: Optional[smtplib.SMTP] = None
+        self._session_last_used = 0.0
+
+    @staticmethod
+    def _format_to(to: Union[str, List[str]]) -> str:
+        return to if isinstance(to, str) else ', '.join(to)
+
+    def send_email(self, subject: str, message: str,
+                   to: Union[str, List[str]]) -> None:
         msg = EmailMessage()
         msg.set_content("{}\nDate - {}".format(message, datetime.now()))
 
         msg['Subject'] = subject
         msg['From'] = self._sender
-        msg['To'] = to
+        msg['To'] = self._format_to(to)
 
         # Send the message via the specified SMTP server.
         self._send_smtp(msg)
 
     def send_email_with_html(self, subject: str, html_message: str,
-                             plain_message: str, to: str) -> None:
+                             plain_message: str,
+                             to: Union[str, List[str]]) -> None:
         """
-        <head> and <body> tags will be included here
+        <head> and <body> tags will be included here. If multiple recipients
+        are given, a single email is sent to all of them.
         """
         html_wrapper = """\
         <html>
@@ -50,7 +69,7 @@ class EmailApi:
 
         msg['Subject'] = subject
         msg['From'] = self._sender
-        msg['To'] = to
+        msg['To'] = self._format_to(to)
 
         # Record the MIME types of both parts - text/plain and text/html.
         part1 = MIMEText("{}\nDate - {}".format(plain_message, datetime.now()),
@@ -67,12 +86,50 @@ class EmailApi:
 
         self._send_smtp(msg)
 
+    def _connect(self) -> None:
+        session = smtplib.SMTP(self._smtp, self._port,
+                               timeout=EMAIL_SMTP_TIMEOUT_SECONDS)
+        try:
+            if None not in [self._username, self._password] \
+                    and len(self._username) != 0:
+                session.starttls()
+                session.login(self._username, self._password)
+        except Exception:
+            session.close()
+            raise
+
+        self._session = session
+
+    def close(self) -> None:
+        if self._session is None:
+            return
+
+        try:
+            self._session.quit()
+        except (smtplib.SMTPException, OSError):
+            # The session may have already been closed by the server
+            self._session.close()
+        finally:
+            self._session = None
+
     def _send_smtp(self, msg: Message) -> None:
-        # Send the message via the specified SMTP server.
-        s = smtplib.SMTP(self._smtp, self._port)
-        if None not in [self._username, self._password] \
-                and len(self._username) != 0:
-            s.starttls()
-            s.login(self._username, self._password)
-        s.send_message(msg)
-        s.quit()
+        # Send the message via the specified SMTP server. The open session is
+        # used if there is one, and if the server dropped it the message is
+        # sent again once over a new session.
+        if self._session is not None and time.monotonic() - \
+                self._session_last_used > EMAIL_SMTP_SESSION_MAX_IDLE_SECONDS:
+            self.close()
+
+        while True:
+            new_session = self._session is None
+            if new_session:
+                self._connect()
+
+            try:
+                self._session.send_message(msg)
+                self._session_last_used = time.monotonic()
+                return
+            except _DISCONNECTION_ERRORS:
+                self.close()
+                if new_session:
+                    raise
@@ -36,17 +36,22 @@ class OpsgenieApi:
         )
         return self._alert_api.create_alert(create_alert_payload=payload)
 
-    def close_alert(self, alert_id: str) -> Optional[SuccessResponse]:
+    # The identifier_type may be 'id', 'tiny' or 'alias'
+    def close_alert(self, alert_id: str, identifier_type: str = 'id') \
+            -> Optional[SuccessResponse]:
         payload = opsgenie_sdk.CloseAlertPayload()
         return self._alert_api.close_alert(identifier=alert_id,
+                                           identifier_type=identifier_type,
                                            close_alert_payload=payload)
 
-    def update_severity(self, severity: OpsgenieSeverities, alert_id: str) \
+    def update_severity(self, severity: OpsgenieSeverities, alert_id: str,
+                        identifier_type: str = 'id') \
             -> Optional[SuccessResponse]:
         payload = opsgenie_sdk.UpdateAlertPriorityPayload(
             priority=severity.value)
         return self._alert_api.update_alert_priority(
-            identifier=alert_id, update_alert_priority_payload=payload)
+            identifier=alert_id, identifier_type=identifier_type,
+            update_alert_priority_payload=payload)
 
     def update_message(self, message: str, alert_id: str) \
             -> Optional[SuccessResponse]:
@@ -0,0 +1,131 @@
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from src.utils.constants.channels import MESSAGE_PACING_MAX_WAIT_SECONDS
+
+
+class TokenBucket:
+    """
+    A token bucket which refills at `rate` tokens per second up to `capacity`
+    tokens. A bucket can also be held empty for a while, which is used when a
+    platform asks us to retry after some time. A bucket may be shared by the
+    threads of several pacers, so its state is only changed under its lock. A
+    token taken by another thread between a check and a consume leaves the
+    bucket in debt, which the next wait accounts for.
+    """
+    __slots__ = ('_rate', '_capacity', '_tokens', '_last_refill',
+                 '_held_until', '_lock')
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        if rate <= 0 or capacity < 1:
+            raise ValueError("A token bucket needs a positive rate and a "
+                             "capacity of at least 1, got {} and {}".format(
+                                 rate, capacity))
+
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._held_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def capacity(self) -> float:
+        return self._capacity
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self._last_refill, 0)
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._last_refill = now
+
+    def seconds_until_available(self, now: float = None) -> float:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._refill(now)
+            wait = 0 if self._tokens >= 1 else (1 - self._tokens) / self._rate
+            return max(wait, self._held_until - now, 0)
+
+    def consume(self, now: float = None) -> None:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._refill(now)
+            self._tokens -= 1
+
+    def hold(self, seconds: float, now: float = None) -> None:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._refill(now)
+            self._tokens = min(self._tokens, 0)
+            self._held_until = max(self._held_until, now + seconds)
+
+
+class MessagePacer:
+    """
+    This class paces the messages sent by a bot to a chat so that they stay
+    within the platform's rate limits. A bot is paced across all its chats by a
+    bucket which is shared by every pacer of that bot within the process, and
+    each chat is paced by its own bucket. Sending waits for both buckets for at
+    most `max_wait` seconds, so that throughput stays at the platform's limit
+    without stalling the caller behind a long `retry_after`.
+    """
+    _bot_buckets: Dict[Tuple[str, str], TokenBucket] = {}
+    _bot_buckets_lock = threading.Lock()
+
+    def __init__(self, platform: str, bot_id: str, bot_rate: float,
+                 bot_burst: float, chat_rate: float, chat_burst: float,
+                 max_wait: float = MESSAGE_PACING_MAX_WAIT_SECONDS) -> None:
+        with MessagePacer._bot_buckets_lock:
+            bot_key = (platform, bot_id)
+            if bot_key not in MessagePacer._bot_buckets:
+                MessagePacer._bot_buckets[bot_key] = TokenBucket(bot_rate,
+                                                                 bot_burst)
+            self._bot_bucket = MessagePacer._bot_buckets[bot_key]
+
+        self._chat_bucket = TokenBucket(chat_rate, chat_burst)
+        self._max_wait = max_wait
+
+    @property
+    def max_wait(self) -> float:
+        return self._max_wait
+
+    def seconds_until_available(self) -> float:
+        now = time.monotonic()
+        return max(self._bot_bucket.seconds_until_available(now),
+                   self._chat_bucket.seconds_until_available(now))
+
+    def acquire(self) -> Optional[float]:
+        """
+        Waits until a message can be sent, if this is within max_wait seconds,
+        and takes a token for it.
+        :return: None if the message can be sent
+               : The number of seconds until a message can be sent otherwise
+        """
+        wait = self.seconds_until_available()
+        if wait > self._max_wait:
+            return wait
+
+        if wait > 0:
+            time.sleep(wait)
+
+        now = time.monotonic()
+        self._bot_bucket.consume(now)
+        self._chat_bucket.consume(now)
+        return None
+
+    def rate_limited(self, retry_after: float) -> None:
+        """
+        Stops sending for `retry_after` seconds after the platform rejected a
+        message for exceeding its rate limits. Since it is not known whether
+        the bot or the chat limit was hit, both are held.
+        :param retry_after: The number of seconds to wait, as given by the
+                          : platform
+        :return: None
+        """
+        now = time.monotonic()
+        self._bot_bucket.hold(retry_after, now)
+        self._chat_bucket.hold(retry_after, now)
@@ -17,3 +17,8 @@ class PagerDutyApi:
             summary=alert_message, source=origin, dedup_key=dedup_key,
             severity=severity.value, payload={
                 'timestamp': datetime.fromtimestamp(timestamp).isoformat()})
+
+    # This method returns the dedup key. Exceptions must be handled by the
+    # caller
+    def resolve(self, dedup_key: str) -> str:
+        return self._session.resolve(dedup_key)
@@ -1,7 +1,17 @@
+import math
+
 from slack_bolt import App
 from slack_bolt.error import BoltError
+from slack_sdk.errors import SlackApiError
 from slack_sdk.web import SlackResponse
 
+from src.channels_manager.apis.pacer import MessagePacer
+from src.utils.constants.channels import (
+    SLACK_BOT_MESSAGES_PER_SECOND, SLACK_BOT_MESSAGES_BURST,
+    SLACK_CHANNEL_MESSAGES_PER_SECOND, SLACK_CHANNEL_MESSAGES_BURST)
+
+_TOO_MANY_REQUESTS = 429
+
 
 class SlackBotApi:
     def __init__(self, bot_token: str, app_token: str, bot_channel_id: str) \
@@ -10,6 +20,10 @@ class SlackBotApi:
         self._app_token = app_token
         self._bot_channel_id = bot_channel_id
         self._app = None
+        self._pacer = MessagePacer(
+            'slack', bot_token, SLACK_BOT_MESSAGES_PER_SECOND,
+            SLACK_BOT_MESSAGES_BURST, SLACK_CHANNEL_MESSAGES_PER_SECOND,
+            SLACK_CHANNEL_MESSAGES_BURST)
 
     @property
     def bot_token(self) -> str:
@@ -46,5 +60,26 @@ class SlackBotApi:
                     status_code=500,
                 )
 
-        return self._app.client.chat_postMessage(channel=self.bot_channel_id,
-                                                 text=message)
+        # If the message cannot be sent soon enough, it is reported as rate
+        # limited the same way Slack would, without performing the request
+        wait = self._pacer.acquire()
+        if wait is not None:
+            retry_after = str(math.ceil(wait))
+            return SlackResponse(
+                client=None,
+                http_verb="POST",
+                api_url='',
+                req_args={},
+                data={'ok': False, 'error': 'ratelimited'},
+                headers={'Retry-After': retry_after},
+                status_code=_TOO_MANY_REQUESTS,
+            )
+
+        try:
+            return self._app.client.chat_postMessage(
+                channel=self.bot_channel_id, text=message)
+        except SlackApiError as e:
+            if e.response.status_code == _TOO_MANY_REQUESTS:
+                self._pacer.rate_limited(
+                    int(e.response.headers.get('Retry-After', 1)))
+            raise e
@@ -1,7 +1,15 @@
+import math
 from typing import Optional, Dict
 
 import requests
 
+from src.channels_manager.apis.pacer import MessagePacer
+from src.utils.constants.channels import (
+    TELEGRAM_BOT_MESSAGES_PER_SECOND, TELEGRAM_BOT_MESSAGES_BURST,
+    TELEGRAM_CHAT_MESSAGES_PER_SECOND, TELEGRAM_CHAT_MESSAGES_BURST)
+
+_TOO_MANY_REQUESTS = 429
+
 
 class TelegramBotApi:
     def __init__(self, bot_token: str, bot_chat_id: Optional[str]) -> None:
@@ -10,6 +18,13 @@ class TelegramBotApi:
 
         self._base_url = "https://api.telegram.org/bot" + bot_token
 
+        # Connections are kept alive and re-used across requests
+        self._session = requests.Session()
+        self._pacer = MessagePacer(
+            'telegram', bot_token, TELEGRAM_BOT_MESSAGES_PER_SECOND,
+            TELEGRAM_BOT_MESSAGES_BURST, TELEGRAM_CHAT_MESSAGES_PER_SECOND,
+            TELEGRAM_CHAT_MESSAGES_BURST)
+
     @property
     def bot_token(self) -> str:
         return self._bot_token
@@ -19,18 +34,35 @@ class TelegramBotApi:
         return self._bot_chat_id
 
     def send_message(self, message: str) -> Dict:
+        # If the message cannot be sent soon enough, it is reported as rate
+        # limited the same way Telegram would, without performing the request
+        wait = self._pacer.acquire()
+        if wait is not None:
+            retry_after = math.ceil(wait)
+            return {
+                'ok': False,
+                'error_code': _TOO_MANY_REQUESTS,
+                'description': 'Too Many Requests: retry after {}'.format(
+                    retry_after),
+                'parameters': {'retry_after': retry_after}
+            }
+
         data = {
             'chat_id': self.bot_chat_id,
             'text': message,
             'parse_mode': "Markdown"
         }
-        return requests.get(self._base_url + "/sendMessage", data=data,
-                            timeout=10, headers={'Connection': 'close'}).json()
+        ret = self._session.get(self._base_url + "/sendMessage", data=data,
+                                timeout=10).json()
+        if not ret.get('ok') and ret.get('error_code') == _TOO_MANY_REQUESTS:
+            self._pacer.rate_limited(
+                ret.get('parameters', {}).get('retry_after', 1))
+
+        return ret
 
     def get_updates(self) -> Dict:
-        return requests.get(self._base_url + "/getUpdates", timeout=10,
-                            headers={'Connection': 'close'}).json()
+        return self._session.get(self._base_url + "/getUpdates",
+                                 timeout=10).json()
 
     def get_me(self) -> Dict:
-        return requests.get(self._base_url + "/getMe", timeout=10,
-                            headers={'Connection': 'close'}).json()
+        return self._session.get(self._base_url + "/getMe", timeout=10).json()
@@ -1,12 +1,15 @@
 import logging
 from datetime import datetime
-from typing import List
+from typing import List, Tuple
 
 from src.alerter.alerts.alert import Alert
 from src.channels_manager.apis.email_api import EmailApi
 from src.channels_manager.channels.channel import Channel
-from src.utils.constants.channels import (EMAIL_TEXT_TEMPLATE,
-                                          EMAIL_HTML_TEMPLATE)
+from src.channels_manager.digest import AlertDigest
+from src.utils.constants.channels import (
+    EMAIL_TEXT_TEMPLATE, EMAIL_HTML_TEMPLATE, EMAIL_DIGEST_HTML_TEMPLATE,
+    EMAIL_DIGEST_HTML_ROW_TEMPLATE, EMAIL_DIGEST_TEXT_TEMPLATE,
+    EMAIL_DIGEST_TEXT_ROW_TEMPLATE)
 from src.utils.data import RequestStatus
 
 
@@ -19,31 +22,58 @@ class EmailChannel(Channel):
         self._emails_to = emails_to
         self._email_api = email_api
 
+    @staticmethod
+    def _format_digest(digest: AlertDigest) -> Tuple[str, str, str]:
+        subject = "PANIC {} digest: {} alerts".format(digest.severity,
+                                                      len(digest.alerts))
+        html_rows = []
+        plain_rows = []
+        for alert in digest.alerts:
+            row_fields = {
+                'date_time': datetime.fromtimestamp(alert.timestamp),
+                'alert_code': alert.alert_code.value,
+                'message': alert.message,
+                'origin_id': alert.origin_id
+            }
+            html_rows.append(EMAIL_DIGEST_HTML_ROW_TEMPLATE.format(
+                **row_fields))
+            plain_rows.append(EMAIL_DIGEST_TEXT_ROW_TEMPLATE.format(
+                **row_fields))
+
+        html_email_message = EMAIL_DIGEST_HTML_TEMPLATE.format(
+            no_of_alerts=len(digest.alerts), severity=digest.severity,
+            parent_id=digest.parent_id, rows='\n'.join(html_rows))
+        plain_email_message = EMAIL_DIGEST_TEXT_TEMPLATE.format(
+            no_of_alerts=len(digest.alerts), severity=digest.severity,
+            parent_id=digest.parent_id, rows='\n'.join(plain_rows))
+        return subject, html_email_message, plain_email_message
+
     def alert(self, alert: Alert) -> RequestStatus:
-        subject = "PANIC {}".format(alert.severity)
-        html_email_message = EMAIL_HTML_TEMPLATE.format(
-            alert_code=alert.alert_code.value, severity=alert.severity,
-            message=alert.message,
-            date_time=datetime.fromtimestamp(alert.timestamp),
-            parent_id=alert.parent_id, origin_id=alert.origin_id
-        )
-        plain_email_message = EMAIL_TEXT_TEMPLATE.format(
-            alert_code=alert.alert_code.value, severity=alert.severity,
-            message=alert.message,
-            date_time=datetime.fromtimestamp(alert.timestamp),
-            parent_id=alert.parent_id, origin_id=alert.origin_id
-        )
+        if isinstance(alert, AlertDigest):
+            subject, html_email_message, plain_email_message = \
+                self._format_digest(alert)
+        else:
+            subject = "PANIC {}".format(alert.severity)
+            html_email_message = EMAIL_HTML_TEMPLATE.format(
+                alert_code=alert.alert_code.value, severity=alert.severity,
+                message=alert.message,
+                date_time=datetime.fromtimestamp(alert.timestamp),
+                parent_id=alert.parent_id, origin_id=alert.origin_id
+            )
+            plain_email_message = EMAIL_TEXT_TEMPLATE.format(
+                alert_code=alert.alert_code.value, severity=alert.severity,
+                message=alert.message,
+                date_time=datetime.fromtimestamp(alert.timestamp),
+                parent_id=alert.parent_id, origin_id=alert.origin_id
+            )
         self._logger.debug("Formatted email template")
         self._logger.debug("Sending alert to the channel's destination emails")
         self._logger.debug("Destination Emails: %s",
                            self._emails_to)
         try:
-            for to_address in self._emails_to:
-                self._logger.debug("Sending alert to %s", to_address)
-                self._email_api.send_email_with_html(
-                    subject, html_email_message, plain_email_message,
-                    to_address)
-                self._logger.debug("Sent alert to %s", to_address)
+            self._email_api.send_email_with_html(
+                subject, html_email_message, plain_email_message,
+                self._emails_to)
             self._logger.debug("Sent alert to all the emails in the channel")
             return RequestStatus.SUCCESS
         except Exception as e:
@@ -5,36 +5,63 @@ from opsgenie_sdk import SuccessResponse
 from src.alerter.alerts.alert import Alert
 from src.channels_manager.apis.opsgenie_api import OpsgenieApi
 from src.channels_manager.channels import Channel
+from src.channels_manager.incidents import IncidentTracker
 from src.utils.data import RequestStatus
 from src.utils.types import OpsgenieSeverities
 
 
 class OpsgenieChannel(Channel):
     def __init__(self, channel_name: str, channel_id: str,
-                 logger: logging.Logger, opsgenie_api: OpsgenieApi):
+                 logger: logging.Logger, opsgenie_api: OpsgenieApi,
+                 coalescing_window: float = 0):
         super().__init__(channel_name, channel_id, logger)
         self._opsgenie_api = opsgenie_api
+        self._incidents = IncidentTracker(coalescing_window)
 
     def alert(self, alert: Alert) -> RequestStatus:
+        if self._incidents.should_coalesce(alert):
+            self.logger.debug("Coalesced %s into its OpsGenie alert on "
+                              "channel %s", alert.alert_code.name,
+                              self.__str__())
+            return RequestStatus.SUCCESS
+
         severity = {
             "critical": OpsgenieSeverities.CRITICAL,
             "error": OpsgenieSeverities.ERROR,
             "warning": OpsgenieSeverities.WARNING,
             "info": OpsgenieSeverities.INFO,
         }.get(alert.severity.lower(), OpsgenieSeverities.INFO)
+        alias = IncidentTracker.incident_key(alert)
+        open_severity = self._incidents.open_severity(alert)
 
         try:
-            response = self._opsgenie_api.create_alert(
-                "PANIC - {}".format(alert.alert_code.name), alert.message,
-                severity, alert.origin_id, alert.timestamp,
-                alias=alert.alert_code.value
-            )
+            # Opsgenie de-duplicates alerts which are created with the alias
+            # of an open alert without changing their priority, therefore
+            # severity changes are sent as priority updates.
+            if IncidentTracker.solves_incident(alert):
+                if open_severity is not None:
+                    response = self._opsgenie_api.close_alert(
+                        alias, identifier_type='alias')
+                else:
+                    response = self._opsgenie_api.create_alert(
+                        "PANIC - {}".format(alert.alert_code.name),
+                        alert.message, severity, alert.origin_id,
+                        alert.timestamp, alias=alert.alert_code.value)
+            elif open_severity not in [None, alert.severity]:
+                response = self._opsgenie_api.update_severity(
+                    severity, alias, identifier_type='alias')
+            else:
+                response = self._opsgenie_api.create_alert(
+                    "PANIC - {}".format(alert.alert_code.name),
+                    alert.message, severity, alert.origin_id,
+                    alert.timestamp, alias=alias)
             self.logger.info(
                 "Sent %s to OpsGenie channel %s, received response %s",
                 alert.alert_code.name, self.__str__(), response
             )
 
             if type(response) == SuccessResponse:
+                self._incidents.record(alert)
                 return RequestStatus.SUCCESS
             else:
                 return RequestStatus.FAILED
@@ -3,25 +3,43 @@ import logging
 from src.alerter.alerts.alert import Alert
 from src.channels_manager.apis.pagerduty_api import PagerDutyApi
 from src.channels_manager.channels import Channel
+from src.channels_manager.incidents import IncidentTracker
 from src.utils.data import RequestStatus
 from src.utils.types import PagerDutySeverities
 
 
 class PagerDutyChannel(Channel):
     def __init__(self, channel_name: str, channel_id: str,
-                 logger: logging.Logger, pagerduty_api: PagerDutyApi):
+                 logger: logging.Logger, pagerduty_api: PagerDutyApi,
+                 coalescing_window: float = 0) -> None:
         super().__init__(channel_name, channel_id, logger)
 
         self._pager_duty_api = pagerduty_api
+        self._incidents = IncidentTracker(coalescing_window)
 
     def alert(self, alert: Alert) -> RequestStatus:
+        if self._incidents.should_coalesce(alert):
+            self.logger.debug("Coalesced %s into its PagerDuty incident on "
+                              "channel %s", alert.alert_code.name,
+                              self.__str__())
+            return RequestStatus.SUCCESS
+
         severity = PagerDutySeverities(alert.severity.lower())
+        dedup_key = IncidentTracker.incident_key(alert)
 
         try:
-            self._pager_duty_api.trigger(alert.message, severity,
-                                         alert.origin_id, alert.timestamp)
+            if not IncidentTracker.solves_incident(alert):
+                self._pager_duty_api.trigger(alert.message, severity,
+                                             alert.origin_id, alert.timestamp,
+                                             dedup_key)
+            elif self._incidents.is_open(alert):
+                self._pager_duty_api.resolve(dedup_key)
+            else:
+                self._pager_duty_api.trigger(alert.message, severity,
+                                             alert.origin_id, alert.timestamp)
             self.logger.info("Sent %s to PagerDuty channel %s",
                              alert.alert_code.name, self.__str__())
+            self._incidents.record(alert)
             return RequestStatus.SUCCESS
         except Exception as e:
             self.logger.error("Error when sending %s to PagerDuty channel %s",
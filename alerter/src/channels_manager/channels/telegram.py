@@ -3,6 +3,8 @@ import logging
 from src.alerter.alerts.alert import Alert
 from src.channels_manager.apis.telegram_bot_api import TelegramBotApi
 from src.channels_manager.channels.channel import Channel
+from src.channels_manager.digest import AlertDigest, format_digest
+from src.utils.constants.channels import TELEGRAM_MESSAGE_MAX_LENGTH
 from src.utils.data import RequestStatus
 
 
@@ -18,11 +20,21 @@ class TelegramChannel(Channel):
     def telegram_bot(self) -> TelegramBotApi:
         return self._telegram_bot
 
+    @staticmethod
+    def _format_alert(subject: str, alert: Alert) -> str:
+        if isinstance(alert, AlertDigest):
+            return format_digest(
+                '*{}*: {} alerts for `{}`'.format(
+                    subject, len(alert.alerts), alert.parent_id),
+                alert, '`{}`', TELEGRAM_MESSAGE_MAX_LENGTH)
+
+        return '*{}*: `{}`'.format(subject, alert.message)
+
     def alert(self, alert: Alert) -> RequestStatus:
         subject = "PANIC {}".format(alert.severity.upper())
         try:
-            ret = self._telegram_bot.send_message('*{}*: `{}`'.format(
-                subject, alert.message))
+            ret = self._telegram_bot.send_message(
+                self._format_alert(subject, alert))
             self.logger.debug("alert: telegram_ret: %s", ret)
             if ret['ok']:
                 self.logger.info("Sent %s to Telegram channel %s.",
@@ -164,9 +164,10 @@ class SlackCommandHandlers(CommandHandler):
 
         mute_alerter_key = Keys.get_alerter_mute()
         all_chains_muted_severities = []
-        if self.redis.exists_unsafe(mute_alerter_key):
-            muted_severities = json.loads(self.redis.get_unsafe(
-                mute_alerter_key).decode())
+        alerter_mute = self.redis.get_multiple_unsafe(
+            [mute_alerter_key])[mute_alerter_key]
+        if alerter_mute is not None:
+            muted_severities = json.loads(alerter_mute.decode())
             for severity, severity_muted in muted_severities.items():
                 if severity_muted:
                     all_chains_muted_severities.append(severity)
@@ -178,12 +179,16 @@ class SlackCommandHandlers(CommandHandler):
 
         associated_chains = self.associated_chains
 
+        # The mute status of every chain is read in a single round trip
+        chain_hashes = {chain_id: Keys.get_hash_parent(chain_id)
+                        for chain_id in associated_chains}
+        chains_mute = self.redis.hget_from_hashes_unsafe(
+            list(chain_hashes.values()), Keys.get_chain_mute_alerts())
+
         for chain_id, chain_name in associated_chains.items():
-            chain_hash = Keys.get_hash_parent(chain_id)
-            mute_alerts_key = Keys.get_chain_mute_alerts()
-            if self.redis.hexists_unsafe(chain_hash, mute_alerts_key):
-                muted_severities = json.loads(self.redis.hget_unsafe(
-                    chain_hash, mute_alerts_key).decode())
+            chain_mute = chains_mute[chain_hashes[chain_id]]
+            if chain_mute is not None:
+                muted_severities = json.loads(chain_mute.decode())
                 chain_muted_severities = []
                 for severity, severity_muted in muted_severities.items():
                     if severity_muted:
@@ -303,13 +308,15 @@ class SlackCommandHandlers(CommandHandler):
             (CHANNELS_MANAGER_NAME, "self._get_manager_component_hb_status"),
         ]
 
+        # The heartbeats of all the components are read in a single round
+        # trip
+        heartbeats = self.redis.get_multiple_unsafe(
+            [Keys.get_component_heartbeat(config[0]) for config in configs])
+
         for config in configs:
-            component_hb_key = Keys.get_component_heartbeat(
-                config[0])
-            if self.redis.exists_unsafe(component_hb_key):
-                component_hb = json.loads(
-                    self.redis.get_unsafe(component_hb_key).decode())
-                status += eval(config[1])(component_hb)
+            component_hb = heartbeats[Keys.get_component_heartbeat(config[0])]
+            if component_hb is not None:
+                status += eval(config[1])(json.loads(component_hb.decode()))
             else:
                 status += "- *{}*: {} - No heartbeats yet.\n" \
                     .format(config[0],
@@ -330,10 +337,12 @@ class SlackCommandHandlers(CommandHandler):
             HEARTBEAT_HANDLER_NAME)
         key_ping_publisher_hb = Keys.get_component_heartbeat(
             PING_PUBLISHER_NAME)
+        heartbeats = self.redis.get_multiple_unsafe(
+            [key_heartbeat_handler_hb, key_ping_publisher_hb])
 
-        if self.redis.exists_unsafe(key_heartbeat_handler_hb):
+        if heartbeats[key_heartbeat_handler_hb] is not None:
             heartbeat_handler_hb = json.loads(
-                self.redis.get_unsafe(key_heartbeat_handler_hb).decode())
+                heartbeats[key_heartbeat_handler_hb].decode())
             hb_timestamp = heartbeat_handler_hb['timestamp']
 
             current_timestamp = datetime.now().timestamp()
@@ -357,9 +366,9 @@ class SlackCommandHandlers(CommandHandler):
                                       self._get_running_icon(False))
             problems_in_checker = True
 
-        if self.redis.exists_unsafe(key_ping_publisher_hb):
+        if heartbeats[key_ping_publisher_hb] is not None:
             ping_publisher_hb = json.loads(
-                self.redis.get_unsafe(key_ping_publisher_hb).decode())
+                heartbeats[key_ping_publisher_hb].decode())
             hb_timestamp = ping_publisher_hb['timestamp']
 
             current_timestamp = datetime.now().timestamp()
@@ -581,6 +590,8 @@ class SlackCommandHandlers(CommandHandler):
 
                 self.redis.hset_unsafe(chain_hash, mute_alerts_key,
                                        json.dumps(severities_muted))
+                self.redis.sadd_unsafe(Keys.get_set_chain_hashes(),
+                                       chain_hash)
                 self.logger.info("Successfully muted %s alerts.", chain_name)
             except (RedisError, ConnectionResetError) as e:
                 self.logger.exception(e)
@@ -752,9 +763,8 @@ class SlackCommandHandlers(CommandHandler):
 
         try:
             # We must unmute severities which are muted for specific chains
-            parent_hash = Keys.get_hash_parent_raw()
-            chain_hashes_list = self.redis.get_keys_unsafe(
-                '*' + parent_hash + '*')
+            chain_hashes_list = self.redis.smembers_unsafe(
+                Keys.get_set_chain_hashes())
 
             for chain_hash in chain_hashes_list:
                 mute_alerts_key = Keys.get_chain_mute_alerts()
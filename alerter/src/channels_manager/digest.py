@@ -0,0 +1,118 @@
+from typing import Dict, List, Tuple
+
+from src.alerter.alert_severities import Severity
+from src.alerter.alerts.alert import Alert
+
+
+class AlertDigest(Alert):
+    """
+    An alert grouping the alerts of one chain and severity which were raised
+    within a digest window, so that they are sent as a single message. The
+    digest takes the alert code and metric of its first alert, and the
+    timestamp of its latest alert so that it is considered valid for as long
+    as its latest alert is.
+    """
+
+    def __init__(self, alerts: List[Alert]) -> None:
+        first_alert = alerts[0]
+        super().__init__(
+            first_alert.alert_code,
+            '\n'.join(alert.message for alert in alerts),
+            first_alert.severity, max(alert.timestamp for alert in alerts),
+            first_alert.parent_id, first_alert.parent_id,
+            first_alert.alert_group_metric_code, [])
+
+        self._alerts = alerts
+
+    @property
+    def alerts(self) -> List[Alert]:
+        return self._alerts
+
+
+class AlertDigester:
+    """
+    This class buffers the alerts received by a channel handler within a
+    window of `window` seconds, and groups them by chain and severity when the
+    window is flushed. Critical alerts are never buffered, and a window of 0
+    disables digests.
+    """
+
+    def __init__(self, window: float) -> None:
+        self._window = window
+        self._buffer: Dict[Tuple[str, str], List[Alert]] = {}
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    @property
+    def enabled(self) -> bool:
+        return self._window > 0
+
+    @property
+    def no_of_buffered_alerts(self) -> int:
+        return sum(len(alerts) for alerts in self._buffer.values())
+
+    def should_buffer(self, alert: Alert) -> bool:
+        return self.enabled and alert.severity != Severity.CRITICAL.value
+
+    def add(self, alert: Alert) -> None:
+        self._buffer.setdefault((alert.parent_id, alert.severity), []).append(
+            alert)
+
+    def _flush_groups(self, keys: List[Tuple[str, str]]) -> List[Alert]:
+        grouped_alerts = []
+        for key in keys:
+            alerts = self._buffer.pop(key)
+            grouped_alerts.append(
+                alerts[0] if len(alerts) == 1 else AlertDigest(alerts))
+        return grouped_alerts
+
+    def flush(self) -> List[Alert]:
+        """
+        Empties the buffer.
+        :return: A digest for every chain and severity with buffered alerts,
+               : in the order the groups were first added to. Groups with a
+               : single alert return the alert itself.
+        """
+        return self._flush_groups(list(self._buffer))
+
+    def flush_chain(self, parent_id: str) -> List[Alert]:
+        """
+        Removes the alerts of a chain from the buffer. This must be done before
+        a critical alert of the chain is sent, as it skips the buffer and would
+        otherwise be sent before alerts which were raised earlier.
+        :param parent_id: The id of the chain
+        :return: The digests of the chain, as returned by flush
+        """
+        return self._flush_groups([key for key in self._buffer
+                                   if key[0] == parent_id])
+
+
+_DIGEST_SUMMARY_TEMPLATE = "\n... and {} more alerts"
+
+
+def format_digest(header: str, digest: AlertDigest, line_template: str,
+                  max_length: int) -> str:
+    """
+    Formats a digest as a header followed by a line for each alert. The alerts
+    which do not fit within max_length characters are summarised by a last
+    line stating how many were left out.
+    :param header: The first line of the message
+    :param digest: The digest to be formatted
+    :param line_template: The template of the line of an alert, which is
+                        : formatted with the alert's message
+    :param max_length: The maximum length of the message
+    :return: The formatted message
+    """
+    lines = [line_template.format(alert.message) for alert in digest.alerts]
+    text = header
+    for index, line in enumerate(lines):
+        no_of_remaining = len(lines) - index - 1
+        summary_length = len(_DIGEST_SUMMARY_TEMPLATE.format(
+            no_of_remaining)) if no_of_remaining else 0
+        if len(text) + 1 + len(line) + summary_length > max_length:
+            return text + _DIGEST_SUMMARY_TEMPLATE.format(len(lines) - index)
+        text += '\n' + line
+
+    return text
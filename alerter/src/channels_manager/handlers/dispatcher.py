@@ -0,0 +1,534 @@
+import json
+import logging
+import multiprocessing
+import queue
+import sys
+import threading
+import time
+import weakref
+from datetime import datetime
+from functools import partial
+from types import FrameType
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pika.exceptions
+from pika.adapters.blocking_connection import BlockingChannel
+
+from src.abstract.publisher_subscriber import PublisherSubscriberComponent
+from src.alerter.alert_code import AlertCode
+from src.alerter.alerts.alert import Alert
+from src.alerter.grouped_alerts_metric_code import GroupedAlertsMetricCode
+from src.channels_manager.channels.twilio import TwilioChannel
+from src.channels_manager.digest import AlertDigester
+from src.channels_manager.handlers.outbox import AlertsOutbox
+from src.channels_manager.handlers.retry_scheduler import RetryScheduler
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.utils.constants.channels import (
+    ALERT_RETRY_INITIAL_DELAY_SECONDS, DISPATCHER_COMMANDS_POLL_SECONDS)
+from src.utils.constants.rabbitmq import (
+    ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
+    CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE,
+    HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
+    CHANNEL_HANDLER_INPUT_ROUTING_KEY_TEMPLATE, TOPIC)
+from src.utils.data import RequestStatus
+from src.utils.exceptions import MessageWasNotDeliveredException
+from src.utils.logging import log_and_print
+
+# The commands sent by the channels manager to the alerts dispatcher
+ADD_DESTINATION = 'add'
+REMOVE_DESTINATION = 'remove'
+
+
+class DestinationWorker:
+    """
+    This class sends the alerts of one channel from a thread of its own, so
+    that a slow or unreachable destination does not hold up the other
+    destinations hosted by the alerts dispatcher. Alerts are queued, expired,
+    re-tried and digested the same way as in the alerts handler of the
+    channel.
+    """
+
+    def __init__(self, name: str, logger: logging.Logger,
+                 send: Callable[[Alert], RequestStatus], queue_size: int = 0,
+                 max_attempts: int = 6, alert_validity_threshold: int = 600,
+                 digest_window: float = 0,
+                 retry_initial_delay: float =
+                 ALERT_RETRY_INITIAL_DELAY_SECONDS) -> None:
+        self._name = name
+        self._logger = logger
+        self._send = send
+        self._alert_validity_threshold = alert_validity_threshold
+        self._retry_scheduler = RetryScheduler(max_attempts,
+                                               retry_initial_delay)
+        self._alert_digester = AlertDigester(digest_window)
+
+        # The alerts and all the bookkeeping above are guarded by the
+        # condition, as alerts are placed by the dispatcher's thread
+        self._condition = threading.Condition()
+        self._alerts = AlertsOutbox(logger, queue_size)
+        self._digest_due_time = None
+        self._blocked = False
+        self._stopped = False
+        self._on_idle = None
+        self._thread = None
+
+    def __str__(self) -> str:
+        return self.name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def logger(self) -> logging.Logger:
+        return self._logger
+
+    @property
+    def no_of_pending_alerts(self) -> int:
+        with self._condition:
+            return self._alerts.qsize() \
+                   + self._alert_digester.no_of_buffered_alerts
+
+    def start(self, on_idle: Callable[[], None] = None) -> None:
+        """
+        Starts sending alerts from a daemon thread.
+        :param on_idle: Called from the worker's thread whenever all the
+                      : alerts received so far have been sent
+        :return: None
+        """
+        self._on_idle = on_idle
+        self._thread = threading.Thread(target=self._run, name=self.name,
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the worker once any send in progress is done. The worker's
+        thread is not waited for, so that a destination which does not respond
+        does not hold up the caller.
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+    def put(self, alert: Alert) -> None:
+        with self._condition:
+            if self._alert_digester.should_buffer(alert):
+                self._alert_digester.add(alert)
+                if self._digest_due_time is None:
+                    self._digest_due_time = \
+                        time.monotonic() + self._alert_digester.window
+            else:
+                # The buffered alerts of the chain were raised earlier, so
+                # they are queued first
+                for buffered_alert in self._alert_digester.flush_chain(
+                        alert.parent_id):
+                    self._place_alert_on_queue(buffered_alert)
+                self._place_alert_on_queue(alert)
+
+            # A new alert makes the worker try the alerts which failed
+            # max_attempts times again, as in the alerts handlers
+            self._blocked = False
+            self._condition.notify()
+
+    def _place_alert_on_queue(self, alert: Alert) -> None:
+        # If the queue is full, shed the oldest alert of the lowest severity
+        # first, or this alert if all the queued alerts are more severe
+        if self._alerts.full():
+            shed_alert = self._alerts.shed(alert)
+            if shed_alert is alert:
+                self.logger.warning("The alerts queue is full, discarded %s",
+                                    alert.alert_code.name)
+                return
+            self._retry_scheduler.forget(shed_alert)
+        self._alerts.put(alert)
+
+    def _seconds_until_due(self) -> Optional[float]:
+        """
+        :return: The number of seconds until the worker has something to do,
+               : which is 0 if there is something to do now
+               : None if there is nothing to do until an alert is received
+        """
+        waits = []
+        if self._digest_due_time is not None:
+            waits.append(max(self._digest_due_time - time.monotonic(), 0))
+        if not self._alerts.empty() and not self._blocked:
+            head = self._alerts.queue[0]
+            head_wait = self._retry_scheduler.seconds_until_next_attempt() \
+                if not self._retry_scheduler.can_attempt(head) else 0
+            waits.append(head_wait)
+        return min(waits) if waits else None
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                wait = self._seconds_until_due()
+                while not self._stopped and (wait is None or wait > 0):
+                    self._condition.wait(wait)
+                    wait = self._seconds_until_due()
+                if self._stopped:
+                    return
+
+                if self._digest_due_time is not None \
+                        and time.monotonic() >= self._digest_due_time:
+                    self._digest_due_time = None
+                    for alert in self._alert_digester.flush():
+                        self._place_alert_on_queue(alert)
+                    self._blocked = False
+
+            try:
+                self._send_alerts()
+            except Exception as e:
+                # The worker must keep on sending the alerts of its channel
+                self.logger.exception(e)
+
+    def _send_alerts(self) -> None:
+        # Send the alerts in order. The lock is not held while an alert is
+        # being sent, so that the dispatcher can keep on placing alerts.
+        while True:
+            with self._condition:
+                if self._stopped or self._blocked:
+                    return
+                if self._alerts.empty():
+                    break
+
+                alert = self._alerts.queue[0]
+                # Discard alert if alert_validity_threshold seconds passed
+                # since it was last raised
+                if (datetime.now().timestamp() - alert.timestamp) \
+                        > self._alert_validity_threshold:
+                    self._alerts.get()
+                    self._retry_scheduler.forget(alert)
+                    continue
+
+                if not self._retry_scheduler.can_attempt(alert):
+                    return
+
+            ret = self._send(alert)
+
+            with self._condition:
+                if ret == RequestStatus.SUCCESS:
+                    self._retry_scheduler.forget(alert)
+                    # The alert may have been shed from a full queue, or
+                    # more severe alerts may have been queued before it, while
+                    # it was being sent
+                    self._alerts.remove(alert)
+                    continue
+
+                delay = self._retry_scheduler.attempt_failed(alert)
+                if delay is None:
+                    self.logger.debug(
+                        "Not all alerts could be sent in a timely manner. The "
+                        "alerts which could not be sent will be kept, and if "
+                        "not a lot of time passes since these alerts were "
+                        "raised, these alerts would still be sent.")
+                    self._blocked = True
+                else:
+                    self.logger.debug("Will re-try sending in %.1f seconds",
+                                      delay)
+                return
+
+        if self._on_idle is not None:
+            self._on_idle()
+
+
+class TwilioCaller:
+    """
+    This class calls the numbers of a Twilio channel for an alert, so that a
+    Twilio channel can be hosted by a DestinationWorker. When an alert is
+    re-tried, only the numbers which could not be called are called again.
+    """
+
+    def __init__(self, twilio_channel: TwilioChannel, call_from: str,
+                 call_to: List[str], twiml: str, twiml_is_url: bool) -> None:
+        self._twilio_channel = twilio_channel
+        self._call_from = call_from
+        self._call_to = call_to
+        self._twiml = twiml
+        self._twiml_is_url = twiml_is_url
+
+        # The numbers called so far for each alert being called. An alert is
+        # forgotten once it is discarded by the worker.
+        self._called = weakref.WeakKeyDictionary()
+
+    def __call__(self, alert: Alert) -> RequestStatus:
+        called = self._called.setdefault(alert, set())
+        calling_status = RequestStatus.SUCCESS
+        for number in self._call_to:
+            if number in called:
+                continue
+
+            ret = self._twilio_channel.alert(
+                call_from=self._call_from, call_to=number, twiml=self._twiml,
+                twiml_is_url=self._twiml_is_url)
+            if ret == RequestStatus.SUCCESS:
+                called.add(number)
+            else:
+                calling_status = RequestStatus.FAILED
+
+        if calling_status == RequestStatus.SUCCESS:
+            del self._called[alert]
+        return calling_status
+
+
+class DispatchedHandler:
+    """
+    This class stands in for the process of an alerts handler which is hosted
+    by the alerts dispatcher, so that the channels manager can keep track of
+    it, stop it and restart it the same way as an alerts handler running in
+    its own process.
+    """
+
+    def __init__(self, channel_id: str,
+                 dispatcher_process: multiprocessing.Process,
+                 commands: multiprocessing.Queue) -> None:
+        self._channel_id = channel_id
+        self._dispatcher_process = dispatcher_process
+        self._commands = commands
+        self._terminated = False
+
+    @property
+    def channel_id(self) -> str:
+        return self._channel_id
+
+    @property
+    def dispatcher_process(self) -> multiprocessing.Process:
+        return self._dispatcher_process
+
+    def is_alive(self) -> bool:
+        return not self._terminated and self._dispatcher_process.is_alive()
+
+    def terminate(self) -> None:
+        if not self._terminated:
+            self._terminated = True
+            self._commands.put((REMOVE_DESTINATION, self.channel_id))
+
+    def join(self, timeout: float = None) -> None:
+        # The destination is removed by the dispatcher, there is no process to
+        # wait for.
+        pass
+
+
+class AlertsDispatcher(PublisherSubscriberComponent):
+    """
+    The alerts dispatcher hosts the alerts handlers of many channels in a
+    single process and over a single RabbitMQ connection. It consumes the
+    input queue of every channel it hosts and hands the alerts to the
+    channel's DestinationWorker. The channels manager adds and removes
+    channels through the `commands` queue, and destination workers are
+    created by `create_worker` from the channel type and the arguments which
+    the channel's alerts handler would be started with.
+    """
+
+    def __init__(self, logger: logging.Logger, name: str,
+                 rabbitmq: RabbitMQApi, commands: multiprocessing.Queue,
+                 create_worker: Callable[[str, Tuple], DestinationWorker],
+                 queue_size: int = 0) -> None:
+        super().__init__(logger, rabbitmq)
+
+        self._name = name
+        self._commands = commands
+        self._create_worker = create_worker
+        self._queue_size = queue_size
+
+        # channel_id -> worker and channel_id -> consumer tag
+        self._workers: Dict[str, DestinationWorker] = {}
+        self._consumer_tags: Dict[str, str] = {}
+
+    def __str__(self) -> str:
+        return self.name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def workers(self) -> Dict[str, DestinationWorker]:
+        return self._workers
+
+    def _initialise_rabbitmq(self) -> None:
+        self.rabbitmq.connect_till_successful()
+
+        self.logger.info("Creating '%s' exchange", ALERT_EXCHANGE)
+        self.rabbitmq.exchange_declare(ALERT_EXCHANGE, TOPIC, False, True,
+                                       False, False)
+
+        # Set producing configuration for heartbeat publishing
+        self.logger.info("Setting delivery confirmation on RabbitMQ channel")
+        self.rabbitmq.confirm_delivery()
+        self.logger.info("Creating '%s' exchange", HEALTH_CHECK_EXCHANGE)
+        self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, TOPIC, False,
+                                       True, False, False)
+
+        # Consumers do not survive a new connection, unlike the workers
+        self._consumer_tags.clear()
+        for channel_id in self._workers:
+            self._consume_destination(channel_id)
+
+    def _consume_destination(self, channel_id: str) -> None:
+        queue_name = CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE.format(
+            channel_id)
+        routing_key = CHANNEL_HANDLER_INPUT_ROUTING_KEY_TEMPLATE.format(
+            channel_id)
+        self.logger.info("Creating queue '%s'", queue_name)
+        self.rabbitmq.queue_declare(queue_name, False, True, False, False)
+        self.logger.info("Binding queue '%s' to exchange '%s' with routing key "
+                         "'%s'", queue_name, ALERT_EXCHANGE, routing_key)
+        self.rabbitmq.queue_bind(queue_name, ALERT_EXCHANGE, routing_key)
+
+        # The pre-fetch count applies to each consumer declared after it, and
+        # is 5 times less the maximum queue size as in the alerts handlers
+        self.rabbitmq.basic_qos(prefetch_count=round(self._queue_size / 5))
+        self.logger.debug("Declaring consuming intentions on '%s'", queue_name)
+        self._consumer_tags[channel_id] = self.rabbitmq.basic_consume(
+            queue_name, partial(self._process_alert, channel_id), False,
+            False, None)
+
+    def _add_destination(self, channel_id: str, channel_type: str,
+                         handler_args: Tuple) -> None:
+        if channel_id in self._workers:
+            self._remove_destination(channel_id)
+
+        worker = self._create_worker(channel_type, handler_args)
+        worker.start(partial(self._on_worker_idle, worker.name))
+        self._workers[channel_id] = worker
+        self._consume_destination(channel_id)
+        log_and_print("{} is now dispatching the alerts of {}".format(
+            self, worker), self.logger)
+
+    def _remove_destination(self, channel_id: str) -> None:
+        if channel_id in self._consumer_tags:
+            self.rabbitmq.basic_cancel(self._consumer_tags.pop(channel_id))
+
+        worker = self._workers.pop(channel_id, None)
+        if worker is not None:
+            worker.stop()
+            log_and_print("{} stopped dispatching the alerts of {}".format(
+                self, worker), self.logger)
+
+    def _process_commands(self) -> None:
+        try:
+            while True:
+                command = self._commands.get_nowait()
+                try:
+                    if command[0] == ADD_DESTINATION:
+                        self._add_destination(*command[1:])
+                    elif command[0] == REMOVE_DESTINATION:
+                        self._remove_destination(*command[1:])
+                except (pika.exceptions.AMQPConnectionError,
+                        pika.exceptions.AMQPChannelError) as e:
+                    raise e
+                except Exception as e:
+                    self.logger.error("Error when processing command %s",
+                                      command)
+                    self.logger.exception(e)
+        except queue.Empty:
+            pass
+
+        self.rabbitmq.connection.call_later(DISPATCHER_COMMANDS_POLL_SECONDS,
+                                            self._process_commands)
+
+    def _process_alert(
+            self, channel_id: str, ch: BlockingChannel,
+            method: pika.spec.Basic.Deliver,
+            properties: pika.spec.BasicProperties, body: bytes) -> None:
+        alert_json = json.loads(body)
+        self.logger.debug("Received %s for %s. Now processing this alert.",
+                          alert_json, channel_id)
+
+        alert = None
+        try:
+            alert_code = alert_json['alert_code']
+            alert_code_enum = AlertCode.get_enum_by_value(alert_code['code'])
+            metric_code_enum = GroupedAlertsMetricCode.get_enum_by_value(
+                alert_json['metric'])
+            alert = Alert(alert_code_enum, alert_json['message'],
+                          alert_json['severity'], alert_json['timestamp'],
+                          alert_json['parent_id'], alert_json['origin_id'],
+                          metric_code_enum, alert_json['metric_state_args'])
+
+            self.logger.debug("Successfully processed %s", alert_json)
+        except Exception as e:
+            self.logger.error("Error when processing %s", alert_json)
+            self.logger.exception(e)
+
+        # If the alert is processed, it can be acknowledged.
+        self.rabbitmq.basic_ack(method.delivery_tag, False)
+
+        # The alert is handed to the worker after acknowledging it, so that if
+        # acknowledgement fails the alert is not sent twice. Alerts of a
+        # channel which is no longer dispatched are dropped.
+        worker = self._workers.get(channel_id)
+        if alert is not None and worker is not None:
+            worker.put(alert)
+
+    def _on_worker_idle(self, handler_name: str) -> None:
+        # Called from a worker's thread, therefore the heartbeat is sent from
+        # the connection's thread, which owns the RabbitMQ channel
+        try:
+            self.rabbitmq.connection.add_callback_threadsafe(
+                partial(self._send_handler_heartbeat, handler_name))
+        except Exception as e:
+            # The connection is being re-established, and heartbeats must be
+            # real-time, so the heartbeat is not sent
+            self.logger.debug("Did not send heartbeat of %s: %s",
+                              handler_name, e)
+
+    def _send_handler_heartbeat(self, handler_name: str) -> None:
+        heartbeat = {
+            'component_name': handler_name,
+            'is_alive': True,
+            'timestamp': datetime.now().timestamp()
+        }
+        try:
+            self._send_heartbeat(heartbeat)
+        except MessageWasNotDeliveredException as e:
+            # Log the message and do not raise it as heartbeats must be
+            # real-time.
+            self.logger.exception(e)
+
+    def _send_heartbeat(self, data_to_send: dict) -> None:
+        self.rabbitmq.basic_publish_confirm(
+            exchange=HEALTH_CHECK_EXCHANGE,
+            routing_key=HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY, body=data_to_send,
+            is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
+            mandatory=True)
+        self.logger.debug("Sent heartbeat to '%s' exchange",
+                          HEALTH_CHECK_EXCHANGE)
+
+    def _listen_for_data(self) -> None:
+        self.rabbitmq.start_consuming()
+
+    def start(self) -> None:
+        self._initialise_rabbitmq()
+        self._process_commands()
+        while True:
+            try:
+                self._listen_for_data()
+            except (pika.exceptions.AMQPConnectionError,
+                    pika.exceptions.AMQPChannelError) as e:
+                # If we have either a channel error or connection error, the
+                # channel is reset, therefore we need to re-initialise the
+                # connection or channel settings
+                raise e
+            except Exception as e:
+                self.logger.exception(e)
+                raise e
+
+    def _on_terminate(self, signum: int, stack: FrameType) -> None:
+        log_and_print("{} is terminating. Connections with RabbitMQ will be "
+                      "closed, and afterwards the process will "
+                      "exit.".format(self), self.logger)
+        for worker in self._workers.values():
+            worker.stop()
+        self.disconnect_from_rabbit()
+        log_and_print("{} terminated.".format(self), self.logger)
+        sys.exit()
+
+    def _send_data(self, *args) -> None:
+        """
+        We are not implementing the _send_data function because with respect to
+        rabbit, the alerts dispatcher only sends heartbeats. Alerts are sent
+        through the third party channels.
+        """
+        pass
@@ -2,8 +2,8 @@ import json
 import logging
 import sys
 from datetime import datetime
-from queue import Queue
 from types import FrameType
+from typing import Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -13,7 +13,10 @@ from src.alerter.alert_code import AlertCode
 from src.alerter.alerts.alert import Alert
 from src.alerter.grouped_alerts_metric_code import GroupedAlertsMetricCode
 from src.channels_manager.channels.email import EmailChannel
+from src.channels_manager.digest import AlertDigester
 from src.channels_manager.handlers.handler import ChannelHandler
+from src.channels_manager.handlers.outbox import AlertsOutbox
+from src.channels_manager.handlers.retry_scheduler import RetryScheduler
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
@@ -29,13 +32,17 @@ class EmailAlertsHandler(ChannelHandler):
     def __init__(self, handler_name: str, logger: logging.Logger,
                  rabbitmq: RabbitMQApi, email_channel: EmailChannel,
                  queue_size: int = 0, max_attempts: int = 6,
-                 alert_validity_threshold: int = 600):
+                 alert_validity_threshold: int = 600,
+                 digest_window: float = 0,
+                 outbox_path: Optional[str] = None):
         super().__init__(handler_name, logger, rabbitmq)
 
         self._email_channel = email_channel
-        self._alerts_queue = Queue(queue_size)
+        self._alerts_queue = AlertsOutbox(logger, queue_size, outbox_path)
         self._max_attempts = max_attempts
         self._alert_validity_threshold = alert_validity_threshold
+        self._retry_scheduler = RetryScheduler(max_attempts)
+        self._alert_digester = AlertDigester(digest_window)
         self._email_alerts_handler_queue = \
             CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE.format(
                 self.email_channel.channel_id)
@@ -48,7 +55,7 @@ class EmailAlertsHandler(ChannelHandler):
         return self._email_channel
 
     @property
-    def alerts_queue(self) -> Queue:
+    def alerts_queue(self) -> AlertsOutbox:
         return self._alerts_queue
 
     def _send_heartbeat(self, data_to_send: dict) -> None:
@@ -90,9 +97,19 @@ class EmailAlertsHandler(ChannelHandler):
         # Place the alert on the alerts queue if there were no processing
         # errors. This is done after acknowledging the alert, so that if
         # acknowledgement fails, the alert is processed again and we do not have
-        # duplication of alerts in the queue
+        # duplication of alerts in the queue. If digests are enabled, the alert
+        # is buffered instead, unless it is critical.
         if not processing_error:
-            self._place_alert_on_queue(alert)
+            if self._alert_digester.should_buffer(alert):
+                self._alert_digester.add(alert)
+                self._schedule_digest_flush(self._alert_digester.window)
+            else:
+                # The buffered alerts of the chain were raised earlier, so
+                # they are queued first
+                for buffered_alert in self._alert_digester.flush_chain(
+                        alert.parent_id):
+                    self._place_alert_on_queue(buffered_alert)
+                self._place_alert_on_queue(alert)
 
         # Send any alerts waiting in the queue, if any
         try:
@@ -101,13 +118,15 @@ class EmailAlertsHandler(ChannelHandler):
             raise e
 
         # By this condition we are sending heartbeats only when there were no
-        # processing errors and when all alerts have been sent successfully.
-        if self.alerts_queue.empty() and not processing_error:
+        # processing errors. Alerts which could not be sent yet are reported
+        # by the outbox_depth of the heartbeat.
+        if not processing_error:
             try:
                 heartbeat = {
                     'component_name': self.handler_name,
                     'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
+                    'timestamp': datetime.now().timestamp(),
+                    'outbox_depth': self.alerts_queue.qsize()
                 }
                 self._send_heartbeat(heartbeat)
             except MessageWasNotDeliveredException as e:
@@ -121,10 +140,16 @@ class EmailAlertsHandler(ChannelHandler):
         self.logger.debug("Adding %s to the alerts queue ...",
                           alert.alert_code.name)
 
-        # Place the alert on the alerts queue. If the queue is full, remove old
-        # alerts first.
+        # Place the alert on the alerts queue. If the queue is full, shed the
+        # oldest alert of the lowest severity first, or this alert if all the
+        # queued alerts are more severe.
         if self.alerts_queue.full():
-            self.alerts_queue.get()
+            shed_alert = self.alerts_queue.shed(alert)
+            if shed_alert is alert:
+                self.logger.warning("The alerts queue is full, discarded %s",
+                                    alert.alert_code.name)
+                return
+            self._retry_scheduler.forget(shed_alert)
         self.alerts_queue.put(alert)
 
         self.logger.debug("%s added to the alerts queue", alert.alert_code.name)
@@ -137,12 +162,13 @@ class EmailAlertsHandler(ChannelHandler):
                               "alerts queue ...")
 
         # Try sending the alerts in the alerts queue one by one. If sending
-        # fails, try re-sending max_attempts - 1 times with 10 seconds sleep in
-        # between. If this still fails, stop sending alerts until the next alert
-        # is received. If alert_validity_threshold seconds pass since the alert
+        # fails, a retry is scheduled with an exponential backoff and the
+        # handler carries on consuming in the meantime. If sending fails
+        # max_attempts times, stop sending alerts until the next alert is
+        # received. If alert_validity_threshold seconds pass since the alert
         # was first raised, the alert is discarded. Important, remove an item
         # from the queue only if the sending was successful, so that if an
-        # exception is raised, that message is not popped
+        # exception is raised, that message is not popped.
         while not self.alerts_queue.empty():
             alert = self.alerts_queue.queue[0]
 
@@ -152,30 +178,46 @@ class EmailAlertsHandler(ChannelHandler):
                     > self._alert_validity_threshold:
                 self.alerts_queue.get()
                 self.alerts_queue.task_done()
+                self._retry_scheduler.forget(alert)
                 continue
 
-            attempts = 1
-            status = self.email_channel.alert(alert)
-            while status != RequestStatus.SUCCESS \
-                    and attempts < self._max_attempts:
-                self.logger.debug("Will re-try sending in 10 seconds. "
-                                  "Attempts left: %s",
-                                  self._max_attempts - attempts)
-                self.rabbitmq.connection.sleep(10)
-                status = self.email_channel.alert(alert)
-                attempts += 1
+            # If a retry of this alert is pending, wait for it so that alerts
+            # are still sent in order
+            if not self._retry_scheduler.can_attempt(alert):
+                if self._retry_timer is None:
+                    self._schedule_retry(
+                        self._retry_scheduler.seconds_until_next_attempt())
+                return
 
+            status = self.email_channel.alert(alert)
             if status == RequestStatus.SUCCESS:
+                self._retry_scheduler.forget(alert)
                 self.alerts_queue.get()
                 self.alerts_queue.task_done()
             else:
-                self.logger.debug("Stopped sending alerts.")
+                delay = self._retry_scheduler.attempt_failed(alert)
+                if delay is None:
+                    self.logger.debug("Stopped sending alerts.")
+                else:
+                    self.logger.debug(
+                        "Will re-try sending in %.1f seconds. Attempts "
+                        "left: %s", delay, self._max_attempts
+                        - self._retry_scheduler.attempts(alert))
+                    self._schedule_retry(delay)
                 return
 
         if not empty:
             self.logger.debug("Successfully sent all data from the publishing "
                               "queue")
 
+    def _retry_failed(self) -> None:
+        self._send_alerts()
+
+    def _flush_digest(self) -> None:
+        for alert in self._alert_digester.flush():
+            self._place_alert_on_queue(alert)
+        self._send_alerts()
+
     def _initialise_rabbitmq(self) -> None:
         self.rabbitmq.connect_till_successful()
 
@@ -210,6 +252,9 @@ class EmailAlertsHandler(ChannelHandler):
                                        True, False, False)
 
     def start(self) -> None:
+        # Timers do not survive a new connection
+        self._retry_timer = None
+        self._digest_timer = None
         self._initialise_rabbitmq()
         while True:
             try:
@@ -231,6 +276,7 @@ class EmailAlertsHandler(ChannelHandler):
                       "closed, and afterwards the process will "
                       "exit.".format(self), self.logger)
         self.disconnect_from_rabbit()
+        self.alerts_queue.close()
         log_and_print("{} terminated.".format(self), self.logger)
         sys.exit()
 
@@ -12,6 +12,12 @@ class ChannelHandler(PublisherSubscriberComponent, ABC):
 
         self._handler_name = handler_name
 
+        # The timer which calls _retry_failed while the handler is consuming
+        self._retry_timer = None
+
+        # The timer which calls _flush_digest once a digest window ends
+        self._digest_timer = None
+
     def __str__(self) -> str:
         return self.handler_name
 
@@ -21,3 +27,52 @@ class ChannelHandler(PublisherSubscriberComponent, ABC):
 
     def _listen_for_data(self) -> None:
         self.rabbitmq.start_consuming()
+
+    def _schedule_retry(self, delay: float) -> None:
+        """
+        Schedules a call to _retry_failed in `delay` seconds. The call is
+        performed by the RabbitMQ connection while the handler keeps consuming,
+        so that failed sends are re-tried without blocking the handler. Only
+        one retry is kept scheduled, as _retry_failed re-tries everything that
+        is due.
+        :param delay: The number of seconds until the retry
+        :return: None
+        """
+        if self._retry_timer is not None:
+            self.rabbitmq.connection.remove_timeout(self._retry_timer)
+        self._retry_timer = self.rabbitmq.connection.call_later(
+            delay, self._on_retry_timer)
+
+    def _on_retry_timer(self) -> None:
+        self._retry_timer = None
+        self._retry_failed()
+
+    def _retry_failed(self) -> None:
+        """
+        Re-tries the sends which failed. Handlers which retry failed sends must
+        override this function.
+        """
+        pass
+
+    def _schedule_digest_flush(self, window: float) -> None:
+        """
+        Schedules a call to _flush_digest in `window` seconds, unless one is
+        already scheduled, so that the alerts buffered since the start of the
+        window are sent together.
+        :param window: The number of seconds until the flush
+        :return: None
+        """
+        if self._digest_timer is None:
+            self._digest_timer = self.rabbitmq.connection.call_later(
+                window, self._on_digest_timer)
+
+    def _on_digest_timer(self) -> None:
+        self._digest_timer = None
+        self._flush_digest()
+
+    def _flush_digest(self) -> None:
+        """
+        Sends the alerts buffered for a digest. Handlers which support digests
+        must override this function.
+        """
+        pass
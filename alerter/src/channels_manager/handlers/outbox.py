@@ -0,0 +1,284 @@
+import json
+import logging
+import os
+import sqlite3
+from collections import deque
+from queue import Queue
+from typing import Deque, Dict, FrozenSet, List, NamedTuple, Optional
+
+from src.alerter.alert_code import AlertCode
+from src.alerter.alert_severities import Severity
+from src.alerter.alerts.alert import Alert
+from src.alerter.grouped_alerts_metric_code import GroupedAlertsMetricCode
+from src.channels_manager.digest import AlertDigest
+from src.channels_manager.incidents import IncidentTracker
+from src.utils.constants.channels import OUTBOX_COMPACTION_INTERVAL
+
+# The priority lane of the alerts of each severity, highest priority first.
+# Alerts of any other severity go in the last lane.
+_SEVERITY_LANES = {
+    Severity.CRITICAL.value: 0,
+    Severity.ERROR.value: 1,
+    Severity.WARNING.value: 2,
+    Severity.INFO.value: 3,
+}
+_NO_OF_LANES = len(_SEVERITY_LANES)
+
+
+def _lane(alert: Alert) -> int:
+    return _SEVERITY_LANES.get(alert.severity, _NO_OF_LANES - 1)
+
+
+class _QueuedAlert(NamedTuple):
+    # The row id of the alert, or None if the alert is only kept in memory
+    row_id: Optional[int]
+    # The lane the alert is queued in, which may be lower than its severity's
+    lane: int
+    incident_keys: FrozenSet[str]
+
+
+def _incident_keys(alert: Alert) -> FrozenSet[str]:
+    # A digest belongs to the incidents of all of its alerts
+    alerts = alert.alerts if isinstance(alert, AlertDigest) else [alert]
+    return frozenset(IncidentTracker.incident_key(incident_alert)
+                     for incident_alert in alerts)
+
+
+def _alert_to_json(alert: Alert) -> str:
+    if isinstance(alert, AlertDigest):
+        return json.dumps({'digest': [digested_alert.alert_data
+                                      for digested_alert in alert.alerts]})
+    return json.dumps(alert.alert_data)
+
+
+def _alert_from_data(alert_data: Dict) -> Alert:
+    return Alert(
+        AlertCode.get_enum_by_value(alert_data['alert_code']['code']),
+        alert_data['message'], alert_data['severity'],
+        alert_data['timestamp'], alert_data['parent_id'],
+        alert_data['origin_id'],
+        GroupedAlertsMetricCode.get_enum_by_value(alert_data['metric']),
+        alert_data['metric_state_args'])
+
+
+def _alert_from_json(alert_json: str) -> Alert:
+    alert_data = json.loads(alert_json)
+    if 'digest' in alert_data:
+        return AlertDigest([_alert_from_data(digested_alert_data)
+                            for digested_alert_data in alert_data['digest']])
+    return _alert_from_data(alert_data)
+
+
+class AlertsOutbox(Queue):
+    """
+    The alerts queue of a channel handler. Alerts are queued in priority lanes
+    by severity, so that the head of the queue is always the oldest alert of
+    the highest severity queued, and a backlog of INFO alerts cannot hold up a
+    CRITICAL one. When the queue is full, `shed` makes room by removing the
+    oldest alert of the lowest severity.
+
+    Alerts of the same incident are never reordered, as otherwise an alert
+    could be solved before it is raised. Therefore, if an alert of the same
+    incident is queued in a lower priority lane, the alert is queued after it
+    in that lane. A digest belongs to the incidents of all of its alerts.
+
+    Alerts are acknowledged to RabbitMQ before they are sent, so if a `path`
+    is given the outbox also keeps its alerts in an SQLite database at that
+    path. This way the alerts which were not sent yet survive a restart of the
+    handler, and are loaded back into their lanes when the outbox is created
+    again.
+
+    Alerts are appended to the database and deleted by primary key, and the
+    space freed by deleted alerts is reclaimed every `compaction_interval`
+    removals. If the database cannot be written to, the alert is still kept in
+    memory so that it is not lost while the handler is running.
+    """
+
+    def __init__(self, logger: logging.Logger, maxsize: int = 0,
+                 path: Optional[str] = None,
+                 compaction_interval: int = OUTBOX_COMPACTION_INTERVAL) \
+            -> None:
+        self._logger = logger
+        self._path = path
+        self._compaction_interval = compaction_interval
+        self._removals_since_compaction = 0
+
+        # The row id, lane and incident of every alert in the queue
+        self._queued_alerts: Deque[_QueuedAlert] = deque()
+        # The number of alerts queued in each priority lane
+        self._lane_sizes: List[int] = [0] * _NO_OF_LANES
+        self._connection = None if path is None else self._connect(path)
+
+        # Queue's constructor calls _init, which loads any persisted alerts
+        super().__init__(maxsize)
+
+    @property
+    def logger(self) -> logging.Logger:
+        return self._logger
+
+    @property
+    def path(self) -> Optional[str]:
+        return self._path
+
+    @property
+    def persistent(self) -> bool:
+        return self._connection is not None
+
+    @staticmethod
+    def _connect(path: str) -> sqlite3.Connection:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Every statement is committed on its own. With write-ahead logging,
+        # commits are not lost if the process is killed.
+        connection = sqlite3.connect(path, isolation_level=None)
+        connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute("CREATE TABLE IF NOT EXISTS outbox ("
+                           "id INTEGER PRIMARY KEY, alert TEXT NOT NULL)")
+        return connection
+
+    def _init(self, maxsize: int) -> None:
+        self.queue = deque()
+        if not self.persistent:
+            return
+
+        rows = self._connection.execute(
+            "SELECT id, alert FROM outbox ORDER BY id").fetchall()
+
+        # Keep the newest alerts if the outbox was persisted with a bigger
+        # maximum size, as a full queue does
+        if 0 < maxsize < len(rows):
+            self._connection.execute("DELETE FROM outbox WHERE id <= ?",
+                                     (rows[-maxsize - 1][0],))
+            rows = rows[-maxsize:]
+
+        for row_id, alert_json in rows:
+            try:
+                alert = _alert_from_json(alert_json)
+            except Exception as e:
+                self.logger.error("Discarding the unreadable alert %s from "
+                                  "the outbox %s", alert_json, self.path)
+                self.logger.exception(e)
+                self._connection.execute("DELETE FROM outbox WHERE id = ?",
+                                         (row_id,))
+                continue
+            self._insert(row_id, alert)
+
+        if self.queue:
+            self.logger.info("Loaded %s alerts which were not sent yet from "
+                             "the outbox %s", len(self.queue), self.path)
+
+    def _qsize(self) -> int:
+        return len(self.queue)
+
+    def _put(self, alert: Alert) -> None:
+        row_id = None
+        if self.persistent:
+            try:
+                row_id = self._connection.execute(
+                    "INSERT INTO outbox (alert) VALUES (?)",
+                    (_alert_to_json(alert),)).lastrowid
+            except sqlite3.Error as e:
+                self.logger.error("Could not save %s to the outbox %s, it will "
+                                  "only be kept in memory.", alert.message,
+                                  self.path)
+                self.logger.exception(e)
+
+        self._insert(row_id, alert)
+
+    def _get(self) -> Alert:
+        return self._remove_at(0)
+
+    def _insert(self, row_id: Optional[int], alert: Alert) -> None:
+        # An alert goes after all the alerts of its lane and the lanes before,
+        # and after the alerts of its incidents which are already queued
+        incident_keys = _incident_keys(alert)
+        lane = max([_lane(alert)] + [
+            queued_alert.lane for queued_alert in self._queued_alerts
+            if not incident_keys.isdisjoint(queued_alert.incident_keys)
+        ])
+        index = sum(self._lane_sizes[:lane + 1])
+        self._lane_sizes[lane] += 1
+        self._queued_alerts.insert(
+            index, _QueuedAlert(row_id, lane, incident_keys))
+        self.queue.insert(index, alert)
+
+    def _remove_at(self, index: int) -> Alert:
+        row_id, lane, _ = self._queued_alerts[index]
+        del self._queued_alerts[index]
+        alert = self.queue[index]
+        del self.queue[index]
+        self._lane_sizes[lane] -= 1
+
+        if row_id is not None:
+            try:
+                self._connection.execute("DELETE FROM outbox WHERE id = ?",
+                                         (row_id,))
+                self._removals_since_compaction += 1
+                if self._removals_since_compaction >= \
+                        self._compaction_interval:
+                    self.compact()
+            except sqlite3.Error as e:
+                self.logger.error("Could not remove an alert from the outbox "
+                                  "%s", self.path)
+                self.logger.exception(e)
+
+        return alert
+
+    def shed(self, alert: Alert) -> Alert:
+        """
+        Makes room for an alert in a full outbox by removing the oldest alert
+        of the lowest priority lane, unless that lane has a higher priority
+        than the alert's.
+        :param alert: The alert to be put in the outbox
+        :return: The alert which was removed
+               : The given alert if nothing was removed, in which case it
+               : should not be put in the outbox
+        """
+        with self.mutex:
+            lowest_lane = max((lane for lane in range(_NO_OF_LANES)
+                               if self._lane_sizes[lane] > 0), default=None)
+            if lowest_lane is None or lowest_lane < _lane(alert):
+                return alert
+
+            shed_alert = self._remove_at(
+                sum(self._lane_sizes[:lowest_lane]))
+            self.not_full.notify()
+            return shed_alert
+
+    def remove(self, alert: Alert) -> bool:
+        """
+        Removes an alert from the outbox wherever it is queued.
+        :param alert: The alert to be removed
+        :return: True if the alert was in the outbox
+               : False otherwise
+        """
+        with self.mutex:
+            for index, queued_alert in enumerate(self.queue):
+                if queued_alert is alert:
+                    self._remove_at(index)
+                    self.not_full.notify()
+                    return True
+            return False
+
+    def compact(self) -> None:
+        """
+        Reclaims the space freed by the alerts removed from the database, and
+        moves the write-ahead log into the database so that neither file keeps
+        on growing.
+        """
+        if not self.persistent:
+            return
+
+        self._removals_since_compaction = 0
+        self._connection.execute("PRAGMA incremental_vacuum")
+        self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.logger.debug("Compacted the outbox %s", self.path)
+
+    def close(self) -> None:
+        if self.persistent:
+            self._connection.close()
+            self._connection = None
@@ -2,8 +2,8 @@ import json
 import logging
 import sys
 from datetime import datetime
-from queue import Queue
 from types import FrameType
+from typing import Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -14,6 +14,8 @@ from src.alerter.alerts.alert import Alert
 from src.alerter.grouped_alerts_metric_code import GroupedAlertsMetricCode
 from src.channels_manager.channels import PagerDutyChannel
 from src.channels_manager.handlers import ChannelHandler
+from src.channels_manager.handlers.outbox import AlertsOutbox
+from src.channels_manager.handlers.retry_scheduler import RetryScheduler
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
@@ -29,13 +31,15 @@ class PagerDutyAlertsHandler(ChannelHandler):
     def __init__(self, handler_name: str, logger: logging.Logger,
                  rabbitmq: RabbitMQApi, pagerduty_channel: PagerDutyChannel,
                  queue_size: int = 0, max_attempts: int = 6,
-                 alert_validity_threshold: int = 600):
+                 alert_validity_threshold: int = 600,
+                 outbox_path: Optional[str] = None):
         super().__init__(handler_name, logger, rabbitmq)
 
         self._pagerduty_channel = pagerduty_channel
-        self._alerts_queue = Queue(queue_size)
+        self._alerts_queue = AlertsOutbox(logger, queue_size, outbox_path)
         self._max_attempts = max_attempts
         self._alert_validity_threshold = alert_validity_threshold
+        self._retry_scheduler = RetryScheduler(max_attempts)
         self._pagerduty_alerts_handler_queue = \
             CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE.format(
                 self._pagerduty_channel.channel_id)
@@ -48,7 +52,7 @@ class PagerDutyAlertsHandler(ChannelHandler):
         return self._pagerduty_channel
 
     @property
-    def alerts_queue(self) -> Queue:
+    def alerts_queue(self) -> AlertsOutbox:
         return self._alerts_queue
 
     def _send_heartbeat(self, data_to_send: dict) -> None:
@@ -101,13 +105,15 @@ class PagerDutyAlertsHandler(ChannelHandler):
             raise e
 
         # By this condition we are sending heartbeats only when there were no
-        # processing errors and when all alerts have been sent successfully.
-        if self.alerts_queue.empty() and not processing_error:
+        # processing errors. Alerts which could not be sent yet are reported
+        # by the outbox_depth of the heartbeat.
+        if not processing_error:
             try:
                 heartbeat = {
                     'component_name': self.handler_name,
                     'is_alive': True,
-                    'timestamp': datetime.now().timestamp()
+                    'timestamp': datetime.now().timestamp(),
+                    'outbox_depth': self.alerts_queue.qsize()
                 }
                 self._send_heartbeat(heartbeat)
             except MessageWasNotDeliveredException as e:
@@ -121,10 +127,16 @@ class PagerDutyAlertsHandler(ChannelHandler):
         self.logger.debug("Adding %s to the alerts queue ...",
                           alert.alert_code.name)
 
-        # Place the alert on the alerts queue. If the queue is full, remove old
-        # alerts first.
+        # Place the alert on the alerts queue. If the queue is full, shed the
+        # oldest alert of the lowest severity first, or this alert if all the
+        # queued alerts are more severe.
         if self._alerts_queue.full():
-            self._alerts_queue.get()
+            shed_alert = self._alerts_queue.shed(alert)
+            if shed_alert is alert:
+                self.logger.warning("The alerts queue is full, discarded %s",
+                                    alert.alert_code.name)
+                return
+            self._retry_scheduler.forget(shed_alert)
         self._alerts_queue.put(alert)
 
         self.logger.debug("%s added to the alerts queue", alert.alert_code.name)
@@ -137,9 +149,10 @@ class PagerDutyAlertsHandler(ChannelHandler):
                               "alerts queue ...")
 
         # Try sending the alerts in the alerts queue one by one. If sending
-        # fails, try re-sending max_attempts - 1 times with 10 seconds sleep in
-        # between. If this still fails, stop sending alerts until the next alert
-        # is received. If alert_validity_threshold seconds pass since the alert
+        # fails, a retry is scheduled with an exponential backoff and the
+        # handler carries on consuming in the meantime. If sending fails
+        # max_attempts times, stop sending alerts until the next alert is
+        # received. If alert_validity_threshold seconds pass since the alert
         # was first raised, the alert is discarded. Important, remove an item
         # from the queue only if the sending was successful, so that if an
         # exception is raised, that message is not popped.
@@ -152,30 +165,41 @@ class PagerDutyAlertsHandler(ChannelHandler):
                     > self._alert_validity_threshold:
                 self._alerts_queue.get()
                 self._alerts_queue.task_done()
+                self._retry_scheduler.forget(alert)
                 continue
 
-            attempts = 1
-            status = self.pagerduty_channel.alert(alert)
-            while status != RequestStatus.SUCCESS \
-                    and attempts < self._max_attempts:
-                self.logger.debug("Will re-try sending in 10 seconds. "
-                                  "Attempts left: %s",
-                                  self._max_attempts - attempts)
-                self.rabbitmq.connection.sleep(10)
-                status = self.pagerduty_channel.alert(alert)
-                attempts += 1
+            # If a retry of this alert is pending, wait for it so that alerts
+            # are still sent in order
+            if not self._retry_scheduler.can_attempt(alert):
+                if self._retry_timer is None:
+                    self._schedule_retry(
+                        self._retry_scheduler.seconds_until_next_attempt())
+                return
 
+            status = self.pagerduty_channel.alert(alert)
             if status == RequestStatus.SUCCESS:
+                self._retry_scheduler.forget(alert)
                 self._alerts_queue.get()
                 self._alerts_queue.task_done()
             else:
-                self.logger.debug("Stopped sending alerts.")
+                delay = self._retry_scheduler.attempt_failed(alert)
+                if delay is None:
+                    self.logger.debug("Stopped sending alerts.")
+                else:
+                    self.logger.debug(
+                        "Will re-try sending in %.1f seconds. Attempts "
+                        "left: %s", delay, self._max_attempts
+                        - self._retry_scheduler.attempts(alert))
+                    self._schedule_retry(delay)
                 return
 
         if not empty:
             self.logger.debug("Successfully sent all data from the publishing "
                               "queue")
 
+    def _retry_failed(self) -> None:
+        self._send_alerts()
+
     def _initialise_rabbitmq(self) -> None:
         self.rabbitmq.connect_till_successful()
 
@@ -210,6 +234,8 @@ class PagerDutyAlertsHandler(ChannelHandler):
                                        True, False, False)
 
     def start(self) -> None:
+        # Timers do not survive a new connection
+        self._retry_timer = None
         self._initialise_rabbitmq()
         while True:
             try:
@@ -231,6 +257,7 @@ class PagerDutyAlertsHandler(ChannelHandler):
                       "closed, and afterwards the process will "
                       "exit.".format(self), self.logger)
         self.disconnect_from_rabbit()
+        self.alerts_queue.close()
         log_and_print("{} terminated.".format(self), self.logger)
         sys.exit()
 
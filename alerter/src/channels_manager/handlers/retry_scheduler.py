@@ -0,0 +1,119 @@
+import random
+from datetime import datetime
+from typing import Dict, Hashable, List, Optional
+
+from src.utils.constants.channels import (ALERT_RETRY_INITIAL_DELAY_SECONDS,
+                                          ALERT_RETRY_MAX_DELAY_SECONDS)
+
+
+class RetryScheduler:
+    """
+    This class keeps track of the failed sending attempts of the items of a
+    channel handler, and of when each item should be re-tried. The delay
+    before a retry doubles with every failed attempt, up to `max_delay`
+    seconds, and a random jitter of up to half the delay is subtracted so that
+    retries of many items do not hit the destination all at once. Once an item
+    fails `max_attempts` times its bookkeeping is cleared, so that it is tried
+    again afresh when the handler next sends alerts.
+    """
+
+    def __init__(self, max_attempts: int,
+                 initial_delay: float = ALERT_RETRY_INITIAL_DELAY_SECONDS,
+                 max_delay: float = ALERT_RETRY_MAX_DELAY_SECONDS) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1, got {}".format(
+                max_attempts))
+
+        self._max_attempts = max_attempts
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+
+        # item -> [failed attempts, time of next attempt]
+        self._retries: Dict[Hashable, List] = {}
+
+    @property
+    def max_attempts(self) -> int:
+        return self._max_attempts
+
+    @property
+    def initial_delay(self) -> float:
+        return self._initial_delay
+
+    @property
+    def max_delay(self) -> float:
+        return self._max_delay
+
+    @property
+    def no_of_pending_retries(self) -> int:
+        return len(self._retries)
+
+    def attempts(self, item: Hashable) -> int:
+        return self._retries[item][0] if item in self._retries else 0
+
+    def can_attempt(self, item: Hashable, time: float = None) -> bool:
+        """
+        :param item: The item to be sent
+        :param time: The time as seconds since the epoch, or None for now
+        :return: True if the item has no pending retry, or its retry is due
+               : False otherwise
+        """
+        if item not in self._retries:
+            return True
+
+        time = datetime.now().timestamp() if time is None else time
+        return time >= self._retries[item][1]
+
+    def attempt_failed(self, item: Hashable,
+                       time: float = None) -> Optional[float]:
+        """
+        Records a failed attempt of an item and schedules its next attempt.
+        :param item: The item which could not be sent
+        :param time: The time of the attempt as seconds since the epoch, or
+                   : None for now
+        :return: The number of seconds until the item should be re-tried
+               : None if the item failed max_attempts times
+        """
+        attempts = self.attempts(item) + 1
+        if attempts >= self._max_attempts:
+            self.forget(item)
+            return None
+
+        delay = min(self._initial_delay * 2 ** (attempts - 1),
+                    self._max_delay)
+        delay -= random.uniform(0, delay / 2)
+
+        time = datetime.now().timestamp() if time is None else time
+        self._retries[item] = [attempts, time + delay]
+        return delay
+
+    def due_items(self, time: float = None) -> List[Hashable]:
+        """
+        :param time: The time as seconds since the epoch, or None for now
+        :return: The items whose retry is due, ordered by their next attempt
+        """
+        time = datetime.now().timestamp() if time is None else time
+        due = [(retry[1], index, item)
+               for index, (item, retry) in enumerate(self._retries.items())
+               if time >= retry[1]]
+        return [item for _, _, item in sorted(due)]
+
+    def seconds_until_next_attempt(self, time: float = None) \
+            -> Optional[float]:
+        """
+        :param time: The time as seconds since the epoch, or None for now
+        :return: The number of seconds until the earliest pending retry, which
+               : is 0 if a retry is already due
+               : None if there are no pending retries
+        """
+        if not self._retries:
+            return None
+
+        time = datetime.now().timestamp() if time is None else time
+        next_attempt = min(retry[1] for retry in self._retries.values())
+        return max(next_attempt - time, 0)
+
+    def forget(self, item: Hashable) -> None:
+        self._retries.pop(item, None)
+
+    def reset(self) -> None:
+        self._retries.clear()
@@ -1,6 +1,8 @@
 import logging
+import multiprocessing
 import time
-from typing import List, Dict, Optional
+from datetime import timedelta
+from typing import List, Dict, Optional, Tuple, Union
 
 import pika.exceptions
 
@@ -24,6 +26,8 @@ from src.channels_manager.commands.handlers.telegram_cmd_handlers import (
     TelegramCommandHandlers)
 from src.channels_manager.handlers import EmailAlertsHandler
 from src.channels_manager.handlers.console.alerts import ConsoleAlertsHandler
+from src.channels_manager.handlers.dispatcher import (
+    AlertsDispatcher, DestinationWorker, TwilioCaller)
 from src.channels_manager.handlers.handler import ChannelHandler
 from src.channels_manager.handlers.log.alerts import LogAlertsHandler
 from src.channels_manager.handlers.opsgenie.alerts import OpsgenieAlertsHandler
@@ -40,7 +44,8 @@ from src.data_store.redis import RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils import env
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME
-from src.utils.constants.names import (TELEGRAM_ALERTS_HANDLER_NAME_TEMPLATE,
+from src.utils.constants.names import (ALERTS_DISPATCHER_NAME,
+                                       TELEGRAM_ALERTS_HANDLER_NAME_TEMPLATE,
                                        TELEGRAM_COMMANDS_HANDLER_NAME_TEMPLATE,
                                        TELEGRAM_COMMAND_HANDLERS_NAME,
                                        SLACK_ALERTS_HANDLER_NAME_TEMPLATE,
@@ -57,6 +62,7 @@ from src.utils.constants.starters import (RE_INITIALISE_SLEEPING_PERIOD,
 from src.utils.logging import create_logger, log_and_print
 from src.utils.starters import (get_initialisation_error_message,
                                 get_stopped_message)
+from src.utils.types import ChannelTypes
 
 
 def _initialise_channel_handler_logger(
@@ -82,6 +88,14 @@ def _initialise_channel_handler_logger(
     return handler_logger
 
 
+def _get_alerts_outbox_path(channel_id: str) -> Optional[str]:
+    # The alerts of a channel are kept on disk only if an outbox file template
+    # is configured
+    if not env.CHANNEL_HANDLERS_OUTBOX_FILE_TEMPLATE:
+        return None
+    return env.CHANNEL_HANDLERS_OUTBOX_FILE_TEMPLATE.format(channel_id)
+
+
 def _initialise_alerts_logger() -> logging.Logger:
     # Try initialising the logger until successful. This had to be done
     # separately to avoid instances when the logger creation failed and we
@@ -126,7 +140,9 @@ def _initialise_telegram_alerts_handler(
 
             telegram_alerts_handler = TelegramAlertsHandler(
                 handler_display_name, handler_logger, rabbitmq,
-                telegram_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+                telegram_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+                digest_window=env.TELEGRAM_DIGEST_WINDOW_SECONDS,
+                outbox_path=_get_alerts_outbox_path(channel_id))
             log_and_print("Successfully initialised {}".format(
                 handler_display_name), handler_logger)
             break
@@ -172,7 +188,10 @@ def _initialise_telegram_commands_handler(
             cmd_handlers_redis = RedisApi(
                 logger=cmd_handlers_logger.getChild(RedisApi.__name__),
                 host=env.REDIS_IP, db=env.REDIS_DB, port=env.REDIS_PORT,
-                namespace=env.UNIQUE_ALERTER_IDENTIFIER)
+                namespace=env.UNIQUE_ALERTER_IDENTIFIER,
+                read_cache_size=env.REDIS_READ_CACHE_SIZE,
+                read_cache_ttl=timedelta(
+                    seconds=env.REDIS_READ_CACHE_TTL_SECONDS))
             cmd_handlers_mongo = MongoApi(
                 logger=cmd_handlers_logger.getChild(MongoApi.__name__),
                 host=REPLICA_SET_HOSTS, db_name=env.DB_NAME,
@@ -233,7 +252,9 @@ def _initialise_slack_alerts_handler(
 
             slack_alerts_handler = SlackAlertsHandler(
                 handler_display_name, handler_logger, rabbitmq,
-                slack_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+                slack_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+                digest_window=env.SLACK_DIGEST_WINDOW_SECONDS,
+                outbox_path=_get_alerts_outbox_path(channel_id))
             log_and_print("Successfully initialised {}".format(
                 handler_display_name), handler_logger)
             break
@@ -281,7 +302,10 @@ def _initialise_slack_commands_handler(
             cmd_handlers_redis = RedisApi(
                 logger=cmd_handlers_logger.getChild(RedisApi.__name__),
                 host=env.REDIS_IP, db=env.REDIS_DB, port=env.REDIS_PORT,
-                namespace=env.UNIQUE_ALERTER_IDENTIFIER)
+                namespace=env.UNIQUE_ALERTER_IDENTIFIER,
+                read_cache_size=env.REDIS_READ_CACHE_SIZE,
+                read_cache_ttl=timedelta(
+                    seconds=env.REDIS_READ_CACHE_TTL_SECONDS))
             cmd_handlers_mongo = MongoApi(
                 logger=cmd_handlers_logger.getChild(MongoApi.__name__),
                 host=REPLICA_SET_HOSTS, db_name=env.DB_NAME,
@@ -384,7 +408,8 @@ def _initialise_pagerduty_alerts_handler(
 
             pagerduty_channel = PagerDutyChannel(
                 channel_name, channel_id, handler_logger.getChild(
-                    PagerDutyChannel.__name__), pagerduty_api)
+                    PagerDutyChannel.__name__), pagerduty_api,
+                coalescing_window=env.INCIDENT_COALESCING_WINDOW_SECONDS)
 
             rabbitmq = RabbitMQApi(
                 logger=handler_logger.getChild(RabbitMQApi.__name__),
@@ -392,7 +417,8 @@ def _initialise_pagerduty_alerts_handler(
 
             pagerduty_alerts_handler = PagerDutyAlertsHandler(
                 handler_display_name, handler_logger, rabbitmq,
-                pagerduty_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+                pagerduty_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+                outbox_path=_get_alerts_outbox_path(channel_id))
             log_and_print("Successfully initialised {}".format(
                 handler_display_name), handler_logger)
             break
@@ -437,7 +463,9 @@ def _initialise_email_alerts_handler(
 
             email_alerts_handler = EmailAlertsHandler(
                 handler_display_name, handler_logger, rabbitmq, email_channel,
-                env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+                env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+                digest_window=env.EMAIL_DIGEST_WINDOW_SECONDS,
+                outbox_path=_get_alerts_outbox_path(channel_id))
             log_and_print("Successfully initialised {}".format(
                 handler_display_name), handler_logger)
             break
@@ -476,7 +504,8 @@ def _initialise_opsgenie_alerts_handler(
 
             opsgenie_channel = OpsgenieChannel(
                 channel_name, channel_id, handler_logger.getChild(
-                    OpsgenieChannel.__name__), opsgenie_api)
+                    OpsgenieChannel.__name__), opsgenie_api,
+                coalescing_window=env.INCIDENT_COALESCING_WINDOW_SECONDS)
 
             rabbitmq = RabbitMQApi(
                 logger=handler_logger.getChild(RabbitMQApi.__name__),
@@ -484,7 +513,8 @@ def _initialise_opsgenie_alerts_handler(
 
             opsgenie_alerts_handler = OpsgenieAlertsHandler(
                 handler_display_name, handler_logger, rabbitmq,
-                opsgenie_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+                opsgenie_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+                outbox_path=_get_alerts_outbox_path(channel_id))
             log_and_print("Successfully initialised {}".format(
                 handler_display_name), handler_logger)
             break
@@ -583,7 +613,142 @@ def start_log_alerts_handler(channel_id: str, channel_name: str) -> None:
     start_handler(log_alerts_handler)
 
 
-def start_handler(handler: ChannelHandler) -> None:
+def _create_destination_worker(channel_type: str,
+                               handler_args: Tuple) -> DestinationWorker:
+    """
+    Creates the worker which sends the alerts of a channel hosted by the alerts
+    dispatcher.
+    :param channel_type: The type of the channel
+    :param handler_args: The arguments the alerts handler of the channel is
+                       : started with
+    :return: The worker of the channel
+    """
+    queue_size = env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE
+    if channel_type == ChannelTypes.TELEGRAM.value:
+        bot_token, bot_chat_id, channel_id, channel_name = handler_args
+        name = TELEGRAM_ALERTS_HANDLER_NAME_TEMPLATE.format(channel_name)
+        logger = _initialise_channel_handler_logger(
+            name, TelegramAlertsHandler.__name__)
+        channel = TelegramChannel(
+            channel_name, channel_id, logger.getChild(
+                TelegramChannel.__name__),
+            TelegramBotApi(bot_token, bot_chat_id))
+        return DestinationWorker(
+            name, logger, channel.alert, queue_size,
+            digest_window=env.TELEGRAM_DIGEST_WINDOW_SECONDS)
+    elif channel_type == ChannelTypes.SLACK.value:
+        bot_token, app_token, bot_channel_id, channel_id, channel_name = \
+            handler_args
+        name = SLACK_ALERTS_HANDLER_NAME_TEMPLATE.format(channel_name)
+        logger = _initialise_channel_handler_logger(
+            name, SlackAlertsHandler.__name__)
+        channel = SlackChannel(
+            channel_name, channel_id, logger.getChild(SlackChannel.__name__),
+            SlackBotApi(bot_token, app_token, bot_channel_id))
+        return DestinationWorker(
+            name, logger, channel.alert, queue_size,
+            digest_window=env.SLACK_DIGEST_WINDOW_SECONDS)
+    elif channel_type == ChannelTypes.TWILIO.value:
+        (account_sid, auth_token, channel_id, channel_name, call_from, call_to,
+         twiml, twiml_is_url) = handler_args
+        name = TWILIO_ALERTS_HANDLER_NAME_TEMPLATE.format(channel_name)
+        logger = _initialise_channel_handler_logger(
+            name, TwilioAlertsHandler.__name__)
+        channel = TwilioChannel(
+            channel_name, channel_id, logger.getChild(TwilioChannel.__name__),
+            TwilioApi(account_sid, auth_token))
+        caller = TwilioCaller(channel, call_from, call_to, twiml, twiml_is_url)
+        return DestinationWorker(
+            name, logger, caller, queue_size, max_attempts=3,
+            alert_validity_threshold=300, retry_initial_delay=5)
+    elif channel_type == ChannelTypes.EMAIL.value:
+        (smtp, email_from, emails_to, channel_id, channel_name, username,
+         password, port) = handler_args
+        name = EMAIL_ALERTS_HANDLER_NAME_TEMPLATE.format(channel_name)
+        logger = _initialise_channel_handler_logger(
+            name, EmailAlertsHandler.__name__)
+        channel = EmailChannel(
+            channel_name, channel_id, logger.getChild(EmailChannel.__name__),
+            emails_to, EmailApi(smtp, email_from, username, password, port))
+        return DestinationWorker(
+            name, logger, channel.alert, queue_size,
+            digest_window=env.EMAIL_DIGEST_WINDOW_SECONDS)
+    elif channel_type == ChannelTypes.PAGERDUTY.value:
+        integration_key, channel_id, channel_name = handler_args
+        name = PAGERDUTY_ALERTS_HANDLER_NAME_TEMPLATE.format(channel_name)
+        logger = _initialise_channel_handler_logger(
+            name, PagerDutyAlertsHandler.__name__)
+        channel = PagerDutyChannel(
+            channel_name, channel_id, logger.getChild(
+                PagerDutyChannel.__name__), PagerDutyApi(integration_key),
+            coalescing_window=env.INCIDENT_COALESCING_WINDOW_SECONDS)
+        return DestinationWorker(name, logger, channel.alert, queue_size)
+    elif channel_type == ChannelTypes.OPSGENIE.value:
+        api_key, eu_host, channel_id, channel_name = handler_args
+        name = OPSGENIE_ALERTS_HANDLER_NAME_TEMPLATE.format(channel_name)
+        logger = _initialise_channel_handler_logger(
+            name, OpsgenieAlertsHandler.__name__)
+        channel = OpsgenieChannel(
+            channel_name, channel_id, logger.getChild(
+                OpsgenieChannel.__name__), OpsgenieApi(api_key, eu_host),
+            coalescing_window=env.INCIDENT_COALESCING_WINDOW_SECONDS)
+        return DestinationWorker(name, logger, channel.alert, queue_size)
+    elif channel_type == ChannelTypes.CONSOLE.value:
+        channel_id, channel_name = handler_args
+        name = CONSOLE_ALERTS_HANDLER_NAME_TEMPLATE.format(channel_name)
+        logger = _initialise_channel_handler_logger(
+            name, ConsoleAlertsHandler.__name__)
+        channel = ConsoleChannel(channel_name, channel_id,
+                                 logger.getChild(ConsoleChannel.__name__))
+        return DestinationWorker(name, logger, channel.alert, queue_size)
+    elif channel_type == ChannelTypes.LOG.value:
+        channel_id, channel_name = handler_args
+        name = LOG_ALERTS_HANDLER_NAME_TEMPLATE.format(channel_name)
+        logger = _initialise_channel_handler_logger(
+            name, LogAlertsHandler.__name__)
+        channel = LogChannel(channel_name, channel_id,
+                             logger.getChild(LogChannel.__name__),
+                             _initialise_alerts_logger())
+        return DestinationWorker(name, logger, channel.alert, queue_size)
+
+    raise ValueError("Channel type {} cannot be dispatched".format(
+        channel_type))
+
+
+def _initialise_alerts_dispatcher(
+        commands: multiprocessing.Queue) -> AlertsDispatcher:
+    dispatcher_logger = _initialise_channel_handler_logger(
+        ALERTS_DISPATCHER_NAME, AlertsDispatcher.__name__)
+
+    # Try initialising the dispatcher until successful
+    while True:
+        try:
+            rabbitmq = RabbitMQApi(
+                logger=dispatcher_logger.getChild(RabbitMQApi.__name__),
+                host=env.RABBIT_IP)
+
+            alerts_dispatcher = AlertsDispatcher(
+                dispatcher_logger, ALERTS_DISPATCHER_NAME, rabbitmq, commands,
+                _create_destination_worker,
+                env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+            log_and_print("Successfully initialised {}".format(
+                ALERTS_DISPATCHER_NAME), dispatcher_logger)
+            break
+        except Exception as e:
+            msg = get_initialisation_error_message(ALERTS_DISPATCHER_NAME, e)
+            log_and_print(msg, dispatcher_logger)
+            # sleep before trying again
+            time.sleep(RE_INITIALISE_SLEEPING_PERIOD)
+
+    return alerts_dispatcher
+
+
+def start_alerts_dispatcher(commands: multiprocessing.Queue) -> None:
+    alerts_dispatcher = _initialise_alerts_dispatcher(commands)
+    start_handler(alerts_dispatcher)
+
+
+def start_handler(handler: Union[ChannelHandler, AlertsDispatcher]) -> None:
     while True:
         try:
             log_and_print("{} started.".format(handler), handler.logger)
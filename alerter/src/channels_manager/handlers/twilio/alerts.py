@@ -13,6 +13,7 @@ from src.alerter.alerts.alert import Alert
 from src.alerter.grouped_alerts_metric_code import GroupedAlertsMetricCode
 from src.channels_manager.channels.twilio import TwilioChannel
 from src.channels_manager.handlers.handler import ChannelHandler
+from src.channels_manager.handlers.retry_scheduler import RetryScheduler
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE, HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
@@ -38,6 +39,10 @@ class TwilioAlertsHandler(ChannelHandler):
         self._twiml_is_url = twiml_is_url
         self._max_attempts = max_attempts
         self._alert_validity_threshold = alert_validity_threshold
+
+        # Failed calls are re-tried per number, starting 5 seconds after the
+        # first attempt
+        self._retry_scheduler = RetryScheduler(max_attempts, initial_delay=5)
         self._twilio_alerts_handler_queue = \
             CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE.format(
                 self.twilio_channel.channel_id)
@@ -148,28 +153,12 @@ class TwilioAlertsHandler(ChannelHandler):
                               "ago")
             return RequestStatus.FAILED
 
-        # For each number try calling max_attempts times with 5 seconds sleep in
-        # between until the call is successful. If this threshold is reached,
-        # we move on to the next number.
+        # Call each number once. Calls which fail are re-tried up to
+        # max_attempts - 1 times with an exponential backoff while the handler
+        # keeps consuming, so that a failing number does not delay the rest.
         calling_status = RequestStatus.SUCCESS
         for number in self._call_to:
-            attempts = 1
-            ret = self.twilio_channel.alert(call_from=self._call_from,
-                                            call_to=number, twiml=self._twiml,
-                                            twiml_is_url=self._twiml_is_url)
-            while ret != RequestStatus.SUCCESS and \
-                    attempts < self._max_attempts:
-                self.logger.debug("Will re-trying calling in 5 seconds. "
-                                  "Attempts left: %s",
-                                  self._max_attempts - attempts)
-                self.rabbitmq.connection.sleep(5)
-                ret = self.twilio_channel.alert(call_from=self._call_from,
-                                                call_to=number,
-                                                twiml=self._twiml,
-                                                twiml_is_url=self._twiml_is_url)
-                attempts += 1
-
-            if ret == RequestStatus.FAILED:
+            if self._call_number(alert, number) != RequestStatus.SUCCESS:
                 calling_status = RequestStatus.FAILED
 
         if calling_status == RequestStatus.SUCCESS:
@@ -181,7 +170,47 @@ class TwilioAlertsHandler(ChannelHandler):
 
         return calling_status
 
+    def _call_number(self, alert: Alert, number: str) -> RequestStatus:
+        ret = self.twilio_channel.alert(call_from=self._call_from,
+                                        call_to=number, twiml=self._twiml,
+                                        twiml_is_url=self._twiml_is_url)
+        if ret == RequestStatus.SUCCESS:
+            self._retry_scheduler.forget((alert, number))
+            return ret
+
+        delay = self._retry_scheduler.attempt_failed((alert, number))
+        if delay is None:
+            self.logger.error("Could not call %s after %s attempts", number,
+                              self._max_attempts)
+        else:
+            self.logger.debug("Will re-try calling %s in %.1f seconds. "
+                              "Attempts left: %s", number, delay,
+                              self._max_attempts
+                              - self._retry_scheduler.attempts((alert, number)))
+            self._schedule_retry(
+                self._retry_scheduler.seconds_until_next_attempt())
+        return ret
+
+    def _retry_failed(self) -> None:
+        for alert, number in self._retry_scheduler.due_items():
+            # Calls for alerts which are now considered to be old are dropped
+            if (datetime.now().timestamp() - alert.timestamp) \
+                    > self._alert_validity_threshold:
+                self.logger.error("Did not re-try calling %s as alert was "
+                                  "raised a while ago", number)
+                self._retry_scheduler.forget((alert, number))
+                continue
+
+            self._call_number(alert, number)
+
+        # Keep a timer for the retries which are not yet due
+        next_attempt = self._retry_scheduler.seconds_until_next_attempt()
+        if next_attempt is not None and self._retry_timer is None:
+            self._schedule_retry(next_attempt)
+
     def start(self) -> None:
+        # Timers do not survive a new connection
+        self._retry_timer = None
         self._initialise_rabbitmq()
         while True:
             try:
@@ -0,0 +1,66 @@
+from typing import Dict, Tuple
+
+from src.alerter.alert_severities import Severity
+from src.alerter.alerts.alert import Alert
+
+
+class IncidentTracker:
+    """
+    This class keeps track of the incidents opened by an incident channel
+    such as PagerDuty or Opsgenie. An incident is identified by a key derived
+    from the origin, metric and metric state arguments of its alerts, so that
+    the alerts raising and solving the same problem share an incident. An INFO
+    alert solves the incident, whereas any other severity opens it. Updates of
+    the same incident with the same severity which are sent within `window`
+    seconds of each other are coalesced, and a window of 0 disables this.
+    """
+
+    def __init__(self, window: float) -> None:
+        self._window = window
+        self._open_incidents: Dict[str, str] = {}
+        self._last_updates: Dict[str, Tuple[str, float]] = {}
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    @staticmethod
+    def incident_key(alert: Alert) -> str:
+        return '_'.join(
+            ['PANIC', alert.origin_id, alert.alert_group_metric_code.value]
+            + [str(arg) for arg in alert.metric_state_args])
+
+    @staticmethod
+    def solves_incident(alert: Alert) -> bool:
+        return alert.severity == Severity.INFO.value
+
+    def is_open(self, alert: Alert) -> bool:
+        return self.incident_key(alert) in self._open_incidents
+
+    def open_severity(self, alert: Alert) -> str:
+        return self._open_incidents.get(self.incident_key(alert))
+
+    def should_coalesce(self, alert: Alert) -> bool:
+        if self._window <= 0:
+            return False
+
+        last_update = self._last_updates.get(self.incident_key(alert))
+        if last_update is None:
+            return False
+
+        last_severity, last_timestamp = last_update
+        return (last_severity == alert.severity
+                and alert.timestamp - last_timestamp < self._window)
+
+    def record(self, alert: Alert) -> None:
+        """
+        Records that an alert was sent successfully to the channel.
+        :param alert: The alert which was sent
+        """
+        key = self.incident_key(alert)
+        if self.solves_incident(alert):
+            self._open_incidents.pop(key, None)
+        else:
+            self._open_incidents[key] = alert.severity
+
+        self._last_updates[key] = (alert.severity, alert.timestamp)
@@ -5,18 +5,21 @@ import multiprocessing
 import sys
 from datetime import datetime
 from types import FrameType
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
 
 from src.abstract.publisher_subscriber import PublisherSubscriberComponent
+from src.channels_manager.handlers.dispatcher import (ADD_DESTINATION,
+                                                      DispatchedHandler)
 from src.channels_manager.handlers.starters import (
     start_telegram_alerts_handler, start_telegram_commands_handler,
     start_slack_alerts_handler, start_slack_commands_handler,
     start_twilio_alerts_handler, start_console_alerts_handler,
     start_log_alerts_handler, start_email_alerts_handler,
-    start_pagerduty_alerts_handler, start_opsgenie_alerts_handler)
+    start_pagerduty_alerts_handler, start_opsgenie_alerts_handler,
+    start_alerts_dispatcher)
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils import env
 from src.utils.configs import (get_newly_added_configs, get_modified_configs,
@@ -52,6 +55,11 @@ class ChannelsManager(PublisherSubscriberComponent):
         self._channel_configs = {}
         self._channel_process_dict = {}
 
+        # The process hosting the alerts handlers if dispatcher mode is
+        # enabled, and the queue through which it is given the handlers
+        self._dispatcher_process = None
+        self._dispatcher_commands = None
+
         super().__init__(logger, rabbitmq)
 
     def __str__(self) -> str:
@@ -124,16 +132,64 @@ class ChannelsManager(PublisherSubscriberComponent):
         self.logger.debug("Sent heartbeat to '%s' exchange",
                           HEALTH_CHECK_EXCHANGE)
 
+    def _start_alerts_dispatcher(self) -> None:
+        self._dispatcher_commands = multiprocessing.Queue()
+        # Commands which are not yet sent to the dispatcher by the time the
+        # manager exits are not needed, so the manager must not wait for them
+        self._dispatcher_commands.cancel_join_thread()
+        process = multiprocessing.Process(
+            target=start_alerts_dispatcher, args=(self._dispatcher_commands,))
+        process.daemon = True
+        log_and_print("Creating a new process for the alerts dispatcher",
+                      self.logger)
+        process.start()
+        self._dispatcher_process = process
+
+    def _start_alerts_handler(
+            self, target: Callable, args: Tuple, channel_id: str,
+            channel_type: str, channel_description: str) \
+            -> Union[multiprocessing.Process, DispatchedHandler]:
+        """
+        Starts an alerts handler in a process of its own, or hosts it in the
+        alerts dispatcher if dispatcher mode is enabled. In the latter case a
+        DispatchedHandler is returned, which can be used in place of the
+        handler's process.
+        :param target: The function which starts the handler in its process
+        :param args: The arguments of the handler
+        :param channel_id: The id of the handler's channel
+        :param channel_type: The type of the handler's channel
+        :param channel_description: Describes the channel in the logs
+        :return: The process of the handler, or its DispatchedHandler
+        """
+        if not env.CHANNEL_HANDLERS_DISPATCHER_MODE:
+            process = multiprocessing.Process(target=target, args=args)
+            process.daemon = True
+            log_and_print("Creating a new process for the alerts handler of "
+                          "{}".format(channel_description), self.logger)
+            process.start()
+            return process
+
+        if self._dispatcher_process is None \
+                or not self._dispatcher_process.is_alive():
+            if self._dispatcher_process is not None:
+                self._dispatcher_process.join()  # To release resources
+            self._start_alerts_dispatcher()
+
+        log_and_print("Adding the alerts handler of {} to the alerts "
+                      "dispatcher".format(channel_description), self.logger)
+        self._dispatcher_commands.put(
+            (ADD_DESTINATION, channel_id, channel_type, args))
+        return DispatchedHandler(channel_id, self._dispatcher_process,
+                                 self._dispatcher_commands)
+
     def _create_and_start_telegram_alerts_handler(
             self, bot_token: str, bot_chat_id: str, channel_id: str,
             channel_name: str) -> None:
-        process = multiprocessing.Process(target=start_telegram_alerts_handler,
-                                          args=(bot_token, bot_chat_id,
-                                                channel_id, channel_name))
-        process.daemon = True
-        log_and_print("Creating a new process for the alerts handler of "
-                      "Telegram channel {}".format(channel_name), self.logger)
-        process.start()
+        process = self._start_alerts_handler(
+            start_telegram_alerts_handler,
+            (bot_token, bot_chat_id, channel_id, channel_name),
+            channel_id, ChannelTypes.TELEGRAM.value,
+            "Telegram channel {}".format(channel_name))
 
         if channel_id not in self._channel_process_dict:
             self._channel_process_dict[channel_id] = {}
@@ -182,14 +238,11 @@ class ChannelsManager(PublisherSubscriberComponent):
     def _create_and_start_slack_alerts_handler(
             self, bot_token: str, app_token: str, bot_channel_id: str,
             channel_id: str, channel_name: str) -> None:
-        process = multiprocessing.Process(target=start_slack_alerts_handler,
-                                          args=(bot_token, app_token,
-                                                bot_channel_id, channel_id,
-                                                channel_name))
-        process.daemon = True
-        log_and_print("Creating a new process for the alerts handler of "
-                      "Slack channel {}".format(channel_name), self.logger)
-        process.start()
+        process = self._start_alerts_handler(
+            start_slack_alerts_handler,
+            (bot_token, app_token, bot_channel_id, channel_id, channel_name),
+            channel_id, ChannelTypes.SLACK.value,
+            "Slack channel {}".format(channel_name))
 
         if channel_id not in self._channel_process_dict:
             self._channel_process_dict[channel_id] = {}
@@ -242,14 +295,12 @@ class ChannelsManager(PublisherSubscriberComponent):
             self, account_sid: str, auth_token: str, channel_id: str,
             channel_name: str, call_from: str, call_to: List[str], twiml: str,
             twiml_is_url: bool) -> None:
-        process = multiprocessing.Process(
-            target=start_twilio_alerts_handler,
-            args=(account_sid, auth_token, channel_id, channel_name, call_from,
-                  call_to, twiml, twiml_is_url))
-        process.daemon = True
-        log_and_print("Creating a new process for the alerts handler of "
-                      "Twilio channel {}".format(channel_name), self.logger)
-        process.start()
+        process = self._start_alerts_handler(
+            start_twilio_alerts_handler,
+            (account_sid, auth_token, channel_id, channel_name, call_from,
+             call_to, twiml, twiml_is_url),
+            channel_id, ChannelTypes.TWILIO.value,
+            "Twilio channel {}".format(channel_name))
 
         if channel_id not in self._channel_process_dict:
             self._channel_process_dict[channel_id] = {}
@@ -274,14 +325,12 @@ class ChannelsManager(PublisherSubscriberComponent):
             self, smtp: str, email_from: str, emails_to: List[str],
             channel_id: str, channel_name: str, username: Optional[str],
             password: Optional[str], port: int = 0) -> None:
-        process = multiprocessing.Process(
-            target=start_email_alerts_handler,
-            args=(smtp, email_from, emails_to, channel_id, channel_name,
-                  username, password, port))
-        process.daemon = True
-        log_and_print("Creating a new process for the alerts handler of "
-                      "e-mail channel {}".format(channel_name), self.logger)
-        process.start()
+        process = self._start_alerts_handler(
+            start_email_alerts_handler,
+            (smtp, email_from, emails_to, channel_id, channel_name, username,
+             password, port),
+            channel_id, ChannelTypes.EMAIL.value,
+            "e-mail channel {}".format(channel_name))
 
         if channel_id not in self._channel_process_dict:
             self._channel_process_dict[channel_id] = {}
@@ -305,13 +354,11 @@ class ChannelsManager(PublisherSubscriberComponent):
     def _create_and_start_pagerduty_alerts_handler(
             self, integration_key: str, channel_id: str, channel_name: str) \
             -> None:
-        process = multiprocessing.Process(
-            target=start_pagerduty_alerts_handler,
-            args=(integration_key, channel_id, channel_name))
-        process.daemon = True
-        log_and_print("Creating a new process for the alerts handler of "
-                      "PagerDuty channel {}".format(channel_name), self.logger)
-        process.start()
+        process = self._start_alerts_handler(
+            start_pagerduty_alerts_handler,
+            (integration_key, channel_id, channel_name),
+            channel_id, ChannelTypes.PAGERDUTY.value,
+            "PagerDuty channel {}".format(channel_name))
 
         if channel_id not in self._channel_process_dict:
             self._channel_process_dict[channel_id] = {}
@@ -330,13 +377,11 @@ class ChannelsManager(PublisherSubscriberComponent):
     def _create_and_start_opsgenie_alerts_handler(
             self, api_key: str, eu_host: bool, channel_id: str,
             channel_name: str) -> None:
-        process = multiprocessing.Process(
-            target=start_opsgenie_alerts_handler,
-            args=(api_key, eu_host, channel_id, channel_name))
-        process.daemon = True
-        log_and_print("Creating a new process for the alerts handler of "
-                      "Opsgenie channel {}".format(channel_name), self.logger)
-        process.start()
+        process = self._start_alerts_handler(
+            start_opsgenie_alerts_handler,
+            (api_key, eu_host, channel_id, channel_name),
+            channel_id, ChannelTypes.OPSGENIE.value,
+            "Opsgenie channel {}".format(channel_name))
 
         if channel_id not in self._channel_process_dict:
             self._channel_process_dict[channel_id] = {}
@@ -355,12 +400,10 @@ class ChannelsManager(PublisherSubscriberComponent):
 
     def _create_and_start_console_alerts_handler(
             self, channel_id: str, channel_name: str) -> None:
-        process = multiprocessing.Process(target=start_console_alerts_handler,
-                                          args=(channel_id, channel_name))
-        process.daemon = True
-        log_and_print("Creating a new process for the alerts handler of "
-                      "console channel {}".format(channel_name), self.logger)
-        process.start()
+        process = self._start_alerts_handler(
+            start_console_alerts_handler, (channel_id, channel_name),
+            channel_id, ChannelTypes.CONSOLE.value,
+            "console channel {}".format(channel_name))
 
         if channel_id not in self._channel_process_dict:
             self._channel_process_dict[channel_id] = {}
@@ -377,12 +420,10 @@ class ChannelsManager(PublisherSubscriberComponent):
 
     def _create_and_start_log_alerts_handler(self, channel_id: str,
                                              channel_name: str) -> None:
-        process = multiprocessing.Process(target=start_log_alerts_handler,
-                                          args=(channel_id, channel_name))
-        process.daemon = True
-        log_and_print("Creating a new process for the alerts handler of "
-                      "log channel {}".format(channel_name), self.logger)
-        process.start()
+        process = self._start_alerts_handler(
+            start_log_alerts_handler, (channel_id, channel_name),
+            channel_id, ChannelTypes.LOG.value,
+            "log channel {}".format(channel_name))
 
         if channel_id not in self._channel_process_dict:
             self._channel_process_dict[channel_id] = {}
@@ -1243,6 +1284,11 @@ class ChannelsManager(PublisherSubscriberComponent):
                 process.terminate()
                 process.join()
 
+        if self._dispatcher_process is not None:
+            log_and_print("Terminating the alerts dispatcher", self.logger)
+            self._dispatcher_process.terminate()
+            self._dispatcher_process.join()
+
         log_and_print("{} terminated.".format(self), self.logger)
         sys.exit()
 
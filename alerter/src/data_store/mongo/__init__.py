@@ -1 +1,2 @@
+from src.data_store.mongo.async_mongo_api import AsyncMongoApi
 from src.data_store.mongo.mongo_api import MongoApi
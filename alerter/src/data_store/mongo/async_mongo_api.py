@@ -0,0 +1,98 @@
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Dict, List, Optional, Any, Callable
+
+from pymongo.results import InsertOneResult, InsertManyResult, UpdateResult
+
+from src.data_store.mongo.mongo_api import MongoApi
+
+
+class AsyncMongoApi:
+    """
+    An asyncio counterpart of MongoApi. Every operation is delegated to a
+    MongoApi whose calls run on a pool of worker threads, with the MongoClient
+    connection pool sized accordingly, so that store I/O can overlap with
+    message processing. The `_safe` back-off is that of MongoApi.
+    """
+
+    def __init__(self, logger: logging.Logger, db_name: str,
+                 host='localhost', port: int = 27017,
+                 username: str = '', password: str = '',
+                 live_check_time_interval: timedelta = timedelta(seconds=60),
+                 timeout_ms: int = 10000, replicaSet=None,
+                 pool_size: int = 10) -> None:
+        self._logger = logger
+        self._pool_size = pool_size
+        self._mongo_api = MongoApi(
+            logger, db_name, host, port, username, password,
+            live_check_time_interval, timeout_ms, replicaSet,
+            max_pool_size=pool_size)
+        self._executor = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix=AsyncMongoApi.__name__)
+
+    @property
+    def is_live(self) -> bool:
+        return self._mongo_api.is_live
+
+    @property
+    def db_name(self) -> str:
+        return self._mongo_api.db_name
+
+    @property
+    def pool_size(self) -> int:
+        return self._pool_size
+
+    async def _run(self, function: Callable, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(function, *args))
+
+    def close(self) -> None:
+        """
+        Waits for the pending operations and closes the MongoClient.
+        """
+        self._executor.shutdown(wait=True)
+        self._mongo_api.close()
+
+    async def insert_one(self, collection: str, document: Dict) \
+            -> Optional[InsertOneResult]:
+        return await self._run(self._mongo_api.insert_one, collection,
+                               document)
+
+    async def insert_many(self, collection: str, documents: List[Dict]) \
+            -> Optional[InsertManyResult]:
+        return await self._run(self._mongo_api.insert_many, collection,
+                               documents)
+
+    async def update_one(self, collection: str, query: Dict, document: Dict) \
+            -> Optional[UpdateResult]:
+        return await self._run(self._mongo_api.update_one, collection, query,
+                               document)
+
+    async def replace_one(self, collection: str, query: Dict, document: Dict) \
+            -> Optional[UpdateResult]:
+        return await self._run(self._mongo_api.replace_one, collection, query,
+                               document)
+
+    async def get_one(self, collection: str, query: Dict) -> Optional[Dict]:
+        return await self._run(self._mongo_api.get_one, collection, query)
+
+    async def get_by(self, collection: str, query: Dict) -> Optional[List]:
+        # Unlike MongoApi.get_by, the lazy cursor is exhausted in the worker
+        # thread so that iterating it does not block the event loop.
+        return await self._run(self._mongo_api.get_all_by, collection, query)
+
+    async def get_all(self, collection: str) -> Optional[List[Dict]]:
+        return await self._run(self._mongo_api.get_all, collection)
+
+    async def drop_collection(self, collection: str) -> Optional[Dict]:
+        return await self._run(self._mongo_api.drop_collection, collection)
+
+    async def drop_db(self) -> None:
+        return await self._run(self._mongo_api.drop_db)
+
+    async def ping_unsafe(self):
+        return await self._run(self._mongo_api.ping_unsafe)
@@ -1,10 +1,12 @@
 import logging
+import threading
 from datetime import timedelta
-from typing import Dict, List, Mapping, Optional, Any
+from typing import Dict, List, Mapping, Optional, Any, Tuple, Union
 
 from pymongo import MongoClient
 from pymongo.collection import CollectionChangeStream
-from pymongo.results import InsertOneResult, InsertManyResult, UpdateResult
+from pymongo.results import (InsertOneResult, InsertManyResult, UpdateResult,
+                             DeleteResult)
 
 from src.utils.timing import TimedTaskLimiter
 
@@ -14,17 +16,20 @@ class MongoApi:
                  host='localhost', port: int = 27017,
                  username: str = '', password: str = '',
                  live_check_time_interval: timedelta = timedelta(seconds=60),
-                 timeout_ms: int = 10000, replicaSet=None) \
-            -> None:
+                 timeout_ms: int = 10000, replicaSet=None,
+                 max_pool_size: int = 100) -> None:
         self._logger = logger
         self._db_name = db_name
 
         self._create_client(host, port, username, password,
-                            timeout_ms, replicaSet)
+                            timeout_ms, replicaSet, max_pool_size)
 
         # The live check limiter means that we don't wait for connection
         # errors to occur to be able to continue, thus speeding everything up
         self._live_check_limiter = TimedTaskLimiter(live_check_time_interval)
+        # The live state is guarded by a lock as the asyncio APIs use this
+        # class from many worker threads
+        self._live_state_lock = threading.Lock()
         self._is_live = True  # This is necessary to initialise the variable
         self._set_as_live()
 
@@ -46,7 +51,7 @@ class MongoApi:
         return self._client[self._db_name][collection].watch(resume_after=token)
 
     def _create_client(self, host, port, username, password, timeout_ms,
-                       replicaSet=None) -> None:
+                       replicaSet=None, max_pool_size: int = 100) -> None:
         """
         Configure Options connection options and/or Replica Set to the 
         MongoClient.
@@ -59,47 +64,56 @@ class MongoApi:
                 self._client = MongoClient(
                     host=host, port=port, connectTimeoutMS=timeout_ms,
                     socketTimeoutMS=timeout_ms,
-                    serverSelectionTimeoutMS=timeout_ms)
+                    serverSelectionTimeoutMS=timeout_ms,
+                    maxPoolSize=max_pool_size)
             else:
                 self._client = MongoClient(
                     host=host, port=port, connectTimeoutMS=timeout_ms,
                     socketTimeoutMS=timeout_ms,
                     serverSelectionTimeoutMS=timeout_ms,
                     replicaSet=replicaSet,
-                    readPreference='primaryPreferred')
+                    readPreference='primaryPreferred',
+                    maxPoolSize=max_pool_size)
         else:
             if replicaSet is None:
                 self._client = MongoClient(
                     host=host, port=port, connectTimeoutMS=timeout_ms,
                     socketTimeoutMS=timeout_ms,
                     serverSelectionTimeoutMS=timeout_ms,
-                    username=username, password=password)
+                    username=username, password=password,
+                    maxPoolSize=max_pool_size)
             else:
                 self._client = MongoClient(
                     host=host, port=port, connectTimeoutMS=timeout_ms,
                     socketTimeoutMS=timeout_ms,
                     serverSelectionTimeoutMS=timeout_ms, username=username,
                     password=password, replicaSet=replicaSet,
-                    readPreference='primaryPreferred')
+                    readPreference='primaryPreferred',
+                    maxPoolSize=max_pool_size)
 
     def _set_as_live(self) -> None:
-        if not self._is_live:
-            self._logger.info("Mongo is now accessible again.")
-        self._is_live = True
+        with self._live_state_lock:
+            if not self._is_live:
+                self._logger.info("Mongo is now accessible again.")
+            self._is_live = True
 
     def _set_as_down(self) -> None:
         # If Mongo is live or if we can check whether it is live (because the
         # live check time interval has passed), reset the live check limiter
         # so that usage of Mongo is skipped for as long as the time interval
-        if self._is_live or self._live_check_limiter.can_do_task():
-            self._live_check_limiter.did_task()
-            self._logger.warning("Mongo is unusable for some reason. Stopping "
-                                 "usage temporarily to improve performance.")
-        self._is_live = False
+        with self._live_state_lock:
+            if self._is_live or self._live_check_limiter.can_do_task():
+                self._live_check_limiter.did_task()
+                self._logger.warning("Mongo is unusable for some reason. "
+                                     "Stopping usage temporarily to improve "
+                                     "performance.")
+            self._is_live = False
 
     def _do_not_use_if_recently_went_down(self) -> bool:
         # If Mongo is not live and cannot check if it is live return true
-        return not self._is_live and not self._live_check_limiter.can_do_task()
+        with self._live_state_lock:
+            return not self._is_live \
+                   and not self._live_check_limiter.can_do_task()
 
     def _safe(self, function, args: List[Any], default_return: Any):
         # Calls the function with the provided arguments and performs exception
@@ -150,6 +164,40 @@ class MongoApi:
             lambda col, q: self._db[col].find(q),
             [collection, query], None)
 
+    def delete_many(self, collection: str, query: Dict) \
+            -> Optional[DeleteResult]:
+        return self._safe(
+            lambda col, q: self._db[col].delete_many(q),
+            [collection, query], None)
+
+    def copy_many(self, collection: str, query: Dict, target: str) \
+            -> Optional[List]:
+        # The documents are copied server-side by a $merge stage. Documents
+        # already in the target are kept, so a copy can be safely repeated.
+        return self._safe(
+            lambda col, q, tgt: list(self._db[col].aggregate([
+                {'$match': q},
+                {'$merge': {'into': tgt, 'on': '_id',
+                            'whenMatched': 'keepExisting',
+                            'whenNotMatched': 'insert'}}
+            ])), [collection, query, target], None)
+
+    def create_index(self, collection: str,
+                     keys: Union[str, List[Tuple[str, int]]],
+                     **kwargs) -> Optional[str]:
+        # Creating an index which already exists with the same options is a
+        # no-op, so this can be called whenever a collection is first used.
+        return self._safe(
+            lambda col, k: self._db[col].create_index(k, **kwargs),
+            [collection, keys], None)
+
+    def get_all_by(self, collection: str, query: Dict) \
+            -> Optional[List[Dict]]:
+        # Unlike get_by, the cursor is exhausted within the call
+        return self._safe(
+            lambda col, q: list(self._db[col].find(q)),
+            [collection, query], None)
+
     def get_all(self, collection: str) -> Optional[List[Dict]]:
         return self._safe(
             lambda col: list(self._db[col].find({})),
@@ -168,5 +216,8 @@ class MongoApi:
     def ping_unsafe(self):
         return self._db.command('ping')
 
+    def close(self) -> None:
+        self._client.close()
+
     def ping_auth(self, username: str, password: str):
         return self._db.authenticate(username, password, 'admin')
\ No newline at end of file
@@ -1,2 +1,3 @@
+from src.data_store.redis.async_redis_api import AsyncRedisApi
 from src.data_store.redis.redis_api import RedisApi
 from src.data_store.redis.store_keys import Keys
@@ -0,0 +1,118 @@
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Dict, Optional, List, Any, Callable
+
+from src.data_store.redis.redis_api import RedisApi
+from src.utils.types import RedisType
+
+
+class AsyncRedisApi:
+    """
+    An asyncio counterpart of RedisApi. Every operation is delegated to a
+    RedisApi whose calls run on a pool of worker threads sharing a pool of
+    Redis connections of the same size, so that store I/O can overlap with
+    message processing. Since the RedisApi methods are used as they are, the
+    `_safe` back-off and the namespace handling are exactly the same.
+    """
+
+    def __init__(self, logger: logging.Logger, db: int,
+                 host: str = 'localhost', port: int = 6379,
+                 password: str = '', namespace: str = '',
+                 live_check_time_interval: timedelta = timedelta(seconds=60),
+                 pool_size: int = 10) -> None:
+        self._logger = logger
+        self._pool_size = pool_size
+        self._redis_api = RedisApi(
+            logger, db, host, port, password, namespace,
+            live_check_time_interval, max_connections=pool_size)
+        self._executor = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix=AsyncRedisApi.__name__)
+
+    @property
+    def is_live(self) -> bool:
+        return self._redis_api.is_live
+
+    @property
+    def pool_size(self) -> int:
+        return self._pool_size
+
+    async def _run(self, function: Callable, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(function, *args))
+
+    def close(self) -> None:
+        """
+        Waits for the pending operations and closes all the connections.
+        """
+        self._executor.shutdown(wait=True)
+        self._redis_api.disconnect()
+
+    async def set(self, key: str, value: RedisType):
+        return await self._run(self._redis_api.set, key, value)
+
+    async def hset(self, name: str, key: str, value: RedisType):
+        return await self._run(self._redis_api.hset, name, key, value)
+
+    async def set_multiple(self, key_values: Dict[str, RedisType]):
+        return await self._run(self._redis_api.set_multiple, key_values)
+
+    async def hset_multiple(self, name: str, key_values: Dict[str, RedisType]):
+        return await self._run(self._redis_api.hset_multiple, name, key_values)
+
+    async def set_for(self, key: str, value: RedisType, time: timedelta):
+        return await self._run(self._redis_api.set_for, key, value, time)
+
+    async def time_to_live(self, key: str):
+        return await self._run(self._redis_api.time_to_live, key)
+
+    async def get(self, key: str, default: Optional[bytes] = None) \
+            -> Optional[bytes]:
+        return await self._run(self._redis_api.get, key, default)
+
+    async def hget(self, name: str, key: str, default: Optional[bytes] = None) \
+            -> Optional[bytes]:
+        return await self._run(self._redis_api.hget, name, key, default)
+
+    async def get_int(self, key: str, default: Optional[int] = None) \
+            -> Optional[int]:
+        return await self._run(self._redis_api.get_int, key, default)
+
+    async def hget_int(self, name: str, key: str,
+                       default: Optional[int] = None) -> Optional[int]:
+        return await self._run(self._redis_api.hget_int, name, key, default)
+
+    async def get_bool(self, key: str, default: Optional[bool] = None) \
+            -> Optional[bool]:
+        return await self._run(self._redis_api.get_bool, key, default)
+
+    async def hget_bool(self, name: str, key: str,
+                        default: Optional[bool] = None) -> Optional[bool]:
+        return await self._run(self._redis_api.hget_bool, name, key, default)
+
+    async def exists(self, key: str) -> bool:
+        return await self._run(self._redis_api.exists, key)
+
+    async def hexists(self, name: str, key: str) -> bool:
+        return await self._run(self._redis_api.hexists, name, key)
+
+    async def get_keys(self, pattern: str = "*") -> List[str]:
+        return await self._run(self._redis_api.get_keys, pattern)
+
+    async def hkeys(self, name: str):
+        return await self._run(self._redis_api.hkeys, name)
+
+    async def remove(self, *keys):
+        return await self._run(self._redis_api.remove, *keys)
+
+    async def hremove(self, name: str, *keys):
+        return await self._run(self._redis_api.hremove, name, *keys)
+
+    async def delete_all(self):
+        return await self._run(self._redis_api.delete_all)
+
+    async def ping_unsafe(self) -> bool:
+        return await self._run(self._redis_api.ping_unsafe)
@@ -1,41 +1,107 @@
 import distutils.util
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import timedelta
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Callable, Set, Tuple
 
 import redis
 
 from src.utils.timing import TimedTaskLimiter
 from src.utils.types import RedisType
 
+# Channel on which Redis publishes client-side caching invalidations when
+# tracking is redirected to a RESP2 connection
+_INVALIDATION_CHANNEL = '__redis__:invalidate'
+
+# Read cache entries are identified by the key and the hash field read. These
+# markers are used instead of a field for top-level key reads.
+_KEY_VALUE = None
+_KEY_EXISTS = ('exists',)
+
 
 class RedisApi:
 
     def __init__(self, logger: logging.Logger, db: int,
                  host: str = 'localhost', port: int = 6379,
                  password: str = '', namespace: str = '',
-                 live_check_time_interval: timedelta = timedelta(seconds=60)) \
-            -> None:
+                 live_check_time_interval: timedelta = timedelta(seconds=60),
+                 write_behind_interval: Optional[timedelta] = None,
+                 write_behind_batch_size: int = 1000,
+                 read_cache_size: int = 0,
+                 read_cache_ttl: timedelta = timedelta(seconds=10),
+                 max_connections: Optional[int] = None) -> None:
         self._logger = logger
         if password == '':
-            self._redis = redis.Redis(host=host, port=port, db=db)
+            self._redis = redis.Redis(host=host, port=port, db=db,
+                                      max_connections=max_connections)
         else:
             self._redis = redis.Redis(host=host, port=port, db=db,
-                                      password=password)
+                                      password=password,
+                                      max_connections=max_connections)
         self._namespace = namespace
 
         # The live check limiter means that we don't wait for connection
         # errors to occur to be able to continue, thus speeding everything up
         self._live_check_limiter = TimedTaskLimiter(live_check_time_interval)
+        # The live state is guarded by a lock as the asyncio APIs use this
+        # class from many worker threads
+        self._live_state_lock = threading.Lock()
         self._is_live = True  # This is necessary to initialise the variable
         self._set_as_live()
 
+        # If a write behind interval is given, hash writes are buffered
+        # locally and flushed in a single pipeline whenever the interval
+        # elapses or the buffer reaches the batch size. Updates to the same
+        # (hash, field) pair are coalesced, with the last write winning.
+        self._write_behind_interval = write_behind_interval
+        self._write_behind_batch_size = write_behind_batch_size
+        self._write_buffer: Dict[str, Dict[str, RedisType]] = {}
+        self._write_buffer_size = 0
+        self._write_behind_limiter = None
+        if write_behind_interval is not None:
+            self._write_behind_limiter = TimedTaskLimiter(write_behind_interval)
+
+        # If a read cache size is given, the results of get and hget are cached
+        # locally for at most read_cache_ttl. The cache is only used while
+        # Redis client-side tracking is active, so that keys modified by any
+        # client are invalidated as soon as the invalidation message is read.
+        self._read_cache_size = read_cache_size
+        self._read_cache_ttl_seconds = read_cache_ttl.total_seconds()
+        self._read_cache: OrderedDict[Tuple[str, Any], Tuple[float, Any]] = \
+            OrderedDict()
+        self._read_cache_fields: Dict[str, Set[Any]] = {}
+        self._invalidations = None
+        self._invalidation_epoch = 0
+        self._tracking_limiter = TimedTaskLimiter(live_check_time_interval)
+
         self._logger.info("Redis initialised.")
 
     @property
     def is_live(self) -> bool:
         return self._is_live
 
+    @property
+    def write_behind_enabled(self) -> bool:
+        return self._write_behind_limiter is not None
+
+    @property
+    def write_behind_interval(self) -> Optional[timedelta]:
+        return self._write_behind_interval
+
+    @property
+    def pending_writes(self) -> int:
+        return self._write_buffer_size
+
+    @property
+    def read_cache_enabled(self) -> bool:
+        return self._read_cache_size > 0
+
+    @property
+    def read_cache_entries(self) -> int:
+        return len(self._read_cache)
+
     def _add_namespace(self, key: str) -> str:
         if not key.startswith(self._namespace + ':'):
             return self._namespace + ':' + key
@@ -49,23 +115,28 @@ class RedisApi:
             return key.replace(self._namespace + ':', '', 1)
 
     def _set_as_live(self) -> None:
-        if not self._is_live:
-            self._logger.info("Redis is now accessible again.")
-        self._is_live = True
+        with self._live_state_lock:
+            if not self._is_live:
+                self._logger.info("Redis is now accessible again.")
+            self._is_live = True
 
     def _set_as_down(self) -> None:
         # If Redis is live or if we can check whether it is live (because the
         # live check time interval has passed), reset the live check limiter
         # so that usage of Redis is skipped for as long as the time interval
-        if self._is_live or self._live_check_limiter.can_do_task():
-            self._live_check_limiter.did_task()
-            self._logger.warning("Redis is unusable for some reason. Stopping "
-                                 "usage temporarily to improve performance.")
-        self._is_live = False
+        with self._live_state_lock:
+            if self._is_live or self._live_check_limiter.can_do_task():
+                self._live_check_limiter.did_task()
+                self._logger.warning("Redis is unusable for some reason. "
+                                     "Stopping usage temporarily to improve "
+                                     "performance.")
+            self._is_live = False
 
     def _do_not_use_if_recently_went_down(self) -> bool:
         # If Redis is not live and cannot check if it is live return true
-        return not self._is_live and not self._live_check_limiter.can_do_task()
+        with self._live_state_lock:
+            return not self._is_live \
+                   and not self._live_check_limiter.can_do_task()
 
     def _safe(self, function, args: List[Any], default_return: Any):
         # Given an "unsafe" function from below and its arguments, safe calls
@@ -82,14 +153,176 @@ class RedisApi:
             self._set_as_down()
             return default_return
 
+    def _buffer_hash_writes(self, name: str,
+                            key_values: Dict[str, RedisType]) -> None:
+        # Last write wins, so a field which is already buffered is simply
+        # overwritten and does not grow the buffer.
+        name = self._add_namespace(name)
+        self._invalidate_cached(name)
+        fields = self._write_buffer.setdefault(name, {})
+        for key, value in key_values.items():
+            if key not in fields:
+                self._write_buffer_size += 1
+            fields[key] = value if value is not None else 'None'
+
+    def _discard_buffered_writes(self, name: str, *keys) -> None:
+        # Deletions must not be undone by a later flush of older writes
+        name = self._add_namespace(name)
+        if name not in self._write_buffer:
+            return
+
+        fields = self._write_buffer[name]
+        if len(keys) == 0:
+            self._write_buffer_size -= len(fields)
+            del self._write_buffer[name]
+            return
+
+        for key in keys:
+            if key in fields:
+                del fields[key]
+                self._write_buffer_size -= 1
+        if not fields:
+            del self._write_buffer[name]
+
+    def _write_buffer_is_due(self) -> bool:
+        return self._write_buffer_size >= self._write_behind_batch_size \
+               or self._write_behind_limiter.can_do_task()
+
+    def flush_unsafe(self):
+        """
+        Writes all buffered hash updates to Redis using a single pipeline. The
+        buffer is cleared only if the pipeline executes successfully so that no
+        update is lost if Redis is temporarily unreachable.
+        """
+        if self._write_behind_limiter is not None:
+            self._write_behind_limiter.did_task()
+
+        if self._write_buffer_size == 0:
+            return []
+
+        pipe = self._redis.pipeline(transaction=False)
+        for name, fields in self._write_buffer.items():
+            pipe.hset(name, mapping=fields)
+        exec_ret = pipe.execute()
+
+        self._write_buffer = {}
+        self._write_buffer_size = 0
+        return exec_ret
+
+    def _start_tracking(self) -> bool:
+        # Tracking is enabled on the subscribed connection itself, with the
+        # invalidations redirected to it, so that both are lost together if the
+        # connection drops. Only keys under this namespace are tracked.
+        if self._invalidations is not None:
+            return True
+        if not self._tracking_limiter.can_do_task():
+            return False
+
+        self._tracking_limiter.did_task()
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.execute_command('CLIENT', 'ID')
+            client_id = pubsub.parse_response()
+            pubsub.execute_command('CLIENT', 'TRACKING', 'ON', 'REDIRECT',
+                                   client_id, 'BCAST', 'PREFIX',
+                                   self._add_namespace(''))
+            pubsub.parse_response()
+            pubsub.subscribe(_INVALIDATION_CHANNEL)
+        except Exception as e:
+            self._logger.error("Could not enable Redis client-side tracking. "
+                               "Reads will not be cached: %s", e)
+            pubsub.close()
+            return False
+
+        self._clear_read_cache()
+        self._invalidations = pubsub
+        self._logger.info("Redis client-side tracking enabled.")
+        return True
+
+    def _stop_tracking(self) -> None:
+        if self._invalidations is not None:
+            try:
+                self._invalidations.close()
+            except Exception:
+                pass
+        self._invalidations = None
+        self._clear_read_cache()
+
+    def _clear_read_cache(self) -> None:
+        self._read_cache.clear()
+        self._read_cache_fields.clear()
+        self._invalidation_epoch += 1
+
+    def _invalidate_cached(self, name: str) -> None:
+        if name in self._read_cache_fields:
+            for field in self._read_cache_fields.pop(name):
+                self._read_cache.pop((name, field), None)
+        self._invalidation_epoch += 1
+
+    def _process_invalidations(self) -> None:
+        try:
+            message = self._invalidations.get_message()
+            while message is not None:
+                if message['type'] == 'message':
+                    if message['data'] is None:
+                        # The database was flushed
+                        self._clear_read_cache()
+                    else:
+                        for name in message['data']:
+                            self._invalidate_cached(name.decode('utf8'))
+                message = self._invalidations.get_message()
+        except Exception as e:
+            # Without invalidations the cache can no longer be trusted
+            self._logger.error("Lost Redis invalidation messages: %s", e)
+            self._stop_tracking()
+
+    def _cached_read(self, name: str, field: Any, read: Callable[[], Any]) \
+            -> Any:
+        if not self._start_tracking():
+            return read()
+
+        self._process_invalidations()
+        cache_key = (name, field)
+        entry = self._read_cache.get(cache_key)
+        if entry is not None:
+            expiry, value = entry
+            if expiry > time.monotonic():
+                self._read_cache.move_to_end(cache_key)
+                return value
+            self._read_cache.pop(cache_key)
+            self._read_cache_fields[name].discard(field)
+
+        # Only cache the value if it was not invalidated while reading it
+        epoch = self._invalidation_epoch
+        value = read()
+        if self._invalidations is None:
+            return value
+        self._process_invalidations()
+        if epoch == self._invalidation_epoch:
+            self._read_cache[cache_key] = (
+                time.monotonic() + self._read_cache_ttl_seconds, value)
+            self._read_cache_fields.setdefault(name, set()).add(field)
+            while len(self._read_cache) > self._read_cache_size:
+                (old_name, old_field), _ = self._read_cache.popitem(last=False)
+                self._read_cache_fields[old_name].discard(old_field)
+                if not self._read_cache_fields[old_name]:
+                    del self._read_cache_fields[old_name]
+        return value
+
     def set_unsafe(self, key: str, value: RedisType):
         key = self._add_namespace(key)
+        self._invalidate_cached(key)
 
         set_ret = self._redis.set(key, value)
         return set_ret
 
     def hset_unsafe(self, name: str, key: str, value: RedisType):
+        if self.write_behind_enabled:
+            self._buffer_hash_writes(name, {key: value})
+            return self.flush_unsafe() if self._write_buffer_is_due() else None
+
         name = self._add_namespace(name)
+        self._invalidate_cached(name)
 
         set_ret = self._redis.hset(name, key, value)
         return set_ret
@@ -100,6 +333,7 @@ class RedisApi:
         namespaced_keys = [self._add_namespace(k) for k in keys]
         for k, uk in zip(keys, namespaced_keys):
             key_values[uk] = key_values.pop(k)
+            self._invalidate_cached(uk)
 
         # Set multiple
         pipe = self._redis.pipeline()
@@ -109,8 +343,13 @@ class RedisApi:
         return exec_ret
 
     def hset_multiple_unsafe(self, name: str, key_values: Dict[str, RedisType]):
+        if self.write_behind_enabled:
+            self._buffer_hash_writes(name, key_values)
+            return self.flush_unsafe() if self._write_buffer_is_due() else None
+
         # Add namespace to hash name
         name = self._add_namespace(name)
+        self._invalidate_cached(name)
 
         # Set multiple
         pipe = self._redis.pipeline()
@@ -121,6 +360,7 @@ class RedisApi:
 
     def set_for_unsafe(self, key: str, value: RedisType, time: timedelta):
         key = self._add_namespace(key)
+        self._invalidate_cached(key)
 
         pipe = self._redis.pipeline()
         pipe.set(key, value)
@@ -143,6 +383,14 @@ class RedisApi:
             -> Optional[bytes]:
         key = self._add_namespace(key)
 
+        if self.read_cache_enabled:
+            # A single GET tells both whether the key exists and its value
+            get_ret = self._cached_read(key, _KEY_VALUE,
+                                        lambda: self._redis.get(key))
+            if get_ret is None:
+                return default
+            return None if get_ret.decode('UTF-8') == 'None' else get_ret
+
         if self.exists_unsafe(key):
             get_ret = self._redis.get(key)
             if get_ret.decode('UTF-8') == 'None':
@@ -156,6 +404,13 @@ class RedisApi:
                     default: Optional[bytes] = None) -> Optional[bytes]:
         name = self._add_namespace(name)
 
+        if self.read_cache_enabled:
+            get_ret = self._cached_read(name, key,
+                                        lambda: self._redis.hget(name, key))
+            if get_ret is None:
+                return default
+            return None if get_ret.decode('UTF-8') == 'None' else get_ret
+
         if self.hexists_unsafe(name, key):
             get_ret = self._redis.hget(name, key)
             if get_ret.decode('UTF-8') == 'None':
@@ -213,12 +468,80 @@ class RedisApi:
 
     def exists_unsafe(self, key: str) -> bool:
         key = self._add_namespace(key)
+        if self.read_cache_enabled:
+            return bool(self._cached_read(key, _KEY_EXISTS,
+                                          lambda: self._redis.exists(key)))
         return bool(self._redis.exists(key))
 
     def hexists_unsafe(self, name: str, key: str) -> bool:
         name = self._add_namespace(name)
+        if self.read_cache_enabled:
+            return self._cached_read(
+                name, key, lambda: self._redis.hget(name, key)) is not None
         return bool(self._redis.hexists(name, key))
 
+    def get_multiple_unsafe(self, keys: List[str],
+                            default: Optional[bytes] = None) \
+            -> Dict[str, Optional[bytes]]:
+        """
+        Gets the values of many keys in a single round trip using MGET.
+        :param keys: The keys to get
+        :param default: The value returned for the keys which do not exist
+        :return: The value of every key, keyed by the key as given
+        """
+        if len(keys) == 0:
+            return {}
+
+        namespaced_keys = [self._add_namespace(key) for key in keys]
+        values = {}
+        for key, get_ret in zip(keys, self._redis.mget(namespaced_keys)):
+            if get_ret is None:
+                values[key] = default
+            elif get_ret.decode('UTF-8') == 'None':
+                values[key] = None
+            else:
+                values[key] = get_ret
+        return values
+
+    def hget_from_hashes_unsafe(self, names: List[str], key: str,
+                                default: Optional[bytes] = None) \
+            -> Dict[str, Optional[bytes]]:
+        """
+        Gets the value of the same key from many hashes in a single round trip
+        by pipelining an HGET for every hash.
+        :param names: The names of the hashes
+        :param key: The key to get from every hash
+        :param default: The value returned for the hashes without the key
+        :return: The value of the key in every hash, keyed by the hash name as
+               : given
+        """
+        if len(names) == 0:
+            return {}
+
+        namespaced_names = [self._add_namespace(name) for name in names]
+        pipe = self._redis.pipeline()
+        for name in namespaced_names:
+            pipe.hget(name, key)
+        exec_ret = pipe.execute()
+
+        values = {}
+        for name, namespaced_name, get_ret in zip(names, namespaced_names,
+                                                  exec_ret):
+            # Writes which are still buffered are newer than what is in Redis
+            buffered_fields = self._write_buffer.get(namespaced_name, {})
+            if key in buffered_fields:
+                value = buffered_fields[key]
+                get_ret = value if isinstance(value, bytes) \
+                    else str(value).encode('utf8')
+
+            if get_ret is None:
+                values[name] = default
+            elif get_ret.decode('UTF-8') == 'None':
+                values[name] = None
+            else:
+                values[name] = get_ret
+        return values
+
     def get_keys_unsafe(self, pattern: str = "*") -> List[str]:
         pattern = self._add_namespace(pattern)
 
@@ -229,12 +552,25 @@ class RedisApi:
 
         return keys_list
 
+    def scan_keys_unsafe(self, pattern: str = "*") -> List[str]:
+        pattern = self._add_namespace(pattern)
+
+        # SCAN goes through the keyspace in batches, so unlike KEYS it does
+        # not block Redis while doing so
+        return [self._remove_namespace(k.decode('utf8'))
+                for k in self._redis.scan_iter(match=pattern)]
+
     def remove_unsafe(self, *keys):
         keys = [self._add_namespace(k) for k in keys]
+        for key in keys:
+            self._discard_buffered_writes(key)
+            self._invalidate_cached(key)
         return self._redis.delete(*keys)
 
     def hremove_unsafe(self, name: str, *keys):
         name = self._add_namespace(name)
+        self._discard_buffered_writes(name, *keys)
+        self._invalidate_cached(name)
         return self._redis.hdel(name, *keys)
 
     def hremove(self, name: str, *keys):
@@ -252,19 +588,64 @@ class RedisApi:
     def hkeys(self, name: str):
         return self._safe(self.hkeys_unsafe, [name], None)
 
+    def hgetall_unsafe(self, name: str) -> Dict[str, bytes]:
+        namespaced_name = self._add_namespace(name)
+
+        values = {k.decode('utf8'): v for k, v in
+                  self._redis.hgetall(namespaced_name).items()}
+
+        # Writes which are still buffered are newer than what is in Redis
+        for key, value in self._write_buffer.get(namespaced_name, {}).items():
+            values[key] = value if isinstance(value, bytes) \
+                else str(value).encode('utf8')
+
+        return values
+
+    def hgetall(self, name: str) -> Optional[Dict[str, bytes]]:
+        return self._safe(self.hgetall_unsafe, [name], None)
+
+    def sadd_unsafe(self, name: str, *values: str) -> int:
+        name = self._add_namespace(name)
+        return self._redis.sadd(name, *values)
+
+    def sadd(self, name: str, *values: str) -> Optional[int]:
+        return self._safe(self.sadd_unsafe, [name, *values], None)
+
+    def smembers_unsafe(self, name: str) -> Set[str]:
+        name = self._add_namespace(name)
+        return {member.decode('utf8') for member in self._redis.smembers(name)}
+
+    def smembers(self, name: str) -> Set[str]:
+        return self._safe(self.smembers_unsafe, [name], set())
+
     def delete_all_unsafe(self):
+        self._write_buffer = {}
+        self._write_buffer_size = 0
+        self._clear_read_cache()
         return self._redis.flushdb()
 
+    def flush(self):
+        return self._safe(self.flush_unsafe, [], None)
+
     def set(self, key: str, value: RedisType):
         return self._safe(self.set_unsafe, [key, value], None)
 
     def hset(self, name: str, key: str, value: RedisType):
+        if self.write_behind_enabled:
+            # Buffering does not need Redis, only the flush does
+            self._buffer_hash_writes(name, {key: value})
+            return self.flush() if self._write_buffer_is_due() else None
+
         return self._safe(self.hset_unsafe, [name, key, value], None)
 
     def set_multiple(self, key_values: Dict[str, RedisType]):
         return self._safe(self.set_multiple_unsafe, [key_values], None)
 
     def hset_multiple(self, name: str, key_values: Dict[str, RedisType]):
+        if self.write_behind_enabled:
+            self._buffer_hash_writes(name, key_values)
+            return self.flush() if self._write_buffer_is_due() else None
+
         return self._safe(self.hset_multiple_unsafe, [name, key_values], None)
 
     def set_for(self, key: str, value: RedisType, time: timedelta):
@@ -301,9 +682,23 @@ class RedisApi:
     def hexists(self, name: str, key: str) -> bool:
         return self._safe(self.hexists_unsafe, [name, key], False)
 
+    def get_multiple(self, keys: List[str], default: Optional[bytes] = None) \
+            -> Dict[str, Optional[bytes]]:
+        return self._safe(self.get_multiple_unsafe, [keys, default],
+                          {key: default for key in keys})
+
+    def hget_from_hashes(self, names: List[str], key: str,
+                         default: Optional[bytes] = None) \
+            -> Dict[str, Optional[bytes]]:
+        return self._safe(self.hget_from_hashes_unsafe, [names, key, default],
+                          {name: default for name in names})
+
     def get_keys(self, pattern: str = "*") -> List[str]:
         return self._safe(self.get_keys_unsafe, [pattern], [])
 
+    def scan_keys(self, pattern: str = "*") -> Optional[List[str]]:
+        return self._safe(self.scan_keys_unsafe, [pattern], None)
+
     def remove(self, *keys):
         return self._safe(self.remove_unsafe, [*keys], None)
 
@@ -312,3 +707,6 @@ class RedisApi:
 
     def ping_unsafe(self) -> bool:
         return self._redis.ping()
+
+    def disconnect(self) -> None:
+        self._redis.connection_pool.disconnect()
@@ -1,8 +1,13 @@
 # Hashes
 _hash_parent = 'hash_p1'
+_hash_alerts_overview = 'hash_ao1'
+
+# Sets
+_set_chain_hashes = 'set_ch1'
 
 # Unique keys
 _key_alerter_mute = "a1"
+_key_chain_hashes_backfilled = "cb1"
 
 # sX_<system_id>
 _key_system_process_cpu_seconds_total = 's1'
@@ -250,10 +255,22 @@ class Keys:
     def get_hash_parent_raw() -> str:
         return _hash_parent
 
+    @staticmethod
+    def get_hash_alerts_overview(parent_id: str) -> str:
+        return Keys._as_prefix(_hash_alerts_overview) + parent_id
+
+    @staticmethod
+    def get_set_chain_hashes() -> str:
+        return _set_chain_hashes
+
     @staticmethod
     def get_alerter_mute() -> str:
         return _key_alerter_mute
 
+    @staticmethod
+    def get_chain_hashes_backfilled() -> str:
+        return _key_chain_hashes_backfilled
+
     @staticmethod
     def get_system_process_cpu_seconds_total(system_id: str) -> str:
         return Keys._as_prefix(_key_system_process_cpu_seconds_total) + (
@@ -1,9 +1,10 @@
 import json
 import logging
-from datetime import datetime
-from typing import Dict
+from datetime import datetime, timedelta
+from typing import Dict, Set
 
 import pika.exceptions
+from pymongo import ASCENDING
 
 from src.alerter.alert_code import InternalAlertCode
 from src.alerter.alert_severities import Severity
@@ -21,12 +22,14 @@ from src.data_store.mongo.mongo_api import MongoApi
 from src.data_store.redis.store_keys import Keys
 from src.data_store.stores.store import Store
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
+from src.utils import env
 from src.utils.constants.data import EXPIRE_METRICS
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME
 from src.utils.constants.rabbitmq import (STORE_EXCHANGE, HEALTH_CHECK_EXCHANGE,
                                           ALERT_STORE_INPUT_QUEUE_NAME,
                                           ALERT_STORE_INPUT_ROUTING_KEY, TOPIC)
 from src.utils.exceptions import (MessageWasNotDeliveredException)
+from src.utils.timing import TimedTaskLimiter
 
 _LIST_OF_ALERTERS = [SystemAlerter.__name__,
                      ChainlinkNodeAlerter.__name__,
@@ -39,6 +42,27 @@ _LIST_OF_ALERTERS = [SystemAlerter.__name__,
                      SubstrateNodeAlerter.__name__,
                      SubstrateNetworkAlerter.__name__]
 
+# Indexes created on a chain collection the first time an alert is stored in
+# it. They serve the lookup of the document being filled, the retention job,
+# and the time and origin filters of the alert history queries.
+_ALERT_INDEXES = [
+    [('doc_type', ASCENDING), ('n_alerts', ASCENDING)],
+    [('doc_type', ASCENDING), ('first', ASCENDING)],
+    [('doc_type', ASCENDING), ('last', ASCENDING)],
+    [('alerts.origin', ASCENDING)],
+]
+_ALERTS_ARCHIVE_COLLECTION_TEMPLATE = '{}_alerts_archive'
+
+# Info alerts which are still shown in the alerts overview, i.e. new GitHub
+# releases and DockerHub tag changes.
+_OVERVIEW_INFO_ALERT_KEY_PREFIXES = (
+    Keys.get_alert_github_release(''),
+    Keys.get_alert_dockerhub_new_tag(''),
+    Keys.get_alert_dockerhub_updated_tag(''),
+    Keys.get_alert_dockerhub_deleted_tag(''),
+)
+_ALERTS_RETENTION_CHECK_INTERVAL = timedelta(hours=1)
+
 
 class AlertStore(Store):
     def __init__(self, name: str, logger: logging.Logger,
@@ -47,6 +71,12 @@ class AlertStore(Store):
         self._mongo = MongoApi(logger=self.logger.getChild(MongoApi.__name__),
                                db_name=self.mongo_db, host=REPLICA_SET_HOSTS,
                                replicaSet=REPLICA_SET_NAME)
+        self._alerts_retention_period = timedelta(
+            days=env.ALERTS_RETENTION_DAYS)
+        self._archive_expired_alerts = env.ALERTS_ARCHIVE_EXPIRED
+        self._indexed_collections: Set[str] = set()
+        self._retention_limiters: Dict[str, TimedTaskLimiter] = {}
+        self._overview_chains: Set[str] = set()
 
     def _initialise_rabbitmq(self) -> None:
         """
@@ -76,6 +106,10 @@ class AlertStore(Store):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, TOPIC, False,
                                        True, False, False)
 
+    def start(self) -> None:
+        self._rebuild_all_alerts_overviews()
+        super().start()
+
     def _listen_for_data(self) -> None:
         self.rabbitmq.basic_consume(queue=ALERT_STORE_INPUT_QUEUE_NAME,
                                     on_message_callback=self._process_data,
@@ -143,11 +177,16 @@ class AlertStore(Store):
         $min is the timestamp of the first alert
         $max is the timestamp of the last alert entered
         $inc increments n_alerts by one each time an alert is added
+
+        Since `last` only grows, a document whose `last` is older than the
+        retention period only holds expired alerts, therefore retention is
+        applied per document.
         """
 
         # Do not save the internal alerts into Mongo as they aren't useful to
         # the user
         if alert['severity'] != Severity.INTERNAL.value:
+            self._create_alert_indexes(alert['parent_id'])
             self.mongo.update_one(
                 alert['parent_id'],
                 {
@@ -169,6 +208,47 @@ class AlertStore(Store):
                     '$inc': {'n_alerts': 1},
                 }
             )
+            self._apply_alerts_retention(alert['parent_id'])
+
+    def _create_alert_indexes(self, collection: str) -> None:
+        if collection in self._indexed_collections:
+            return
+
+        for keys in _ALERT_INDEXES:
+            if self.mongo.create_index(collection, keys) is None:
+                # Mongo is having difficulties, retry with the next alert
+                return
+
+        self._indexed_collections.add(collection)
+
+    def _apply_alerts_retention(self, collection: str) -> None:
+        """
+        Removes the alert documents of the collection whose last alert is older
+        than the retention period, at most once every hour per collection. If
+        archiving is enabled the documents are first copied to the collection's
+        archive, so that the alert history is not lost.
+        """
+        if self._alerts_retention_period <= timedelta(0):
+            return
+
+        limiter = self._retention_limiters.setdefault(
+            collection, TimedTaskLimiter(_ALERTS_RETENTION_CHECK_INTERVAL))
+        if not limiter.can_do_task():
+            return
+
+        cutoff = (datetime.now() - self._alerts_retention_period).timestamp()
+        query = {'doc_type': 'alert', 'last': {'$lt': cutoff}}
+        if self._archive_expired_alerts:
+            archive = _ALERTS_ARCHIVE_COLLECTION_TEMPLATE.format(collection)
+            if self.mongo.copy_many(collection, query, archive) is None:
+                return
+
+        result = self.mongo.delete_many(collection, query)
+        if result is not None:
+            limiter.did_task()
+            if result.deleted_count > 0:
+                self.logger.info("Removed %s expired alert documents from %s.",
+                                 result.deleted_count, collection)
 
     def _process_redis_store(self, alert: Dict) -> None:
         if alert['severity'] == Severity.INTERNAL.value:
@@ -241,11 +321,11 @@ class AlertStore(Store):
                 if alert['parent_id'] is None:
                     self.logger.debug("Resetting the %s metrics for all "
                                       "chains.", metrics_type)
-                    parent_hash = Keys.get_hash_parent_raw()
-                    chain_hashes_list = self.redis.get_keys_unsafe(
-                        '*' + parent_hash + '*')
+                    parent_prefix = Keys.get_hash_parent('')
+                    chain_hashes_list = self.redis.smembers_unsafe(
+                        Keys.get_set_chain_hashes())
 
-                    # Go through all the chains that are in REDIS
+                    # Go through all the chains registered in REDIS
                     for chain in chain_hashes_list:
                         # For each chain we need to load all the keys and only
                         # delete the ones that match the pattern `alert_system*`
@@ -261,6 +341,9 @@ class AlertStore(Store):
                             # We only want to delete alert keys
                             if redis_key_index in key and not ignore_metric:
                                 self.redis.hremove(chain, key)
+                                self.redis.hremove(
+                                    Keys.get_hash_alerts_overview(
+                                        chain[len(parent_prefix):]), key)
                 else:
                     self.logger.debug("Resetting %s metrics for chain %s.",
                                       metrics_type, alert['parent_id'])
@@ -281,6 +364,8 @@ class AlertStore(Store):
                         # We only want to delete alert keys
                         if redis_key_index in key and not ignore_metric:
                             self.redis.hremove(chain_hash, key)
+                            self.redis.hremove(Keys.get_hash_alerts_overview(
+                                alert['parent_id']), key)
         else:
             """
             If the alert is not of severity Internal, the metric needs to be
@@ -298,9 +383,101 @@ class AlertStore(Store):
             if metric in EXPIRE_METRICS:
                 metric_data['expiry'] = alert['timestamp'] + 600
 
+            self._register_chain(alert['parent_id'])
             name = Keys.get_hash_parent(alert['parent_id'])
             value = json.dumps(metric_data)
             metric_state_args = alert['metric_state_args']
             key = eval('Keys.get_alert_{}(*metric_state_args)'.format(metric))
 
             self.redis.hset(name, key, value)
+            self._update_alerts_overview(alert['parent_id'], key, value,
+                                         alert['severity'])
+
+    @staticmethod
+    def _is_overview_alert(key: str, severity: str) -> bool:
+        return (severity != Severity.INFO.value
+                or key.startswith(_OVERVIEW_INFO_ALERT_KEY_PREFIXES))
+
+    def _rebuild_alerts_overview(self, parent_id: str) -> bool:
+        """
+        Rebuilds the alerts overview of a chain from the alerts stored in the
+        chain hash. This is done for every chain when the store starts, and
+        again when a chain is updated after its overview could not be, so that
+        the overview catches up with alerts stored before it existed or while
+        it could not be updated.
+        :return: True if the overview was rebuilt, False otherwise
+        """
+        chain_values = self.redis.hgetall(Keys.get_hash_parent(parent_id))
+        if chain_values is None:
+            return False
+
+        overview = {}
+        for key, value in chain_values.items():
+            if not key.startswith('alert_'):
+                continue
+            try:
+                severity = json.loads(value)['severity']
+            except (ValueError, TypeError, KeyError):
+                continue
+            if self._is_overview_alert(key, severity):
+                overview[key] = value
+
+        overview_hash = Keys.get_hash_alerts_overview(parent_id)
+        self.redis.remove(overview_hash)
+        if overview:
+            self.redis.hset_multiple(overview_hash, overview)
+
+        self._overview_chains.add(parent_id)
+        return True
+
+    def _rebuild_all_alerts_overviews(self) -> None:
+        """
+        Rebuilds the alerts overview of every chain when the store starts, so
+        that the overview shows the alerts of chains which raise no new alert
+        for a while, such as after an upgrade. The chains are taken from the
+        registry of chain hashes. Since the registry is only filled as the
+        stores process data, the chain hashes stored before it existed are
+        registered by scanning the keyspace once, after which a marker key
+        is set so that later starts skip the scan.
+        """
+        parent_prefix = Keys.get_hash_parent('')
+        chain_hashes = self.redis.smembers(Keys.get_set_chain_hashes())
+        if not self.redis.exists(Keys.get_chain_hashes_backfilled()):
+            stored_chain_hashes = self.redis.scan_keys(parent_prefix + '*')
+            if stored_chain_hashes is not None:
+                unregistered_chain_hashes = \
+                    set(stored_chain_hashes) - chain_hashes
+                if not unregistered_chain_hashes or self.redis.sadd(
+                        Keys.get_set_chain_hashes(),
+                        *unregistered_chain_hashes) is not None:
+                    self.redis.set(Keys.get_chain_hashes_backfilled(), 1)
+                chain_hashes |= unregistered_chain_hashes
+
+        for chain_hash in chain_hashes:
+            self._rebuild_alerts_overview(chain_hash[len(parent_prefix):])
+
+    def _update_alerts_overview(self, parent_id: str, key: str, value: str,
+                                severity: str) -> None:
+        """
+        The alerts overview of a chain is a hash holding only the alerts which
+        the overview shows, that is every alert which is not an info alert
+        together with new releases and tag changes. An alert is added when it
+        is raised and removed when it goes back to info, so the API can build
+        the overview of a chain from this small hash alone, and any alert
+        missing from it is counted as info.
+        """
+        if parent_id not in self._overview_chains:
+            # The rebuild already includes the alert just stored
+            self._rebuild_alerts_overview(parent_id)
+            return
+
+        overview_hash = Keys.get_hash_alerts_overview(parent_id)
+        if self._is_overview_alert(key, severity):
+            ret = self.redis.hset(overview_hash, key, value)
+        else:
+            ret = self.redis.hremove(overview_hash, key)
+
+        if ret is None:
+            # Redis could not be updated, therefore rebuild the overview once
+            # Redis is usable again.
+            self._overview_chains.discard(parent_id)
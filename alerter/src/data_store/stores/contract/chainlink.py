@@ -20,7 +20,7 @@ from src.utils.exceptions import (MessageWasNotDeliveredException,
 class ChainlinkContractStore(Store):
     def __init__(self, name: str, logger: logging.Logger,
                  rabbitmq: RabbitMQApi) -> None:
-        super().__init__(name, logger, rabbitmq)
+        super().__init__(name, logger, rabbitmq, redis_write_behind=True)
         self._mongo = MongoApi(logger=self.logger.getChild(MongoApi.__name__),
                                db_name=self.mongo_db, host=REPLICA_SET_HOSTS,
                                replicaSet=REPLICA_SET_NAME)
@@ -88,7 +88,7 @@ class ChainlinkContractStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._acknowledge(method.delivery_tag)
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -119,6 +119,7 @@ class ChainlinkContractStore(Store):
         node_name = meta_data['node_name']
         node_id = meta_data['node_id']
         parent_id = meta_data['node_parent_id']
+        self._register_chain(parent_id)
         metrics = data['data']
         redis_hash = Keys.get_hash_parent(parent_id)
 
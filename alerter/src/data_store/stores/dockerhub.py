@@ -121,6 +121,7 @@ class DockerhubStore(Store):
         repo_name = meta_data['repo_name']
         repo_id = meta_data['repo_id']
         parent_id = meta_data['repo_parent_id']
+        self._register_chain(parent_id)
         metrics = data['data']
 
         self.logger.debug(
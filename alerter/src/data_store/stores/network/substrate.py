@@ -20,7 +20,7 @@ from src.utils.exceptions import MessageWasNotDeliveredException
 class SubstrateNetworkStore(Store):
     def __init__(self, name: str, logger: logging.Logger,
                  rabbitmq: RabbitMQApi) -> None:
-        super().__init__(name, logger, rabbitmq)
+        super().__init__(name, logger, rabbitmq, redis_write_behind=True)
         self._mongo = MongoApi(logger=self.logger.getChild(MongoApi.__name__),
                                db_name=self.mongo_db, host=REPLICA_SET_HOSTS,
                                replicaSet=REPLICA_SET_NAME)
@@ -89,7 +89,7 @@ class SubstrateNetworkStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._acknowledge(method.delivery_tag)
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -118,6 +118,7 @@ class SubstrateNetworkStore(Store):
     def _process_redis_websocket_result_store(self, data: Dict) -> None:
         meta_data = data['meta_data']
         parent_id = meta_data['parent_id']
+        self._register_chain(parent_id)
         chain_name = meta_data['chain_name']
         metrics = data['data']
 
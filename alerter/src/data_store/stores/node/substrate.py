@@ -23,7 +23,7 @@ from src.utils.exceptions import (
 class SubstrateNodeStore(Store):
     def __init__(self, name: str, logger: logging.Logger,
                  rabbitmq: RabbitMQApi) -> None:
-        super().__init__(name, logger, rabbitmq)
+        super().__init__(name, logger, rabbitmq, redis_write_behind=True)
         self._mongo = MongoApi(logger=self.logger.getChild(MongoApi.__name__),
                                db_name=self.mongo_db, host=REPLICA_SET_HOSTS,
                                replicaSet=REPLICA_SET_NAME)
@@ -91,7 +91,7 @@ class SubstrateNodeStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._acknowledge(method.delivery_tag)
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -122,6 +122,7 @@ class SubstrateNodeStore(Store):
         node_name = meta_data['node_name']
         node_id = meta_data['node_id']
         parent_id = meta_data['node_parent_id']
+        self._register_chain(parent_id)
         metrics = data['data']
 
         self.logger.debug(
@@ -197,6 +198,7 @@ class SubstrateNodeStore(Store):
         node_name = meta_data['node_name']
         node_id = meta_data['node_id']
         parent_id = meta_data['node_parent_id']
+        self._register_chain(parent_id)
         downtime_exception = NodeIsDownException(node_name)
 
         if error_code == downtime_exception.code:
@@ -1,7 +1,9 @@
 import logging
 import sys
 from abc import abstractmethod
+from datetime import timedelta
 from types import FrameType
+from typing import Dict, Optional
 
 import pika
 import pika.exceptions
@@ -9,16 +11,23 @@ import pika.exceptions
 from src.abstract.publisher_subscriber import PublisherSubscriberComponent
 from src.data_store.mongo.mongo_api import MongoApi
 from src.data_store.redis.redis_api import RedisApi
+from src.data_store.redis.store_keys import Keys
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils import env
 from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
                                           HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
 from src.utils.logging import log_and_print
+from src.utils.timing import TimedTaskLimiter
+
+# A chain is registered again every so often, so that the registry of chain
+# hashes is restored if Redis loses its data while the store is running.
+_CHAIN_REGISTRATION_INTERVAL = timedelta(minutes=5)
 
 
 class Store(PublisherSubscriberComponent):
     def __init__(self, name: str, logger: logging.Logger,
-                 rabbitmq: RabbitMQApi) -> None:
+                 rabbitmq: RabbitMQApi, redis_write_behind: bool = False) \
+            -> None:
         super().__init__(logger, rabbitmq)
         self._name = name        
         self._mongo_db = env.DB_NAME
@@ -29,10 +38,24 @@ class Store(PublisherSubscriberComponent):
         redis_port = env.REDIS_PORT
         unique_alerter_identifier = env.UNIQUE_ALERTER_IDENTIFIER
 
+        # Stores which only write metrics may coalesce their Redis writes. In
+        # that case message acknowledgements are deferred until the buffered
+        # writes are flushed.
+        write_behind_interval = None
+        if redis_write_behind and env.REDIS_WRITE_BEHIND_INTERVAL_SECONDS > 0:
+            write_behind_interval = timedelta(
+                seconds=env.REDIS_WRITE_BEHIND_INTERVAL_SECONDS)
+        self._unacked_delivery_tag: Optional[int] = None
+        self._flush_scheduled = False
+        self._chain_registration_limiters: Dict[str, TimedTaskLimiter] = {}
+
         self._mongo = None
         self._redis = RedisApi(logger=self._logger.getChild(RedisApi.__name__),
                                db=redis_db, host=redis_ip, port=redis_port,
-                               namespace=unique_alerter_identifier)
+                               namespace=unique_alerter_identifier,
+                               write_behind_interval=write_behind_interval,
+                               write_behind_batch_size=
+                               env.REDIS_WRITE_BEHIND_BATCH_SIZE)
 
     def __str__(self) -> str:
         return self.name
@@ -63,6 +86,65 @@ class Store(PublisherSubscriberComponent):
     def _process_mongo_store(self, *args) -> None:
         pass
 
+    def _register_chain(self, parent_id: str) -> None:
+        """
+        Adds the hash of a chain to the registry of chain hashes, so that the
+        chains can be enumerated with SMEMBERS rather than by scanning the
+        keyspace. This is done at most once every _CHAIN_REGISTRATION_INTERVAL
+        per chain.
+        """
+        limiter = self._chain_registration_limiters.setdefault(
+            parent_id, TimedTaskLimiter(_CHAIN_REGISTRATION_INTERVAL))
+        if not limiter.can_do_task():
+            return
+
+        if self.redis.sadd(Keys.get_set_chain_hashes(),
+                           Keys.get_hash_parent(parent_id)) is not None:
+            limiter.did_task()
+
+    def _acknowledge(self, delivery_tag: int) -> None:
+        """
+        Acknowledges a processed message. If Redis writes are coalesced, the
+        acknowledgement is deferred until the buffered writes are flushed, and
+        all deferred messages are then acknowledged at once.
+        """
+        if not self.redis.write_behind_enabled:
+            self.rabbitmq.basic_ack(delivery_tag, False)
+            return
+
+        self._unacked_delivery_tag = delivery_tag
+        if self.redis.pending_writes == 0:
+            # The writes of this message were flushed while it was processed
+            self._ack_deferred()
+        elif not self._flush_scheduled:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        self.rabbitmq.connection.call_later(
+            self.redis.write_behind_interval.total_seconds(),
+            self._flush_redis_and_ack)
+        self._flush_scheduled = True
+
+    def _ack_deferred(self) -> None:
+        if self._unacked_delivery_tag is not None:
+            self.rabbitmq.basic_ack(self._unacked_delivery_tag, True)
+            self._unacked_delivery_tag = None
+
+    def _flush_redis_and_ack(self, retry: bool = True) -> None:
+        # The deferred messages are acknowledged only once their writes are in
+        # Redis. If Redis is down the writes stay buffered and the messages
+        # stay unacknowledged, so that they are re-delivered if the store dies
+        # before a later flush succeeds.
+        self._flush_scheduled = False
+        self.redis.flush()
+        if self.redis.pending_writes == 0:
+            self._ack_deferred()
+        elif retry:
+            self.logger.warning("Could not flush %s buffered Redis writes, "
+                                "will re-try in %s.", self.redis.pending_writes,
+                                self.redis.write_behind_interval)
+            self._schedule_flush()
+
     @abstractmethod
     def _process_data(self,
                       ch: pika.adapters.blocking_connection.BlockingChannel,
@@ -81,6 +163,9 @@ class Store(PublisherSubscriberComponent):
                           HEALTH_CHECK_EXCHANGE)
 
     def start(self) -> None:
+        # Delivery tags and timers do not survive a new connection
+        self._unacked_delivery_tag = None
+        self._flush_scheduled = False
         self._initialise_rabbitmq()
         while True:
             try:
@@ -99,6 +184,11 @@ class Store(PublisherSubscriberComponent):
         log_and_print("{} is terminating. Connections with RabbitMQ will be "
                       "closed, and afterwards the process will exit."
                       .format(self), self.logger)
+        if self.redis.write_behind_enabled:
+            try:
+                self._flush_redis_and_ack(retry=False)
+            except Exception as e:
+                self.logger.exception(e)
         self.disconnect_from_rabbit()
         log_and_print("{} terminated.".format(self), self.logger)
         sys.exit()
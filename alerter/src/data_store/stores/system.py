@@ -21,7 +21,7 @@ from src.utils.exceptions import (ReceivedUnexpectedDataException,
 class SystemStore(Store):
     def __init__(self, name: str, logger: logging.Logger,
                  rabbitmq: RabbitMQApi) -> None:
-        super().__init__(name, logger, rabbitmq)
+        super().__init__(name, logger, rabbitmq, redis_write_behind=True)
         self._mongo = MongoApi(logger=self.logger.getChild(MongoApi.__name__),
                                db_name=self.mongo_db, host=REPLICA_SET_HOSTS,
                                replicaSet=REPLICA_SET_NAME)
@@ -95,7 +95,7 @@ class SystemStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._acknowledge(method.delivery_tag)
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -126,6 +126,7 @@ class SystemStore(Store):
         system_name = meta_data['system_name']
         system_id = meta_data['system_id']
         parent_id = meta_data['system_parent_id']
+        self._register_chain(parent_id)
         metrics = data['data']
 
         self.logger.debug(
@@ -195,6 +196,7 @@ class SystemStore(Store):
         if error_code == downtime_exception.code:
             system_id = meta_data['system_id']
             parent_id = meta_data['system_parent_id']
+            self._register_chain(parent_id)
             metrics = data['data']
 
             self.logger.debug(
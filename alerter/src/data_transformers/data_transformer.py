@@ -13,8 +13,12 @@ from src.data_store.redis.redis_api import RedisApi
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
                                           HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
-from src.utils.exceptions import MessageWasNotDeliveredException
+from src.utils.env import ALERTER_WORKERS_PER_TYPE
+from src.utils.exceptions import (MessageWasNotDeliveredException,
+                                  ReceivedUnexpectedDataException)
 from src.utils.logging import log_and_print
+from src.utils.routing_key import (get_alerter_worker_index,
+                                   get_alerter_worker_routing_key)
 from src.utils.types import Monitorable
 
 
@@ -78,6 +82,47 @@ class DataTransformer(QueuingPublisherSubscriberComponent):
             properties: pika.spec.BasicProperties, body: bytes) -> None:
         pass
 
+    def _get_parent_id(self, processed_data: Dict, parent_id_key: str) -> str:
+        """
+        Given processed data indexed by 'result' or 'error', or a dict of such
+        data for each data source, this function returns the parent_id stored
+        in the meta_data.
+        :param processed_data: The processed data
+        :param parent_id_key: The meta_data key of the parent_id
+        :return: The parent_id of the processed data
+        """
+        for response_index_key in ['result', 'error']:
+            if response_index_key in processed_data:
+                return processed_data[response_index_key]['meta_data'][
+                    parent_id_key]
+
+        for source_data in processed_data.values():
+            if isinstance(source_data, dict) and source_data:
+                return self._get_parent_id(source_data, parent_id_key)
+
+        raise ReceivedUnexpectedDataException(
+            "{}: _get_parent_id".format(self))
+
+    def _get_alerter_routing_key(self, routing_key: str,
+                                 data_for_alerting: Dict,
+                                 parent_id_key: str) -> str:
+        """
+        Returns the routing key with which the data for alerting is published,
+        so that it is consumed by the alerter worker its chain is assigned to.
+        :param routing_key: The transformed data routing key of the alerter
+        :param data_for_alerting: The data to be sent to the alerter
+        :param parent_id_key: The meta_data key of the parent_id
+        :return: The routing key of the alerter worker
+        """
+        if ALERTER_WORKERS_PER_TYPE <= 1:
+            return routing_key
+
+        parent_id = self._get_parent_id(data_for_alerting, parent_id_key)
+        worker_index = get_alerter_worker_index(parent_id,
+                                                ALERTER_WORKERS_PER_TYPE)
+        return get_alerter_worker_routing_key(routing_key, worker_index,
+                                              ALERTER_WORKERS_PER_TYPE)
+
     def _send_heartbeat(self, data_to_send: dict) -> None:
         self.rabbitmq.basic_publish_confirm(
             exchange=HEALTH_CHECK_EXCHANGE,
@@ -539,8 +539,11 @@ class SubstrateNetworkTransformer(DataTransformer):
 
     def _place_latest_data_on_queue(self, data_for_alerting: Dict,
                                     data_for_saving: Dict) -> None:
+        alerter_routing_key = self._get_alerter_routing_key(
+            SUBSTRATE_NETWORK_TRANSFORMED_DATA_ROUTING_KEY, data_for_alerting,
+            'parent_id')
         self._push_to_queue(data_for_alerting, ALERT_EXCHANGE,
-                            SUBSTRATE_NETWORK_TRANSFORMED_DATA_ROUTING_KEY,
+                            alerter_routing_key,
                             pika.BasicProperties(delivery_mode=2), True)
 
         self._push_to_queue(data_for_saving, STORE_EXCHANGE,
@@ -24,6 +24,7 @@ from src.utils.cosmos import (
 from src.utils.exceptions import (
     ReceivedUnexpectedDataException, NodeIsDownException,
     MessageWasNotDeliveredException)
+from src.utils.missed_blocks_window import MissedBlocksWindow
 from src.utils.types import str_to_bool_strict, convert_to_int
 
 
@@ -34,6 +35,12 @@ class CosmosNodeDataTransformer(DataTransformer):
         super().__init__(transformer_name, logger, redis, rabbitmq,
                          max_queue_size)
 
+        # The missed blocks windows updated by the transformation of the
+        # tendermint RPC data, indexed by node_id. A node's window is only
+        # replaced when its state is updated, so that the heights of data
+        # which could not be processed are not marked as recorded.
+        self._new_missed_blocks_windows: Dict[str, MissedBlocksWindow] = {}
+
     def _initialise_rabbitmq(self) -> None:
         # A data transformer is both a consumer and producer, therefore we need
         # to initialise both the consuming and producing configurations.
@@ -227,6 +234,9 @@ class CosmosNodeDataTransformer(DataTransformer):
             node.set_node_name(node_name)
             node.set_slashed(metrics['slashed'])
             node.set_missed_blocks(metrics['missed_blocks'])
+            if node_id in self._new_missed_blocks_windows:
+                node.set_missed_blocks_window(
+                    self._new_missed_blocks_windows.pop(node_id))
             node.set_is_syncing(metrics['is_syncing'])
             ## check if the node was a mev-tendermint node and update state if so
             if meta_data['is_mev_tendermint_node']:
@@ -405,9 +415,11 @@ class CosmosNodeDataTransformer(DataTransformer):
             # Add previous for each metric
             pd_data['went_down_at'][
                 'previous'] = node.went_down_at_tendermint_rpc
-            pd_data['slashed']['previous'] = copy.deepcopy(node.slashed)
-            pd_data['missed_blocks']['previous'] = copy.deepcopy(
-                node.missed_blocks)
+            # The node's slashed and missed_blocks dicts are replaced rather
+            # than modified when the state is updated, so they need not be
+            # copied.
+            pd_data['slashed']['previous'] = node.slashed
+            pd_data['missed_blocks']['previous'] = node.missed_blocks
             pd_data['is_syncing']['previous'] = node.is_syncing
             ## Check if the current node is a mev-tendermint node, if so send the previous state of the mev-tendermint metrics
             if td_meta_data['is_mev_tendermint_node']:
@@ -585,6 +597,7 @@ class CosmosNodeDataTransformer(DataTransformer):
             td_node_metrics = transformed_data['result']['data']
             node_id = meta_data['node_id']
             node: CosmosNode = self.state[node_id]
+            missed_blocks_window = copy.deepcopy(node.missed_blocks_window)
 
             # Historical data will be used to compute new metrics slashed and
             # missed blocks
@@ -625,14 +638,22 @@ class CosmosNodeDataTransformer(DataTransformer):
                     # 'total_count'] will be incremented by one and the block
                     # height - 1 will be added to _missed_blocks[
                     # 'missed_heights']. Note that each block has signing
-                    # information related to the previous block height.
+                    # information related to the previous block height. Each
+                    # height is also recorded in a copy of the node's missed
+                    # blocks window, so that a height which was already
+                    # considered in a previous round is not counted again.
                     was_active = datum['active_in_prev_block']
                     signed_block = datum['signed_prev_block']
-                    if was_active and not signed_block:
+                    missed = was_active and not signed_block
+                    is_new_height = missed_blocks_window.record(
+                        block_height - 1, missed)
+                    if missed and is_new_height:
                         transformed_missed_blocks['total_count'] += 1
                         transformed_missed_blocks['missed_heights'].append(
                             block_height - 1)
 
+            self._new_missed_blocks_windows[node_id] = missed_blocks_window
+
             # Transform the meta_data by deleting the monitor_name and changing
             # the time key to last_monitored key
             del td_meta_data['monitor_name']
@@ -805,8 +826,11 @@ class CosmosNodeDataTransformer(DataTransformer):
 
     def _place_latest_data_on_queue(self, data_for_alerting: Dict,
                                     data_for_saving: Dict) -> None:
+        alerter_routing_key = self._get_alerter_routing_key(
+            COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY, data_for_alerting,
+            'node_parent_id')
         self._push_to_queue(data_for_alerting, ALERT_EXCHANGE,
-                            COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY,
+                            alerter_routing_key,
                             pika.BasicProperties(delivery_mode=2), True)
 
         self._push_to_queue(data_for_saving, STORE_EXCHANGE,
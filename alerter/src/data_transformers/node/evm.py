@@ -305,8 +305,11 @@ class EVMNodeDataTransformer(DataTransformer):
     def _place_latest_data_on_queue(
             self, transformed_data: Dict, data_for_alerting: Dict,
             data_for_saving: Dict) -> None:
+        alerter_routing_key = self._get_alerter_routing_key(
+            EVM_NODE_TRANSFORMED_DATA_ROUTING_KEY, data_for_alerting,
+            'node_parent_id')
         self._push_to_queue(data_for_alerting, ALERT_EXCHANGE,
-                            EVM_NODE_TRANSFORMED_DATA_ROUTING_KEY,
+                            alerter_routing_key,
                             pika.BasicProperties(delivery_mode=2), True)
 
         self._push_to_queue(data_for_saving, STORE_EXCHANGE,
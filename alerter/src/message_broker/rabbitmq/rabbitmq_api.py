@@ -310,6 +310,13 @@ class RabbitMQApi:
         if self._connection_initialised():
             return self._safe(self.channel.basic_consume, args, -1)
 
+    def basic_cancel(self, consumer_tag: str) -> Optional[int]:
+        args = [consumer_tag]
+        # Perform operation only if a connection has been initialised, if not,
+        # this function will throw a ConnectionNotInitialised exception
+        if self._connection_initialised():
+            return self._safe(self.channel.basic_cancel, args, -1)
+
     def basic_get(self, queue: str, auto_ack: bool = False) -> Optional[int]:
         args = [queue, auto_ack]
         # Perform operation only if a connection has been initialised, if not,
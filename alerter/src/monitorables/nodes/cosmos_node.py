@@ -4,8 +4,9 @@ from typing import Optional, Dict
 from schema import Schema, Or
 
 from src.monitorables.nodes.node import Node
-from src.utils.constants.cosmos import BondStatus
+from src.utils.constants.cosmos import BondStatus, MISSED_BLOCKS_WINDOW_SIZE
 from src.utils.exceptions import InvalidDictSchemaException
+from src.utils.missed_blocks_window import MissedBlocksWindow
 
 
 class CosmosNode(Node):
@@ -46,6 +47,12 @@ class CosmosNode(Node):
             'missed_heights': []
         }
 
+        # This keeps whether the validator missed each of the most recent block
+        # heights, so that heights which are received again in a later
+        # monitoring round are not counted twice in 'total_count'.
+        self._missed_blocks_window = MissedBlocksWindow(
+            MISSED_BLOCKS_WINDOW_SIZE)
+
         # These store the timestamps of the last successful monitoring round.
         self._last_monitored_prometheus = None
         self._last_monitored_tendermint_rpc = None
@@ -107,6 +114,10 @@ class CosmosNode(Node):
     def missed_blocks(self) -> Dict:
         return self._missed_blocks
 
+    @property
+    def missed_blocks_window(self) -> MissedBlocksWindow:
+        return self._missed_blocks_window
+
     @property
     def last_monitored_prometheus(self) -> Optional[float]:
         return self._last_monitored_prometheus
@@ -269,6 +280,10 @@ class CosmosNode(Node):
         else:
             raise InvalidDictSchemaException('new_missed_blocks')
 
+    def set_missed_blocks_window(
+            self, new_missed_blocks_window: MissedBlocksWindow) -> None:
+        self._missed_blocks_window = new_missed_blocks_window
+
     def set_last_monitored_prometheus(
             self, new_last_monitored_prometheus: Optional[float]) -> None:
         self._last_monitored_prometheus = new_last_monitored_prometheus
@@ -297,6 +312,7 @@ class CosmosNode(Node):
         self.set_jailed(None)
         self.set_slashed({'slashed': False, 'amount_map': {}})
         self.set_missed_blocks({'total_count': 0, 'missed_heights': []})
+        self.missed_blocks_window.reset()
         self.set_last_monitored_prometheus(None)
         self.set_last_monitored_cosmos_rest(None)
         self.set_last_monitored_tendermint_rpc(None)
@@ -53,3 +53,83 @@ Triggered At: {date_time}
 Parent ID: {parent_id}
 Origin ID: {origin_id}
 """
+EMAIL_DIGEST_HTML_TEMPLATE = """<style type="text/css">
+.email {{font-family: sans-serif}}
+.tg  {{border:none; border-spacing:0;border-collapse: collapse;}}
+.tg td{{border-style:none;border-width:0px;overflow:hidden; padding:10px 
+5px;word-break:normal;}}
+.tg th{{border-style:none;border-width:0px;overflow:hidden;padding:10px 
+5px;word-break:normal;text-align:left;background-color:lightgray;}}
+@media screen and (max-width: 767px) {{.tg {{width: auto !important;}}.tg col 
+{{width: auto !important;}}.tg-wrap {{overflow-x: 
+auto;-webkit-overflow-scrolling: touch;}} }}</style>
+<div class="email">
+<h2>PANIC Alert Digest</h2>
+<p>{no_of_alerts} {severity} alerts were generated for {parent_id}:</p>
+<div class="tg-wrap"><table class="tg">
+<thead>
+  <tr>
+    <th>Triggered At</th>
+    <th>Alert Code</th>
+    <th>Message</th>
+    <th>Origin ID</th>
+  </tr>
+</thead>
+<tbody>
+{rows}
+</tbody>
+</table></div>
+</div>"""
+EMAIL_DIGEST_HTML_ROW_TEMPLATE = """  <tr>
+    <td>{date_time}</td>
+    <td>{alert_code}</td>
+    <td>{message}</td>
+    <td>{origin_id}</td>
+  </tr>"""
+EMAIL_DIGEST_TEXT_TEMPLATE = """
+PANIC Alert Digest!
+======================
+{no_of_alerts} {severity} alerts were generated for {parent_id}:
+
+{rows}
+"""
+EMAIL_DIGEST_TEXT_ROW_TEMPLATE = "[{date_time}] {alert_code}: {message} " \
+                                 "(Origin ID: {origin_id})"
+
+# The maximum length of a message sent through a channel
+TELEGRAM_MESSAGE_MAX_LENGTH = 4096
+SLACK_MESSAGE_MAX_LENGTH = 4000
+
+# Retries of alerts which could not be sent through a channel are backed off
+# exponentially starting from the initial delay, up to the maximum delay.
+ALERT_RETRY_INITIAL_DELAY_SECONDS = 10
+ALERT_RETRY_MAX_DELAY_SECONDS = 120
+
+# Outbound message pacing limits, as messages per second and burst size. A bot
+# is limited across all of its chats, and separately within each chat.
+TELEGRAM_BOT_MESSAGES_PER_SECOND = 30
+TELEGRAM_BOT_MESSAGES_BURST = 30
+TELEGRAM_CHAT_MESSAGES_PER_SECOND = 1
+TELEGRAM_CHAT_MESSAGES_BURST = 3
+SLACK_BOT_MESSAGES_PER_SECOND = 1
+SLACK_BOT_MESSAGES_BURST = 5
+SLACK_CHANNEL_MESSAGES_PER_SECOND = 1
+SLACK_CHANNEL_MESSAGES_BURST = 3
+
+# The longest a message waits for the pacer before it is treated as rate
+# limited and left to be re-tried by the alerts handler
+MESSAGE_PACING_MAX_WAIT_SECONDS = 2
+
+# SMTP sessions are re-used across emails. A session which has been idle for
+# longer than the maximum idle time is replaced, since servers tend to close
+# idle sessions without notice.
+EMAIL_SMTP_TIMEOUT_SECONDS = 10
+EMAIL_SMTP_SESSION_MAX_IDLE_SECONDS = 60
+
+# How often the alerts dispatcher checks for channels added or removed by the
+# channels manager
+DISPATCHER_COMMANDS_POLL_SECONDS = 1
+
+# The alerts outbox of a channel handler reclaims the space freed by the
+# alerts it removed every time this many alerts are removed
+OUTBOX_COMPACTION_INTERVAL = 100
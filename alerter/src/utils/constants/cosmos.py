@@ -9,6 +9,11 @@ BondStatus = Literal[
     BOND_STATUS_INVALID
 ]
 
+# The number of most recent block heights for which a Cosmos node keeps whether
+# the validator missed the block. This matches the default signed blocks window
+# of the slashing module.
+MISSED_BLOCKS_WINDOW_SIZE = 10000
+
 PROPOSAL_STATUS_UNSPECIFIED = 'unspecified'
 PROPOSAL_STATUS_DEPOSIT_PERIOD = 'deposit_period'
 PROPOSAL_STATUS_VOTING_PERIOD = 'voting_period'
@@ -49,6 +49,7 @@ DATA_STORE_MANAGER_NAME = 'Data Store Manager'
 ALERT_ROUTER_NAME = 'Alert Router'
 CONFIGS_MANAGER_NAME = 'Configs Manager'
 CHANNELS_MANAGER_NAME = 'Channels Manager'
+ALERTS_DISPATCHER_NAME = 'Alerts Dispatcher'
 HEARTBEAT_HANDLER_NAME = 'Heartbeat Handler'
 PING_PUBLISHER_NAME = 'Ping Publisher'
 HEALTH_CHECKER_MANAGER_NAME = 'Health Checker Manager'
@@ -17,11 +17,30 @@ UNIQUE_ALERTER_IDENTIFIER = os.environ['UNIQUE_ALERTER_IDENTIFIER']
 # Mongo configuration
 DB_NAME = os.environ['DB_NAME']
 DB_PORT = int(os.environ['DB_PORT'])
+# Alert history retention. Alert documents whose last alert is older than
+# ALERTS_RETENTION_DAYS are removed from the chain collections, or moved to an
+# archive collection if ALERTS_ARCHIVE_EXPIRED is set. 0 keeps alerts forever.
+ALERTS_RETENTION_DAYS = float(os.getenv('ALERTS_RETENTION_DAYS', 0))
+ALERTS_ARCHIVE_EXPIRED: bool = \
+    str(os.getenv('ALERTS_ARCHIVE_EXPIRED', False)).lower() in (
+        "true", "yes", "y")
 
 # Redis configuration
 REDIS_IP = os.environ['REDIS_IP']
 REDIS_PORT = int(os.environ['REDIS_PORT'])
 REDIS_DB = int(os.environ['REDIS_DB'])
+# Write coalescing for the metric stores. Hash writes are buffered and flushed
+# every REDIS_WRITE_BEHIND_INTERVAL_SECONDS, or earlier if the buffer holds
+# REDIS_WRITE_BEHIND_BATCH_SIZE fields. An interval of 0 disables buffering.
+REDIS_WRITE_BEHIND_INTERVAL_SECONDS = float(
+    os.getenv('REDIS_WRITE_BEHIND_INTERVAL_SECONDS', 0))
+REDIS_WRITE_BEHIND_BATCH_SIZE = int(
+    os.getenv('REDIS_WRITE_BEHIND_BATCH_SIZE', 1000))
+# Local read cache for components which repeatedly read the same small keys,
+# such as mute and heartbeat keys. A size of 0 disables the cache.
+REDIS_READ_CACHE_SIZE = int(os.getenv('REDIS_READ_CACHE_SIZE', 0))
+REDIS_READ_CACHE_TTL_SECONDS = float(
+    os.getenv('REDIS_READ_CACHE_TTL_SECONDS', 10))
 
 # RabbitMQ configuration
 RABBIT_IP = os.environ['RABBIT_IP']
@@ -75,6 +94,45 @@ ALERT_ROUTER_PUBLISHING_QUEUE_SIZE = int(
 CONFIG_PUBLISHING_QUEUE_SIZE = int(
     os.environ['CONFIG_PUBLISHING_QUEUE_SIZE'])
 
+# Flap detection of the thresholded alerts. A metric whose alert state changes
+# ALERTS_FLAP_THRESHOLD times within ALERTS_FLAP_WINDOW_SECONDS raises a single
+# flapping alert, and its alerts are suppressed until its state does not change
+# for ALERTS_FLAP_WINDOW_SECONDS. A threshold of 0 disables flap detection.
+ALERTS_FLAP_THRESHOLD = int(os.getenv('ALERTS_FLAP_THRESHOLD', 0))
+ALERTS_FLAP_WINDOW_SECONDS = float(
+    os.getenv('ALERTS_FLAP_WINDOW_SECONDS', 600))
+
+# The number of worker processes started for each chain alerter type. The
+# chains are assigned to the workers by hashing their parent_id.
+ALERTER_WORKERS_PER_TYPE = int(os.getenv('ALERTER_WORKERS_PER_TYPE', 1))
+
+# Digest windows of the human-facing channels. Non-critical alerts are
+# buffered for this many seconds and sent as one message per chain and
+# severity. A window of 0 sends every alert on its own.
+TELEGRAM_DIGEST_WINDOW_SECONDS = float(
+    os.getenv('TELEGRAM_DIGEST_WINDOW_SECONDS', 0))
+SLACK_DIGEST_WINDOW_SECONDS = float(os.getenv('SLACK_DIGEST_WINDOW_SECONDS', 0))
+EMAIL_DIGEST_WINDOW_SECONDS = float(os.getenv('EMAIL_DIGEST_WINDOW_SECONDS', 0))
+
+# Updates of the same PagerDuty or Opsgenie incident which keep its severity are
+# not sent again if they are raised within this many seconds of the last one.
+# A window of 0 sends every update.
+INCIDENT_COALESCING_WINDOW_SECONDS = float(
+    os.getenv('INCIDENT_COALESCING_WINDOW_SECONDS', 0))
+
+# If enabled, the alerts handlers of all the channels are hosted by a single
+# alerts dispatcher process over one RabbitMQ connection, instead of each
+# running in its own process.
+CHANNEL_HANDLERS_DISPATCHER_MODE: bool = \
+    str(os.getenv('CHANNEL_HANDLERS_DISPATCHER_MODE', False)).lower() in (
+        "true", "yes", "y")
+
+# The alerts which a channel handler did not send yet are kept on disk in the
+# file given by this template, formatted with the channel id, so that they are
+# not lost if the handler restarts. If empty, they are only kept in memory.
+CHANNEL_HANDLERS_OUTBOX_FILE_TEMPLATE = os.getenv(
+    'CHANNEL_HANDLERS_OUTBOX_FILE_TEMPLATE', '')
+
 # Console Output
 ENABLE_CONSOLE_ALERTS: bool = \
     os.getenv('ENABLE_CONSOLE_ALERTS', False).lower() in (
@@ -0,0 +1,92 @@
+from typing import Any, Optional
+
+# The state of a height in the window, one byte per height.
+_NOT_RECORDED = 0
+_SIGNED = 1
+_MISSED = 2
+
+
+class MissedBlocksWindow:
+    """
+    Keeps whether a validator missed each of the last `size` block heights in
+    a ring indexed by height, together with the number of missed heights in
+    the window. Recording a height is O(1), and moving the window forward
+    clears at most `size` slots however far it moves, so the counters can be
+    read at any time without walking the heights, even after a long catch-up.
+    A height which is recorded again while it is in the window is ignored,
+    which avoids counting a missed block twice when monitoring rounds overlap.
+    """
+    __slots__ = ('_size', '_ring', '_last_height', '_no_of_missed')
+
+    def __init__(self, size: int) -> None:
+        if size <= 0:
+            raise ValueError("The window size must be positive")
+
+        self._size = size
+        self._ring = bytearray(size)
+        self._last_height: Optional[int] = None
+        self._no_of_missed = 0
+
+    def __eq__(self, other: Any) -> bool:
+        return (isinstance(other, MissedBlocksWindow)
+                and self._size == other._size
+                and self._ring == other._ring
+                and self._last_height == other._last_height
+                and self._no_of_missed == other._no_of_missed)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def last_height(self) -> Optional[int]:
+        return self._last_height
+
+    @property
+    def no_of_missed(self) -> int:
+        return self._no_of_missed
+
+    def _clear_slot(self, index: int) -> None:
+        if self._ring[index] == _MISSED:
+            self._no_of_missed -= 1
+        self._ring[index] = _NOT_RECORDED
+
+    def _move_to(self, height: int) -> None:
+        # Every height the window moves over is cleared, but only the last
+        # `size` of them can still be in the ring. An empty ring is clear.
+        if self._last_height is not None:
+            first_height = max(self._last_height + 1, height - self._size + 1)
+            for new_height in range(first_height, height + 1):
+                self._clear_slot(new_height % self._size)
+        self._last_height = height
+
+    def record(self, height: int, missed: bool) -> bool:
+        """
+        Records whether the validator missed the block at the given height.
+        Heights are expected in increasing order, but heights within the
+        window may be recorded in any order.
+        :param height: The block height
+        :param missed: Whether the validator missed the block
+        :return: False if the height was already recorded in the window
+               : True otherwise. Heights which are older than the window are
+               : not kept, and True is returned for them since it cannot be
+               : told whether they were recorded before.
+        """
+        if self._last_height is None or height > self._last_height:
+            self._move_to(height)
+        elif height <= self._last_height - self._size:
+            return True
+
+        index = height % self._size
+        if self._ring[index] != _NOT_RECORDED:
+            return False
+
+        self._ring[index] = _MISSED if missed else _SIGNED
+        if missed:
+            self._no_of_missed += 1
+        return True
+
+    def reset(self) -> None:
+        self._ring = bytearray(self._size)
+        self._last_height = None
+        self._no_of_missed = 0
@@ -1,4 +1,5 @@
 import os
+import zlib
 
 
 def get_routing_key(src_path: str, root_dir: str = "./") -> str:
@@ -24,3 +25,67 @@ def get_routing_key(src_path: str, root_dir: str = "./") -> str:
         path_list.append(tail)
 
     return '.'.join(reversed(path_list))
+
+
+def get_alerter_worker_index(parent_id: str, no_of_workers: int) -> int:
+    """
+    Assigns a chain to one of the workers of an alerter type by hashing its
+    parent_id. A stable hash is used so that the data transformers and the
+    alerters, which run in different processes, agree on the assignment.
+    :param parent_id: The parent_id of the chain
+    :param no_of_workers: The number of workers of the alerter type
+    :return: The index of the worker the chain is assigned to
+    """
+    return zlib.crc32(parent_id.encode('utf-8')) % no_of_workers
+
+
+def get_alerter_worker_routing_key(routing_key: str, worker_index: int,
+                                   no_of_workers: int) -> str:
+    """
+    Given the routing key of the transformed data of an alerter type, this
+    function returns the routing key of the data of the given worker. If the
+    alerter type is not split into multiple workers the routing key is
+    returned unchanged.
+    :param routing_key: The routing key of the alerter type
+    :param worker_index: The index of the worker
+    :param no_of_workers: The number of workers of the alerter type
+    :return: The routing key of the worker
+    """
+    if no_of_workers <= 1:
+        return routing_key
+
+    return '{}.{}'.format(routing_key, worker_index)
+
+
+def get_alerter_worker_queue_name(queue_name: str, worker_index: int,
+                                  no_of_workers: int) -> str:
+    """
+    Given the input queue name of an alerter type, this function returns the
+    name of the input queue of the given worker. If the alerter type is not
+    split into multiple workers the queue name is returned unchanged.
+    :param queue_name: The input queue name of the alerter type
+    :param worker_index: The index of the worker
+    :param no_of_workers: The number of workers of the alerter type
+    :return: The input queue name of the worker
+    """
+    if no_of_workers <= 1:
+        return queue_name
+
+    return '{}_{}'.format(queue_name, worker_index)
+
+
+def get_alerter_worker_name(alerter_name: str, worker_index: int,
+                            no_of_workers: int) -> str:
+    """
+    Given the name of an alerter type, this function returns the name of the
+    given worker. If the alerter type is not split into multiple workers the
+    name is returned unchanged.
+    :param alerter_name: The name of the alerter type
+    :param worker_index: The index of the worker
+    :param no_of_workers: The number of workers of the alerter type
+    :return: The name of the worker
+    """
+    if no_of_workers <= 1:
+        return alerter_name
+
+    return '{} {}'.format(alerter_name, worker_index)
@@ -1,19 +1,93 @@
+import time
+from collections import deque
 from datetime import datetime, timedelta
-from queue import Queue
-from typing import Optional, Any
+from typing import Optional, Any, Iterable, Union, Callable
 
 from src.utils.datetime import strfdelta
 
+# Times are stored as float seconds since the epoch, with datetime.min stored
+# as -inf. Datetimes and floats are both accepted as inputs, so that callers
+# which already have an epoch timestamp do not need to build a datetime.
+TimeType = Union[datetime, float]
+_NO_TIME = float('-inf')
+
+# Intervals are compared with microsecond resolution, the resolution of
+# datetimes, so that float rounding does not change the outcome of a
+# comparison of an elapsed time which is exactly equal to an interval.
+_HALF_RESOLUTION = 0.5e-6
+
+
+# The source of the current time used when no time is given to a tracker. It
+# is replaced by a simulated clock when recorded data is replayed.
+_time_source: Callable[[], float] = time.time
+
+
+def set_time_source(time_source: Optional[Callable[[], float]]) -> None:
+    """
+    Sets the function returning the current time, as seconds since the epoch,
+    used by the trackers when no time is given to them.
+    :param time_source: The function returning the current time, or None to
+                      : use the system clock
+    :return: None
+    """
+    global _time_source
+    _time_source = time.time if time_source is None else time_source
+
+
+def _now() -> float:
+    return _time_source()
+
+
+def _to_seconds(value: Optional[TimeType]) -> float:
+    if value.__class__ is float:
+        return value
+    elif value is None:
+        return _now()
+    elif isinstance(value, datetime):
+        return _NO_TIME if value == datetime.min else value.timestamp()
+    return float(value)
+
+
+def _to_datetime(seconds: float) -> datetime:
+    return datetime.min if seconds == _NO_TIME \
+        else datetime.fromtimestamp(seconds)
+
+
+def _slots_equal(first: Any, second: Any,
+                 excluded: Iterable[str] = ()) -> bool:
+    """
+    Compares the attributes of two objects whose attributes are stored in
+    __slots__, the same way objects are compared using __dict__ elsewhere.
+    :param first: The first object
+    :param second: The second object
+    :param excluded: The attributes which are not compared
+    :return: True if the objects have the same slots, and the values of all
+           : non-excluded slots are equal
+           : False otherwise
+    """
+    slots = getattr(type(first), '__slots__', ())
+    if slots != getattr(type(second), '__slots__', None):
+        return False
+
+    return all(getattr(first, slot) == getattr(second, slot)
+               for slot in slots if slot not in excluded)
+
 
 class TimedTaskLimiter:
+    # A limiter is kept for many metrics of every monitorable, therefore
+    # __slots__ are used to keep its memory footprint small.
+    __slots__ = ('_time_interval', '_time_interval_seconds',
+                 '_last_time_that_did_task')
+
     def __init__(self, time_interval: timedelta) -> None:
         super().__init__()
 
         self._time_interval = time_interval
-        self._last_time_that_did_task = datetime.min
+        self._time_interval_seconds = time_interval.total_seconds()
+        self._last_time_that_did_task = _NO_TIME
 
     def __eq__(self, other: Any) -> bool:
-        return self.__dict__ == other.__dict__
+        return _slots_equal(self, other)
 
     @property
     def time_interval(self) -> timedelta:
@@ -21,39 +95,43 @@ class TimedTaskLimiter:
 
     @property
     def last_time_that_did_task(self) -> datetime:
-        return self._last_time_that_did_task
+        return _to_datetime(self._last_time_that_did_task)
 
     def set_time_interval(self, time_interval: timedelta) -> None:
         self._time_interval = time_interval
+        self._time_interval_seconds = time_interval.total_seconds()
 
-    def can_do_task(self, start_time: datetime = None) -> bool:
-        if start_time is None:
-            start_time = datetime.now()
-
-        return \
-            (start_time - self._last_time_that_did_task) >= self._time_interval
+    def can_do_task(self, start_time: TimeType = None) -> bool:
+        return (_to_seconds(start_time) - self._last_time_that_did_task
+                >= self._time_interval_seconds - _HALF_RESOLUTION)
 
     def did_task(self) -> None:
-        self._last_time_that_did_task = datetime.now()
+        self._last_time_that_did_task = _now()
 
     def reset(self) -> None:
-        self._last_time_that_did_task = datetime.min
+        self._last_time_that_did_task = _NO_TIME
 
-    def set_last_time_that_did_task(self, time: datetime) -> None:
-        self._last_time_that_did_task = time
+    def set_last_time_that_did_task(self, time: TimeType) -> None:
+        self._last_time_that_did_task = _to_seconds(time)
 
 
 class TimedTaskTracker:
+    # A tracker is kept for many metrics of every monitorable, therefore
+    # __slots__ are used to keep its memory footprint small.
+    __slots__ = ('_time_interval', '_time_interval_seconds', '_start_time',
+                 '_timer_started', '_did_task')
+
     def __init__(self, time_interval: timedelta) -> None:
         super().__init__()
 
         self._time_interval = time_interval
-        self._start_time = datetime.min
+        self._time_interval_seconds = time_interval.total_seconds()
+        self._start_time = _NO_TIME
         self._timer_started = False
         self._did_task = False
 
     def __eq__(self, other: Any) -> bool:
-        return self.__dict__ == other.__dict__
+        return _slots_equal(self, other)
 
     @property
     def time_interval(self) -> timedelta:
@@ -69,47 +147,50 @@ class TimedTaskTracker:
 
     @property
     def start_time(self) -> datetime:
-        return self._start_time
+        return _to_datetime(self._start_time)
 
     def set_time_interval(self, time_interval: timedelta) -> None:
         self._time_interval = time_interval
+        self._time_interval_seconds = time_interval.total_seconds()
 
-    def start_timer(self, start_time: datetime = None) -> None:
-        if start_time is None:
-            self._start_time = datetime.now()
-        else:
-            self._start_time = start_time
-
+    def start_timer(self, start_time: TimeType = None) -> None:
+        self._start_time = _to_seconds(start_time)
         self._timer_started = True
         self._did_task = False
 
-    def can_do_task(self, time: datetime = None) -> bool:
-        if not self.timer_started or self.did_task:
+    def can_do_task(self, time: TimeType = None) -> bool:
+        if not self._timer_started or self._did_task:
             return False
-        else:
-            if time is None:
-                time = datetime.now()
 
-            return (time - self.start_time) >= self.time_interval
+        return (_to_seconds(time) - self._start_time
+                >= self._time_interval_seconds - _HALF_RESOLUTION)
 
     def do_task(self) -> None:
-        if self.timer_started:
+        if self._timer_started:
             self._did_task = True
 
     def reset(self) -> None:
         self._timer_started = False
         self._did_task = False
-        self._start_time = datetime.min
+        self._start_time = _NO_TIME
 
 
 class TimedOccurrenceTracker:
+    """
+    This class keeps the times of the last `max_occurrences` occurrences in a
+    bounded deque, so that adding an occurrence drops the oldest one.
+    """
+    __slots__ = ('_max_occurrences', '_time_interval',
+                 '_time_interval_seconds', '_last_occurrences')
+
     def __init__(self, max_occurrences: int, time_interval: timedelta) -> None:
         super().__init__()
 
         self._max_occurrences = max_occurrences
         self._time_interval = time_interval
+        self._time_interval_seconds = time_interval.total_seconds()
 
-        self._last_occurrences = Queue(maxsize=max_occurrences)
+        self._last_occurrences = deque(maxlen=max_occurrences)
         self.reset()
 
     @property
@@ -124,29 +205,20 @@ class TimedOccurrenceTracker:
     def time_interval_pretty(self) -> str:
         return strfdelta(self.time_interval, "{hours}h, {minutes}m, {seconds}s")
 
-    def action_happened(self, at_time: Optional[datetime] = None) -> None:
-        # Default: get current time
-        if at_time is None:
-            at_time = datetime.now()
-
-        self._last_occurrences.get()
-        self._last_occurrences.put(at_time)
+    def action_happened(self, at_time: Optional[TimeType] = None) -> None:
+        # Default: get current time. Since the deque is bounded, appending
+        # removes the oldest occurrence.
+        self._last_occurrences.append(_to_seconds(at_time))
 
-    def too_many_occurrences(self, from_time: Optional[datetime] = None) \
+    def too_many_occurrences(self, from_time: Optional[TimeType] = None) \
             -> bool:
-        # Default: get current time
-        if from_time is None:
-            from_time = datetime.now()
-
-        # noinspection PyUnresolvedReferences
-        oldest_occurrence = self._last_occurrences.queue[0]
-        return (from_time - oldest_occurrence) < self._time_interval
+        oldest_occurrence = self._last_occurrences[0]
+        return (_to_seconds(from_time) - oldest_occurrence
+                < self._time_interval_seconds - _HALF_RESOLUTION)
 
     def reset(self) -> None:
-        while not self._last_occurrences.empty():
-            self._last_occurrences.get()
-        for i in range(self._max_occurrences):
-            self._last_occurrences.put(datetime.min)
+        self._last_occurrences.clear()
+        self._last_occurrences.extend([_NO_TIME] * self._max_occurrences)
 
 
 class OccurrencesInTimePeriodTracker:
@@ -154,60 +226,49 @@ class OccurrencesInTimePeriodTracker:
     This class keeps track of how many occurrences happened in a time period.
     Each element represents the time of an occurrence and thus the length of the
     queue is the number of occurrences. When adding a new occurrence the class
-    attempts to keep the occurrences happened within a time period.
+    attempts to keep the occurrences happened within a time period. The
+    occurrences are kept in a deque rather than in a Queue, as a Queue carries
+    a lock and three conditions which are not needed by the alerters and take
+    up most of the memory of a tracker.
     """
+    __slots__ = ('_time_period', '_time_period_seconds', '_occurrences_queue')
 
     def __init__(self, time_period: timedelta) -> None:
         super().__init__()
 
         self._time_period = time_period
-        self._occurrences_queue = Queue()
+        self._time_period_seconds = time_period.total_seconds()
+        self._occurrences_queue = deque()
 
     def __eq__(self, other: Any) -> bool:
         """
-        This function checks that all keys and values are the same for both
-        objects except for the `self._occurrences_queue` variable. This is
-        omitted because __eq__ was not implemented for the Queue object.
+        This function checks that all attributes are the same for both
+        objects except for the `self._occurrences_queue` variable, which is
+        omitted so that trackers are compared only by their configuration.
         :param other: Other objects
         :return: True if conditions described above are matched
                : False otherwise
         """
-
-        if self.__dict__.keys() != other.__dict__.keys():
-            return False
-
-        for key, val in self.__dict__.items():
-            if not key == '_occurrences_queue' \
-                    and not val == other.__dict__[key]:
-                return False
-
-        return True
+        return _slots_equal(self, other, ('_occurrences_queue',))
 
     @property
     def time_period(self) -> timedelta:
         return self._time_period
 
-    def add_occurrence(self, time: datetime = None) -> None:
-        if time is None:
-            time = datetime.now()
-
+    def add_occurrence(self, time: TimeType = None) -> None:
+        time = _to_seconds(time)
         self.remove_old_occurrences(time)
+        self._occurrences_queue.append(time)
 
-        self._occurrences_queue.put(time)
-
-    def remove_old_occurrences(self, time: datetime = None) -> None:
-        if time is None:
-            time = datetime.now()
-
-        while not self._occurrences_queue.empty():
-            oldest_occurrence = self._occurrences_queue.queue[0]
-            if (time - oldest_occurrence) > self.time_period:
-                self._occurrences_queue.get()
-            else:
-                break
+    def remove_old_occurrences(self, time: TimeType = None) -> None:
+        time = _to_seconds(time)
+        max_age = self._time_period_seconds + _HALF_RESOLUTION
+        occurrences = self._occurrences_queue
+        while occurrences and time - occurrences[0] > max_age:
+            occurrences.popleft()
 
     def no_of_occurrences(self) -> int:
-        return self._occurrences_queue.qsize()
+        return len(self._occurrences_queue)
 
     def reset(self) -> None:
-        self._occurrences_queue.queue.clear()
+        self._occurrences_queue.clear()
@@ -1211,6 +1211,86 @@ class TestAlertRouter(unittest.TestCase):
         finally:
             disconnect_from_rabbit(self._test_alert_router.rabbitmq)
 
+    @mock.patch.object(AlertRouter, "_send_data", autospec=True)
+    @mock.patch.object(AlertRouter, "_push_to_queue", autospec=True)
+    @mock.patch.object(AlertRouter, "is_all_muted", autospec=True)
+    @mock.patch.object(AlertRouter, "is_chain_severity_muted", autospec=True)
+    @mock.patch.object(RabbitMQApi, "basic_ack", autospec=True)
+    def test__process_alert_routes_all_alerts_of_envelope(
+            self, mock_basic_ack: MagicMock,
+            mock_is_chain_severity_muted: MagicMock,
+            mock_is_all_muted: MagicMock, mock_push_to_queue: MagicMock,
+            mock_send_data: MagicMock
+    ):
+        mock_basic_ack.return_value = None
+        mock_is_all_muted.return_value = False
+        mock_is_chain_severity_muted.return_value = False
+        mock_push_to_queue.return_value = None
+        mock_send_data.return_value = None
+
+        config = {
+            'test_234': {
+                'id': "test_234",
+                'info': True,
+                'warning': True,
+                'critical': True,
+                'error': True,
+                'parent_ids': "GENERAL,",
+            }
+        }
+        self._test_alert_router._config = {self.CONFIG_ROUTING_KEY: config}
+        try:
+            # Must create a connection so that the blocking channel is passed
+            connect_to_rabbit(self.rabbitmq)
+            self._test_alert_router._initialise_rabbitmq()
+            blocking_channel = self._test_alert_router._rabbitmq.channel
+
+            method_chains = pika.spec.Basic.Deliver(
+                routing_key=self.ALERT_ROUTER_INPUT_ROUTING_KEY
+            )
+            properties = pika.spec.BasicProperties()
+            alert_timestamp = datetime(
+                year=1997, month=8, day=15, hour=10, minute=21, second=33,
+                microsecond=30
+            )
+            alerts = [
+                Alert(
+                    DummyAlertCode.TEST_ALERT_CODE, "This is a test alert",
+                    severity, alert_timestamp.timestamp(), "GENERAL",
+                    "origin_123", GroupedGithubAlertsMetricCode.GithubRelease,
+                    []
+                ) for severity in ['warning', 'warning', 'critical']
+            ]
+
+            envelope_json = json.dumps(
+                {'alerts': [alert.alert_data for alert in alerts]})
+
+            self._test_alert_router._process_alert(
+                blocking_channel, method_chains, properties, envelope_json
+            )
+
+            # The envelope is acknowledged once, and the mute statuses are
+            # retrieved once per severity and chain
+            mock_basic_ack.assert_called_once()
+            self.assertEqual(2, mock_is_all_muted.call_count)
+            self.assertEqual(2, mock_is_chain_severity_muted.call_count)
+
+            # Every alert is still sent to the channel, console, log and store
+            for alert in alerts:
+                mock_push_to_queue.assert_any_call(
+                    self._test_alert_router,
+                    {**alert.alert_data, 'destination_id': 'test_234'},
+                    ALERT_EXCHANGE,
+                    CHANNEL_HANDLER_INPUT_ROUTING_KEY_TEMPLATE.format(
+                        "test_234"),
+                    mandatory=False
+                )
+            self.assertEqual(12, mock_push_to_queue.call_count)
+
+            mock_send_data.assert_called_once_with(self._test_alert_router)
+        finally:
+            disconnect_from_rabbit(self._test_alert_router.rabbitmq)
+
     @freeze_time("1997-08-15T10:21:33.000030")
     @mock.patch.object(RabbitMQApi, "basic_ack", autospec=True)
     def test__process_ping_sends_valid_hb(self, mock_ack: MagicMock):
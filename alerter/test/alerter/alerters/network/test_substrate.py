@@ -557,28 +557,24 @@ class TestSubstrateNetworkAlerter(unittest.TestCase):
 
         self.assertTrue(self.test_alerter.publishing_queue.empty())
 
-        expected_data_1 = {
+        expected_data = {
             'exchange': ALERT_EXCHANGE,
             'routing_key': SUBSTRATE_NETWORK_ALERT_ROUTING_KEY,
-            'data': 'data_1',
-            'properties': pika.BasicProperties(delivery_mode=2),
-            'mandatory': True
-        }
-        expected_data_2 = {
-            'exchange': ALERT_EXCHANGE,
-            'routing_key': SUBSTRATE_NETWORK_ALERT_ROUTING_KEY,
-            'data': 'data_2',
+            'data': {'alerts': ['data_1', 'data_2']},
             'properties': pika.BasicProperties(delivery_mode=2),
             'mandatory': True
         }
         self.test_alerter._place_latest_data_on_queue(test_data)
-        self.assertEqual(2,
+        self.assertEqual(1,
                          self.test_alerter.publishing_queue.qsize())
-        self.assertEqual(expected_data_1,
-                         self.test_alerter.publishing_queue.get())
-        self.assertEqual(expected_data_2,
+        self.assertEqual(expected_data,
                          self.test_alerter.publishing_queue.get())
 
+    def test_place_latest_data_on_queue_does_nothing_if_no_alerts(
+            self) -> None:
+        self.test_alerter._place_latest_data_on_queue([])
+        self.assertTrue(self.test_alerter.publishing_queue.empty())
+
     def test_place_latest_data_on_queue_removes_old_data_if_full_then_places(
             self) -> None:
         # First fill the queue with the same data
@@ -596,7 +592,7 @@ class TestSubstrateNetworkAlerter(unittest.TestCase):
             expected_data = {
                 'exchange': ALERT_EXCHANGE,
                 'routing_key': SUBSTRATE_NETWORK_ALERT_ROUTING_KEY,
-                'data': 'data_2',
+                'data': {'alerts': ['data_2']},
                 'properties': pika.BasicProperties(delivery_mode=2),
                 'mandatory': True
             }
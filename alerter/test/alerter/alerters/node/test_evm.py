@@ -31,6 +31,7 @@ from src.utils.constants.rabbitmq import (
     EVM_NODE_ALERT_ROUTING_KEY)
 from src.utils.env import RABBIT_IP
 from src.utils.exceptions import PANICException, NodeIsDownException
+from src.utils.routing_key import get_alerter_worker_index
 from test.test_utils.utils import (
     connect_to_rabbit, delete_queue_if_exists, delete_exchange_if_exists,
     disconnect_from_rabbit)
@@ -382,34 +383,76 @@ class TestEVMNodeAlerter(unittest.TestCase):
         self.test_node_alerter._process_configs(method, body)
         mock_ack.assert_called_once()
 
+    @parameterized.expand([(True,), (False,)])
+    @mock.patch.object(EVMNodeAlertsConfigsFactory, "get_parent_id")
+    @mock.patch.object(EVMNodeAlertsConfigsFactory, "add_new_config")
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test_process_configs_only_processes_configs_of_assigned_chains(
+            self, assigned, mock_ack, mock_add_new_conf,
+            mock_get_parent_id) -> None:
+        """
+        In this test we will check that if the alerter type is split into
+        multiple workers, a worker only processes the configs of the chains
+        assigned to it, and acknowledges the rest.
+        """
+        mock_ack.return_value = None
+        mock_get_parent_id.return_value = self.test_parent_id
+        assigned_worker = get_alerter_worker_index(self.test_parent_id, 2)
+        worker_index = assigned_worker if assigned else 1 - assigned_worker
+        self.test_node_alerter.set_worker(worker_index, 2)
+
+        self.test_node_alerter.rabbitmq.connect()
+        method = pika.spec.Basic.Deliver(
+            routing_key=self.test_configs_routing_key)
+        body = json.dumps(self.received_configurations)
+        self.test_node_alerter._process_configs(method, body)
+
+        self.assertEqual(assigned, mock_add_new_conf.called)
+        mock_ack.assert_called_once()
+
+    @parameterized.expand([(1, False), (2, True)])
+    @mock.patch.object(RabbitMQApi, "queue_delete")
+    def test_delete_single_worker_queue_only_deletes_if_multiple_workers(
+            self, no_of_workers, deleted, mock_queue_delete) -> None:
+        """
+        In this test we will check that the input queue used when the alerter
+        type has a single worker is deleted only if there are more workers.
+        """
+        self.test_node_alerter.set_worker(0, no_of_workers)
+
+        self.test_node_alerter._delete_single_worker_queue(
+            EVM_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
+
+        if deleted:
+            mock_queue_delete.assert_called_once_with(
+                EVM_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
+        else:
+            mock_queue_delete.assert_not_called()
+
     def test_place_latest_data_on_queue_places_data_on_queue_correctly(
             self) -> None:
         test_data = ['data_1', 'data_2']
 
         self.assertTrue(self.test_node_alerter.publishing_queue.empty())
 
-        expected_data_1 = {
+        expected_data = {
             'exchange': ALERT_EXCHANGE,
             'routing_key': EVM_NODE_ALERT_ROUTING_KEY,
-            'data': 'data_1',
-            'properties': pika.BasicProperties(delivery_mode=2),
-            'mandatory': True
-        }
-        expected_data_2 = {
-            'exchange': ALERT_EXCHANGE,
-            'routing_key': EVM_NODE_ALERT_ROUTING_KEY,
-            'data': 'data_2',
+            'data': {'alerts': ['data_1', 'data_2']},
             'properties': pika.BasicProperties(delivery_mode=2),
             'mandatory': True
         }
         self.test_node_alerter._place_latest_data_on_queue(test_data)
-        self.assertEqual(2,
+        self.assertEqual(1,
                          self.test_node_alerter.publishing_queue.qsize())
-        self.assertEqual(expected_data_1,
-                         self.test_node_alerter.publishing_queue.get())
-        self.assertEqual(expected_data_2,
+        self.assertEqual(expected_data,
                          self.test_node_alerter.publishing_queue.get())
 
+    def test_place_latest_data_on_queue_does_nothing_if_no_alerts(
+            self) -> None:
+        self.test_node_alerter._place_latest_data_on_queue([])
+        self.assertTrue(self.test_node_alerter.publishing_queue.empty())
+
     def test_place_latest_data_on_queue_removes_old_data_if_full_then_places(
             self) -> None:
         # First fill the queue with the same data
@@ -427,7 +470,7 @@ class TestEVMNodeAlerter(unittest.TestCase):
             expected_data = {
                 'exchange': ALERT_EXCHANGE,
                 'routing_key': EVM_NODE_ALERT_ROUTING_KEY,
-                'data': 'data_2',
+                'data': {'alerts': ['data_2']},
                 'properties': pika.BasicProperties(delivery_mode=2),
                 'mandatory': True
             }
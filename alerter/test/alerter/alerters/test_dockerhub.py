@@ -374,11 +374,10 @@ class TestDockerhubAlerter(unittest.TestCase):
         mock_dockerhub_access.assert_not_called()
         mock_updated_dockerhub_tag.assert_not_called()
         mock_deleted_dockerhub_tag.assert_not_called()
-        # Call count of basic_publish_confirm is higher than
-        # dockerhub_release call_count because of the hb and initial
-        # validation alerts
+        # All the alerts are published in a single envelope, followed by the
+        # heartbeat
         self.assertEqual(3, mock_new_dockerhub_tag.call_count)
-        self.assertEqual(4, mock_basic_publish_confirm.call_count)
+        self.assertEqual(2, mock_basic_publish_confirm.call_count)
 
     @mock.patch(
         "src.alerter.alerters.alerter.RabbitMQApi.basic_publish_confirm",
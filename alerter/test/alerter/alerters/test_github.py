@@ -350,11 +350,10 @@ class TestGithubAlerter(unittest.TestCase):
             mock_new_github_release.assert_has_calls([call_1, call_2, call_3,
                                                       call_4, call_5])
             mock_github_access.assert_not_called()
-            # Call count of basic_publish_confirm is higher than
-            # github_release call_count because of the hb and initial
-            # validation alerts
+            # All the alerts are published in a single envelope, followed by
+            # the heartbeat
             self.assertEqual(5, mock_new_github_release.call_count)
-            self.assertEqual(6, mock_basic_publish_confirm.call_count)
+            self.assertEqual(2, mock_basic_publish_confirm.call_count)
         except Exception as e:
             self.fail("Test failed: {}".format(e))
 
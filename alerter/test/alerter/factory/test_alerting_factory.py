@@ -8,6 +8,7 @@ from parameterized import parameterized
 
 from src.alerter.alert_code.node.chainlink_alert_code import \
     ChainlinkNodeAlertCode
+from src.alerter.alert_severities import Severity
 from src.alerter.alerts.alert import Alert
 from src.alerter.alerts.node.chainlink import (
     NoChangeInHeightAlert, BlockHeightUpdatedAlert,
@@ -594,6 +595,97 @@ class TestAlertingFactory(unittest.TestCase):
         self.assertEqual(self.dummy_logger,
                          self.test_factory_instance.component_logger)
 
+    def test_compiled_rule_parses_the_config_thresholds(self) -> None:
+        compiled = self.test_factory_instance.compiled_rule(
+            self.test_alerts_config.head_tracker_current_head,
+            self.test_parent_id, self.test_node_id,
+            GroupedChainlinkNodeAlertsMetricCode.NoChangeInHeight.value)
+
+        self.assertTrue(compiled.rule.warning_enabled)
+        self.assertEqual(3.0, compiled.rule.warning_threshold)
+        self.assertTrue(compiled.rule.critical_enabled)
+        self.assertEqual(7.0, compiled.rule.critical_threshold)
+        self.assertTrue(compiled.rule.critical_repeat_enabled)
+        self.assertIsNone(compiled.rule.warning_time_window)
+
+    def test_compiled_rule_references_the_alerting_state(self) -> None:
+        metric_name = \
+            GroupedChainlinkNodeAlertsMetricCode.NoChangeInHeight.value
+        compiled = self.test_factory_instance.compiled_rule(
+            self.test_alerts_config.head_tracker_current_head,
+            self.test_parent_id, self.test_node_id, metric_name)
+        state = self.test_factory_instance.alerting_state[
+            self.test_parent_id][self.test_node_id]
+
+        self.assertIs(state['warning_sent'], compiled.warning_sent)
+        self.assertIs(state['critical_sent'], compiled.critical_sent)
+        self.assertIs(state['warning_window_timer'][metric_name],
+                      compiled.warning_window_timer)
+        self.assertIs(state['critical_window_timer'][metric_name],
+                      compiled.critical_window_timer)
+        self.assertIs(state['critical_repeat_timer'][metric_name],
+                      compiled.critical_repeat_timer)
+
+    def test_compiled_rule_compiles_a_config_only_once(self) -> None:
+        metric_name = \
+            GroupedChainlinkNodeAlertsMetricCode.NoChangeInHeight.value
+        first = self.test_factory_instance.compiled_rule(
+            self.test_alerts_config.head_tracker_current_head,
+            self.test_parent_id, self.test_node_id, metric_name)
+        second = self.test_factory_instance.compiled_rule(
+            self.test_alerts_config.head_tracker_current_head,
+            self.test_parent_id, self.test_node_id, metric_name)
+
+        self.assertIs(first, second)
+
+    def test_compiled_rule_recompiles_if_a_new_config_is_received(
+            self) -> None:
+        metric_name = \
+            GroupedChainlinkNodeAlertsMetricCode.NoChangeInHeight.value
+        first = self.test_factory_instance.compiled_rule(
+            self.test_alerts_config.head_tracker_current_head,
+            self.test_parent_id, self.test_node_id, metric_name)
+        new_config = dict(self.test_alerts_config.head_tracker_current_head)
+        new_config['warning_threshold'] = '4'
+        second = self.test_factory_instance.compiled_rule(
+            new_config, self.test_parent_id, self.test_node_id, metric_name)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(4.0, second.rule.warning_threshold)
+
+    def test_compiled_rule_recompiles_if_alerting_state_is_recreated(
+            self) -> None:
+        metric_name = \
+            GroupedChainlinkNodeAlertsMetricCode.NoChangeInHeight.value
+        first = self.test_factory_instance.compiled_rule(
+            self.test_alerts_config.head_tracker_current_head,
+            self.test_parent_id, self.test_node_id, metric_name)
+        del self.test_factory_instance.alerting_state[self.test_parent_id]
+        self.test_factory_instance.create_alerting_state(
+            self.test_parent_id, self.test_node_id, self.test_alerts_config)
+        second = self.test_factory_instance.compiled_rule(
+            self.test_alerts_config.head_tracker_current_head,
+            self.test_parent_id, self.test_node_id, metric_name)
+        state = self.test_factory_instance.alerting_state[
+            self.test_parent_id][self.test_node_id]
+
+        self.assertIsNot(first, second)
+        self.assertIs(state['warning_sent'], second.warning_sent)
+
+    def test_remove_compiled_rules_removes_only_the_chain_rules(self) -> None:
+        metric_name = \
+            GroupedChainlinkNodeAlertsMetricCode.NoChangeInHeight.value
+        self.test_factory_instance.compiled_rule(
+            self.test_alerts_config.head_tracker_current_head,
+            self.test_parent_id, self.test_node_id, metric_name)
+        other_key = ('other_parent_id', self.test_node_id, metric_name)
+        self.test_factory_instance._compiled_rules[other_key] = None
+
+        self.test_factory_instance.remove_compiled_rules(self.test_parent_id)
+
+        self.assertEqual([other_key],
+                         list(self.test_factory_instance._compiled_rules))
+
     def test_classify_no_change_in_alert_does_nothing_warning_critical_disabled(
             self) -> None:
         """
@@ -1939,6 +2031,90 @@ class TestAlertingFactory(unittest.TestCase):
 
         self.assertEqual([], data_for_alerting)
 
+    def test_classify_thresholded_only_resets_repeat_if_below_thresholds(
+            self) -> None:
+        """
+        In this test we will check that if the current value is below both
+        thresholds and no alert was raised, no alert is raised and the only
+        change to the state is that the critical repeat limiter is reset.
+        """
+        metric_name = EVMAlertsMetricCode.BlockHeightDifference.value
+        state = self.test_evm_factory_instance.alerting_state[
+            self.test_parent_id][self.test_node_id]
+        critical_repeat_limiter = state['critical_repeat_timer'][metric_name]
+        critical_repeat_limiter.set_last_time_that_did_task(datetime.now())
+
+        data_for_alerting = []
+        current = float(self.evm_node_alerts_config
+                        .evm_block_syncing_block_height_difference[
+                            'warning_threshold']) - 1
+        self.test_evm_factory_instance.classify_thresholded_alert(
+            current, self.evm_node_alerts_config
+                .evm_block_syncing_block_height_difference,
+            BlockHeightDifferenceIncreasedAboveThresholdAlert,
+            BlockHeightDifferenceDecreasedBelowThresholdAlert,
+            data_for_alerting,
+            self.test_parent_id, self.test_node_id, metric_name,
+            self.test_node_name, datetime.now().timestamp()
+        )
+
+        self.assertEqual([], data_for_alerting)
+        self.assertFalse(state['warning_sent'][metric_name])
+        self.assertFalse(state['critical_sent'][metric_name])
+        self.assertEqual(datetime.min,
+                         critical_repeat_limiter.last_time_that_did_task)
+
+    def test_classify_thresholded_replaces_toggles_with_flapping_alert(
+            self) -> None:
+        """
+        In this test we will check that if flap detection is enabled and the
+        value keeps crossing the warning threshold, the toggling alerts are
+        replaced by a single flapping alert. Once the value does not cross the
+        threshold for the flap time window, a single alert with the latest
+        state of the metric is raised.
+        """
+        self.test_evm_factory_instance.set_flap_detection(
+            3, timedelta(seconds=60))
+        config = self.evm_node_alerts_config \
+            .evm_block_syncing_block_height_difference
+        warning_threshold = float(config['warning_threshold'])
+        start = datetime(2012, 1, 1).timestamp()
+
+        data_for_alerting = []
+        for second in range(6):
+            current = warning_threshold + (1 if second % 2 == 0 else -1)
+            self.test_evm_factory_instance.classify_thresholded_alert(
+                current, config,
+                BlockHeightDifferenceIncreasedAboveThresholdAlert,
+                BlockHeightDifferenceDecreasedBelowThresholdAlert,
+                data_for_alerting, self.test_parent_id, self.test_node_id,
+                EVMAlertsMetricCode.BlockHeightDifference.value,
+                self.test_node_name, start + second
+            )
+
+        self.assertEqual([
+            'BlockHeightDifferenceIncreasedAboveThresholdAlert',
+            'BlockHeightDifferenceDecreasedBelowThresholdAlert',
+            'MetricFlappingAlert',
+        ], [alert['alert_code']['name'] for alert in data_for_alerting])
+        self.assertEqual(EVMAlertsMetricCode.BlockHeightDifference.value,
+                         data_for_alerting[-1]['metric'])
+
+        data_for_alerting.clear()
+        self.test_evm_factory_instance.classify_thresholded_alert(
+            warning_threshold - 1, config,
+            BlockHeightDifferenceIncreasedAboveThresholdAlert,
+            BlockHeightDifferenceDecreasedBelowThresholdAlert,
+            data_for_alerting, self.test_parent_id, self.test_node_id,
+            EVMAlertsMetricCode.BlockHeightDifference.value,
+            self.test_node_name, start + 70
+        )
+
+        self.assertEqual(1, len(data_for_alerting))
+        self.assertEqual('MetricStoppedFlappingAlert',
+                         data_for_alerting[0]['alert_code']['name'])
+        self.assertEqual('INFO', data_for_alerting[0]['severity'])
+
     @parameterized.expand([
         ('WARNING', 'warning_threshold'),
         ('CRITICAL', 'critical_threshold'),
@@ -2817,6 +2993,66 @@ class TestAlertingFactory(unittest.TestCase):
 
         self.assertEqual([], data_for_alerting)
 
+    def test_classify_thresholded_reverse_no_change_if_above_thresholds(
+            self) -> None:
+        """
+        In this test we will check that if the current value is above both
+        thresholds and no alert was raised, no alert is raised and the state
+        is left unchanged.
+        """
+        metric_name = GroupedChainlinkNodeAlertsMetricCode.BalanceThreshold
+        state = self.test_factory_instance.alerting_state[
+            self.test_parent_id][self.test_node_id]
+        last_time_that_did_task = datetime.now()
+        state['critical_repeat_timer'][
+            metric_name].set_last_time_that_did_task(last_time_that_did_task)
+
+        data_for_alerting = []
+        current = float(self.test_alerts_config.balance_amount[
+                            'warning_threshold']) + 1
+        self.test_factory_instance.classify_thresholded_alert_reverse(
+            current, self.test_alerts_config.balance_amount,
+            IncreasedAboveThresholdTestAlert,
+            DecreasedBelowThresholdTestAlert, data_for_alerting,
+            self.test_parent_id, self.test_node_id, metric_name,
+            self.test_node_name, datetime.now().timestamp()
+        )
+
+        self.assertEqual([], data_for_alerting)
+        self.assertFalse(state['warning_sent'][metric_name])
+        self.assertFalse(state['critical_sent'][metric_name])
+        self.assertEqual(
+            last_time_that_did_task,
+            state['critical_repeat_timer'][metric_name]
+                .last_time_that_did_task)
+
+    @parameterized.expand([
+        (11.0, []),
+        (9.0, [Severity.WARNING.value]),
+    ])
+    def test_classify_thresholded_reverse_ignores_disabled_thresholds(
+            self, current, expected_severities) -> None:
+        """
+        In this test we will check that a disabled threshold which is not set
+        is not compared with the current value, and that the value is still
+        checked against the enabled threshold.
+        """
+        config = dict(self.test_alerts_config.balance_amount)
+        config['critical_enabled'] = 'false'
+        del config['critical_threshold']
+        data_for_alerting = []
+
+        self.test_factory_instance.classify_thresholded_alert_reverse(
+            current, config, IncreasedAboveThresholdTestAlert,
+            DecreasedBelowThresholdTestAlert, data_for_alerting,
+            self.test_parent_id, self.test_node_id,
+            GroupedChainlinkNodeAlertsMetricCode.BalanceThreshold,
+            self.test_node_name, datetime.now().timestamp()
+        )
+
+        self.assertEqual(expected_severities,
+                         [alert['severity'] for alert in data_for_alerting])
+
     @parameterized.expand([
         ('WARNING', 'warning_threshold'),
         ('CRITICAL', 'critical_threshold'),
@@ -0,0 +1,51 @@
+import unittest
+
+from src.alerter.factory.chain_height_index import ChainHeightIndex
+
+
+class TestChainHeightIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_index = ChainHeightIndex()
+        self.test_index.update('node_1', 100)
+        self.test_index.update('node_2', 105)
+        self.test_index.update('node_3', 103)
+
+    def tearDown(self) -> None:
+        self.test_index = None
+
+    def test_max_height_is_none_if_no_heights(self) -> None:
+        self.assertIsNone(ChainHeightIndex().max_height)
+
+    def test_max_height_returns_max_height_of_all_nodes(self) -> None:
+        self.assertEqual(105, self.test_index.max_height)
+        self.assertEqual(3, len(self.test_index))
+
+    def test_update_increases_max_height_if_node_above_max(self) -> None:
+        self.test_index.update('node_1', 110)
+        self.assertEqual(110, self.test_index.max_height)
+
+    def test_update_recomputes_max_height_if_max_node_goes_back(self) -> None:
+        self.test_index.update('node_2', 101)
+        self.assertEqual(103, self.test_index.max_height)
+
+    def test_update_keeps_max_height_if_other_node_goes_back(self) -> None:
+        self.test_index.update('node_3', 90)
+        self.assertEqual(105, self.test_index.max_height)
+
+    def test_update_with_none_height_ignores_node(self) -> None:
+        self.test_index.update('node_2', None)
+        self.assertEqual(103, self.test_index.max_height)
+        self.assertEqual(2, len(self.test_index))
+
+    def test_remove_recomputes_max_height_if_max_node_removed(self) -> None:
+        self.test_index.remove('node_2')
+        self.assertEqual(103, self.test_index.max_height)
+
+        self.test_index.remove('node_1')
+        self.test_index.remove('node_3')
+        self.assertIsNone(self.test_index.max_height)
+
+    def test_remove_does_nothing_if_node_not_in_index(self) -> None:
+        self.test_index.remove('node_4')
+        self.assertEqual(105, self.test_index.max_height)
+        self.assertEqual(3, len(self.test_index))
@@ -209,6 +209,45 @@ class TestEVMNodeAlertingFactory(unittest.TestCase):
         self.assertEqual(expected_state,
                          self.evm_node_alerting_factory.alerting_state)
 
+    def test_update_current_height_updates_state_and_chain_max_height(
+            self) -> None:
+        """
+        In this test we will check that the current height of a node is stored
+        in its alerting state, and that the maximum height of the chain is the
+        maximum of the heights of its nodes.
+        """
+        for node_id in [self.test_node_id, self.test_dummy_node_id1]:
+            self.evm_node_alerting_factory.create_alerting_state(
+                self.test_parent_id, node_id, self.evm_node_alerts_config)
+        self.assertIsNone(self.evm_node_alerting_factory.get_chain_max_height(
+            self.test_parent_id))
+
+        self.evm_node_alerting_factory.update_current_height(
+            self.test_parent_id, self.test_node_id, 100)
+        self.evm_node_alerting_factory.update_current_height(
+            self.test_parent_id, self.test_dummy_node_id1, 90)
+
+        self.assertEqual(100, self.evm_node_alerting_factory.alerting_state[
+            self.test_parent_id][self.test_node_id]['current_height'])
+        self.assertEqual(100, self.evm_node_alerting_factory
+                         .get_chain_max_height(self.test_parent_id))
+
+    def test_remove_chain_alerting_state_removes_chain_heights(self) -> None:
+        """
+        In this test we will check that the remove function also removes the
+        heights stored for the nodes of the given chain
+        """
+        self.evm_node_alerting_factory.create_alerting_state(
+            self.test_parent_id, self.test_node_id, self.evm_node_alerts_config)
+        self.evm_node_alerting_factory.update_current_height(
+            self.test_parent_id, self.test_node_id, 100)
+
+        self.evm_node_alerting_factory.remove_chain_alerting_state(
+            self.test_parent_id)
+
+        self.assertIsNone(self.evm_node_alerting_factory.get_chain_max_height(
+            self.test_parent_id))
+
     def test_remove_chain_alerting_state_does_nothing_if_chain_does_not_exist(
             self) -> None:
         """
@@ -0,0 +1,90 @@
+import unittest
+from datetime import datetime, timedelta
+
+from src.alerter.alert_severities import Severity
+from src.alerter.alerts.node.evm import (
+    BlockHeightDifferenceIncreasedAboveThresholdAlert,
+    BlockHeightDifferenceDecreasedBelowThresholdAlert)
+from src.alerter.factory.flap_detector import FlapDetector
+
+
+class TestFlapDetector(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_parent_id = 'test_parent_id'
+        self.test_node_id = 'test_node_id'
+        self.test_node_name = 'test_node_name'
+        self.test_start = datetime(2012, 1, 1).timestamp()
+        self.test_flap_detector = FlapDetector(3, timedelta(seconds=60))
+
+    def tearDown(self) -> None:
+        self.test_flap_detector = None
+
+    def _increased_alert(self, severity: str, timestamp: float) -> dict:
+        return BlockHeightDifferenceIncreasedAboveThresholdAlert(
+            self.test_node_name, 10, severity, timestamp, severity,
+            self.test_parent_id, self.test_node_id).alert_data
+
+    def _decreased_alert(self, timestamp: float) -> dict:
+        return BlockHeightDifferenceDecreasedBelowThresholdAlert(
+            self.test_node_name, 1, Severity.INFO.value, timestamp,
+            Severity.WARNING.value, self.test_parent_id,
+            self.test_node_id).alert_data
+
+    def _filter(self, raised_alerts: list, timestamp: float) -> list:
+        data_for_alerting = []
+        self.test_flap_detector.filter(raised_alerts, data_for_alerting,
+                                       self.test_node_name, timestamp)
+        return data_for_alerting
+
+    def test_filter_passes_alerts_if_below_threshold(self) -> None:
+        alerts = [self._increased_alert(Severity.WARNING.value,
+                                        self.test_start),
+                  self._decreased_alert(self.test_start + 1)]
+
+        self.assertEqual(alerts, self._filter(alerts, self.test_start + 1))
+        self.assertFalse(self.test_flap_detector.flapping)
+
+    def test_filter_does_not_count_repeated_alerts_as_state_changes(
+            self) -> None:
+        for second in range(5):
+            alert = self._increased_alert(Severity.CRITICAL.value,
+                                          self.test_start + second)
+            self.assertEqual([alert],
+                             self._filter([alert], self.test_start + second))
+
+        self.assertFalse(self.test_flap_detector.flapping)
+
+    def test_filter_suppresses_alerts_while_flapping(self) -> None:
+        data_for_alerting = []
+        for second in range(6):
+            alert = self._decreased_alert(self.test_start + second) \
+                if second % 2 else self._increased_alert(
+                    Severity.WARNING.value, self.test_start + second)
+            data_for_alerting.extend(
+                self._filter([alert], self.test_start + second))
+
+        self.assertEqual(3, len(data_for_alerting))
+        self.assertEqual('MetricFlappingAlert',
+                         data_for_alerting[2]['alert_code']['name'])
+        self.assertEqual(Severity.WARNING.value,
+                         data_for_alerting[2]['severity'])
+        self.assertTrue(self.test_flap_detector.flapping)
+        self.assertEqual(4, self.test_flap_detector.no_of_suppressed_alerts)
+
+    def test_filter_stops_flapping_once_stable_for_time_window(self) -> None:
+        for second in range(4):
+            alert = self._decreased_alert(self.test_start + second) \
+                if second % 2 else self._increased_alert(
+                    Severity.WARNING.value, self.test_start + second)
+            self._filter([alert], self.test_start + second)
+
+        self.assertEqual([], self._filter([], self.test_start + 50))
+        data_for_alerting = self._filter([], self.test_start + 70)
+
+        self.assertFalse(self.test_flap_detector.flapping)
+        self.assertEqual(1, len(data_for_alerting))
+        self.assertEqual('MetricStoppedFlappingAlert',
+                         data_for_alerting[0]['alert_code']['name'])
+        self.assertEqual(Severity.INFO.value, data_for_alerting[0]['severity'])
+        self.assertIn('2 alerts were suppressed',
+                      data_for_alerting[0]['message'])
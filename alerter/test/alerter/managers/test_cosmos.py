@@ -575,6 +575,42 @@ class TestCosmosAlertersManager(unittest.TestCase):
         mock_init_proc.assert_not_called()
         mock_start.assert_not_called()
 
+    @freeze_time("2012-01-01")
+    @mock.patch("src.alerter.managers.manager.ALERTER_WORKERS_PER_TYPE", 2)
+    @mock.patch.object(CosmosAlertersManager,
+                       "_push_latest_data_to_queue_and_send")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_create_and_start_alerter_processes_starts_a_process_per_worker(
+            self, mock_start, mock_push_and_send) -> None:
+        """
+        In this test we will check that when the alerters are split into
+        multiple workers, a process is started for each worker of each alerter
+        type, and that a single reset alert is sent for each alerter type.
+        """
+        mock_start.return_value = None
+        mock_push_and_send.return_value = None
+
+        self.test_manager._create_and_start_alerter_processes()
+
+        expected_workers = {
+            '{} 0'.format(COSMOS_NODE_ALERTER_NAME): start_cosmos_node_alerter,
+            '{} 1'.format(COSMOS_NODE_ALERTER_NAME): start_cosmos_node_alerter,
+            '{} 0'.format(COSMOS_NETWORK_ALERTER_NAME):
+                start_cosmos_network_alerter,
+            '{} 1'.format(COSMOS_NETWORK_ALERTER_NAME):
+                start_cosmos_network_alerter,
+        }
+        self.assertEqual(set(expected_workers.keys()),
+                         set(self.test_manager.alerter_process_dict.keys()))
+        for worker_name, starter in expected_workers.items():
+            process = self.test_manager.alerter_process_dict[worker_name]
+            self.assertTrue(process.daemon)
+            self.assertEqual(starter, process._target)
+            self.assertEqual({'worker_index': int(worker_name[-1])},
+                             process._kwargs)
+        self.assertEqual(4, mock_start.call_count)
+        self.assertEqual(2, mock_push_and_send.call_count)
+
     @freeze_time("2012-01-01")
     @mock.patch.object(RabbitMQApi, 'basic_ack')
     @mock.patch.object(CosmosAlertersManager,
@@ -0,0 +1,150 @@
+import json
+import logging
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from src.alerter.alerters.node.evm import EVMNodeAlerter
+from src.alerter.replay.replay_engine import (AlerterReplayEngine,
+                                              ReplayReport, load_records)
+from src.alerter.replay.replay_rabbitmq_api import ReplayRabbitMQApi
+from src.alerter.replay.simulated_clock import SimulatedClock
+from src.configs.factory.alerts.evm_alerts import EVMNodeAlertsConfigsFactory
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.utils import timing
+from src.utils.constants.rabbitmq import EVM_NODE_TRANSFORMED_DATA_ROUTING_KEY
+from src.utils.exceptions import NodeIsDownException
+
+
+class TestAlerterReplayEngine(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('dummy')
+        self.dummy_logger.disabled = True
+        self.test_parent_id = 'test_parent_id'
+        self.test_node_id = 'test_node_id'
+        self.test_node_name = 'test_node_name'
+        self.test_configs_routing_key = 'chains.chainlink.bsc.alerts_config'
+        self.test_went_down_at = datetime(2012, 1, 1).timestamp()
+
+        configs = {}
+        for i, metric in enumerate([
+            'evm_block_syncing_no_change_in_block_height',
+            'evm_block_syncing_block_height_difference', 'evm_node_is_down'
+        ]):
+            configs[str(i)] = {
+                'name': metric,
+                'parent_id': self.test_parent_id,
+                'enabled': 'true',
+                'critical_threshold': '7',
+                'critical_repeat': '5',
+                'critical_enabled': 'true',
+                'critical_repeat_enabled': 'true',
+                'warning_threshold': '3',
+                'warning_enabled': 'true',
+            }
+
+        # The node is reported down 0, 4, 8 and 14 seconds after it went
+        # down, which crosses the warning threshold, the critical threshold
+        # and the critical repeat interval.
+        node_is_down_exception = NodeIsDownException(self.test_node_name)
+        self.test_records = [
+            {'routing_key': self.test_configs_routing_key, 'body': configs}
+        ]
+        for seconds_down in [0, 4, 8, 14]:
+            self.test_records.append({
+                'routing_key': EVM_NODE_TRANSFORMED_DATA_ROUTING_KEY,
+                'body': {
+                    'error': {
+                        'meta_data': {
+                            'node_name': self.test_node_name,
+                            'node_id': self.test_node_id,
+                            'node_parent_id': self.test_parent_id,
+                            'time': self.test_went_down_at + seconds_down
+                        },
+                        'message': node_is_down_exception.message,
+                        'code': node_is_down_exception.code,
+                        'data': {
+                            'went_down_at': {
+                                'current': self.test_went_down_at,
+                                'previous': None
+                            }
+                        }
+                    }
+                }
+            })
+
+        self.test_rabbitmq = ReplayRabbitMQApi(self.dummy_logger)
+        self.test_alerter = EVMNodeAlerter(
+            'test_alerter', self.dummy_logger, EVMNodeAlertsConfigsFactory(),
+            self.test_rabbitmq)
+        self.test_engine = AlerterReplayEngine(self.test_alerter)
+
+    def tearDown(self) -> None:
+        self.dummy_logger = None
+        self.test_rabbitmq = None
+        self.test_alerter = None
+        self.test_engine = None
+
+    def test_init_raises_value_error_if_alerter_uses_rabbitmq(self) -> None:
+        alerter = EVMNodeAlerter(
+            'test_alerter', self.dummy_logger, EVMNodeAlertsConfigsFactory(),
+            RabbitMQApi(self.dummy_logger))
+        self.assertRaises(ValueError, AlerterReplayEngine, alerter)
+
+    def test_replay_raises_alerts_using_times_of_recorded_data(self) -> None:
+        report = self.test_engine.replay(self.test_records)
+
+        self.assertEqual([
+            ('WARNING', 'NodeWentDownAtAlert', 4),
+            ('CRITICAL', 'NodeWentDownAtAlert', 8),
+            ('CRITICAL', 'NodeStillDownAlert', 14),
+        ], [
+            (alert['severity'], alert['alert_code']['name'],
+             alert['timestamp'] - self.test_went_down_at)
+            for alert in report.alerts
+        ])
+        self.assertEqual({'WARNING': 1, 'CRITICAL': 2},
+                         report.alerts_by_severity())
+
+    def test_replay_reports_latency_of_every_data_message(self) -> None:
+        report = self.test_engine.replay(self.test_records)
+
+        self.assertEqual(4, report.no_of_messages)
+        self.assertEqual(1, report.no_of_configs)
+        self.assertTrue(all(latency > 0 for latency in report.latencies))
+        self.assertEqual(max(report.latencies),
+                         report.latency_percentile(100))
+
+    def test_replay_moves_clock_to_last_data_time_and_restores_time_source(
+            self) -> None:
+        self.test_engine.replay(self.test_records)
+
+        self.assertEqual(self.test_went_down_at + 14,
+                         self.test_engine.clock.time)
+        self.assertIs(timing.time.time, timing._time_source)
+        self.assertEqual([], self.test_rabbitmq.published)
+
+    def test_load_records_reads_one_record_per_non_empty_line(self) -> None:
+        file_descriptor, file_path = tempfile.mkstemp()
+        try:
+            with os.fdopen(file_descriptor, 'w') as recording:
+                for record in self.test_records:
+                    recording.write(json.dumps(record) + '\n\n')
+
+            self.assertEqual(self.test_records, list(load_records(file_path)))
+        finally:
+            os.remove(file_path)
+
+    def test_latency_percentile_returns_zero_if_nothing_evaluated(
+            self) -> None:
+        self.assertEqual(0.0, ReplayReport().latency_percentile(50))
+
+    def test_simulated_clock_never_goes_back(self) -> None:
+        clock = SimulatedClock(100.0)
+        clock.set_time(90.0)
+        self.assertEqual(100.0, clock.now())
+
+        clock.set_time(datetime.fromtimestamp(110.0))
+        clock.advance(5)
+        self.assertEqual(115.0, clock.now())
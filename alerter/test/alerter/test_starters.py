@@ -526,7 +526,7 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_system_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.system_alerts_configs_factory
+            self.system_alerts_configs_factory, 0
         )
 
     @mock.patch("src.alerter.alerter_starters._initialise_github_alerter")
@@ -570,7 +570,7 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_chainlink_node_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.chainlink_node_alerts_configs_factory)
+            self.chainlink_node_alerts_configs_factory, 0)
 
     @mock.patch(
         "src.alerter.alerter_starters._initialise_evm_node_alerter")
@@ -586,7 +586,7 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_evm_node_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.evm_node_alerts_configs_factory)
+            self.evm_node_alerts_configs_factory, 0)
 
     @mock.patch(
         "src.alerter.alerter_starters._initialise_chainlink_contract_alerter")
@@ -604,7 +604,7 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_chainlink_contract_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.chainlink_contract_alerts_configs_factory)
+            self.chainlink_contract_alerts_configs_factory, 0)
 
     @mock.patch("src.alerter.alerter_starters._initialise_cosmos_node_alerter")
     @mock.patch('src.alerter.alerter_starters.start_alerter')
@@ -619,7 +619,7 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_cosmos_node_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.cosmos_node_alerts_configs_factory)
+            self.cosmos_node_alerts_configs_factory, 0)
 
     @mock.patch(
         "src.alerter.alerter_starters._initialise_cosmos_network_alerter")
@@ -635,7 +635,7 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_cosmos_network_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.cosmos_network_alerts_configs_factory)
+            self.cosmos_network_alerts_configs_factory, 0)
 
     @mock.patch(
         "src.alerter.alerter_starters._initialise_substrate_node_alerter")
@@ -652,7 +652,7 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_substrate_node_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.substrate_node_alerts_configs_factory)
+            self.substrate_node_alerts_configs_factory, 0)
 
     @mock.patch(
         "src.alerter.alerter_starters._initialise_substrate_network_alerter")
@@ -670,4 +670,4 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_substrate_network_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.substrate_network_alerts_configs_factory)
+            self.substrate_network_alerts_configs_factory, 0)
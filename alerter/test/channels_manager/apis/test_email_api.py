@@ -1,4 +1,5 @@
 import smtplib
+import time
 import unittest
 from datetime import datetime
 from email.message import EmailMessage
@@ -12,8 +13,9 @@ from parameterized import parameterized
 from src.alerter.alerts.system_alerts import (
     OpenFileDescriptorsIncreasedAboveThresholdAlert)
 from src.channels_manager.apis.email_api import EmailApi
-from src.utils.constants.channels import (EMAIL_HTML_TEMPLATE,
-                                          EMAIL_TEXT_TEMPLATE)
+from src.utils.constants.channels import (
+    EMAIL_HTML_TEMPLATE, EMAIL_TEXT_TEMPLATE, EMAIL_SMTP_TIMEOUT_SECONDS,
+    EMAIL_SMTP_SESSION_MAX_IDLE_SECONDS)
 
 
 class TestEmailApi(unittest.TestCase):
@@ -27,6 +29,7 @@ class TestEmailApi(unittest.TestCase):
         self.test_subject = 'Test Alert'
         self.test_sender = 'PANIC alerter'
         self.test_receiver = 'test@email.com'
+        self.test_receivers = ['test1@email.com', 'test2@email.com']
 
         self.test_email_api = EmailApi(self.test_smtp, self.test_sender,
                                        self.test_username, self.test_password,
@@ -67,6 +70,8 @@ class TestEmailApi(unittest.TestCase):
             '_username': self.test_email_api._username,
             '_password': self.test_email_api._password,
             '_port': self.test_email_api._port,
+            '_session': None,
+            '_session_last_used': 0.0,
         }
         self.assertDictEqual(expected_instance_variables,
                              self.test_email_api.__dict__)
@@ -97,6 +102,19 @@ class TestEmailApi(unittest.TestCase):
         # By the as_string function we will get the formatted e-mail as string
         self.assertEqual(expected_msg.as_string(), args[0].as_string())
 
+    @freeze_time("2012-01-01")
+    @mock.patch.object(EmailApi, "_send_smtp")
+    def test_send_email_sends_one_message_to_all_recipients(
+            self, mock_send_smtp) -> None:
+        mock_send_smtp.return_value = None
+
+        self.test_email_api.send_email(self.test_subject, self.test_message,
+                                       self.test_receivers)
+
+        mock_send_smtp.assert_called_once()
+        args, _ = mock_send_smtp.call_args
+        self.assertEqual(', '.join(self.test_receivers), args[0]['To'])
+
     @freeze_time("2012-01-01")
     @mock.patch.object(EmailApi, "_send_smtp")
     def test_send_email_with_html_sends_the_correct_message(
@@ -184,13 +202,123 @@ class TestEmailApi(unittest.TestCase):
         self.test_email_api._send_smtp(self.test_msg)
 
         # Check that the SMTP interface initialisation was performed correctly.
-        mock_smtp_init.assert_called_once_with(self.test_smtp, self.test_port)
+        mock_smtp_init.assert_called_once_with(
+            self.test_smtp, self.test_port, timeout=EMAIL_SMTP_TIMEOUT_SECONDS)
 
         # Check that send_message was called correctly.
         mock_send_message.assert_called_once_with(self.test_msg)
 
-        # Check that quit was called correctly.
+        # Check that the session is kept open to be re-used
+        mock_quit.assert_not_called()
+        self.assertEqual(self.test_smtp_interface,
+                         self.test_email_api._session)
+
+    @mock.patch.object(smtplib.SMTP, "send_message")
+    @mock.patch.object(smtplib.SMTP, "quit")
+    @mock.patch.object(smtplib.SMTP, "starttls")
+    @mock.patch.object(smtplib.SMTP, "login")
+    @mock.patch.object(smtplib, "SMTP")
+    def test_send_smtp_reuses_the_open_session(
+            self, mock_smtp_init, mock_login, mock_starttls, mock_quit,
+            mock_send_message) -> None:
+        mock_smtp_init.return_value = self.test_smtp_interface
+        mock_quit.return_value = None
+        mock_send_message.return_value = None
+        mock_login.return_value = None
+        mock_starttls.return_value = None
+
+        self.test_email_api._send_smtp(self.test_msg)
+        self.test_email_api._send_smtp(self.test_msg)
+
+        mock_smtp_init.assert_called_once()
+        mock_login.assert_called_once()
+        self.assertEqual(2, mock_send_message.call_count)
+
+    @mock.patch.object(smtplib.SMTP, "send_message")
+    @mock.patch.object(smtplib.SMTP, "quit")
+    @mock.patch.object(smtplib.SMTP, "starttls")
+    @mock.patch.object(smtplib.SMTP, "login")
+    @mock.patch.object(smtplib, "SMTP")
+    def test_send_smtp_replaces_a_session_idle_for_too_long(
+            self, mock_smtp_init, mock_login, mock_starttls, mock_quit,
+            mock_send_message) -> None:
+        mock_smtp_init.return_value = self.test_smtp_interface
+        mock_quit.return_value = None
+        mock_send_message.return_value = None
+        mock_login.return_value = None
+        mock_starttls.return_value = None
+        self.test_email_api._session = smtplib.SMTP()
+        self.test_email_api._session_last_used = \
+            time.monotonic() - EMAIL_SMTP_SESSION_MAX_IDLE_SECONDS - 1
+        # Only the sessions opened by _send_smtp are counted
+        mock_smtp_init.reset_mock()
+
+        self.test_email_api._send_smtp(self.test_msg)
+
+        mock_quit.assert_called_once_with()
+        mock_smtp_init.assert_called_once()
+        mock_send_message.assert_called_once_with(self.test_msg)
+        self.assertEqual(self.test_smtp_interface,
+                         self.test_email_api._session)
+
+    @mock.patch.object(smtplib.SMTP, "send_message")
+    @mock.patch.object(smtplib.SMTP, "quit")
+    @mock.patch.object(smtplib.SMTP, "starttls")
+    @mock.patch.object(smtplib.SMTP, "login")
+    @mock.patch.object(smtplib, "SMTP")
+    def test_send_smtp_reconnects_if_the_open_session_was_dropped(
+            self, mock_smtp_init, mock_login, mock_starttls, mock_quit,
+            mock_send_message) -> None:
+        mock_smtp_init.return_value = self.test_smtp_interface
+        mock_quit.return_value = None
+        mock_send_message.side_effect = [smtplib.SMTPServerDisconnected(),
+                                         None]
+        mock_login.return_value = None
+        mock_starttls.return_value = None
+        self.test_email_api._session = smtplib.SMTP()
+        self.test_email_api._session_last_used = time.monotonic()
+        # Only the sessions opened by _send_smtp are counted
+        mock_smtp_init.reset_mock()
+
+        self.test_email_api._send_smtp(self.test_msg)
+
+        mock_smtp_init.assert_called_once()
+        mock_login.assert_called_once_with(self.test_username,
+                                           self.test_password)
+        self.assertEqual(2, mock_send_message.call_count)
+        self.assertEqual(self.test_smtp_interface,
+                         self.test_email_api._session)
+
+    @mock.patch.object(smtplib.SMTP, "send_message")
+    @mock.patch.object(smtplib.SMTP, "quit")
+    @mock.patch.object(smtplib.SMTP, "starttls")
+    @mock.patch.object(smtplib.SMTP, "login")
+    @mock.patch.object(smtplib, "SMTP")
+    def test_send_smtp_raises_if_a_new_session_is_dropped(
+            self, mock_smtp_init, mock_login, mock_starttls, mock_quit,
+            mock_send_message) -> None:
+        mock_smtp_init.return_value = self.test_smtp_interface
+        mock_quit.return_value = None
+        mock_send_message.side_effect = smtplib.SMTPServerDisconnected()
+        mock_login.return_value = None
+        mock_starttls.return_value = None
+
+        self.assertRaises(smtplib.SMTPServerDisconnected,
+                          self.test_email_api._send_smtp, self.test_msg)
+
+        mock_smtp_init.assert_called_once()
+        mock_send_message.assert_called_once_with(self.test_msg)
+        self.assertIsNone(self.test_email_api._session)
+
+    @mock.patch.object(smtplib.SMTP, "quit")
+    def test_close_closes_the_open_session(self, mock_quit) -> None:
+        mock_quit.return_value = None
+        self.test_email_api._session = self.test_smtp_interface
+
+        self.test_email_api.close()
+
         mock_quit.assert_called_once_with()
+        self.assertIsNone(self.test_email_api._session)
 
     @mock.patch.object(smtplib.SMTP, "send_message")
     @mock.patch.object(smtplib.SMTP, "quit")
@@ -114,7 +114,20 @@ class TestOpsgenieApi(unittest.TestCase):
         ret = opsgenie_api.close_alert(self.test_alias)
 
         mock_close_alert.assert_called_once_with(
-            identifier=self.test_alias,
+            identifier=self.test_alias, identifier_type='id',
+            close_alert_payload=expected_payload)
+        self.assertEqual(ret, opsgenie_sdk.SuccessResponse)
+
+    @mock.patch.object(opsgenie_sdk.AlertApi, "close_alert")
+    def test_close_alert_closes_an_alert_by_alias_correctly(
+            self, mock_close_alert) -> None:
+        mock_close_alert.return_value = opsgenie_sdk.SuccessResponse
+        expected_payload = opsgenie_sdk.CloseAlertPayload()
+
+        ret = self.test_opsgenie_api_eu.close_alert(self.test_alias, 'alias')
+
+        mock_close_alert.assert_called_once_with(
+            identifier=self.test_alias, identifier_type='alias',
             close_alert_payload=expected_payload)
         self.assertEqual(ret, opsgenie_sdk.SuccessResponse)
 
@@ -134,7 +147,7 @@ class TestOpsgenieApi(unittest.TestCase):
         ret = opsgenie_api.update_severity(new_severity, self.test_alias)
 
         mock_update_priority.assert_called_once_with(
-            identifier=self.test_alias,
+            identifier=self.test_alias, identifier_type='id',
             update_alert_priority_payload=expected_payload)
         self.assertEqual(ret, opsgenie_sdk.SuccessResponse)
 
@@ -0,0 +1,128 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from parameterized import parameterized
+
+from src.channels_manager.apis.pacer import TokenBucket, MessagePacer
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_rate = 2
+        self.test_capacity = 3
+        self.test_now = 1000.0
+        with mock.patch.object(time, 'monotonic',
+                               return_value=self.test_now):
+            self.bucket = TokenBucket(self.test_rate, self.test_capacity)
+
+    @parameterized.expand([(0, 1,), (-1, 1,), (1, 0,), ])
+    def test_init_raises_value_error_if_invalid_limits(
+            self, rate: float, capacity: float) -> None:
+        self.assertRaises(ValueError, TokenBucket, rate, capacity)
+
+    def test_bucket_allows_a_burst_of_capacity_tokens(self) -> None:
+        for _ in range(self.test_capacity):
+            self.assertEqual(
+                0, self.bucket.seconds_until_available(self.test_now))
+            self.bucket.consume(self.test_now)
+
+        self.assertAlmostEqual(
+            1 / self.test_rate,
+            self.bucket.seconds_until_available(self.test_now))
+
+    def test_bucket_refills_at_rate_up_to_capacity(self) -> None:
+        for _ in range(self.test_capacity):
+            self.bucket.consume(self.test_now)
+
+        self.assertEqual(0, self.bucket.seconds_until_available(
+            self.test_now + 1 / self.test_rate))
+
+        # Waiting long does not allow more than a burst of capacity tokens
+        later = self.test_now + 100
+        for _ in range(self.test_capacity):
+            self.bucket.consume(later)
+        self.assertGreater(self.bucket.seconds_until_available(later), 0)
+
+    def test_hold_makes_bucket_unavailable_for_the_given_time(self) -> None:
+        self.bucket.hold(30, self.test_now)
+
+        self.assertEqual(
+            30, self.bucket.seconds_until_available(self.test_now))
+        self.assertEqual(
+            0, self.bucket.seconds_until_available(self.test_now + 30))
+
+    def test_bucket_counts_every_token_consumed_by_concurrent_threads(
+            self) -> None:
+        test_no_of_threads = 10
+        test_consumes_per_thread = 1000
+
+        def consume() -> None:
+            for _ in range(test_consumes_per_thread):
+                self.bucket.consume(self.test_now)
+
+        threads = [threading.Thread(target=consume)
+                   for _ in range(test_no_of_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        tokens = self.test_capacity \
+            - test_no_of_threads * test_consumes_per_thread
+        self.assertAlmostEqual(
+            (1 - tokens) / self.test_rate,
+            self.bucket.seconds_until_available(self.test_now))
+
+
+class TestMessagePacer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_platform = 'test_platform'
+        self.test_bot_id = 'test_bot_id'
+        self.test_max_wait = 2
+        self.pacer = MessagePacer(self.test_platform, self.test_bot_id, 30, 30,
+                                  1, 1, self.test_max_wait)
+
+    def tearDown(self) -> None:
+        MessagePacer._bot_buckets.clear()
+
+    def test_pacers_of_the_same_bot_share_the_bot_bucket(self) -> None:
+        other_chat_pacer = MessagePacer(self.test_platform, self.test_bot_id,
+                                        30, 30, 1, 1)
+        other_bot_pacer = MessagePacer(self.test_platform, 'other_bot_id', 30,
+                                       30, 1, 1)
+
+        self.assertIs(self.pacer._bot_bucket, other_chat_pacer._bot_bucket)
+        self.assertIsNot(self.pacer._bot_bucket, other_bot_pacer._bot_bucket)
+        self.assertIsNot(self.pacer._chat_bucket,
+                         other_chat_pacer._chat_bucket)
+
+    @mock.patch.object(time, 'sleep')
+    def test_acquire_waits_for_the_next_token_within_max_wait(
+            self, mock_sleep) -> None:
+        self.assertIsNone(self.pacer.acquire())
+        mock_sleep.assert_not_called()
+
+        self.assertIsNone(self.pacer.acquire())
+        mock_sleep.assert_called_once()
+        self.assertTrue(0 < mock_sleep.call_args[0][0] <= 1)
+
+    @mock.patch.object(time, 'sleep')
+    def test_acquire_returns_wait_if_longer_than_max_wait(
+            self, mock_sleep) -> None:
+        self.pacer.rate_limited(30)
+
+        wait = self.pacer.acquire()
+
+        self.assertTrue(self.test_max_wait < wait <= 30)
+        mock_sleep.assert_not_called()
+
+    def test_rate_limited_holds_every_chat_of_the_bot(self) -> None:
+        other_chat_pacer = MessagePacer(self.test_platform, self.test_bot_id,
+                                        30, 30, 1, 1)
+
+        self.pacer.rate_limited(30)
+
+        self.assertGreater(other_chat_pacer.seconds_until_available(),
+                           self.test_max_wait)
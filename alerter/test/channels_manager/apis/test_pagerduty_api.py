@@ -68,3 +68,12 @@ class TestPagerDutyApi(unittest.TestCase):
             payload=self.test_alert_payload,
         )
         self.assertEqual(ret, self.test_dedup_key)
+
+    @mock.patch.object(EventsAPISession, "resolve")
+    def test_resolve_resolves_an_alert_successfully(self, mock_resolve) -> None:
+        mock_resolve.return_value = self.test_dedup_key
+
+        ret = self.test_pagerduty_api.resolve(self.test_dedup_key)
+
+        mock_resolve.assert_called_once_with(self.test_dedup_key)
+        self.assertEqual(ret, self.test_dedup_key)
@@ -2,7 +2,10 @@ import unittest
 from unittest.mock import patch
 
 from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web import SlackResponse
 
+from src.channels_manager.apis.pacer import MessagePacer
 from src.channels_manager.apis.slack_bot_api import SlackBotApi
 
 
@@ -18,6 +21,7 @@ class TestSlackBotApi(unittest.TestCase):
 
     def tearDown(self) -> None:
         self.test_slack_bot_api = None
+        MessagePacer._bot_buckets.clear()
 
     def test_bot_token_returns_bot_token(self) -> None:
         self.assertEqual(self.test_bot_token,
@@ -56,3 +60,26 @@ class TestSlackBotApi(unittest.TestCase):
         mock_chat_postMessage.assert_called_once_with(
             channel=self.test_bot_channel_id,
             text=self.test_message)
+
+    @patch('slack_sdk.WebClient.chat_postMessage')
+    @patch('slack_bolt.app.app.App.__init__')
+    def test_send_message_does_not_send_while_rate_limited(
+            self, mock_app, mock_chat_postMessage) -> None:
+        mock_app.return_value = None
+        rate_limited_response = SlackResponse(
+            client=None, http_verb="POST", api_url='', req_args={},
+            data={'ok': False, 'error': 'ratelimited'},
+            headers={'Retry-After': '30'}, status_code=429)
+        mock_chat_postMessage.side_effect = SlackApiError(
+            'ratelimited', rate_limited_response)
+        self.test_slack_bot_api.initialize_app()
+        self.test_slack_bot_api._app._client = WebClient()
+
+        self.assertRaises(SlackApiError, self.test_slack_bot_api.send_message,
+                          self.test_message)
+        ret = self.test_slack_bot_api.send_message(self.test_message)
+
+        mock_chat_postMessage.assert_called_once()
+        self.assertEqual(429, ret.status_code)
+        self.assertEqual('30', ret.headers['Retry-After'])
+        self.assertFalse(ret['ok'])
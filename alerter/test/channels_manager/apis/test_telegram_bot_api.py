@@ -3,6 +3,7 @@ from unittest import mock
 
 import requests
 
+from src.channels_manager.apis.pacer import MessagePacer
 from src.channels_manager.apis.telegram_bot_api import TelegramBotApi
 
 
@@ -19,6 +20,7 @@ class TestTelegramBotApi(unittest.TestCase):
 
     def tearDown(self) -> None:
         self.test_telegram_bot_api = None
+        MessagePacer._bot_buckets.clear()
 
     def test_bot_token_returns_bot_token(self) -> None:
         self.assertEqual(self.test_bot_token,
@@ -39,7 +41,7 @@ class TestTelegramBotApi(unittest.TestCase):
     have to expose infrastructure details.
     '''
 
-    @mock.patch.object(requests, "get")
+    @mock.patch.object(requests.Session, "get")
     def test_send_message_sends_a_message_correctly(self, mock_get) -> None:
         data_dict = {
             'chat_id': self.test_bot_chat_id,
@@ -50,21 +52,47 @@ class TestTelegramBotApi(unittest.TestCase):
         self.test_telegram_bot_api.send_message(self.test_message)
 
         mock_get.assert_called_once_with(self.test_base_url + "/sendMessage",
-                                         data=data_dict, timeout=10,
-                                         headers={'Connection': 'close'})
+                                         data=data_dict, timeout=10)
 
-    @mock.patch.object(requests, "get")
+    @mock.patch.object(requests.Session, "get")
+    def test_send_message_reuses_the_session_connections(
+            self, mock_get) -> None:
+        mock_get.return_value.json.return_value = {'ok': True}
+
+        self.test_telegram_bot_api.send_message(self.test_message)
+        self.test_telegram_bot_api.send_message(self.test_message)
+
+        self.assertEqual(2, mock_get.call_count)
+        for call_args in mock_get.call_args_list:
+            self.assertNotIn('headers', call_args[1])
+
+    @mock.patch.object(requests.Session, "get")
+    def test_send_message_does_not_send_while_rate_limited(
+            self, mock_get) -> None:
+        mock_get.return_value.json.return_value = {
+            'ok': False, 'error_code': 429,
+            'description': 'Too Many Requests: retry after 30',
+            'parameters': {'retry_after': 30}
+        }
+
+        self.test_telegram_bot_api.send_message(self.test_message)
+        ret = self.test_telegram_bot_api.send_message(self.test_message)
+
+        mock_get.assert_called_once()
+        self.assertFalse(ret['ok'])
+        self.assertEqual(429, ret['error_code'])
+        self.assertEqual(30, ret['parameters']['retry_after'])
+
+    @mock.patch.object(requests.Session, "get")
     def test_send_get_updates_sends_request_correctly(self, mock_get) -> None:
         self.test_telegram_bot_api.get_updates()
 
         mock_get.assert_called_once_with(self.test_base_url + "/getUpdates",
-                                         timeout=10,
-                                         headers={'Connection': 'close'})
+                                         timeout=10)
 
-    @mock.patch.object(requests, "get")
+    @mock.patch.object(requests.Session, "get")
     def test_send_get_me_sends_request_correctly(self, mock_get) -> None:
         self.test_telegram_bot_api.get_me()
 
         mock_get.assert_called_once_with(self.test_base_url + "/getMe",
-                                         timeout=10,
-                                         headers={'Connection': 'close'})
+                                         timeout=10)
@@ -2,12 +2,12 @@ import logging
 import unittest
 from datetime import datetime
 from unittest import mock
-from unittest.mock import call
 
 from src.alerter.alerts.system_alerts import (
     OpenFileDescriptorsIncreasedAboveThresholdAlert)
 from src.channels_manager.apis.email_api import EmailApi
 from src.channels_manager.channels.email import EmailChannel
+from src.channels_manager.digest import AlertDigest
 from src.utils.constants.channels import (EMAIL_HTML_TEMPLATE,
                                           EMAIL_TEXT_TEMPLATE)
 from src.utils.data import RequestStatus
@@ -103,19 +103,34 @@ class TestEmailChannel(unittest.TestCase):
 
         self.test_email_channel.alert(self.test_alert)
 
-        self.assertEqual(3, len(mock_send_email_html.call_args_list))
-        self.assertEqual(call(expected_subject, expected_html_email_message,
-                              expected_plain_email_message,
-                              self.test_emails_to[0]),
-                         mock_send_email_html.call_args_list[0])
-        self.assertEqual(call(expected_subject, expected_html_email_message,
-                              expected_plain_email_message,
-                              self.test_emails_to[1]),
-                         mock_send_email_html.call_args_list[1])
-        self.assertEqual(call(expected_subject, expected_html_email_message,
-                              expected_plain_email_message,
-                              self.test_emails_to[2]),
-                         mock_send_email_html.call_args_list[2])
+        # A single email is sent to all the addresses
+        mock_send_email_html.assert_called_once_with(
+            expected_subject, expected_html_email_message,
+            expected_plain_email_message, self.test_emails_to)
+
+    @mock.patch.object(EmailApi, "send_email_with_html")
+    def test_alert_sends_a_digest_as_one_email_to_all_addresses(
+            self, mock_send_email_html) -> None:
+        test_alert_2 = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            'test_system_2', self.test_percentage_usage,
+            self.test_panic_severity, self.test_alert.timestamp + 1,
+            self.test_panic_severity, self.test_parent_id, 'system_id_2'
+        )
+        test_digest = AlertDigest([self.test_alert, test_alert_2])
+        mock_send_email_html.return_value = None
+
+        self.test_email_channel.alert(test_digest)
+
+        mock_send_email_html.assert_called_once()
+        subject, html_message, plain_message, emails_to = \
+            mock_send_email_html.call_args[0]
+        self.assertEqual(self.test_emails_to, emails_to)
+        self.assertEqual(
+            "PANIC {} digest: 2 alerts".format(self.test_alert.severity),
+            subject)
+        for alert in test_digest.alerts:
+            self.assertIn(alert.message, html_message)
+            self.assertIn(alert.message, plain_message)
 
     @mock.patch.object(EmailApi, "send_email_with_html")
     def test_alert_returns_success_if_emails_sent_successfully(
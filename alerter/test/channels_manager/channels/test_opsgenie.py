@@ -5,9 +5,11 @@ from unittest import mock
 from opsgenie_sdk import SuccessResponse
 
 from src.alerter.alerts.system_alerts import (
+    OpenFileDescriptorsDecreasedBelowThresholdAlert,
     OpenFileDescriptorsIncreasedAboveThresholdAlert)
 from src.channels_manager.apis.opsgenie_api import OpsgenieApi
 from src.channels_manager.channels.opsgenie import OpsgenieChannel
+from src.channels_manager.incidents import IncidentTracker
 from src.utils.data import RequestStatus
 from src.utils.types import OpsgenieSeverities
 
@@ -37,12 +39,28 @@ class TestOpsgenieChannel(unittest.TestCase):
             self.test_panic_severity, self.test_last_monitored,
             self.test_panic_severity, self.test_parent_id, self.test_system_id
         )
+        self.test_solved_alert = \
+            OpenFileDescriptorsDecreasedBelowThresholdAlert(
+                self.test_system_name, self.test_percentage_usage, 'INFO',
+                self.test_last_monitored + 1, self.test_panic_severity,
+                self.test_parent_id, self.test_system_id
+            )
+        self.test_alias = IncidentTracker.incident_key(self.test_alert)
+        self.test_success_response = SuccessResponse(
+            request_id='id1', api_client=self.test_opsgenie_api._client)
+        self.test_coalescing_window = 60
+        self.test_coalescing_channel = OpsgenieChannel(
+            self.test_channel_name, self.test_channel_id, self.dummy_logger,
+            self.test_opsgenie_api, self.test_coalescing_window)
 
     def tearDown(self) -> None:
         self.dummy_logger = None
         self.test_opsgenie_api = None
         self.test_opsgenie_channel = None
         self.test_alert = None
+        self.test_solved_alert = None
+        self.test_success_response = None
+        self.test_coalescing_channel = None
 
     def test__str__returns_channel_name(self) -> None:
         self.assertEqual(self.test_channel_name,
@@ -72,7 +90,7 @@ class TestOpsgenieChannel(unittest.TestCase):
         mock_create_alert.assert_called_once_with(
             expected_msg, self.test_alert.message, OpsgenieSeverities.WARNING,
             self.test_alert.origin_id, self.test_alert.timestamp,
-            alias=self.test_alert.alert_code.value)
+            alias=self.test_alias)
 
     @mock.patch.object(OpsgenieApi, "create_alert")
     def test_alert_returns_success_if_create_alert_request_successful(
@@ -95,3 +113,93 @@ class TestOpsgenieChannel(unittest.TestCase):
         mock_create_alert.side_effect = Exception('test')
         actual_ret = self.test_opsgenie_channel.alert(self.test_alert)
         self.assertEqual(RequestStatus.FAILED, actual_ret)
+
+    @mock.patch.object(OpsgenieApi, "close_alert")
+    @mock.patch.object(OpsgenieApi, "create_alert")
+    def test_alert_closes_the_alert_opened_for_the_same_metric(
+            self, mock_create_alert, mock_close_alert) -> None:
+        mock_create_alert.return_value = self.test_success_response
+        mock_close_alert.return_value = self.test_success_response
+
+        self.test_opsgenie_channel.alert(self.test_alert)
+        actual_ret = self.test_opsgenie_channel.alert(self.test_solved_alert)
+
+        mock_close_alert.assert_called_once_with(self.test_alias,
+                                                 identifier_type='alias')
+        self.assertEqual(RequestStatus.SUCCESS, actual_ret)
+
+    @mock.patch.object(OpsgenieApi, "close_alert")
+    @mock.patch.object(OpsgenieApi, "create_alert")
+    def test_alert_creates_info_alerts_if_no_alert_is_open(
+            self, mock_create_alert, mock_close_alert) -> None:
+        mock_create_alert.return_value = self.test_success_response
+
+        self.test_opsgenie_channel.alert(self.test_solved_alert)
+        self.test_opsgenie_channel.alert(self.test_solved_alert)
+
+        mock_close_alert.assert_not_called()
+        mock_create_alert.assert_called_with(
+            "PANIC - {}".format(self.test_solved_alert.alert_code.name),
+            self.test_solved_alert.message, OpsgenieSeverities.INFO,
+            self.test_solved_alert.origin_id, self.test_solved_alert.timestamp,
+            alias=self.test_solved_alert.alert_code.value)
+        self.assertEqual(2, mock_create_alert.call_count)
+
+    @mock.patch.object(OpsgenieApi, "close_alert")
+    @mock.patch.object(OpsgenieApi, "create_alert")
+    def test_alert_keeps_the_alert_open_if_close_alert_fails(
+            self, mock_create_alert, mock_close_alert) -> None:
+        mock_create_alert.return_value = self.test_success_response
+        mock_close_alert.side_effect = [
+            'This is not a SuccessResponse object', self.test_success_response]
+        self.test_opsgenie_channel.alert(self.test_alert)
+
+        self.assertEqual(
+            RequestStatus.FAILED,
+            self.test_opsgenie_channel.alert(self.test_solved_alert))
+        self.assertEqual(
+            RequestStatus.SUCCESS,
+            self.test_opsgenie_channel.alert(self.test_solved_alert))
+        self.assertEqual(2, mock_close_alert.call_count)
+
+    @mock.patch.object(OpsgenieApi, "update_severity")
+    @mock.patch.object(OpsgenieApi, "create_alert")
+    def test_alert_updates_the_priority_of_an_open_alert_on_severity_change(
+            self, mock_create_alert, mock_update_severity) -> None:
+        mock_create_alert.return_value = self.test_success_response
+        mock_update_severity.return_value = self.test_success_response
+        critical_alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage + 1, 'CRITICAL',
+            self.test_alert.timestamp + 1, 'CRITICAL', self.test_parent_id,
+            self.test_system_id)
+
+        self.test_opsgenie_channel.alert(self.test_alert)
+        actual_ret = self.test_opsgenie_channel.alert(critical_alert)
+
+        mock_create_alert.assert_called_once()
+        mock_update_severity.assert_called_once_with(
+            OpsgenieSeverities.CRITICAL, self.test_alias,
+            identifier_type='alias')
+        self.assertEqual(RequestStatus.SUCCESS, actual_ret)
+
+    @mock.patch.object(OpsgenieApi, "create_alert")
+    def test_alert_coalesces_updates_with_the_same_severity_within_window(
+            self, mock_create_alert) -> None:
+        mock_create_alert.return_value = self.test_success_response
+        later_alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage + 1,
+            self.test_panic_severity,
+            self.test_alert.timestamp + self.test_coalescing_window - 1,
+            self.test_panic_severity, self.test_parent_id, self.test_system_id)
+        latest_alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage + 2,
+            self.test_panic_severity,
+            self.test_alert.timestamp + self.test_coalescing_window,
+            self.test_panic_severity, self.test_parent_id, self.test_system_id)
+
+        self.test_coalescing_channel.alert(self.test_alert)
+        actual_ret = self.test_coalescing_channel.alert(later_alert)
+        self.test_coalescing_channel.alert(latest_alert)
+
+        self.assertEqual(RequestStatus.SUCCESS, actual_ret)
+        self.assertEqual(2, mock_create_alert.call_count)
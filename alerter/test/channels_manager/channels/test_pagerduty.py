@@ -3,9 +3,11 @@ import unittest
 from unittest import mock
 
 from src.alerter.alerts.system_alerts import (
+    OpenFileDescriptorsDecreasedBelowThresholdAlert,
     OpenFileDescriptorsIncreasedAboveThresholdAlert)
 from src.channels_manager.apis.pagerduty_api import PagerDutyApi
 from src.channels_manager.channels import PagerDutyChannel
+from src.channels_manager.incidents import IncidentTracker
 from src.utils.data import RequestStatus
 from src.utils.types import PagerDutySeverities
 
@@ -35,12 +37,25 @@ class TestPagerDutyChannel(unittest.TestCase):
             self.test_panic_severity, self.test_last_monitored,
             self.test_panic_severity, self.test_parent_id, self.test_system_id
         )
+        self.test_solved_alert = \
+            OpenFileDescriptorsDecreasedBelowThresholdAlert(
+                self.test_system_name, self.test_percentage_usage, 'INFO',
+                self.test_last_monitored + 1, self.test_panic_severity,
+                self.test_parent_id, self.test_system_id
+            )
+        self.test_dedup_key = IncidentTracker.incident_key(self.test_alert)
+        self.test_coalescing_window = 60
+        self.test_coalescing_channel = PagerDutyChannel(
+            self.test_channel_name, self.test_channel_id, self.dummy_logger,
+            self.test_pagerduty_api, self.test_coalescing_window)
 
     def tearDown(self) -> None:
         self.dummy_logger = None
         self.test_pagerduty_api = None
         self.test_pagerduty_channel = None
         self.test_alert = None
+        self.test_solved_alert = None
+        self.test_coalescing_channel = None
 
     def test__str__returns_channel_name(self) -> None:
         self.assertEqual(self.test_channel_name,
@@ -68,7 +83,8 @@ class TestPagerDutyChannel(unittest.TestCase):
         self.test_pagerduty_channel.alert(self.test_alert)
         mock_trigger.assert_called_once_with(
             self.test_alert.message, PagerDutySeverities.WARNING,
-            self.test_alert.origin_id, self.test_alert.timestamp)
+            self.test_alert.origin_id, self.test_alert.timestamp,
+            self.test_dedup_key)
 
     @mock.patch.object(PagerDutyApi, "trigger")
     def test_alert_returns_success_if_trigger_request_successful(
@@ -83,3 +99,88 @@ class TestPagerDutyChannel(unittest.TestCase):
         mock_trigger.side_effect = Exception('test')
         actual_ret = self.test_pagerduty_channel.alert(self.test_alert)
         self.assertEqual(RequestStatus.FAILED, actual_ret)
+
+    @mock.patch.object(PagerDutyApi, "resolve")
+    @mock.patch.object(PagerDutyApi, "trigger")
+    def test_alert_resolves_the_incident_opened_for_the_same_metric(
+            self, mock_trigger, mock_resolve) -> None:
+        self.test_pagerduty_channel.alert(self.test_alert)
+        actual_ret = self.test_pagerduty_channel.alert(self.test_solved_alert)
+
+        mock_trigger.assert_called_once()
+        mock_resolve.assert_called_once_with(self.test_dedup_key)
+        self.assertEqual(RequestStatus.SUCCESS, actual_ret)
+
+    @mock.patch.object(PagerDutyApi, "resolve")
+    @mock.patch.object(PagerDutyApi, "trigger")
+    def test_alert_triggers_info_alerts_if_no_incident_is_open(
+            self, mock_trigger, mock_resolve) -> None:
+        self.test_pagerduty_channel.alert(self.test_solved_alert)
+
+        mock_resolve.assert_not_called()
+        mock_trigger.assert_called_once_with(
+            self.test_solved_alert.message, PagerDutySeverities.INFO,
+            self.test_solved_alert.origin_id, self.test_solved_alert.timestamp)
+
+    @mock.patch.object(PagerDutyApi, "resolve")
+    @mock.patch.object(PagerDutyApi, "trigger")
+    def test_alert_does_not_resolve_an_incident_twice(
+            self, mock_trigger, mock_resolve) -> None:
+        self.test_pagerduty_channel.alert(self.test_alert)
+        self.test_pagerduty_channel.alert(self.test_solved_alert)
+        self.test_pagerduty_channel.alert(self.test_solved_alert)
+
+        mock_resolve.assert_called_once_with(self.test_dedup_key)
+        self.assertEqual(2, mock_trigger.call_count)
+
+    @mock.patch.object(PagerDutyApi, "resolve")
+    @mock.patch.object(PagerDutyApi, "trigger")
+    def test_alert_keeps_the_incident_open_if_resolve_fails(
+            self, mock_trigger, mock_resolve) -> None:
+        mock_resolve.side_effect = [Exception('test'), self.test_dedup_key]
+        self.test_pagerduty_channel.alert(self.test_alert)
+
+        self.assertEqual(
+            RequestStatus.FAILED,
+            self.test_pagerduty_channel.alert(self.test_solved_alert))
+        self.assertEqual(
+            RequestStatus.SUCCESS,
+            self.test_pagerduty_channel.alert(self.test_solved_alert))
+        self.assertEqual(2, mock_resolve.call_count)
+        mock_trigger.assert_called_once()
+
+    @mock.patch.object(PagerDutyApi, "trigger")
+    def test_alert_coalesces_updates_with_the_same_severity_within_window(
+            self, mock_trigger) -> None:
+        later_alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage + 1,
+            self.test_panic_severity,
+            self.test_alert.timestamp + self.test_coalescing_window - 1,
+            self.test_panic_severity, self.test_parent_id, self.test_system_id)
+
+        self.test_coalescing_channel.alert(self.test_alert)
+        actual_ret = self.test_coalescing_channel.alert(later_alert)
+
+        mock_trigger.assert_called_once()
+        self.assertEqual(RequestStatus.SUCCESS, actual_ret)
+
+    @mock.patch.object(PagerDutyApi, "trigger")
+    def test_alert_sends_updates_after_the_window_or_on_severity_change(
+            self, mock_trigger) -> None:
+        critical_alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage + 1, 'CRITICAL',
+            self.test_alert.timestamp + 1, 'CRITICAL', self.test_parent_id,
+            self.test_system_id)
+        later_alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage + 2, 'CRITICAL',
+            critical_alert.timestamp + self.test_coalescing_window, 'CRITICAL',
+            self.test_parent_id, self.test_system_id)
+
+        self.test_coalescing_channel.alert(self.test_alert)
+        self.test_coalescing_channel.alert(critical_alert)
+        self.test_coalescing_channel.alert(later_alert)
+
+        self.assertEqual(3, mock_trigger.call_count)
+        self.assertEqual(
+            {self.test_dedup_key},
+            {call[0][4] for call in mock_trigger.call_args_list})
@@ -6,6 +6,7 @@ from src.alerter.alerts.system_alerts import (
     OpenFileDescriptorsIncreasedAboveThresholdAlert)
 from src.channels_manager.apis.telegram_bot_api import TelegramBotApi
 from src.channels_manager.channels import TelegramChannel
+from src.channels_manager.digest import AlertDigest
 from src.utils.data import RequestStatus
 
 
@@ -73,6 +74,24 @@ class TestTelegramChannel(unittest.TestCase):
         self.test_telegram_channel.alert(self.test_alert)
         mock_send_message.assert_called_once_with(expected_message)
 
+    @mock.patch.object(TelegramBotApi, "send_message")
+    def test_alert_sends_a_digest_as_one_message(
+            self, mock_send_message) -> None:
+        test_alert_2 = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            'test_system_2', self.test_percentage_usage,
+            self.test_panic_severity, self.test_last_monitored + 1,
+            self.test_panic_severity, self.test_parent_id, 'system_id_2'
+        )
+        test_digest = AlertDigest([self.test_alert, test_alert_2])
+        expected_subject = "PANIC {}".format(self.test_panic_severity)
+        expected_message = '*{}*: 2 alerts for `{}`\n`{}`\n`{}`'.format(
+            expected_subject, self.test_parent_id, self.test_alert.message,
+            test_alert_2.message)
+
+        self.test_telegram_channel.alert(test_digest)
+
+        mock_send_message.assert_called_once_with(expected_message)
+
     @mock.patch.object(TelegramBotApi, "send_message")
     def test_alert_returns_success_if_api_request_ok(self,
                                                      mock_send_message) -> None:
@@ -339,12 +339,15 @@ class TestSlackCommandHandlers(unittest.TestCase):
             self.test_slack_command_handlers._get_rabbit_based_status()
         self.assertEqual(expected_status, actual_status)
 
-    @mock.patch.object(RedisApi, "hexists_unsafe")
-    @mock.patch.object(RedisApi, "exists_unsafe")
+    @mock.patch.object(RedisApi, "hget_from_hashes_unsafe")
+    @mock.patch.object(RedisApi, "get_multiple_unsafe")
     def test_get_muted_status_returns_correct_status_if_no_severity_muted(
-            self, mock_exists_unsafe, mock_hexists_unsafe) -> None:
-        mock_exists_unsafe.return_value = False
-        mock_hexists_unsafe.return_value = False
+            self, mock_get_multiple_unsafe,
+            mock_hget_from_hashes_unsafe) -> None:
+        mock_get_multiple_unsafe.return_value = {Keys.get_alerter_mute(): None}
+        mock_hget_from_hashes_unsafe.return_value = {
+            Keys.get_hash_parent(chain_id): None
+            for chain_id in self.test_associated_chains}
         expected_status = ''
         expected_status += "- There is no severity which was muted using " \
                            "/muteall \n"
@@ -397,15 +400,16 @@ class TestSlackCommandHandlers(unittest.TestCase):
             }
         ).encode(),),
     ])
-    @mock.patch.object(RedisApi, "hexists_unsafe")
-    @mock.patch.object(RedisApi, "exists_unsafe")
-    @mock.patch.object(RedisApi, "get_unsafe")
+    @mock.patch.object(RedisApi, "hget_from_hashes_unsafe")
+    @mock.patch.object(RedisApi, "get_multiple_unsafe")
     def test_get_muted_status_return_correct_if_muteall_muted_severities_only(
-            self, get_unsafe_ret, mock_get_unsafe, mock_exists_unsafe,
-            mock_hexists_unsafe) -> None:
-        mock_exists_unsafe.return_value = True
-        mock_hexists_unsafe.return_value = False
-        mock_get_unsafe.return_value = get_unsafe_ret
+            self, get_unsafe_ret, mock_get_multiple_unsafe,
+            mock_hget_from_hashes_unsafe) -> None:
+        mock_get_multiple_unsafe.return_value = {
+            Keys.get_alerter_mute(): get_unsafe_ret}
+        mock_hget_from_hashes_unsafe.return_value = {
+            Keys.get_hash_parent(chain_id): None
+            for chain_id in self.test_associated_chains}
         all_chains_muted_severities = []
         for severity, severity_muted in json.loads(
                 get_unsafe_ret.decode()).items():
@@ -419,14 +423,12 @@ class TestSlackCommandHandlers(unittest.TestCase):
 
         self.assertEqual(expected_status, actual_status)
 
-    @mock.patch.object(RedisApi, "hget_unsafe")
-    @mock.patch.object(RedisApi, "hexists_unsafe")
-    @mock.patch.object(RedisApi, "exists_unsafe")
+    @mock.patch.object(RedisApi, "hget_from_hashes_unsafe")
+    @mock.patch.object(RedisApi, "get_multiple_unsafe")
     def test_get_muted_status_return_correct_if_mute_muted_severities_only(
-            self, mock_exists_unsafe, mock_hexists_unsafe,
-            mock_hget_unsafe) -> None:
-        mock_exists_unsafe.return_value = False
-        mock_hexists_unsafe.side_effect = [True, False, True]
+            self, mock_get_multiple_unsafe,
+            mock_hget_from_hashes_unsafe) -> None:
+        mock_get_multiple_unsafe.return_value = {Keys.get_alerter_mute(): None}
         chain1_muted_severities = json.dumps({
             'INFO': False,
             'WARNING': True,
@@ -439,8 +441,10 @@ class TestSlackCommandHandlers(unittest.TestCase):
             'CRITICAL': False,
             'ERROR': False,
         }).encode()
-        mock_hget_unsafe.side_effect = [chain1_muted_severities,
-                                        chain3_muted_severities]
+        mock_hget_from_hashes_unsafe.return_value = dict(zip(
+            [Keys.get_hash_parent(chain_id)
+             for chain_id in self.test_associated_chains],
+            [chain1_muted_severities, None, chain3_muted_severities]))
 
         actual_status = self.test_slack_command_handlers._get_muted_status()
 
@@ -465,21 +469,18 @@ class TestSlackCommandHandlers(unittest.TestCase):
 
         self.assertEqual(expected_status, actual_status)
 
-    @mock.patch.object(RedisApi, "hget_unsafe")
-    @mock.patch.object(RedisApi, "hexists_unsafe")
-    @mock.patch.object(RedisApi, "get_unsafe")
-    @mock.patch.object(RedisApi, "exists_unsafe")
+    @mock.patch.object(RedisApi, "hget_from_hashes_unsafe")
+    @mock.patch.object(RedisApi, "get_multiple_unsafe")
     def test_get_muted_status_return_correct_if_mute_and_muteall_severities(
-            self, mock_exists_unsafe, mock_get_unsafe, mock_hexists_unsafe,
-            mock_hget_unsafe) -> None:
-        mock_exists_unsafe.return_value = True
-        mock_get_unsafe.return_value = json.dumps({
-            'INFO': False,
-            'WARNING': True,
-            'CRITICAL': True,
-            'ERROR': False,
-        }).encode()
-        mock_hexists_unsafe.side_effect = [True, False, True]
+            self, mock_get_multiple_unsafe,
+            mock_hget_from_hashes_unsafe) -> None:
+        mock_get_multiple_unsafe.return_value = {
+            Keys.get_alerter_mute(): json.dumps({
+                'INFO': False,
+                'WARNING': True,
+                'CRITICAL': True,
+                'ERROR': False,
+            }).encode()}
         chain1_muted_severities = json.dumps({
             'INFO': False,
             'WARNING': True,
@@ -492,8 +493,10 @@ class TestSlackCommandHandlers(unittest.TestCase):
             'CRITICAL': False,
             'ERROR': False,
         }).encode()
-        mock_hget_unsafe.side_effect = [chain1_muted_severities,
-                                        chain3_muted_severities]
+        mock_hget_from_hashes_unsafe.return_value = dict(zip(
+            [Keys.get_hash_parent(chain_id)
+             for chain_id in self.test_associated_chains],
+            [chain1_muted_severities, None, chain3_muted_severities]))
 
         actual_status = self.test_slack_command_handlers._get_muted_status()
 
@@ -698,17 +701,16 @@ class TestSlackCommandHandlers(unittest.TestCase):
                        "_get_worker_component_hb_status")
     @mock.patch.object(SlackCommandHandlers,
                        "_get_manager_component_hb_status")
-    @mock.patch.object(RedisApi, "exists_unsafe")
-    @mock.patch.object(RedisApi, "get_unsafe")
+    @mock.patch.object(RedisApi, "get_multiple_unsafe")
     def test_get_panic_components_status_return_correct_if_all_ok(
-            self, mock_get_unsafe, mock_exists_unsafe, mock_manager_status,
+            self, mock_get_multiple_unsafe, mock_manager_status,
             mock_worker_status) -> None:
         # The PANIC component's status is declared to be all ok if every
         # component in PANIC is running and sending HBs in a timely manner.
         # Note, here we are assuming that there are no problems with the Health
         # Checker
-        mock_get_unsafe.return_value = json.dumps({}).encode()
-        mock_exists_unsafe.return_value = True
+        mock_get_multiple_unsafe.side_effect = lambda keys: {
+            key: json.dumps({}).encode() for key in keys}
 
         # If the HB is ok an '' is always sent. This was confirmed in a
         # previous test.
@@ -771,18 +773,18 @@ class TestSlackCommandHandlers(unittest.TestCase):
                        "_get_worker_component_hb_status")
     @mock.patch.object(SlackCommandHandlers,
                        "_get_manager_component_hb_status")
-    @mock.patch.object(RedisApi, "exists_unsafe")
-    @mock.patch.object(RedisApi, "get_unsafe")
+    @mock.patch.object(RedisApi, "get_multiple_unsafe")
     def test_get_panic_components_status_return_correct_if_no_hbs_yet(
-            self, components_hb_available_dict, mock_get_unsafe,
-            mock_exists_unsafe, mock_manager_status,
-            mock_worker_status) -> None:
+            self, components_hb_available_dict, mock_get_multiple_unsafe,
+            mock_manager_status, mock_worker_status) -> None:
         # We will test for both when there are no hbs yet for every component
         # and for some components only. Note, here we are assuming that there
         # are no problems with the Health Checker.
-        mock_get_unsafe.return_value = json.dumps({}).encode()
-        mock_exists_unsafe.side_effect = list(
-            components_hb_available_dict.values())
+        mock_get_multiple_unsafe.return_value = {
+            Keys.get_component_heartbeat(component):
+                json.dumps({}).encode() if hb_available else None
+            for component, hb_available in components_hb_available_dict.items()
+        }
 
         # We will assume that every hb is ok if it exists. The case when some
         # might not be ok will be tackled by the next test.
@@ -959,22 +961,20 @@ class TestSlackCommandHandlers(unittest.TestCase):
                        "_get_worker_component_hb_status")
     @mock.patch.object(SlackCommandHandlers,
                        "_get_manager_component_hb_status")
-    @mock.patch.object(RedisApi, "exists_unsafe")
-    @mock.patch.object(RedisApi, "get_unsafe")
+    @mock.patch.object(RedisApi, "get_multiple_unsafe")
     def test_get_panic_components_status_return_correct_if_some_hbs_not_ok(
-            self, components_hb_status_dict, mock_get_unsafe,
-            mock_exists_unsafe, mock_manager_status,
-            mock_worker_status) -> None:
+            self, components_hb_status_dict, mock_get_multiple_unsafe,
+            mock_manager_status, mock_worker_status) -> None:
         # A hb is declared to be not ok if it exceeds the grace_interval or
         # it implies that some processes are dead. We will test for both when
         # every hb is not ok and when there are no hbs mixed with ok hbs and
         # not ok hbs. Note, here we are assuming that there are no problems with
         # the Health Checker.
-        mock_get_unsafe.return_value = json.dumps({}).encode()
-        mock_exists_unsafe.side_effect = [
-            value['hb_exists'] for value in list(
-                components_hb_status_dict.values())
-        ]
+        mock_get_multiple_unsafe.return_value = {
+            Keys.get_component_heartbeat(component):
+                json.dumps({}).encode() if hb_status['hb_exists'] else None
+            for component, hb_status in components_hb_status_dict.items()
+        }
         manager_components = [
             SYSTEM_MONITORS_MANAGER_NAME, GITHUB_MONITORS_MANAGER_NAME,
             DOCKERHUB_MONITORS_MANAGER_NAME, NODE_MONITORS_MANAGER_NAME,
@@ -1014,11 +1014,10 @@ class TestSlackCommandHandlers(unittest.TestCase):
                             False))
         self.assertEqual(expected_ret, actual_ret)
 
-    @mock.patch.object(RedisApi, "get_unsafe")
-    @mock.patch.object(RedisApi, "exists_unsafe")
+    @mock.patch.object(RedisApi, "get_multiple_unsafe")
     @freeze_time("2012-01-01")
     def test_get_health_checker_status_ret_correct_if_hc_sub_components_ok(
-            self, mock_exists, mock_get) -> None:
+            self, mock_get_multiple) -> None:
         # The Health Checker's sub components are declared to be ok if their
         # heartbeats are within an acceptable time interval. Therefore for this
         # test we can mock this scenario. We will parametrize to test for both
@@ -1026,8 +1025,11 @@ class TestSlackCommandHandlers(unittest.TestCase):
         # hb_timestamp = hb_interval and when
         # hb_timestamp = hb_interval + grace_interval. Note we cannot use
         # parametrize.expand with frozen times together with freeze_time.
-        mock_exists.return_value = True
-        mock_get.side_effect = [
+        key_heartbeat_handler_hb = Keys.get_component_heartbeat(
+            HEARTBEAT_HANDLER_NAME)
+        key_ping_publisher_hb = Keys.get_component_heartbeat(
+            PING_PUBLISHER_NAME)
+        heartbeats = [
             json.dumps({
                 'timestamp': datetime.now().timestamp(),
                 'component_name': HEARTBEAT_HANDLER_NAME,
@@ -1057,6 +1059,11 @@ class TestSlackCommandHandlers(unittest.TestCase):
                 'component_name': PING_PUBLISHER_NAME,
             }).encode(),
         ]
+        mock_get_multiple.side_effect = [
+            {key_heartbeat_handler_hb: heartbeats[index],
+             key_ping_publisher_hb: heartbeats[index + 1]}
+            for index in range(0, len(heartbeats), 2)
+        ]
 
         # We will run it 3 times as there are 3 different pairs of side effects.
         expected_ret = ("- *Health Checker*: {}\n".format(
@@ -1072,19 +1079,21 @@ class TestSlackCommandHandlers(unittest.TestCase):
         self.assertEqual(expected_ret, actual_ret)
 
     @parameterized.expand([(41, 1,), (60, 2,), (67, 2,), (89, 2,), (90, 3,), ])
-    @mock.patch.object(RedisApi, "get_unsafe")
-    @mock.patch.object(RedisApi, "exists_unsafe")
+    @mock.patch.object(RedisApi, "get_multiple_unsafe")
     @freeze_time("2012-01-01")
     def test_get_health_checker_status_ret_correct_if_hc_sub_components_not_ok(
-            self, hb_delay, expected_missed_hbs, mock_exists, mock_get) -> None:
+            self, hb_delay, expected_missed_hbs, mock_get_multiple) -> None:
         # The Health Checker's sub components are declared to not be ok if their
         # heartbeats are not within the acceptable time interval. Therefore for
         # this test we can mock this scenario. We will mock different scenarios
         # such as both health checker components are not ok, or one of them
         # is ok. Note we cannot use parametrize.expand with frozen times
         # together with freeze_time.
-        mock_exists.return_value = True
-        mock_get.side_effect = [
+        key_heartbeat_handler_hb = Keys.get_component_heartbeat(
+            HEARTBEAT_HANDLER_NAME)
+        key_ping_publisher_hb = Keys.get_component_heartbeat(
+            PING_PUBLISHER_NAME)
+        heartbeats = [
             json.dumps({
                 'timestamp': datetime.now().timestamp() - hb_delay,
                 'component_name': HEARTBEAT_HANDLER_NAME,
@@ -1110,6 +1119,11 @@ class TestSlackCommandHandlers(unittest.TestCase):
                 'component_name': PING_PUBLISHER_NAME,
             }).encode(),
         ]
+        mock_get_multiple.side_effect = [
+            {key_heartbeat_handler_hb: heartbeats[index],
+             key_ping_publisher_hb: heartbeats[index + 1]}
+            for index in range(0, len(heartbeats), 2)
+        ]
 
         # We will run it 3 times as there are 3 different pairs of side effects.
         expected_status = ''
@@ -1150,26 +1164,33 @@ class TestSlackCommandHandlers(unittest.TestCase):
             self.test_slack_command_handlers._get_health_checker_status()
         self.assertEqual(expected_ret, actual_ret)
 
-    @mock.patch.object(RedisApi, "get_unsafe")
-    @mock.patch.object(RedisApi, "exists_unsafe")
+    @mock.patch.object(RedisApi, "get_multiple_unsafe")
     def test_get_health_checker_status_ret_correct_if_hc_components_no_hbs_yet(
-            self, mock_exists, mock_get) -> None:
+            self, mock_get_multiple) -> None:
         # We will mock different scenarios such as when both heartbeats are not
         # there yet and when one of them only is there yet. Note we cannot use
         # parametrize.expand with frozen times together with freeze_time.
-        mock_exists.side_effect = [True, False, False, True, False, False]
+        key_heartbeat_handler_hb = Keys.get_component_heartbeat(
+            HEARTBEAT_HANDLER_NAME)
+        key_ping_publisher_hb = Keys.get_component_heartbeat(
+            PING_PUBLISHER_NAME)
 
         # Note that we will assume that the hbs are ok. The other cases when the
         # hbs are not ok is tackled by the previous tests.
-        mock_get.side_effect = [
-            json.dumps({
-                'timestamp': datetime.now().timestamp(),
-                'component_name': HEARTBEAT_HANDLER_NAME,
-            }).encode(),
-            json.dumps({
-                'timestamp': datetime.now().timestamp(),
-                'component_name': PING_PUBLISHER_NAME,
-            }).encode(),
+        heartbeat_handler_hb = json.dumps({
+            'timestamp': datetime.now().timestamp(),
+            'component_name': HEARTBEAT_HANDLER_NAME,
+        }).encode()
+        ping_publisher_hb = json.dumps({
+            'timestamp': datetime.now().timestamp(),
+            'component_name': PING_PUBLISHER_NAME,
+        }).encode()
+        mock_get_multiple.side_effect = [
+            {key_heartbeat_handler_hb: heartbeat_handler_hb,
+             key_ping_publisher_hb: None},
+            {key_heartbeat_handler_hb: None,
+             key_ping_publisher_hb: ping_publisher_hb},
+            {key_heartbeat_handler_hb: None, key_ping_publisher_hb: None},
         ]
 
         # We will run it 3 times as there are 3 different pairs of side effects.
@@ -1439,6 +1460,11 @@ class TestSlackCommandHandlers(unittest.TestCase):
             else:
                 self.fail("Expected a mute key for {}".format(chain_name))
 
+        self.assertEqual(
+            {Keys.get_hash_parent(chain_id)
+             for chain_id in self.test_associated_chains},
+            self.test_redis.smembers_unsafe(Keys.get_set_chain_hashes()))
+
     @parameterized.expand([
         ("INFO", "INFO",), ("CRITICAL", "WARNING",),
         ("error", "CRITICAL",), ("WARNING", "ERROR",),
@@ -2158,6 +2184,8 @@ class TestSlackCommandHandlers(unittest.TestCase):
         if specific_chain_muted_enabled:
             self.test_redis.hset_unsafe(chain_hash, mute_chain_alerts_key,
                                         json.dumps(muted_severities_dict))
+            self.test_redis.sadd_unsafe(Keys.get_set_chain_hashes(),
+                                        chain_hash)
             self.assertTrue(self.test_redis.hexists_unsafe(
                 chain_hash, mute_chain_alerts_key))
 
@@ -2227,6 +2255,8 @@ class TestSlackCommandHandlers(unittest.TestCase):
         if specific_chain_muted_enabled:
             self.test_redis.hset_unsafe(chain_hash, mute_chain_alerts_key,
                                         json.dumps(muted_severities_dict))
+            self.test_redis.sadd_unsafe(Keys.get_set_chain_hashes(),
+                                        chain_hash)
             self.assertTrue(self.test_redis.hexists_unsafe(
                 chain_hash, mute_chain_alerts_key))
 
@@ -2269,7 +2299,7 @@ class TestSlackCommandHandlers(unittest.TestCase):
                             "that redis is online. Re-try again when the "
                             "issue is solved."),
     ])
-    @mock.patch.object(RedisApi, "get_keys_unsafe")
+    @mock.patch.object(RedisApi, "smembers_unsafe")
     @mock.patch.object(RedisApi, "exists_unsafe")
     @mock.patch.object(RedisApi, "hexists_unsafe")
     @mock.patch.object(SlackCommandHandlers, "_authorise")
@@ -2277,12 +2307,12 @@ class TestSlackCommandHandlers(unittest.TestCase):
     def test_unmuteall_callback_correct_replies_if_unmute_error_specific_chains(
             self, unmuting_error, expected_reply, mock_say,
             mock_authorise, mock_hexists_unsafe, mock_exists_unsafe,
-            mock_get_keys_unsafe) -> None:
+            mock_smembers_unsafe) -> None:
         mock_say.return_value = None
         mock_authorise.return_value = True
         mock_hexists_unsafe.side_effect = unmuting_error
         mock_exists_unsafe.return_value = False
-        mock_get_keys_unsafe.return_value = ['hash_1', 'hash_2', 'hash_3']
+        mock_smembers_unsafe.return_value = {'hash_1', 'hash_2', 'hash_3'}
 
         self.test_slack_command_handlers.unmuteall_callback(self.test_ack,
                                                             self.test_say,
@@ -17,8 +17,11 @@ from src.alerter.alerts.system_alerts import (
 from src.channels_manager.apis.opsgenie_api import OpsgenieApi
 from src.channels_manager.channels.opsgenie import OpsgenieChannel
 from src.channels_manager.handlers.opsgenie.alerts import OpsgenieAlertsHandler
+from src.channels_manager.handlers.outbox import AlertsOutbox
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils import env
+from src.utils.constants.channels import (
+    ALERT_RETRY_INITIAL_DELAY_SECONDS, ALERT_RETRY_MAX_DELAY_SECONDS)
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE, HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
     CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE,
@@ -460,7 +463,8 @@ class TestOpsgenieAlertsHandler(unittest.TestCase):
             expected_heartbeat = {
                 'component_name': self.test_handler_name,
                 'is_alive': True,
-                'timestamp': datetime.now().timestamp()
+                'timestamp': datetime.now().timestamp(),
+                'outbox_depth': 0
             }
             mock_send_heartbeat.assert_called_once_with(expected_heartbeat)
         except Exception as e:
@@ -468,15 +472,18 @@ class TestOpsgenieAlertsHandler(unittest.TestCase):
 
         mock_basic_ack.assert_called_once()
 
+    @freeze_time("2012-01-01")
+    @mock.patch.object(Queue, "qsize")
     @mock.patch.object(Queue, "empty")
     @mock.patch.object(OpsgenieAlertsHandler, "_send_heartbeat")
     @mock.patch.object(OpsgenieAlertsHandler, "_send_alerts")
     @mock.patch.object(OpsgenieAlertsHandler, "_place_alert_on_queue")
     @mock.patch.object(RabbitMQApi, "basic_ack")
-    def test_process_alert_does_not_send_hb_if_not_all_data_sent_from_queue(
+    def test_process_alert_sends_hb_with_outbox_depth_if_data_not_all_sent(
             self, mock_basic_ack, mock_place_alert, mock_send_alerts,
-            mock_send_heartbeat, mock_empty) -> None:
+            mock_send_heartbeat, mock_empty, mock_qsize) -> None:
         mock_empty.return_value = False
+        mock_qsize.return_value = 3
         mock_place_alert.return_value = None
         mock_basic_ack.return_value = None
         mock_send_alerts.return_value = None
@@ -491,25 +498,22 @@ class TestOpsgenieAlertsHandler(unittest.TestCase):
             body = json.dumps(self.test_alert.alert_data)
             properties = pika.spec.BasicProperties()
 
-            # First test with a valid alert
-            self.test_opsgenie_alerts_handler._process_alert(blocking_channel,
-                                                             method, properties,
-                                                             body)
-
-            # Test with an invalid alert dict
-            invalid_alert = copy.deepcopy(self.test_alert.alert_data)
-            del invalid_alert['message']
-            body = json.dumps(invalid_alert)
+            # Send alert
             self.test_opsgenie_alerts_handler._process_alert(blocking_channel,
                                                              method, properties,
                                                              body)
 
-            mock_send_heartbeat.assert_not_called()
+            expected_heartbeat = {
+                'component_name': self.test_handler_name,
+                'is_alive': True,
+                'timestamp': datetime.now().timestamp(),
+                'outbox_depth': 3
+            }
+            mock_send_heartbeat.assert_called_once_with(expected_heartbeat)
         except Exception as e:
             self.fail("Test failed: {}".format(e))
 
-        args, _ = mock_basic_ack.call_args
-        self.assertEqual(2, len(args))
+        mock_basic_ack.assert_called_once()
 
     @parameterized.expand([(True,), (False,), ])
     @mock.patch.object(Queue, "empty")
@@ -688,19 +692,48 @@ class TestOpsgenieAlertsHandler(unittest.TestCase):
         all_queue_items = list(test_queue.queue)
         self.assertEqual(['item1', 'item2', self.test_alert], all_queue_items)
 
-    def test_place_alert_on_queue_removes_oldest_and_places_if_queue_full(
+    def test_place_alert_on_queue_sheds_least_severe_oldest_if_queue_full(
             self) -> None:
         # Use a smaller queue in this case for simplicity
-        test_queue = Queue(3)
+        test_queue = AlertsOutbox(self.dummy_logger, 3)
         self.test_opsgenie_alerts_handler._alerts_queue = test_queue
-        test_queue.put('item1')
-        test_queue.put('item2')
-        test_queue.put('item3')
+        info_alert, older_warning_alert, critical_alert = [
+            OpenFileDescriptorsIncreasedAboveThresholdAlert(
+                self.test_system_name, self.test_percentage_usage, severity,
+                self.test_timestamp, severity, self.test_parent_id,
+                self.test_system_id)
+            for severity in ['INFO', 'WARNING', 'CRITICAL']
+        ]
+        test_queue.put(info_alert)
+        test_queue.put(older_warning_alert)
+        test_queue.put(critical_alert)
 
+        self.test_opsgenie_alerts_handler._place_alert_on_queue(self.test_alert)
         self.test_opsgenie_alerts_handler._place_alert_on_queue(self.test_alert)
 
         all_queue_items = list(test_queue.queue)
-        self.assertEqual(['item2', 'item3', self.test_alert], all_queue_items)
+        self.assertEqual([critical_alert, self.test_alert, self.test_alert],
+                         all_queue_items)
+
+    def test_place_alert_on_queue_discards_alert_if_queue_full_of_severer(
+            self) -> None:
+        # Use a smaller queue in this case for simplicity
+        test_queue = AlertsOutbox(self.dummy_logger, 3)
+        self.test_opsgenie_alerts_handler._alerts_queue = test_queue
+        critical_alerts = [
+            OpenFileDescriptorsIncreasedAboveThresholdAlert(
+                self.test_system_name, self.test_percentage_usage, 'CRITICAL',
+                self.test_timestamp, 'CRITICAL', self.test_parent_id,
+                self.test_system_id)
+            for _ in range(3)
+        ]
+        for alert in critical_alerts:
+            test_queue.put(alert)
+
+        self.test_opsgenie_alerts_handler._place_alert_on_queue(self.test_alert)
+
+        all_queue_items = list(test_queue.queue)
+        self.assertEqual(critical_alerts, all_queue_items)
 
     @mock.patch.object(Queue, "empty")
     @mock.patch.object(Queue, "get")
@@ -781,30 +814,37 @@ class TestOpsgenieAlertsHandler(unittest.TestCase):
           RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.SUCCESS],
          5,),
     ])
-    @freeze_time("2012-01-01")
     @mock.patch.object(RabbitMQApi, "connection")
     @mock.patch.object(OpsgenieChannel, "alert")
     def test_send_alerts_attempts_to_send_alert_for_up_to_max_attempts_times(
             self, alert_request_status_list, expected_no_calls, mock_alert,
             mock_connection) -> None:
         mock_alert.side_effect = alert_request_status_list
-        mock_connection.return_value.sleep.return_value = None
-        test_alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
-            self.test_system_name, self.test_percentage_usage,
-            self.test_panic_severity, datetime.now().timestamp(),
-            self.test_panic_severity, self.test_parent_id, self.test_system_id
-        )
-        test_queue = Queue(4)
-        self.test_opsgenie_alerts_handler._alerts_queue = test_queue
-        test_queue.put(test_alert)
-
-        self.test_opsgenie_alerts_handler._send_alerts()
+        with freeze_time("2012-01-01") as frozen_time:
+            test_alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+                self.test_system_name, self.test_percentage_usage,
+                self.test_panic_severity, datetime.now().timestamp(),
+                self.test_panic_severity, self.test_parent_id,
+                self.test_system_id
+            )
+            test_queue = Queue(4)
+            self.test_opsgenie_alerts_handler._alerts_queue = test_queue
+            test_queue.put(test_alert)
+
+            # Send the alerts once every retry is due, by moving past the
+            # longest backoff of each attempt
+            for attempt in range(self.test_max_attempts):
+                self.test_opsgenie_alerts_handler._send_alerts()
+                frozen_time.tick(timedelta(seconds=min(
+                    ALERT_RETRY_INITIAL_DELAY_SECONDS * 2 ** attempt,
+                    ALERT_RETRY_MAX_DELAY_SECONDS)))
 
         expected_calls = []
         for _ in range(expected_no_calls):
             expected_calls.append(call(test_alert))
         actual_calls = mock_alert.call_args_list
         self.assertEqual(expected_calls, actual_calls)
+        mock_connection.sleep.assert_not_called()
 
     @parameterized.expand([
         ([RequestStatus.SUCCESS],),
@@ -815,14 +855,39 @@ class TestOpsgenieAlertsHandler(unittest.TestCase):
         ([RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.FAILED,
           RequestStatus.FAILED, RequestStatus.SUCCESS],),
     ])
-    @freeze_time("2012-01-01")
     @mock.patch.object(RabbitMQApi, "connection")
     @mock.patch.object(OpsgenieChannel, "alert")
     def test_send_alerts_removes_alert_if_it_was_successfully_sent(
             self, alert_request_status_list, mock_alert,
             mock_connection) -> None:
         mock_alert.side_effect = alert_request_status_list
-        mock_connection.return_value.sleep.return_value = None
+        with freeze_time("2012-01-01") as frozen_time:
+            test_alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+                self.test_system_name, self.test_percentage_usage,
+                self.test_panic_severity, datetime.now().timestamp(),
+                self.test_panic_severity, self.test_parent_id,
+                self.test_system_id
+            )
+            test_queue = Queue(4)
+            self.test_opsgenie_alerts_handler._alerts_queue = test_queue
+            test_queue.put(test_alert)
+
+            for attempt in range(len(alert_request_status_list)):
+                self.test_opsgenie_alerts_handler._send_alerts()
+                frozen_time.tick(timedelta(seconds=min(
+                    ALERT_RETRY_INITIAL_DELAY_SECONDS * 2 ** attempt,
+                    ALERT_RETRY_MAX_DELAY_SECONDS)))
+
+        self.assertTrue(self.test_opsgenie_alerts_handler.alerts_queue.empty())
+        retry_scheduler = self.test_opsgenie_alerts_handler._retry_scheduler
+        self.assertEqual(0, retry_scheduler.no_of_pending_retries)
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(RabbitMQApi, "connection")
+    @mock.patch.object(OpsgenieChannel, "alert")
+    def test_send_alerts_schedules_a_retry_if_an_alert_is_not_sent(
+            self, mock_alert, mock_connection) -> None:
+        mock_alert.return_value = RequestStatus.FAILED
         test_alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
             self.test_system_name, self.test_percentage_usage,
             self.test_panic_severity, datetime.now().timestamp(),
@@ -834,7 +899,37 @@ class TestOpsgenieAlertsHandler(unittest.TestCase):
 
         self.test_opsgenie_alerts_handler._send_alerts()
 
-        self.assertTrue(self.test_opsgenie_alerts_handler.alerts_queue.empty())
+        # The retry is left to a timer rather than blocking the handler
+        mock_alert.assert_called_once_with(test_alert)
+        mock_connection.sleep.assert_not_called()
+        mock_connection.call_later.assert_called_once()
+        delay = mock_connection.call_later.call_args[0][0]
+        self.assertTrue(ALERT_RETRY_INITIAL_DELAY_SECONDS / 2 <= delay
+                        <= ALERT_RETRY_INITIAL_DELAY_SECONDS)
+        retry_scheduler = self.test_opsgenie_alerts_handler._retry_scheduler
+        self.assertEqual(1, retry_scheduler.attempts(test_alert))
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(RabbitMQApi, "connection")
+    @mock.patch.object(OpsgenieChannel, "alert")
+    def test_send_alerts_does_not_resend_an_alert_before_its_retry_is_due(
+            self, mock_alert, mock_connection) -> None:
+        mock_alert.return_value = RequestStatus.FAILED
+        test_alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage,
+            self.test_panic_severity, datetime.now().timestamp(),
+            self.test_panic_severity, self.test_parent_id, self.test_system_id
+        )
+        test_queue = Queue(4)
+        self.test_opsgenie_alerts_handler._alerts_queue = test_queue
+        test_queue.put(test_alert)
+
+        self.test_opsgenie_alerts_handler._send_alerts()
+        self.test_opsgenie_alerts_handler._send_alerts()
+
+        mock_alert.assert_called_once_with(test_alert)
+        self.assertEqual(
+            1, self.test_opsgenie_alerts_handler.alerts_queue.qsize())
 
     @freeze_time("2012-01-01")
     @mock.patch.object(RabbitMQApi, "connection")
@@ -0,0 +1,363 @@
+import json
+import logging
+import queue
+import threading
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+import pika
+
+from src.alerter.alerts.system_alerts import (
+    OpenFileDescriptorsIncreasedAboveThresholdAlert)
+from src.channels_manager.channels.twilio import TwilioChannel
+from src.channels_manager.handlers.dispatcher import (
+    ADD_DESTINATION, REMOVE_DESTINATION, AlertsDispatcher, DestinationWorker,
+    DispatchedHandler, TwilioCaller)
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.utils import env
+from src.utils.constants.rabbitmq import (
+    CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE,
+    CHANNEL_HANDLER_INPUT_ROUTING_KEY_TEMPLATE, ALERT_EXCHANGE)
+from src.utils.data import RequestStatus
+
+
+class TestDestinationWorker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.test_worker_name = 'test_worker'
+        self.test_queue_size = 3
+        self.test_max_attempts = 2
+        self.mock_send = mock.MagicMock(return_value=RequestStatus.SUCCESS)
+        self.test_worker = DestinationWorker(
+            self.test_worker_name, self.dummy_logger, self.mock_send,
+            self.test_queue_size, self.test_max_attempts)
+        self.test_alerts = [self._create_alert('WARNING') for _ in range(3)]
+
+    def tearDown(self) -> None:
+        self.test_worker.stop()
+        self.test_worker = None
+
+    @staticmethod
+    def _create_alert(
+            severity: str, timestamp: float = None,
+            origin_id: str = 'system_1234', parent_id: str = 'parent_1234') \
+            -> OpenFileDescriptorsIncreasedAboveThresholdAlert:
+        timestamp = datetime.now().timestamp() if timestamp is None \
+            else timestamp
+        return OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            'test_system', 50, severity, timestamp, severity, parent_id,
+            origin_id)
+
+    def test_send_alerts_sends_alerts_in_order_and_calls_on_idle(self) -> None:
+        on_idle = mock.MagicMock()
+        self.test_worker._on_idle = on_idle
+        for alert in self.test_alerts:
+            self.test_worker.put(alert)
+
+        self.test_worker._send_alerts()
+
+        self.assertEqual([mock.call(alert) for alert in self.test_alerts],
+                         self.mock_send.call_args_list)
+        self.assertEqual(0, self.test_worker.no_of_pending_alerts)
+        on_idle.assert_called_once_with()
+
+    def test_send_alerts_stops_at_a_failed_alert_until_its_retry_is_due(
+            self) -> None:
+        self.mock_send.return_value = RequestStatus.FAILED
+        for alert in self.test_alerts:
+            self.test_worker.put(alert)
+
+        self.test_worker._send_alerts()
+        self.test_worker._send_alerts()
+
+        self.mock_send.assert_called_once_with(self.test_alerts[0])
+        self.assertEqual(3, self.test_worker.no_of_pending_alerts)
+        self.assertGreater(self.test_worker._seconds_until_due(), 0)
+
+    def test_send_alerts_waits_for_a_new_alert_after_max_attempts(
+            self) -> None:
+        self.mock_send.return_value = RequestStatus.FAILED
+        self.test_worker.put(self.test_alerts[0])
+
+        self.test_worker._send_alerts()
+        # Make the retry of the alert due
+        self.test_worker._retry_scheduler._retries[self.test_alerts[0]][1] = 0
+        self.test_worker._send_alerts()
+
+        self.assertEqual(self.test_max_attempts, self.mock_send.call_count)
+        self.assertIsNone(self.test_worker._seconds_until_due())
+
+        self.test_worker.put(self.test_alerts[1])
+
+        self.assertEqual(0, self.test_worker._seconds_until_due())
+
+    def test_send_alerts_discards_expired_alerts(self) -> None:
+        expired_alert = self._create_alert(
+            'WARNING', (datetime.now() - timedelta(hours=1)).timestamp())
+        self.test_worker.put(expired_alert)
+        self.test_worker.put(self.test_alerts[0])
+
+        self.test_worker._send_alerts()
+
+        self.mock_send.assert_called_once_with(self.test_alerts[0])
+        self.assertEqual(0, self.test_worker.no_of_pending_alerts)
+
+    def test_put_removes_the_oldest_alert_if_the_queue_is_full(self) -> None:
+        alerts = self.test_alerts + [self._create_alert('WARNING')]
+        for alert in alerts:
+            self.test_worker.put(alert)
+
+        self.assertEqual(alerts[1:], list(self.test_worker._alerts.queue))
+
+    def test_put_sheds_the_least_severe_alert_if_the_queue_is_full(
+            self) -> None:
+        info_alert = self._create_alert('INFO', origin_id='system_5678')
+        critical_alert = self._create_alert('CRITICAL',
+                                            origin_id='system_5678')
+        self.test_worker.put(info_alert)
+        self.test_worker.put(self.test_alerts[0])
+        self.test_worker.put(self.test_alerts[1])
+
+        self.test_worker.put(critical_alert)
+        self.test_worker.put(self._create_alert('INFO', origin_id='system_90'))
+
+        self.assertEqual([critical_alert] + self.test_alerts[:2],
+                         list(self.test_worker._alerts.queue))
+
+    def test_send_alerts_sends_critical_alerts_first(self) -> None:
+        critical_alert = self._create_alert('CRITICAL',
+                                            origin_id='system_5678')
+        for alert in self.test_alerts[:2]:
+            self.test_worker.put(alert)
+        self.test_worker.put(critical_alert)
+
+        self.test_worker._send_alerts()
+
+        self.assertEqual(
+            [mock.call(alert)
+             for alert in [critical_alert] + self.test_alerts[:2]],
+            self.mock_send.call_args_list)
+        self.assertEqual(0, self.test_worker.no_of_pending_alerts)
+
+    def test_put_buffers_non_critical_alerts_if_digests_enabled(self) -> None:
+        worker = DestinationWorker(
+            self.test_worker_name, self.dummy_logger, self.mock_send,
+            digest_window=30)
+        critical_alert = self._create_alert('CRITICAL',
+                                            parent_id='parent_5678')
+
+        worker.put(self.test_alerts[0])
+        worker.put(critical_alert)
+
+        self.assertEqual([critical_alert], list(worker._alerts.queue))
+        self.assertEqual(2, worker.no_of_pending_alerts)
+        self.assertIsNotNone(worker._digest_due_time)
+
+    def test_put_queues_buffered_alerts_of_chain_before_critical_alert(
+            self) -> None:
+        worker = DestinationWorker(
+            self.test_worker_name, self.dummy_logger, self.mock_send,
+            digest_window=30)
+        other_chain_alert = self._create_alert('WARNING',
+                                               parent_id='parent_5678')
+        critical_alert = self._create_alert('CRITICAL')
+
+        worker.put(self.test_alerts[0])
+        worker.put(other_chain_alert)
+        worker.put(critical_alert)
+
+        self.assertEqual([self.test_alerts[0], critical_alert],
+                         list(worker._alerts.queue))
+        self.assertEqual(3, worker.no_of_pending_alerts)
+
+    def test_worker_thread_sends_alerts_put_on_it(self) -> None:
+        idle = threading.Event()
+        self.test_worker.start(idle.set)
+
+        self.test_worker.put(self.test_alerts[0])
+
+        self.assertTrue(idle.wait(5))
+        self.mock_send.assert_called_once_with(self.test_alerts[0])
+
+
+class TestTwilioCaller(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_call_to = ['+35611111111', '+35622222222']
+        self.mock_twilio_channel = mock.MagicMock(spec=TwilioChannel)
+        self.test_caller = TwilioCaller(self.mock_twilio_channel,
+                                        '+35699999999', self.test_call_to,
+                                        'test_twiml', False)
+        self.test_alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            'test_system', 50, 'CRITICAL', datetime.now().timestamp(),
+            'CRITICAL', 'parent_1234', 'system_1234')
+
+    def test_caller_only_calls_the_numbers_which_failed_again(self) -> None:
+        self.mock_twilio_channel.alert.side_effect = [
+            RequestStatus.SUCCESS, RequestStatus.FAILED, RequestStatus.SUCCESS]
+
+        self.assertEqual(RequestStatus.FAILED,
+                         self.test_caller(self.test_alert))
+        self.assertEqual(RequestStatus.SUCCESS,
+                         self.test_caller(self.test_alert))
+
+        called_numbers = [
+            call_args[1]['call_to']
+            for call_args in self.mock_twilio_channel.alert.call_args_list]
+        self.assertEqual(self.test_call_to + [self.test_call_to[1]],
+                         called_numbers)
+        self.assertEqual(0, len(self.test_caller._called))
+
+
+class TestDispatchedHandler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_channel_id = 'test_channel_id'
+        self.mock_dispatcher_process = mock.MagicMock()
+        self.mock_dispatcher_process.is_alive.return_value = True
+        self.mock_commands = mock.MagicMock()
+        self.test_handler = DispatchedHandler(
+            self.test_channel_id, self.mock_dispatcher_process,
+            self.mock_commands)
+
+    def test_is_alive_returns_whether_the_dispatcher_is_alive(self) -> None:
+        self.assertTrue(self.test_handler.is_alive())
+
+        self.mock_dispatcher_process.is_alive.return_value = False
+
+        self.assertFalse(self.test_handler.is_alive())
+
+    def test_terminate_removes_the_destination_once(self) -> None:
+        self.test_handler.terminate()
+        self.test_handler.terminate()
+        self.test_handler.join()
+
+        self.mock_commands.put.assert_called_once_with(
+            (REMOVE_DESTINATION, self.test_channel_id))
+        self.assertFalse(self.test_handler.is_alive())
+        self.mock_dispatcher_process.terminate.assert_not_called()
+
+
+class TestAlertsDispatcher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.rabbitmq = RabbitMQApi(
+            self.dummy_logger, env.RABBIT_IP,
+            connection_check_time_interval=timedelta(seconds=0))
+        self.test_channel_id = 'test_channel_id'
+        self.test_channel_type = 'telegram'
+        self.test_handler_args = ('test_token', 'test_chat_id',
+                                  self.test_channel_id, 'test_channel')
+        self.test_consumer_tag = 'test_consumer_tag'
+        self.commands = queue.Queue()
+        self.mock_worker = mock.MagicMock(spec=DestinationWorker)
+        self.mock_worker.name = 'test_worker'
+        self.mock_create_worker = mock.MagicMock(
+            return_value=self.mock_worker)
+        self.test_dispatcher = AlertsDispatcher(
+            self.dummy_logger, 'test_dispatcher', self.rabbitmq,
+            self.commands, self.mock_create_worker, 10)
+        self.test_alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            'test_system', 50, 'WARNING', datetime.now().timestamp(),
+            'WARNING', 'parent_1234', 'system_1234')
+
+    def tearDown(self) -> None:
+        self.test_dispatcher = None
+        self.rabbitmq = None
+
+    @mock.patch.object(RabbitMQApi, "basic_consume")
+    @mock.patch.object(RabbitMQApi, "basic_qos")
+    @mock.patch.object(RabbitMQApi, "queue_bind")
+    @mock.patch.object(RabbitMQApi, "queue_declare")
+    def test_add_destination_starts_worker_and_consumes_its_queue(
+            self, mock_queue_declare, mock_queue_bind, mock_basic_qos,
+            mock_basic_consume) -> None:
+        mock_basic_consume.return_value = self.test_consumer_tag
+
+        self.test_dispatcher._add_destination(
+            self.test_channel_id, self.test_channel_type,
+            self.test_handler_args)
+
+        self.mock_create_worker.assert_called_once_with(
+            self.test_channel_type, self.test_handler_args)
+        self.mock_worker.start.assert_called_once()
+        self.assertEqual({self.test_channel_id: self.mock_worker},
+                         self.test_dispatcher.workers)
+        queue_name = CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE.format(
+            self.test_channel_id)
+        mock_queue_declare.assert_called_once_with(queue_name, False, True,
+                                                   False, False)
+        mock_queue_bind.assert_called_once_with(
+            queue_name, ALERT_EXCHANGE,
+            CHANNEL_HANDLER_INPUT_ROUTING_KEY_TEMPLATE.format(
+                self.test_channel_id))
+        mock_basic_qos.assert_called_once_with(prefetch_count=2)
+        self.assertEqual(queue_name, mock_basic_consume.call_args[0][0])
+
+    @mock.patch.object(RabbitMQApi, "basic_cancel")
+    @mock.patch.object(RabbitMQApi, "basic_consume")
+    @mock.patch.object(RabbitMQApi, "basic_qos")
+    @mock.patch.object(RabbitMQApi, "queue_bind")
+    @mock.patch.object(RabbitMQApi, "queue_declare")
+    def test_remove_destination_stops_worker_and_cancels_its_consumer(
+            self, mock_queue_declare, mock_queue_bind, mock_basic_qos,
+            mock_basic_consume, mock_basic_cancel) -> None:
+        mock_basic_consume.return_value = self.test_consumer_tag
+        self.test_dispatcher._add_destination(
+            self.test_channel_id, self.test_channel_type,
+            self.test_handler_args)
+
+        self.test_dispatcher._remove_destination(self.test_channel_id)
+
+        mock_basic_cancel.assert_called_once_with(self.test_consumer_tag)
+        self.mock_worker.stop.assert_called_once_with()
+        self.assertEqual({}, self.test_dispatcher.workers)
+
+    @mock.patch.object(RabbitMQApi, "connection",
+                       new_callable=mock.PropertyMock)
+    @mock.patch.object(AlertsDispatcher, "_remove_destination")
+    @mock.patch.object(AlertsDispatcher, "_add_destination")
+    def test_process_commands_processes_all_commands_and_polls_again(
+            self, mock_add_destination, mock_remove_destination,
+            mock_connection) -> None:
+        self.commands.put((ADD_DESTINATION, self.test_channel_id,
+                           self.test_channel_type, self.test_handler_args))
+        self.commands.put((REMOVE_DESTINATION, self.test_channel_id))
+
+        self.test_dispatcher._process_commands()
+
+        mock_add_destination.assert_called_once_with(
+            self.test_channel_id, self.test_channel_type,
+            self.test_handler_args)
+        mock_remove_destination.assert_called_once_with(self.test_channel_id)
+        mock_connection.return_value.call_later.assert_called_once()
+
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test_process_alert_acks_and_hands_alert_to_worker(
+            self, mock_basic_ack) -> None:
+        self.test_dispatcher._workers[self.test_channel_id] = self.mock_worker
+        method = pika.spec.Basic.Deliver(delivery_tag=1)
+        body = json.dumps(self.test_alert.alert_data)
+
+        self.test_dispatcher._process_alert(
+            self.test_channel_id, None, method, pika.spec.BasicProperties(),
+            body)
+
+        mock_basic_ack.assert_called_once_with(1, False)
+        self.mock_worker.put.assert_called_once()
+        self.assertEqual(self.test_alert.alert_data,
+                         self.mock_worker.put.call_args[0][0].alert_data)
+
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test_process_alert_drops_alerts_of_removed_destinations(
+            self, mock_basic_ack) -> None:
+        method = pika.spec.Basic.Deliver(delivery_tag=1)
+        body = json.dumps(self.test_alert.alert_data)
+
+        self.test_dispatcher._process_alert(
+            self.test_channel_id, None, method, pika.spec.BasicProperties(),
+            body)
+
+        mock_basic_ack.assert_called_once_with(1, False)
+        self.mock_worker.put.assert_not_called()
@@ -0,0 +1,239 @@
+import logging
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from parameterized import parameterized
+
+from src.alerter.alerts.system_alerts import (
+    OpenFileDescriptorsIncreasedAboveThresholdAlert)
+from src.channels_manager.digest import AlertDigest
+from src.channels_manager.handlers.outbox import AlertsOutbox
+
+
+class TestAlertsOutbox(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.test_path = os.path.join(self.test_dir.name, 'channels',
+                                      'test_channel.db')
+        self.test_queue_size = 3
+        self.test_timestamp = 45676565.556
+        self.test_alerts = [
+            OpenFileDescriptorsIncreasedAboveThresholdAlert(
+                'test_system_{}'.format(index), 50, 'WARNING',
+                self.test_timestamp + index, 'WARNING', 'parent_1234',
+                'system_1234')
+            for index in range(4)
+        ]
+        self.outbox = AlertsOutbox(self.dummy_logger, self.test_queue_size,
+                                   self.test_path)
+
+    def tearDown(self) -> None:
+        self.outbox.close()
+        self.test_dir.cleanup()
+
+    def _create_alert(self, severity: str, origin_id: str = 'system_1234') \
+            -> OpenFileDescriptorsIncreasedAboveThresholdAlert:
+        return OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            'test_system', 50, severity, self.test_timestamp, severity,
+            'parent_1234', origin_id)
+
+    def _reopen(self, queue_size: int = None) -> AlertsOutbox:
+        self.outbox.close()
+        queue_size = self.test_queue_size if queue_size is None \
+            else queue_size
+        self.outbox = AlertsOutbox(self.dummy_logger, queue_size,
+                                   self.test_path)
+        return self.outbox
+
+    @parameterized.expand([(True,), (False,), ])
+    def test_outbox_is_a_fifo_queue_of_maxsize_alerts(
+            self, persistent: bool) -> None:
+        outbox = self.outbox if persistent else AlertsOutbox(
+            self.dummy_logger, self.test_queue_size)
+        for alert in self.test_alerts[:3]:
+            outbox.put(alert)
+
+        self.assertEqual(persistent, outbox.persistent)
+        self.assertTrue(outbox.full())
+        self.assertIs(self.test_alerts[0], outbox.queue[0])
+        self.assertEqual(self.test_alerts[:3],
+                         [outbox.get() for _ in range(3)])
+        self.assertTrue(outbox.empty())
+
+    @parameterized.expand([(True,), (False,), ])
+    def test_outbox_queues_alerts_by_severity_and_then_in_order(
+            self, persistent: bool) -> None:
+        outbox = self._reopen(queue_size=0) if persistent else AlertsOutbox(
+            self.dummy_logger)
+        info_alert, first_warning_alert, critical_alert, \
+            second_warning_alert, error_alert = [
+                self._create_alert(severity, 'system_{}'.format(index))
+                for index, severity in enumerate(
+                    ['INFO', 'WARNING', 'CRITICAL', 'WARNING', 'ERROR'])
+            ]
+        for alert in [info_alert, first_warning_alert, critical_alert,
+                      second_warning_alert, error_alert]:
+            outbox.put(alert)
+
+        self.assertEqual(
+            [critical_alert, error_alert, first_warning_alert,
+             second_warning_alert, info_alert],
+            [outbox.get() for _ in range(5)])
+
+    def test_outbox_loads_alerts_back_in_their_priority_lanes(self) -> None:
+        self.outbox.put(self._create_alert('WARNING', 'system_1'))
+        self.outbox.put(self._create_alert('CRITICAL', 'system_2'))
+
+        outbox = self._reopen()
+
+        self.assertEqual(['CRITICAL', 'WARNING'],
+                         [alert.severity for alert in outbox.queue])
+
+    def test_outbox_keeps_the_alerts_of_an_incident_in_order(self) -> None:
+        outbox = self._reopen(queue_size=0)
+        first_critical_alert, info_alert, second_critical_alert = [
+            self._create_alert(severity)
+            for severity in ['CRITICAL', 'INFO', 'CRITICAL']
+        ]
+        other_critical_alert = self._create_alert('CRITICAL', 'system_5678')
+        for alert in [first_critical_alert, info_alert, second_critical_alert,
+                      other_critical_alert]:
+            outbox.put(alert)
+
+        expected_alerts = [first_critical_alert, other_critical_alert,
+                           info_alert, second_critical_alert]
+        self.assertEqual(expected_alerts, list(outbox.queue))
+
+        outbox = self._reopen(queue_size=0)
+        self.assertEqual(
+            [(alert.severity, alert.origin_id) for alert in expected_alerts],
+            [(alert.severity, alert.origin_id) for alert in outbox.queue])
+
+    def test_outbox_keeps_a_digest_before_the_later_alerts_of_its_incidents(
+            self) -> None:
+        outbox = self._reopen(queue_size=0)
+        digest = AlertDigest([self._create_alert('WARNING'),
+                              self._create_alert('WARNING', 'system_5678')])
+        critical_alert = self._create_alert('CRITICAL', 'system_5678')
+        other_critical_alert = self._create_alert('CRITICAL', 'system_9012')
+        for alert in [digest, critical_alert, other_critical_alert]:
+            outbox.put(alert)
+
+        self.assertEqual([other_critical_alert, digest, critical_alert],
+                         list(outbox.queue))
+
+    def test_shed_removes_the_oldest_alert_of_the_lowest_lane(self) -> None:
+        critical_alert, first_info_alert, second_info_alert = [
+            self._create_alert(severity)
+            for severity in ['CRITICAL', 'INFO', 'INFO']
+        ]
+        for alert in [critical_alert, first_info_alert, second_info_alert]:
+            self.outbox.put(alert)
+
+        shed_alert = self.outbox.shed(self._create_alert('WARNING'))
+
+        self.assertIs(first_info_alert, shed_alert)
+        self.assertEqual([critical_alert, second_info_alert],
+                         list(self.outbox.queue))
+
+        outbox = self._reopen()
+        self.assertEqual(2, outbox.qsize())
+
+    def test_shed_removes_nothing_if_the_alert_is_the_least_severe(
+            self) -> None:
+        for severity in ['CRITICAL', 'ERROR', 'WARNING']:
+            self.outbox.put(self._create_alert(severity))
+        info_alert = self._create_alert('INFO')
+
+        shed_alert = self.outbox.shed(info_alert)
+
+        self.assertIs(info_alert, shed_alert)
+        self.assertEqual(3, self.outbox.qsize())
+
+    def test_remove_removes_an_alert_wherever_it_is_queued(self) -> None:
+        for alert in self.test_alerts[:3]:
+            self.outbox.put(alert)
+
+        self.assertTrue(self.outbox.remove(self.test_alerts[1]))
+        self.assertFalse(self.outbox.remove(self.test_alerts[1]))
+
+        self.assertEqual([self.test_alerts[0], self.test_alerts[2]],
+                         list(self.outbox.queue))
+        outbox = self._reopen()
+        self.assertEqual(2, outbox.qsize())
+
+    def test_outbox_loads_the_alerts_which_were_not_removed_in_order(
+            self) -> None:
+        for alert in self.test_alerts[:3]:
+            self.outbox.put(alert)
+        self.outbox.get()
+
+        outbox = self._reopen()
+
+        self.assertEqual(2, outbox.qsize())
+        self.assertEqual([alert.alert_data for alert in self.test_alerts[1:3]],
+                         [alert.alert_data for alert in outbox.queue])
+
+    def test_outbox_keeps_the_newest_alerts_if_loaded_with_a_smaller_size(
+            self) -> None:
+        for alert in self.test_alerts[:3]:
+            self.outbox.put(alert)
+
+        outbox = self._reopen(2)
+        outbox = self._reopen(self.test_queue_size)
+
+        self.assertEqual([alert.alert_data for alert in self.test_alerts[1:3]],
+                         [alert.alert_data for alert in outbox.queue])
+
+    def test_outbox_loads_digests_with_their_alerts(self) -> None:
+        self.outbox.put(AlertDigest(self.test_alerts[:2]))
+
+        outbox = self._reopen()
+
+        digest = outbox.get()
+        self.assertIsInstance(digest, AlertDigest)
+        self.assertEqual([alert.alert_data for alert in self.test_alerts[:2]],
+                         [alert.alert_data for alert in digest.alerts])
+
+    def test_outbox_discards_unreadable_alerts_when_loading(self) -> None:
+        self.outbox.put(self.test_alerts[0])
+        self.outbox.close()
+        connection = sqlite3.connect(self.test_path)
+        connection.execute("INSERT INTO outbox (alert) VALUES ('{}')")
+        connection.commit()
+        connection.close()
+
+        outbox = self._reopen()
+        outbox = self._reopen()
+
+        self.assertEqual(1, outbox.qsize())
+        self.assertEqual(self.test_alerts[0].alert_data,
+                         outbox.queue[0].alert_data)
+
+    @mock.patch.object(AlertsOutbox, "compact")
+    def test_outbox_is_compacted_every_compaction_interval_removals(
+            self, mock_compact) -> None:
+        outbox = AlertsOutbox(self.dummy_logger, 0, self.test_path, 2)
+        for alert in self.test_alerts:
+            outbox.put(alert)
+
+        outbox.get()
+        mock_compact.assert_not_called()
+        outbox.get()
+        mock_compact.assert_called_once_with()
+        outbox.close()
+
+    def test_compact_keeps_the_alerts_in_the_outbox(self) -> None:
+        for alert in self.test_alerts[:3]:
+            self.outbox.put(alert)
+        self.outbox.get()
+
+        self.outbox.compact()
+        outbox = self._reopen()
+
+        self.assertEqual(2, outbox.qsize())
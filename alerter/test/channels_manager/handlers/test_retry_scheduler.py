@@ -0,0 +1,87 @@
+import unittest
+
+from parameterized import parameterized
+
+from src.channels_manager.handlers.retry_scheduler import RetryScheduler
+
+
+class TestRetryScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_max_attempts = 4
+        self.test_initial_delay = 10
+        self.test_max_delay = 30
+        self.test_time = 1000.0
+        self.scheduler = RetryScheduler(self.test_max_attempts,
+                                        self.test_initial_delay,
+                                        self.test_max_delay)
+
+    @parameterized.expand([(0,), (-1,)])
+    def test_init_raises_value_error_if_max_attempts_is_not_positive(
+            self, max_attempts: int) -> None:
+        self.assertRaises(ValueError, RetryScheduler, max_attempts)
+
+    def test_can_attempt_returns_true_for_items_without_failed_attempts(
+            self) -> None:
+        self.assertTrue(self.scheduler.can_attempt('item', self.test_time))
+        self.assertEqual(0, self.scheduler.attempts('item'))
+
+    @parameterized.expand([(1, 5, 10,), (2, 10, 20,), (3, 15, 30,), ])
+    def test_attempt_failed_backs_off_exponentially_up_to_max_delay(
+            self, no_of_failures: int, min_delay: float,
+            max_delay: float) -> None:
+        delay = None
+        for _ in range(no_of_failures):
+            delay = self.scheduler.attempt_failed('item', self.test_time)
+
+        self.assertTrue(min_delay <= delay <= max_delay)
+        self.assertEqual(no_of_failures, self.scheduler.attempts('item'))
+
+    def test_can_attempt_returns_true_only_once_the_retry_is_due(self) -> None:
+        delay = self.scheduler.attempt_failed('item', self.test_time)
+
+        self.assertFalse(
+            self.scheduler.can_attempt('item', self.test_time + delay - 0.1))
+        self.assertTrue(
+            self.scheduler.can_attempt('item', self.test_time + delay))
+
+    def test_attempt_failed_forgets_item_after_max_attempts(self) -> None:
+        for _ in range(self.test_max_attempts - 1):
+            self.assertIsNotNone(
+                self.scheduler.attempt_failed('item', self.test_time))
+
+        self.assertIsNone(self.scheduler.attempt_failed('item', self.test_time))
+        self.assertEqual(0, self.scheduler.attempts('item'))
+        self.assertTrue(self.scheduler.can_attempt('item', self.test_time))
+
+    def test_due_items_returns_due_items_ordered_by_next_attempt(self) -> None:
+        self.scheduler.attempt_failed('item_1', self.test_time)
+        self.scheduler.attempt_failed('item_2', self.test_time - 10)
+        self.scheduler.attempt_failed('item_3', self.test_time + 100)
+
+        self.assertEqual(['item_2', 'item_1'],
+                         self.scheduler.due_items(self.test_time + 10))
+
+    def test_seconds_until_next_attempt_returns_time_to_earliest_retry(
+            self) -> None:
+        self.assertIsNone(
+            self.scheduler.seconds_until_next_attempt(self.test_time))
+
+        delay_1 = self.scheduler.attempt_failed('item_1', self.test_time)
+        delay_2 = self.scheduler.attempt_failed('item_2', self.test_time)
+
+        self.assertAlmostEqual(
+            min(delay_1, delay_2),
+            self.scheduler.seconds_until_next_attempt(self.test_time))
+        self.assertEqual(
+            0, self.scheduler.seconds_until_next_attempt(self.test_time + 10))
+
+    def test_forget_and_reset_clear_the_bookkeeping(self) -> None:
+        self.scheduler.attempt_failed('item_1', self.test_time)
+        self.scheduler.attempt_failed('item_2', self.test_time)
+
+        self.scheduler.forget('item_1')
+        self.assertEqual(0, self.scheduler.attempts('item_1'))
+        self.assertEqual(1, self.scheduler.no_of_pending_retries)
+
+        self.scheduler.reset()
+        self.assertEqual(0, self.scheduler.no_of_pending_retries)
@@ -42,7 +42,8 @@ from src.channels_manager.handlers.starters import (
     _initialise_email_alerts_handler, start_email_alerts_handler,
     _initialise_opsgenie_alerts_handler, start_opsgenie_alerts_handler,
     _initialise_console_alerts_handler, start_console_alerts_handler,
-    _initialise_log_alerts_handler, start_log_alerts_handler)
+    _initialise_log_alerts_handler, start_log_alerts_handler,
+    _get_alerts_outbox_path)
 from src.channels_manager.handlers.telegram.commands import (
     TelegramCommandsHandler)
 from src.channels_manager.handlers.twilio.alerts import TwilioAlertsHandler
@@ -360,7 +361,9 @@ class TestHandlerStarters(unittest.TestCase):
             host=env.RABBIT_IP)
         mock_alerts_handler.assert_called_once_with(
             handler_display_name, self.dummy_logger, self.rabbitmq,
-            self.telegram_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+            self.telegram_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+            digest_window=env.TELEGRAM_DIGEST_WINDOW_SECONDS,
+            outbox_path=_get_alerts_outbox_path(self.telegram_channel_id))
 
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_telegram_alerts_handler")
@@ -514,7 +517,9 @@ class TestHandlerStarters(unittest.TestCase):
             host=env.RABBIT_IP)
         mock_alerts_handler.assert_called_once_with(
             handler_display_name, self.dummy_logger, self.rabbitmq,
-            self.slack_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+            self.slack_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+            digest_window=env.SLACK_DIGEST_WINDOW_SECONDS,
+            outbox_path=_get_alerts_outbox_path(self.slack_channel_id))
 
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_slack_alerts_handler")
@@ -723,13 +728,15 @@ class TestHandlerStarters(unittest.TestCase):
         mock_pagerduty_channel.assert_called_once_with(
             self.pagerduty_channel_name, self.pagerduty_channel_id,
             self.dummy_logger.getChild(PagerDutyChannel.__name__),
-            self.pagerduty_api)
+            self.pagerduty_api,
+            coalescing_window=env.INCIDENT_COALESCING_WINDOW_SECONDS)
         mock_rabbit.assert_called_once_with(
             logger=self.dummy_logger.getChild(RabbitMQApi.__name__),
             host=env.RABBIT_IP)
         mock_alerts_handler.assert_called_once_with(
             handler_display_name, self.dummy_logger, self.rabbitmq,
-            self.pagerduty_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+            self.pagerduty_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+            outbox_path=_get_alerts_outbox_path(self.pagerduty_channel_id))
 
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_pagerduty_alerts_handler")
@@ -788,7 +795,9 @@ class TestHandlerStarters(unittest.TestCase):
             host=env.RABBIT_IP)
         mock_alerts_handler.assert_called_once_with(
             handler_display_name, self.dummy_logger, self.rabbitmq,
-            self.email_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+            self.email_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+            digest_window=env.EMAIL_DIGEST_WINDOW_SECONDS,
+            outbox_path=_get_alerts_outbox_path(self.email_channel_id))
 
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_email_alerts_handler")
@@ -838,13 +847,15 @@ class TestHandlerStarters(unittest.TestCase):
         mock_opsgenie_channel.assert_called_once_with(
             self.opsgenie_channel_name, self.opsgenie_channel_id,
             self.dummy_logger.getChild(OpsgenieChannel.__name__),
-            self.opsgenie_api)
+            self.opsgenie_api,
+            coalescing_window=env.INCIDENT_COALESCING_WINDOW_SECONDS)
         mock_rabbit.assert_called_once_with(
             logger=self.dummy_logger.getChild(RabbitMQApi.__name__),
             host=env.RABBIT_IP)
         mock_alerts_handler.assert_called_once_with(
             handler_display_name, self.dummy_logger, self.rabbitmq,
-            self.opsgenie_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+            self.opsgenie_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+            outbox_path=_get_alerts_outbox_path(self.opsgenie_channel_id))
 
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_opsgenie_alerts_handler")
@@ -522,86 +522,87 @@ class TestTwilioAlertsHandler(unittest.TestCase):
         self.assertEqual(expected_calls, actual_calls)
 
     @parameterized.expand([
-        ([RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.FAILED,
-          RequestStatus.SUCCESS, RequestStatus.SUCCESS], [0], [3, 0, 0],
+        ([[RequestStatus.SUCCESS], [RequestStatus.SUCCESS],
+          [RequestStatus.SUCCESS]], [1, 1, 1], RequestStatus.SUCCESS),
+        ([[RequestStatus.FAILED, RequestStatus.SUCCESS],
+          [RequestStatus.SUCCESS], [RequestStatus.SUCCESS]], [2, 1, 1],
          RequestStatus.FAILED),
-        ([RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.FAILED,
-          RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.FAILED,
-          RequestStatus.SUCCESS], [0, 1], [3, 3, 0], RequestStatus.FAILED),
-        ([RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.FAILED,
-          RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.FAILED,
-          RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.FAILED],
-         [0, 1, 2], [3, 3, 3], RequestStatus.FAILED),
-        ([RequestStatus.SUCCESS, RequestStatus.FAILED, RequestStatus.FAILED,
-          RequestStatus.FAILED, RequestStatus.SUCCESS], [1], [0, 3, 0],
+        ([[RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.SUCCESS],
+          [RequestStatus.SUCCESS], [RequestStatus.FAILED,
+                                    RequestStatus.SUCCESS]], [3, 1, 2],
          RequestStatus.FAILED),
-        ([RequestStatus.SUCCESS, RequestStatus.FAILED, RequestStatus.FAILED,
-          RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.FAILED,
-          RequestStatus.FAILED, ], [1, 2], [0, 3, 3], RequestStatus.FAILED),
-        ([RequestStatus.SUCCESS, RequestStatus.SUCCESS, RequestStatus.FAILED,
-          RequestStatus.FAILED, RequestStatus.FAILED], [2], [0, 0, 3],
-         RequestStatus.FAILED),
-        ([RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.FAILED,
-          RequestStatus.SUCCESS, RequestStatus.FAILED, RequestStatus.FAILED,
-          RequestStatus.FAILED, ], [0, 2], [3, 0, 3], RequestStatus.FAILED),
-        ([RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.FAILED,
-          RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.FAILED,
-          RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.FAILED],
-         [0, 1, 2], [3, 3, 3], RequestStatus.FAILED),
-        ([RequestStatus.FAILED, RequestStatus.SUCCESS, RequestStatus.SUCCESS,
-          RequestStatus.SUCCESS], [0], [2, 0, 0], RequestStatus.SUCCESS),
-        ([RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.SUCCESS,
-          RequestStatus.SUCCESS, RequestStatus.SUCCESS], [0], [3, 0, 0],
-         RequestStatus.SUCCESS),
-        ([RequestStatus.SUCCESS, RequestStatus.FAILED, RequestStatus.SUCCESS,
-          RequestStatus.SUCCESS], [1], [0, 2, 0], RequestStatus.SUCCESS),
-        ([RequestStatus.SUCCESS, RequestStatus.FAILED, RequestStatus.FAILED,
-          RequestStatus.SUCCESS, RequestStatus.SUCCESS], [1], [0, 3, 0],
-         RequestStatus.SUCCESS),
-        ([RequestStatus.SUCCESS, RequestStatus.SUCCESS, RequestStatus.FAILED,
-          RequestStatus.SUCCESS], [2], [0, 0, 2], RequestStatus.SUCCESS),
-        ([RequestStatus.SUCCESS, RequestStatus.SUCCESS, RequestStatus.FAILED,
-          RequestStatus.FAILED, RequestStatus.SUCCESS], [2], [0, 0, 3],
-         RequestStatus.SUCCESS),
+        ([[RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.FAILED,
+           RequestStatus.SUCCESS], [RequestStatus.SUCCESS],
+          [RequestStatus.FAILED, RequestStatus.FAILED, RequestStatus.FAILED,
+           RequestStatus.SUCCESS]], [3, 1, 3], RequestStatus.FAILED),
+        ([[RequestStatus.FAILED] * 4, [RequestStatus.FAILED] * 4,
+          [RequestStatus.FAILED] * 4], [3, 3, 3], RequestStatus.FAILED),
     ])
     @mock.patch.object(RabbitMQApi, "connection")
     @mock.patch.object(TwilioChannel, "alert")
     def test_call_using_twilio_attempts_calling_max_attempts_times_for_everyone(
-            self, alert_request_status, failed_callee_index, amount_of_calls,
+            self, statuses_per_callee, expected_calls_per_callee,
             expected_ret, mock_alert, mock_connection) -> None:
         # Here we will assume that the self._alert_validity_threshold is not
         # exceeded
-        mock_alert.side_effect = alert_request_status
-        mock_connection.return_value.sleep.return_value = None
-        successful_callee_index = [
-            i
-            for i in range(len(self.test_call_to))
-            if i not in failed_callee_index
-        ]
-        expected_calls = []
-        test_alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
-            self.test_system_name, self.test_percentage_usage,
-            self.test_panic_severity, datetime.now().timestamp(),
-            self.test_panic_severity, self.test_parent_id, self.test_system_id
-        )
-        for index in range(len(self.test_call_to)):
-            if index in failed_callee_index:
-                for _ in range(amount_of_calls[index]):
-                    expected_calls.append(
-                        call(call_from=self.test_call_from,
-                             call_to=self.test_call_to[index],
-                             twiml=self.test_twiml,
-                             twiml_is_url=self.test_twiml_is_url)
-                    )
-            elif index in successful_callee_index:
-                expected_calls.append(
-                    call(call_from=self.test_call_from,
-                         call_to=self.test_call_to[index],
-                         twiml=self.test_twiml,
-                         twiml_is_url=self.test_twiml_is_url)
-                )
+        statuses = {
+            number: iter(statuses_per_callee[index])
+            for index, number in enumerate(self.test_call_to)
+        }
+        mock_alert.side_effect = \
+            lambda call_from, call_to, twiml, twiml_is_url: next(
+                statuses[call_to])
+        with freeze_time("2012-01-01") as frozen_time:
+            test_alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+                self.test_system_name, self.test_percentage_usage,
+                self.test_panic_severity, datetime.now().timestamp(),
+                self.test_panic_severity, self.test_parent_id,
+                self.test_system_id
+            )
+
+            ret = self.test_twilio_alerts_handler._call_using_twilio(
+                test_alert)
+
+            # Failed calls are re-tried by the retry timer, so perform the
+            # retries after the longest backoff of each attempt
+            for attempt in range(self.test_max_attempts - 1):
+                frozen_time.tick(timedelta(seconds=5 * 2 ** attempt))
+                self.test_twilio_alerts_handler._retry_failed()
 
-        ret = self.test_twilio_alerts_handler._call_using_twilio(test_alert)
         self.assertEqual(expected_ret, ret)
-        actual_calls = mock_alert.call_args_list
-        self.assertEqual(expected_calls, actual_calls)
+        for index, number in enumerate(self.test_call_to):
+            expected_calls = [
+                call(call_from=self.test_call_from, call_to=number,
+                     twiml=self.test_twiml,
+                     twiml_is_url=self.test_twiml_is_url)
+            ] * expected_calls_per_callee[index]
+            actual_calls = [actual_call
+                            for actual_call in mock_alert.call_args_list
+                            if actual_call[1]['call_to'] == number]
+            self.assertEqual(expected_calls, actual_calls)
+        mock_connection.sleep.assert_not_called()
+        retry_scheduler = self.test_twilio_alerts_handler._retry_scheduler
+        self.assertEqual(0, retry_scheduler.no_of_pending_retries)
+
+    @mock.patch.object(RabbitMQApi, "connection")
+    @mock.patch.object(TwilioChannel, "alert")
+    def test_retry_failed_does_not_call_if_validity_threshold_exceeded(
+            self, mock_alert, mock_connection) -> None:
+        mock_alert.return_value = RequestStatus.FAILED
+        with freeze_time("2012-01-01") as frozen_time:
+            test_alert = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+                self.test_system_name, self.test_percentage_usage,
+                self.test_panic_severity, datetime.now().timestamp(),
+                self.test_panic_severity, self.test_parent_id,
+                self.test_system_id
+            )
+            self.test_twilio_alerts_handler._call_using_twilio(test_alert)
+            mock_alert.reset_mock()
+
+            frozen_time.tick(timedelta(
+                seconds=self.test_alert_validity_threshold + 1))
+            self.test_twilio_alerts_handler._retry_failed()
+
+        mock_alert.assert_not_called()
+        retry_scheduler = self.test_twilio_alerts_handler._retry_scheduler
+        self.assertEqual(0, retry_scheduler.no_of_pending_retries)
@@ -0,0 +1,110 @@
+import unittest
+
+from parameterized import parameterized
+
+from src.alerter.alert_severities import Severity
+from src.alerter.alerts.system_alerts import (
+    OpenFileDescriptorsIncreasedAboveThresholdAlert)
+from src.channels_manager.digest import (AlertDigest, AlertDigester,
+                                         format_digest)
+
+
+class TestAlertDigester(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_window = 30
+        self.test_percentage_usage = 50
+        self.test_timestamp = 45676565.556
+        self.test_parent_id = 'parent_1234'
+        self.test_other_parent_id = 'parent_5678'
+        self.digester = AlertDigester(self.test_window)
+
+    def _create_alert(self, severity: str, parent_id: str,
+                      timestamp: float) -> \
+            OpenFileDescriptorsIncreasedAboveThresholdAlert:
+        return OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            'test_system', self.test_percentage_usage, severity, timestamp,
+            severity, parent_id, 'test_system_id')
+
+    @parameterized.expand([
+        (Severity.INFO.value, True,),
+        (Severity.WARNING.value, True,),
+        (Severity.ERROR.value, True,),
+        (Severity.CRITICAL.value, False,),
+    ])
+    def test_should_buffer_returns_false_only_for_critical_alerts(
+            self, severity: str, expected_ret: bool) -> None:
+        alert = self._create_alert(severity, self.test_parent_id,
+                                   self.test_timestamp)
+
+        self.assertEqual(expected_ret, self.digester.should_buffer(alert))
+
+    def test_should_buffer_returns_false_if_digests_disabled(self) -> None:
+        digester = AlertDigester(0)
+        alert = self._create_alert(Severity.WARNING.value, self.test_parent_id,
+                                   self.test_timestamp)
+
+        self.assertFalse(digester.enabled)
+        self.assertFalse(digester.should_buffer(alert))
+
+    def test_flush_groups_alerts_by_chain_and_severity(self) -> None:
+        warning_1 = self._create_alert(
+            Severity.WARNING.value, self.test_parent_id, self.test_timestamp)
+        info = self._create_alert(
+            Severity.INFO.value, self.test_parent_id, self.test_timestamp)
+        warning_2 = self._create_alert(
+            Severity.WARNING.value, self.test_parent_id,
+            self.test_timestamp + 5)
+        other_chain_warning = self._create_alert(
+            Severity.WARNING.value, self.test_other_parent_id,
+            self.test_timestamp)
+        for alert in [warning_1, info, warning_2, other_chain_warning]:
+            self.digester.add(alert)
+
+        grouped_alerts = self.digester.flush()
+
+        self.assertEqual(3, len(grouped_alerts))
+        self.assertIsInstance(grouped_alerts[0], AlertDigest)
+        self.assertEqual([warning_1, warning_2], grouped_alerts[0].alerts)
+        self.assertEqual(self.test_timestamp + 5, grouped_alerts[0].timestamp)
+        self.assertEqual(Severity.WARNING.value, grouped_alerts[0].severity)
+        self.assertEqual(self.test_parent_id, grouped_alerts[0].parent_id)
+        self.assertIs(info, grouped_alerts[1])
+        self.assertIs(other_chain_warning, grouped_alerts[2])
+        self.assertEqual(0, self.digester.no_of_buffered_alerts)
+
+    def test_flush_chain_only_removes_the_alerts_of_the_chain(self) -> None:
+        warning = self._create_alert(
+            Severity.WARNING.value, self.test_parent_id, self.test_timestamp)
+        info = self._create_alert(
+            Severity.INFO.value, self.test_parent_id, self.test_timestamp)
+        other_chain_warning = self._create_alert(
+            Severity.WARNING.value, self.test_other_parent_id,
+            self.test_timestamp)
+        for alert in [warning, other_chain_warning, info]:
+            self.digester.add(alert)
+
+        grouped_alerts = self.digester.flush_chain(self.test_parent_id)
+
+        self.assertEqual([warning, info], grouped_alerts)
+        self.assertEqual([other_chain_warning], self.digester.flush())
+
+    @parameterized.expand([(1000, 5, 0,), (250, 2, 3,), (10, 0, 5,), ])
+    def test_format_digest_summarises_alerts_which_do_not_fit(
+            self, max_length: int, expected_no_of_lines: int,
+            expected_no_left_out: int) -> None:
+        alerts = [self._create_alert(Severity.WARNING.value,
+                                     self.test_parent_id, self.test_timestamp)
+                  for _ in range(5)]
+        digest = AlertDigest(alerts)
+
+        text = format_digest('header', digest, '{}', max_length)
+
+        lines = text.split('\n')
+        self.assertEqual('header', lines[0])
+        if expected_no_left_out:
+            self.assertEqual(
+                '... and {} more alerts'.format(expected_no_left_out),
+                lines[-1])
+            self.assertEqual(expected_no_of_lines, len(lines) - 2)
+        else:
+            self.assertEqual(expected_no_of_lines, len(lines) - 1)
@@ -12,12 +12,15 @@ from freezegun import freeze_time
 from parameterized import parameterized
 from pika.exceptions import AMQPConnectionError, AMQPChannelError
 
+from src.channels_manager.handlers.dispatcher import (
+    ADD_DESTINATION, REMOVE_DESTINATION, DispatchedHandler)
 from src.channels_manager.handlers.starters import (
     start_telegram_alerts_handler, start_telegram_commands_handler,
     start_slack_alerts_handler,
     start_twilio_alerts_handler, start_email_alerts_handler,
     start_pagerduty_alerts_handler, start_opsgenie_alerts_handler,
-    start_console_alerts_handler, start_log_alerts_handler)
+    start_console_alerts_handler, start_log_alerts_handler,
+    start_alerts_dispatcher)
 from src.channels_manager.manager import ChannelsManager
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils import env
@@ -1108,6 +1111,70 @@ class TestChannelsManager(unittest.TestCase):
         self.assertEqual(start_log_alerts_handler, process._target)
         mock_start.assert_called_once_with()
 
+    @mock.patch.object(env, "CHANNEL_HANDLERS_DISPATCHER_MODE", True)
+    @mock.patch.object(multiprocessing.Process, "is_alive")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_create_and_start_alerts_handler_adds_it_to_dispatcher_if_enabled(
+            self, mock_start, mock_is_alive) -> None:
+        mock_start.return_value = None
+        mock_is_alive.return_value = True
+        handler_type = ChannelHandlerTypes.ALERTS.value
+
+        self.test_manager._create_and_start_telegram_alerts_handler(
+            self.telegram_bot_token, self.telegram_bot_chat_id,
+            self.telegram_channel_id, self.telegram_channel_name)
+        self.test_manager._create_and_start_log_alerts_handler(
+            self.log_channel_id, self.log_channel_name)
+
+        # A single dispatcher process hosts both handlers
+        mock_start.assert_called_once_with()
+        dispatcher_process = self.test_manager._dispatcher_process
+        self.assertTrue(dispatcher_process.daemon)
+        self.assertEqual(start_alerts_dispatcher, dispatcher_process._target)
+        telegram_process = self.test_manager.channel_process_dict[
+            self.telegram_channel_id][handler_type]['process']
+        log_process = self.test_manager.channel_process_dict[
+            self.log_channel_id][handler_type]['process']
+        self.assertIsInstance(telegram_process, DispatchedHandler)
+        self.assertIsInstance(log_process, DispatchedHandler)
+        self.assertEqual(dispatcher_process,
+                         telegram_process.dispatcher_process)
+        self.assertEqual(dispatcher_process, log_process.dispatcher_process)
+
+        commands = self.test_manager._dispatcher_commands
+        self.assertEqual(
+            (ADD_DESTINATION, self.telegram_channel_id,
+             ChannelTypes.TELEGRAM.value,
+             (self.telegram_bot_token, self.telegram_bot_chat_id,
+              self.telegram_channel_id, self.telegram_channel_name)),
+            commands.get(timeout=5))
+        self.assertEqual(
+            (ADD_DESTINATION, self.log_channel_id, ChannelTypes.LOG.value,
+             (self.log_channel_id, self.log_channel_name)),
+            commands.get(timeout=5))
+
+    @mock.patch.object(env, "CHANNEL_HANDLERS_DISPATCHER_MODE", True)
+    @mock.patch.object(multiprocessing.Process, "is_alive")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_terminating_a_dispatched_handler_removes_it_from_dispatcher(
+            self, mock_start, mock_is_alive) -> None:
+        mock_start.return_value = None
+        mock_is_alive.return_value = True
+        handler_type = ChannelHandlerTypes.ALERTS.value
+        self.test_manager._create_and_start_log_alerts_handler(
+            self.log_channel_id, self.log_channel_name)
+        process = self.test_manager.channel_process_dict[
+            self.log_channel_id][handler_type]['process']
+        commands = self.test_manager._dispatcher_commands
+        commands.get(timeout=5)
+
+        process.terminate()
+        process.join()
+
+        self.assertFalse(process.is_alive())
+        self.assertEqual((REMOVE_DESTINATION, self.log_channel_id),
+                         commands.get(timeout=5))
+
     @mock.patch.object(ChannelsManager, "_create_and_start_log_alerts_handler")
     @mock.patch.object(ChannelsManager,
                        "_create_and_start_console_alerts_handler")
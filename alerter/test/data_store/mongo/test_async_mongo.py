@@ -0,0 +1,97 @@
+import asyncio
+import logging
+import unittest
+
+from pymongo.errors import PyMongoError
+
+from src.data_store.mongo.async_mongo_api import AsyncMongoApi
+from src.data_store.mongo.mongo_api import MongoApi
+from src.utils import env
+from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME
+
+
+class TestAsyncMongoApiWithMongoOnline(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('dummy')
+        self.dummy_logger.disabled = True
+        self.db = env.DB_NAME
+        self.pool_size = 4
+        self.mongo = AsyncMongoApi(logger=self.dummy_logger, db_name=self.db,
+                                   host=REPLICA_SET_HOSTS,
+                                   replicaSet=REPLICA_SET_NAME,
+                                   pool_size=self.pool_size)
+        self.sync_mongo = MongoApi(logger=self.dummy_logger, db_name=self.db,
+                                   host=REPLICA_SET_HOSTS,
+                                   replicaSet=REPLICA_SET_NAME)
+
+        try:
+            self.sync_mongo.ping_unsafe()
+        except PyMongoError:
+            self.fail("Mongo is not online.")
+
+        # Clear test database
+        self.sync_mongo.drop_db()
+
+        self.col1 = 'collection1'
+        self.val1 = {'a': 'b', 'c': 'd'}
+        self.val2 = {'e': 'f', 'g': 'h'}
+
+    def tearDown(self) -> None:
+        self.sync_mongo.drop_db()
+        self.mongo.close()
+        self.dummy_logger = None
+        self.mongo = None
+        self.sync_mongo = None
+
+    def test_pool_size_returns_pool_size(self):
+        self.assertEqual(self.pool_size, self.mongo.pool_size)
+        self.assertEqual(self.db, self.mongo.db_name)
+
+    async def test_insert_one_inserts_value_into_collection(self):
+        await self.mongo.insert_one(self.col1, dict(self.val1))
+
+        documents = self.sync_mongo.get_all(self.col1)
+        self.assertEqual(1, len(documents))
+        self.assertEqual(self.val1['a'], documents[0]['a'])
+
+    async def test_update_one_upserts_document(self):
+        await self.mongo.update_one(self.col1, {'a': 'b'},
+                                    {'$set': {'c': 'x'}})
+
+        document = await self.mongo.get_one(self.col1, {'a': 'b'})
+        self.assertEqual('x', document['c'])
+
+    async def test_get_by_returns_list_of_matching_documents(self):
+        await self.mongo.insert_many(self.col1, [dict(self.val1),
+                                                 dict(self.val2)])
+
+        documents = await self.mongo.get_by(self.col1, {'e': 'f'})
+        self.assertIsInstance(documents, list)
+        self.assertEqual(1, len(documents))
+        self.assertEqual('h', documents[0]['g'])
+
+    async def test_operations_can_run_concurrently(self):
+        await asyncio.gather(*[
+            self.mongo.insert_one(self.col1, {'index': i}) for i in range(10)
+        ])
+        self.assertEqual(10, len(await self.mongo.get_all(self.col1)))
+
+
+class TestAsyncMongoApiWithMongoOffline(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('dummy')
+        self.dummy_logger.disabled = True
+        self.mongo = AsyncMongoApi(logger=self.dummy_logger,
+                                   db_name=env.DB_NAME, host='dummyhost',
+                                   timeout_ms=1)
+
+    def tearDown(self) -> None:
+        self.mongo.close()
+        self.dummy_logger = None
+        self.mongo = None
+
+    async def test_get_by_returns_none_and_sets_mongo_as_down(self):
+        self.assertIsNone(await self.mongo.get_by('collection', {}))
+        self.assertFalse(self.mongo.is_live)
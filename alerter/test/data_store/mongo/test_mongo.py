@@ -225,6 +225,14 @@ class TestMongoApiWithMongoOnline(unittest.TestCase):
         self.assertEqual(dict(get_result[1]), self.val2)
         self.assertEqual(dict(get_result[2]), self.val3)
 
+    def test_get_all_by_returns_a_list_of_the_matching_documents(self):
+        self.mongo._db[self.col1].insert_many([self.val1, self.val2, self.val3])
+
+        get_result = self.mongo.get_all_by(self.col1, {'e': 'f'})
+
+        self.assertIsInstance(get_result, list)
+        self.assertEqual([self.val2], [dict(doc) for doc in get_result])
+
     def test_drop_collection_deletes_the_specified_collection(self):
         # Check that col1 and col2 are empty
         get_result1 = list(self.mongo._db[self.col1].find({}))
@@ -251,6 +259,33 @@ class TestMongoApiWithMongoOnline(unittest.TestCase):
         self.assertEqual(len(get_result1), 0)
         self.assertEqual(len(get_result2), 1)
 
+    def test_delete_many_deletes_only_the_matching_documents(self):
+        self.mongo._db[self.col1].insert_many([self.val1, self.val2, self.val3])
+
+        self.mongo.delete_many(self.col1, {'_id': {'$in': [
+            self.val1['_id'], self.val2['_id']]}})
+
+        get_result = list(self.mongo._db[self.col1].find({}))
+        self.assertEqual(len(get_result), 1)
+        self.assertEqual(dict(get_result[0]), self.val3)
+
+    def test_copy_many_copies_matching_documents_and_can_be_repeated(self):
+        self.mongo._db[self.col1].insert_many([self.val1, self.val2, self.val3])
+        query = {'_id': {'$in': [self.val1['_id'], self.val2['_id']]}}
+
+        self.mongo.copy_many(self.col1, query, self.col2)
+        self.mongo.copy_many(self.col1, query, self.col2)
+
+        self.assertEqual(len(list(self.mongo._db[self.col1].find({}))), 3)
+        get_result = list(self.mongo._db[self.col2].find({}).sort('_id'))
+        self.assertEqual(len(get_result), 2)
+
+    def test_create_index_creates_the_index_on_the_collection(self):
+        name = self.mongo.create_index(self.col1, [('a', 1), ('b', 1)])
+
+        self.assertEqual('a_1_b_1', name)
+        self.assertIn(name, self.mongo._db[self.col1].index_information())
+
     def test_drop_db_deletes_all_collections(self):
         # Check that col1 and col2 are empty
         get_result1 = list(self.mongo._db[self.col1].find({}))
@@ -382,10 +417,26 @@ class TestMongoApiWithMongoOffline(unittest.TestCase):
         self.mongo._set_as_down()
         self.assertIsNone(self.mongo.get_all(self.col1))
 
+    def test_get_all_by_returns_none_if_mongo_already_down(self):
+        self.mongo._set_as_down()
+        self.assertIsNone(self.mongo.get_all_by(self.col1, {}))
+
     def test_drop_collection_returns_none_if_mongo_already_down(self):
         self.mongo._set_as_down()
         self.assertIsNone(self.mongo.drop_collection(self.col1))
 
+    def test_delete_many_returns_none_if_mongo_already_down(self):
+        self.mongo._set_as_down()
+        self.assertIsNone(self.mongo.delete_many(self.col1, {}))
+
+    def test_copy_many_returns_none_if_mongo_already_down(self):
+        self.mongo._set_as_down()
+        self.assertIsNone(self.mongo.copy_many(self.col1, {}, "archive"))
+
+    def test_create_index_returns_none_if_mongo_already_down(self):
+        self.mongo._set_as_down()
+        self.assertIsNone(self.mongo.create_index(self.col1, 'a'))
+
     def test_drop_db_returns_none_if_mongo_already_down(self):
         self.mongo._set_as_down()
         self.assertIsNone(self.mongo.drop_db())
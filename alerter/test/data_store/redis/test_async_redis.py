@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import unittest
+from datetime import timedelta
+from unittest.mock import patch
+
+from redis import ConnectionError as RedisConnectionError
+
+from src.data_store.redis.async_redis_api import AsyncRedisApi
+from src.data_store.redis.redis_api import RedisApi
+from src.utils import env
+
+REDIS_RECENTLY_DOWN_FUNCTION = \
+    'src.data_store.redis.redis_api.RedisApi._do_not_use_if_recently_went_down'
+
+
+class TestAsyncRedisApiWithRedisOnline(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('dummy')
+        self.dummy_logger.disabled = True
+        self.db = env.REDIS_DB
+        self.host = env.REDIS_IP
+        self.port = env.REDIS_PORT
+        self.namespace = 'testnamespace'
+        self.pool_size = 4
+        self.redis = AsyncRedisApi(logger=self.dummy_logger, db=self.db,
+                                   host=self.host, port=self.port,
+                                   namespace=self.namespace,
+                                   pool_size=self.pool_size)
+        self.sync_redis = RedisApi(logger=self.dummy_logger, db=self.db,
+                                   host=self.host, port=self.port,
+                                   namespace=self.namespace)
+
+        # Ping Redis
+        try:
+            self.sync_redis.ping_unsafe()
+        except RedisConnectionError:
+            self.fail('Redis is not online.')
+
+        self.sync_redis.delete_all_unsafe()
+
+        self.hash_name = 'dummy_hash'
+        self.key1 = 'key1'
+        self.key2 = 'key2'
+        self.val1 = 'val1'
+        self.val1_bytes = bytes('val1', encoding='utf8')
+        self.val2 = 'val2'
+        self.val2_bytes = bytes('val2', encoding='utf8')
+        self.default_str = 'DEFAULT'
+
+    def tearDown(self) -> None:
+        self.sync_redis.delete_all_unsafe()
+        self.redis.close()
+        self.dummy_logger = None
+        self.redis = None
+        self.sync_redis = None
+
+    def test_pool_size_returns_pool_size(self):
+        self.assertEqual(self.pool_size, self.redis.pool_size)
+        self.assertEqual(
+            self.pool_size,
+            self.redis._redis_api._redis.connection_pool.max_connections)
+
+    async def test_set_sets_the_specified_key_to_the_specified_value(self):
+        await self.redis.set(self.key1, self.val1)
+        self.assertEqual(self.val1_bytes, self.sync_redis.get(self.key1))
+
+    async def test_get_uses_namespace(self):
+        self.sync_redis._redis.set(self.namespace + ':' + self.key1, self.val1)
+        self.assertEqual(self.val1_bytes, await self.redis.get(self.key1))
+
+    async def test_hset_multiple_and_hget_round_trip(self):
+        await self.redis.hset_multiple(self.hash_name, {self.key1: self.val1,
+                                                        self.key2: None})
+        self.assertEqual(self.val1_bytes,
+                         await self.redis.hget(self.hash_name, self.key1))
+        self.assertIsNone(await self.redis.hget(self.hash_name, self.key2,
+                                                self.default_str))
+        self.assertTrue(await self.redis.hexists(self.hash_name, self.key2))
+
+    async def test_set_for_sets_a_time_to_live(self):
+        await self.redis.set_for(self.key1, self.val1, timedelta(seconds=60))
+        self.assertIsNotNone(await self.redis.time_to_live(self.key1))
+
+    async def test_remove_and_get_keys(self):
+        await self.redis.set_multiple({self.key1: self.val1,
+                                       self.key2: self.val2})
+        self.assertSetEqual({self.key1, self.key2},
+                            set(await self.redis.get_keys()))
+
+        await self.redis.remove(self.key1)
+        self.assertListEqual([self.key2], await self.redis.get_keys())
+
+    async def test_operations_can_run_concurrently(self):
+        keys = ['key{}'.format(i) for i in range(20)]
+        await asyncio.gather(*[self.redis.set(key, key) for key in keys])
+        values = await asyncio.gather(*[self.redis.get(key) for key in keys])
+
+        self.assertListEqual([bytes(key, encoding='utf8') for key in keys],
+                             values)
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    async def test_get_returns_default_if_redis_down(self, _):
+        self.sync_redis._redis.set(self.namespace + ':' + self.key1, self.val1)
+        self.assertEqual(self.default_str,
+                         await self.redis.get(self.key1, self.default_str))
+
+
+class TestAsyncRedisApiWithRedisOffline(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('dummy')
+        self.dummy_logger.disabled = True
+        self.redis = AsyncRedisApi(self.dummy_logger, env.REDIS_DB,
+                                   'dummyhost', 6379)
+
+    def tearDown(self) -> None:
+        self.redis.close()
+        self.dummy_logger = None
+        self.redis = None
+
+    async def test_get_returns_default_and_sets_redis_as_down(self):
+        self.assertEqual('DEFAULT', await self.redis.get('key', 'DEFAULT'))
+        self.assertFalse(self.redis.is_live)
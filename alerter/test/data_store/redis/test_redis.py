@@ -280,6 +280,48 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
     def test_hexists_unsafe_returns_false_if_not_exists(self):
         self.assertFalse(self.redis.hexists_unsafe(self.hash_name, self.key1))
 
+    def test_get_multiple_unsafe_returns_set_values_and_default_for_unset(
+            self):
+        self.redis.set_unsafe(self.key1, self.val1)
+        self.redis.set_unsafe(self.key2, 'None')
+        self.assertDictEqual(
+            self.redis.get_multiple_unsafe(
+                [self.key1, self.key2, self.key3], default=self.default_str),
+            {self.key1: self.val1_bytes, self.key2: None,
+             self.key3: self.default_str})
+
+    def test_get_multiple_unsafe_returns_empty_dict_if_no_keys_given(self):
+        self.assertDictEqual(self.redis.get_multiple_unsafe([]), {})
+
+    def test_hget_from_hashes_unsafe_returns_values_and_default_for_unset(
+            self):
+        hash_name2 = self.hash_name + '2'
+        hash_name3 = self.hash_name + '3'
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.redis.hset_unsafe(hash_name2, self.key1, 'None')
+        self.redis.hset_unsafe(hash_name3, self.key2, self.val2)
+        self.assertDictEqual(
+            self.redis.hget_from_hashes_unsafe(
+                [self.hash_name, hash_name2, hash_name3], self.key1,
+                default=self.default_str),
+            {self.hash_name: self.val1_bytes, hash_name2: None,
+             hash_name3: self.default_str})
+
+    def test_hget_from_hashes_unsafe_returns_empty_dict_if_no_hashes_given(
+            self):
+        self.assertDictEqual(
+            self.redis.hget_from_hashes_unsafe([], self.key1), {})
+
+    def test_smembers_unsafe_returns_empty_set_if_set_does_not_exist(self):
+        self.assertSetEqual(self.redis.smembers_unsafe(self.key1), set())
+
+    def test_sadd_unsafe_adds_values_to_set_only_once(self):
+        self.assertEqual(
+            self.redis.sadd_unsafe(self.key1, self.val1, self.val2), 2)
+        self.assertEqual(self.redis.sadd_unsafe(self.key1, self.val1), 0)
+        self.assertSetEqual(self.redis.smembers_unsafe(self.key1),
+                            {self.val1, self.val2})
+
     def test_get_keys_unsafe_returns_empty_list_if_no_keys(self):
         keys_list = self.redis.get_keys_unsafe()
         self.assertListEqual(keys_list, [])
@@ -318,6 +360,17 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
         keys_list = self.redis.get_keys_unsafe('aa*')
         self.assertSetEqual(set(keys_list), {prefixed_key1, prefixed_key3})
 
+    def test_scan_keys_unsafe_gets_only_keys_that_match_prefix_pattern(self):
+        prefixed_key1 = 'aaa' + self.key1
+        prefixed_key2 = 'bbb' + self.key2
+        prefixed_key3 = 'aa' + self.key3
+        self.redis.set_unsafe(prefixed_key1, self.val1)
+        self.redis.set_unsafe(prefixed_key2, self.val2)
+        self.redis.set_unsafe(prefixed_key3, self.val3_int)
+
+        keys_list = self.redis.scan_keys_unsafe('aa*')
+        self.assertSetEqual(set(keys_list), {prefixed_key1, prefixed_key3})
+
     def test_remove_unsafe_does_nothing_if_key_does_not_exists(self):
         self.redis.remove_unsafe(self.key1)
         self.assertFalse(self.redis.exists_unsafe(self.key1))
@@ -601,6 +654,53 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
         self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
         self.assertFalse(self.redis.hexists(self.hash_name, self.key1))
 
+    def test_get_multiple_returns_set_values_and_default_for_unset(self):
+        self.redis.set(self.key1, self.val1)
+        self.assertDictEqual(
+            self.redis.get_multiple([self.key1, self.key2],
+                                    default=self.default_str),
+            {self.key1: self.val1_bytes, self.key2: self.default_str})
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_get_multiple_returns_default_for_every_key_if_redis_down(self, _):
+        self.redis.set_unsafe(self.key1, self.val1)
+        self.assertDictEqual(
+            self.redis.get_multiple([self.key1, self.key2],
+                                    default=self.default_str),
+            {self.key1: self.default_str, self.key2: self.default_str})
+
+    def test_hget_from_hashes_returns_values_and_default_for_unset(self):
+        hash_name2 = self.hash_name + '2'
+        self.redis.hset(self.hash_name, self.key1, self.val1)
+        self.assertDictEqual(
+            self.redis.hget_from_hashes([self.hash_name, hash_name2],
+                                        self.key1, default=self.default_str),
+            {self.hash_name: self.val1_bytes, hash_name2: self.default_str})
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_hget_from_hashes_returns_default_for_every_hash_if_redis_down(
+            self, _):
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.assertDictEqual(
+            self.redis.hget_from_hashes([self.hash_name], self.key1,
+                                        default=self.default_str),
+            {self.hash_name: self.default_str})
+
+    def test_sadd_adds_values_to_set(self):
+        self.redis.sadd(self.key1, self.val1, self.val2)
+        self.assertSetEqual(self.redis.smembers(self.key1),
+                            {self.val1, self.val2})
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_sadd_returns_none_and_nothing_added_if_redis_down(self, _):
+        self.assertIsNone(self.redis.sadd(self.key1, self.val1))
+        self.assertSetEqual(self.redis.smembers_unsafe(self.key1), set())
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_smembers_returns_empty_set_if_redis_down(self, _):
+        self.redis.sadd_unsafe(self.key1, self.val1)
+        self.assertSetEqual(self.redis.smembers(self.key1), set())
+
     def test_get_keys_returns_empty_list_if_no_keys(self):
         keys_list = self.redis.get_keys()
         self.assertListEqual(keys_list, [])
@@ -685,6 +785,22 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
         self.assertIsNone(self.redis.hremove(self.hash_name, self.key1))
         self.assertTrue(self.redis.hexists_unsafe(self.hash_name, self.key1))
 
+    def test_hgetall_returns_empty_dict_if_hash_does_not_exist(self):
+        self.assertEqual({}, self.redis.hgetall(self.hash_name))
+
+    def test_hgetall_returns_all_fields_and_values_of_hash(self):
+        self.redis.hset_multiple(self.hash_name, {self.key1: self.val1,
+                                                  self.key2: self.val2})
+
+        self.assertEqual({self.key1: self.val1_bytes,
+                          self.key2: self.val2_bytes},
+                         self.redis.hgetall(self.hash_name))
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_hgetall_returns_none_if_redis_down(self, _):
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.assertIsNone(self.redis.hgetall(self.hash_name))
+
     def test_delete_all_does_nothing_if_no_keys_exist(self):
         self.redis.delete_all()
         self.assertEqual(0, len(self.redis.get_keys()))
@@ -815,6 +931,23 @@ class TestRedisApiWithRedisOffline(unittest.TestCase):
         self.assertRaises(RedisConnectionError, self.redis.hexists_unsafe,
                           self.hash_name, self.key)
 
+    def test_get_multiple_unsafe_throws_connection_exception(self):
+        self.assertRaises(RedisConnectionError, self.redis.get_multiple_unsafe,
+                          [self.key])
+
+    def test_hget_from_hashes_unsafe_throws_connection_exception(self):
+        self.assertRaises(RedisConnectionError,
+                          self.redis.hget_from_hashes_unsafe,
+                          [self.hash_name], self.key)
+
+    def test_sadd_unsafe_throws_connection_exception(self):
+        self.assertRaises(RedisConnectionError, self.redis.sadd_unsafe,
+                          self.key, self.val)
+
+    def test_smembers_unsafe_throws_connection_exception(self):
+        self.assertRaises(RedisConnectionError, self.redis.smembers_unsafe,
+                          self.key)
+
     def test_get_keys_unsafe_throws_connection_exception(self):
         self.assertRaises(RedisConnectionError, self.redis.get_keys_unsafe)
 
@@ -902,6 +1035,21 @@ class TestRedisApiWithRedisOffline(unittest.TestCase):
     def test_hexists_returns_false(self):
         self.assertFalse(self.redis.hexists(self.hash_name, self.key))
 
+    def test_get_multiple_returns_default_for_every_key(self):
+        self.assertDictEqual(self.redis.get_multiple([self.key]),
+                             {self.key: None})
+
+    def test_hget_from_hashes_returns_default_for_every_hash(self):
+        self.assertDictEqual(
+            self.redis.hget_from_hashes([self.hash_name], self.key),
+            {self.hash_name: None})
+
+    def test_sadd_returns_none(self):
+        self.assertIsNone(self.redis.sadd(self.key, self.val))
+
+    def test_smembers_returns_empty_set(self):
+        self.assertSetEqual(self.redis.smembers(self.key), set())
+
     def test_get_keys_returns_empty_list(self):
         self.assertListEqual(self.redis.get_keys(), [])
 
@@ -1037,6 +1185,293 @@ class TestRedisNamespaceWithRedisOnline(unittest.TestCase):
             self.val1_bytes)
 
 
+class TestRedisApiWriteBehindWithRedisOnline(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('dummy')
+        self.dummy_logger.disabled = True
+        self.db = env.REDIS_DB
+        self.host = env.REDIS_IP
+        self.port = env.REDIS_PORT
+        self.namespace = 'testnamespace'
+        self.write_behind_interval = timedelta(seconds=3600)
+        self.write_behind_batch_size = 4
+        self.redis = RedisApi(logger=self.dummy_logger, db=self.db,
+                              host=self.host, port=self.port,
+                              namespace=self.namespace,
+                              write_behind_interval=self.write_behind_interval,
+                              write_behind_batch_size=
+                              self.write_behind_batch_size)
+        self.reader = RedisApi(logger=self.dummy_logger, db=self.db,
+                               host=self.host, port=self.port,
+                               namespace=self.namespace)
+
+        # Ping Redis
+        try:
+            self.redis.ping_unsafe()
+        except RedisConnectionError:
+            self.fail('Redis is not online.')
+
+        self.redis.delete_all_unsafe()
+
+        # The first write is flushed immediately as the interval starts from
+        # the minimum datetime, so start every test with a flush
+        self.redis.flush_unsafe()
+
+        self.hash_name = 'dummy_hash'
+        self.hash_name_2 = 'dummy_hash_2'
+        self.key1 = 'key1'
+        self.key2 = 'key2'
+        self.val1 = 'val1'
+        self.val1_bytes = bytes('val1', encoding='utf8')
+        self.val2 = 'val2'
+        self.val2_bytes = bytes('val2', encoding='utf8')
+
+    def tearDown(self) -> None:
+        self.dummy_logger = None
+        self.redis.delete_all_unsafe()
+        self.redis = None
+        self.reader = None
+
+    def test_write_behind_enabled_returns_true_if_interval_given(self):
+        self.assertTrue(self.redis.write_behind_enabled)
+        self.assertFalse(self.reader.write_behind_enabled)
+
+    def test_hset_multiple_buffers_writes_until_flush(self):
+        self.redis.hset_multiple(self.hash_name, {self.key1: self.val1,
+                                                  self.key2: self.val2})
+
+        self.assertEqual(2, self.redis.pending_writes)
+        self.assertIsNone(self.reader.hget(self.hash_name, self.key1))
+
+        self.redis.flush()
+
+        self.assertEqual(0, self.redis.pending_writes)
+        self.assertEqual(self.val1_bytes,
+                         self.reader.hget(self.hash_name, self.key1))
+        self.assertEqual(self.val2_bytes,
+                         self.reader.hget(self.hash_name, self.key2))
+
+    def test_hset_coalesces_writes_to_the_same_field(self):
+        self.redis.hset(self.hash_name, self.key1, self.val1)
+        self.redis.hset_multiple(self.hash_name, {self.key1: self.val2})
+
+        self.assertEqual(1, self.redis.pending_writes)
+        self.redis.flush()
+        self.assertEqual(self.val2_bytes,
+                         self.reader.hget(self.hash_name, self.key1))
+
+    def test_hset_multiple_stores_none_as_none_string(self):
+        self.redis.hset_multiple(self.hash_name, {self.key1: None})
+        self.redis.flush()
+
+        self.assertEqual(b'None', self.redis._redis.hget(
+            self.namespace + ':' + self.hash_name, self.key1))
+
+    def test_hset_multiple_flushes_once_batch_size_reached(self):
+        self.redis.hset_multiple(self.hash_name, {self.key1: self.val1,
+                                                  self.key2: self.val2})
+        self.redis.hset_multiple(self.hash_name_2, {self.key1: self.val1,
+                                                    self.key2: self.val2})
+
+        self.assertEqual(0, self.redis.pending_writes)
+        self.assertEqual(self.val2_bytes,
+                         self.reader.hget(self.hash_name_2, self.key2))
+
+    def test_hset_multiple_flushes_once_interval_elapsed(self):
+        self.redis._write_behind_limiter.reset()
+        self.redis.hset_multiple(self.hash_name, {self.key1: self.val1})
+
+        self.assertEqual(0, self.redis.pending_writes)
+        self.assertEqual(self.val1_bytes,
+                         self.reader.hget(self.hash_name, self.key1))
+
+    def test_hremove_discards_buffered_writes_of_removed_fields(self):
+        self.redis.hset_multiple(self.hash_name, {self.key1: self.val1,
+                                                  self.key2: self.val2})
+        self.redis.hremove(self.hash_name, self.key1)
+        self.redis.flush()
+
+        self.assertEqual(1, len(self.reader.hkeys(self.hash_name)))
+        self.assertIsNone(self.reader.hget(self.hash_name, self.key1))
+
+    def test_remove_discards_buffered_writes_of_removed_hashes(self):
+        self.redis.hset_multiple(self.hash_name, {self.key1: self.val1})
+        self.redis.remove(self.hash_name)
+        self.redis.flush()
+
+        self.assertEqual(0, self.redis.pending_writes)
+        self.assertFalse(self.reader.exists(self.hash_name))
+
+    def test_hgetall_includes_buffered_writes(self):
+        self.reader.hset(self.hash_name, self.key1, self.val1)
+        self.redis.hset_multiple(self.hash_name, {self.key1: self.val2,
+                                                  self.key2: 123})
+
+        self.assertEqual({self.key1: self.val2_bytes, self.key2: b'123'},
+                         self.redis.hgetall(self.hash_name))
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_flush_keeps_buffered_writes_if_redis_down(self, _):
+        self.redis.hset_multiple(self.hash_name, {self.key1: self.val1})
+        self.redis.flush()
+
+        self.assertEqual(1, self.redis.pending_writes)
+
+
+class TestRedisApiReadCacheWithRedisOnline(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('dummy')
+        self.dummy_logger.disabled = True
+        self.db = env.REDIS_DB
+        self.host = env.REDIS_IP
+        self.port = env.REDIS_PORT
+        self.namespace = 'testnamespace'
+        self.read_cache_size = 3
+        self.read_cache_ttl = timedelta(seconds=3600)
+        self.redis = RedisApi(logger=self.dummy_logger, db=self.db,
+                              host=self.host, port=self.port,
+                              namespace=self.namespace,
+                              read_cache_size=self.read_cache_size,
+                              read_cache_ttl=self.read_cache_ttl)
+        self.writer = RedisApi(logger=self.dummy_logger, db=self.db,
+                               host=self.host, port=self.port,
+                               namespace=self.namespace)
+
+        # Ping Redis
+        try:
+            self.redis.ping_unsafe()
+        except RedisConnectionError:
+            self.fail('Redis is not online.')
+
+        self.writer.delete_all_unsafe()
+
+        self.hash_name = 'dummy_hash'
+        self.key1 = 'key1'
+        self.key2 = 'key2'
+        self.key3 = 'key3'
+        self.key4 = 'key4'
+        self.val1 = 'val1'
+        self.val1_bytes = bytes('val1', encoding='utf8')
+        self.val2 = 'val2'
+        self.val2_bytes = bytes('val2', encoding='utf8')
+
+    def tearDown(self) -> None:
+        self.dummy_logger = None
+        self.writer.delete_all_unsafe()
+        self.redis._stop_tracking()
+        self.redis = None
+        self.writer = None
+
+    def _wait_for_invalidations(self) -> None:
+        # Invalidation messages are pushed asynchronously by Redis
+        sleep(0.2)
+
+    def test_read_cache_enabled_returns_true_if_size_given(self):
+        self.assertTrue(self.redis.read_cache_enabled)
+        self.assertFalse(self.writer.read_cache_enabled)
+
+    def test_get_caches_the_value_read(self):
+        self.writer.set(self.key1, self.val1)
+
+        self.assertEqual(self.val1_bytes, self.redis.get(self.key1))
+        self.assertEqual(1, self.redis.read_cache_entries)
+
+        # Ignore invalidations to check that the cached value is returned
+        self.redis._invalidations.get_message = lambda: None
+        self.writer.set(self.key1, self.val2)
+        self.assertEqual(self.val1_bytes, self.redis.get(self.key1))
+
+    def test_get_returns_default_for_unset_key(self):
+        self.assertEqual(b'default', self.redis.get(self.key1, b'default'))
+        self.assertFalse(self.redis.exists(self.key1))
+
+    def test_get_returns_none_for_none_string(self):
+        self.writer.set(self.key1, 'None')
+        self.assertIsNone(self.redis.get(self.key1, b'default'))
+
+    def test_get_returns_new_value_after_write_by_another_client(self):
+        self.writer.set(self.key1, self.val1)
+        self.assertEqual(self.val1_bytes, self.redis.get(self.key1))
+
+        self.writer.set(self.key1, self.val2)
+        self._wait_for_invalidations()
+
+        self.assertEqual(self.val2_bytes, self.redis.get(self.key1))
+
+    def test_get_returns_default_after_removal_by_another_client(self):
+        self.writer.set(self.key1, self.val1)
+        self.assertTrue(self.redis.exists(self.key1))
+
+        self.writer.remove(self.key1)
+        self._wait_for_invalidations()
+
+        self.assertFalse(self.redis.exists(self.key1))
+        self.assertIsNone(self.redis.get(self.key1))
+
+    def test_hget_returns_new_value_after_write_by_another_client(self):
+        self.writer.hset(self.hash_name, self.key1, self.val1)
+        self.assertEqual(self.val1_bytes,
+                         self.redis.hget(self.hash_name, self.key1))
+        self.assertTrue(self.redis.hexists(self.hash_name, self.key1))
+
+        self.writer.hset(self.hash_name, self.key1, self.val2)
+        self._wait_for_invalidations()
+
+        self.assertEqual(self.val2_bytes,
+                         self.redis.hget(self.hash_name, self.key1))
+
+    def test_own_writes_invalidate_the_cache_immediately(self):
+        self.redis.set(self.key1, self.val1)
+        self.assertEqual(self.val1_bytes, self.redis.get(self.key1))
+
+        self.redis.set(self.key1, self.val2)
+        self.assertEqual(self.val2_bytes, self.redis.get(self.key1))
+
+        self.redis.hset(self.hash_name, self.key1, self.val1)
+        self.assertEqual(self.val1_bytes,
+                         self.redis.hget(self.hash_name, self.key1))
+
+        self.redis.hremove(self.hash_name, self.key1)
+        self.assertIsNone(self.redis.hget(self.hash_name, self.key1))
+
+    def test_read_cache_evicts_least_recently_used_entries(self):
+        for key in [self.key1, self.key2, self.key3, self.key4]:
+            self.writer.set(key, self.val1)
+            self.redis.get(key)
+
+        self.assertEqual(self.read_cache_size, self.redis.read_cache_entries)
+        self.assertNotIn((self.namespace + ':' + self.key1, None),
+                         self.redis._read_cache)
+
+    def test_read_cache_entries_expire_after_ttl(self):
+        self.redis._read_cache_ttl_seconds = 0.1
+        self.writer.set(self.key1, self.val1)
+        self.redis.get(self.key1)
+
+        # Make sure that invalidations cannot refresh the value
+        self.redis._invalidations.get_message = lambda: None
+        self.writer._redis.set(self.namespace + ':' + self.key1, self.val2)
+        sleep(0.2)
+
+        self.assertEqual(self.val2_bytes, self.redis.get(self.key1))
+
+    def test_read_cache_cleared_on_flush_by_another_client(self):
+        self.writer.set(self.key1, self.val1)
+        self.redis.get(self.key1)
+
+        self.writer.delete_all()
+        self._wait_for_invalidations()
+
+        self.assertIsNone(self.redis.get(self.key1))
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_get_returns_default_if_redis_down(self, _):
+        self.writer._redis.set(self.namespace + ':' + self.key1, self.val1)
+        self.assertEqual(b'default', self.redis.get(self.key1, b'default'))
+
+
 class TestRedisApiLiveAndDownFeaturesWithRedisOffline(unittest.TestCase):
 
     def setUp(self) -> None:
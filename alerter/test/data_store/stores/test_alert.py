@@ -921,6 +921,82 @@ class TestAlertStore(unittest.TestCase):
         )
         mock_update_one.assert_has_calls([call_1])
 
+    @mock.patch.object(MongoApi, "update_one")
+    @mock.patch.object(MongoApi, "create_index")
+    def test_process_mongo_store_creates_indexes_once_per_collection(
+            self, mock_create_index, mock_update_one) -> None:
+        mock_create_index.return_value = 'index_name'
+        self.test_store._process_mongo_store(self.alert_data_1)
+        self.test_store._process_mongo_store(self.alert_data_1)
+
+        self.assertEqual(4, mock_create_index.call_count)
+        mock_create_index.assert_any_call(
+            self.alert_data_1['parent_id'], [('doc_type', 1), ('last', 1)])
+        mock_create_index.assert_any_call(
+            self.alert_data_1['parent_id'], [('alerts.origin', 1)])
+        self.assertEqual(2, mock_update_one.call_count)
+
+    @mock.patch.object(MongoApi, "update_one")
+    @mock.patch.object(MongoApi, "create_index")
+    def test_process_mongo_store_retries_indexes_if_mongo_is_down(
+            self, mock_create_index, mock_update_one) -> None:
+        mock_create_index.return_value = None
+        self.test_store._process_mongo_store(self.alert_data_1)
+        self.test_store._process_mongo_store(self.alert_data_1)
+
+        self.assertEqual(2, mock_create_index.call_count)
+        self.assertEqual(2, mock_update_one.call_count)
+
+    @mock.patch.object(MongoApi, "delete_many")
+    def test_apply_alerts_retention_does_nothing_if_retention_disabled(
+            self, mock_delete_many) -> None:
+        self.test_store._alerts_retention_period = timedelta(0)
+        self.test_store._apply_alerts_retention(self.parent_id)
+        mock_delete_many.assert_not_called()
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(MongoApi, "copy_many")
+    @mock.patch.object(MongoApi, "delete_many")
+    def test_apply_alerts_retention_deletes_expired_documents_once_per_hour(
+            self, mock_delete_many, mock_copy_many) -> None:
+        self.test_store._alerts_retention_period = timedelta(days=30)
+        self.test_store._archive_expired_alerts = False
+        self.test_store._apply_alerts_retention(self.parent_id)
+        self.test_store._apply_alerts_retention(self.parent_id)
+
+        cutoff = (datetime.now() - timedelta(days=30)).timestamp()
+        mock_delete_many.assert_called_once_with(
+            self.parent_id, {'doc_type': 'alert', 'last': {'$lt': cutoff}})
+        mock_copy_many.assert_not_called()
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(MongoApi, "copy_many")
+    @mock.patch.object(MongoApi, "delete_many")
+    def test_apply_alerts_retention_archives_before_deleting(
+            self, mock_delete_many, mock_copy_many) -> None:
+        self.test_store._alerts_retention_period = timedelta(days=30)
+        self.test_store._archive_expired_alerts = True
+        self.test_store._apply_alerts_retention(self.parent_id)
+
+        cutoff = (datetime.now() - timedelta(days=30)).timestamp()
+        query = {'doc_type': 'alert', 'last': {'$lt': cutoff}}
+        mock_copy_many.assert_called_once_with(
+            self.parent_id, query, self.parent_id + '_alerts_archive')
+        mock_delete_many.assert_called_once_with(self.parent_id, query)
+
+    @mock.patch.object(MongoApi, "copy_many")
+    @mock.patch.object(MongoApi, "delete_many")
+    def test_apply_alerts_retention_does_not_delete_if_archiving_failed(
+            self, mock_delete_many, mock_copy_many) -> None:
+        mock_copy_many.return_value = None
+        self.test_store._alerts_retention_period = timedelta(days=30)
+        self.test_store._archive_expired_alerts = True
+        self.test_store._apply_alerts_retention(self.parent_id)
+        self.test_store._apply_alerts_retention(self.parent_id)
+
+        self.assertEqual(2, mock_copy_many.call_count)
+        mock_delete_many.assert_not_called()
+
     @parameterized.expand([
         ("self.alert_data_1",),
         ("self.alert_data_2",),
@@ -985,6 +1061,123 @@ class TestAlertStore(unittest.TestCase):
         self.assertFalse(self.redis.hexists(chain_hash_1, metric_key_1))
         self.assertFalse(self.redis.hexists(chain_hash_2, metric_key_2))
 
+    def test_process_redis_store_adds_problems_to_alerts_overview(
+            self) -> None:
+        self.test_store._process_redis_store(self.alert_data_9)
+        overview_hash = Keys.get_hash_alerts_overview(self.parent_id)
+        chain_hash = Keys.get_hash_parent(self.parent_id)
+        key = Keys.get_alert_system_cpu_usage(self.origin_id_9)
+
+        self.assertEqual(self.redis.hget(chain_hash, key),
+                         self.redis.hget(overview_hash, key))
+
+    def test_process_redis_store_removes_info_alerts_from_alerts_overview(
+            self) -> None:
+        info_alert = copy.deepcopy(self.alert_data_9)
+        info_alert['severity'] = self.info
+        self.test_store._process_redis_store(self.alert_data_9)
+        self.test_store._process_redis_store(info_alert)
+        overview_hash = Keys.get_hash_alerts_overview(self.parent_id)
+        chain_hash = Keys.get_hash_parent(self.parent_id)
+        key = Keys.get_alert_system_cpu_usage(self.origin_id_9)
+
+        self.assertTrue(self.redis.hexists(chain_hash, key))
+        self.assertFalse(self.redis.hexists(overview_hash, key))
+
+    def test_process_redis_store_keeps_info_releases_in_alerts_overview(
+            self) -> None:
+        self.alert_data_github_1['severity'] = self.info
+        self.test_store._process_redis_store(self.alert_data_github_1)
+        overview_hash = Keys.get_hash_alerts_overview(self.parent_id)
+        key = Keys.get_alert_github_release(self.origin_id)
+
+        self.assertTrue(self.redis.hexists(overview_hash, key))
+
+    def test_process_redis_store_rebuilds_alerts_overview_from_chain_hash(
+            self) -> None:
+        chain_hash = Keys.get_hash_parent(self.parent_id)
+        overview_hash = Keys.get_hash_alerts_overview(self.parent_id)
+        problem_key = Keys.get_alert_system_ram_usage(self.origin_id_9)
+        problem = json.dumps({'severity': self.critical})
+        info_key = Keys.get_alert_system_is_down(self.origin_id_9)
+        self.redis.hset_multiple(chain_hash, {
+            problem_key: problem,
+            info_key: json.dumps({'severity': self.info}),
+            Keys.get_system_last_monitored(self.origin_id_9): 1.0,
+        })
+        self.redis.hset(overview_hash, info_key, 'stale')
+
+        self.test_store._process_redis_store(self.alert_data_9)
+
+        self.assertEqual(
+            sorted([problem_key,
+                    Keys.get_alert_system_cpu_usage(self.origin_id_9)]),
+            sorted(self.redis.hkeys(overview_hash)))
+        self.assertEqual(problem.encode(),
+                         self.redis.hget(overview_hash, problem_key))
+
+    def test_rebuild_all_alerts_overviews_rebuilds_every_chain(self) -> None:
+        # Only the first chain is in the registry of chain hashes
+        problem = json.dumps({'severity': self.critical})
+        problem_key = Keys.get_alert_system_ram_usage(self.origin_id_9)
+        for parent_id in [self.parent_id, self.parent_id2]:
+            self.redis.hset(Keys.get_hash_parent(parent_id), problem_key,
+                            problem)
+        self.redis.sadd(Keys.get_set_chain_hashes(),
+                        Keys.get_hash_parent(self.parent_id))
+
+        self.test_store._rebuild_all_alerts_overviews()
+
+        for parent_id in [self.parent_id, self.parent_id2]:
+            self.assertEqual(problem.encode(), self.redis.hget(
+                Keys.get_hash_alerts_overview(parent_id), problem_key))
+        self.assertEqual(
+            {Keys.get_hash_parent(self.parent_id),
+             Keys.get_hash_parent(self.parent_id2)},
+            self.redis.smembers(Keys.get_set_chain_hashes()))
+        self.assertTrue(
+            self.redis.exists(Keys.get_chain_hashes_backfilled()))
+
+    @mock.patch.object(RedisApi, "scan_keys")
+    def test_rebuild_all_alerts_overviews_scans_keyspace_only_once(
+            self, mock_scan_keys) -> None:
+        mock_scan_keys.return_value = []
+
+        self.test_store._rebuild_all_alerts_overviews()
+        self.test_store._rebuild_all_alerts_overviews()
+
+        mock_scan_keys.assert_called_once_with(Keys.get_hash_parent('') + '*')
+
+    @mock.patch.object(RedisApi, "scan_keys")
+    def test_rebuild_all_alerts_overviews_scans_again_if_scan_failed(
+            self, mock_scan_keys) -> None:
+        mock_scan_keys.return_value = None
+
+        self.test_store._rebuild_all_alerts_overviews()
+
+        self.assertFalse(
+            self.redis.exists(Keys.get_chain_hashes_backfilled()))
+
+    @mock.patch("src.data_store.stores.store.Store.start")
+    @mock.patch.object(AlertStore, "_rebuild_all_alerts_overviews")
+    def test_start_rebuilds_all_alerts_overviews_first(
+            self, mock_rebuild, mock_start) -> None:
+        self.test_store.start()
+
+        mock_rebuild.assert_called_once_with()
+        mock_start.assert_called_once_with()
+
+    def test_process_redis_store_removes_reset_alerts_from_alerts_overview(
+            self) -> None:
+        self.test_store._process_redis_store(self.alert_data_9)
+        overview_hash = Keys.get_hash_alerts_overview(self.parent_id)
+        key = Keys.get_alert_system_cpu_usage(self.origin_id_9)
+        self.assertTrue(self.redis.hexists(overview_hash, key))
+
+        self.test_store._process_redis_store(self.alert_internal_system_chain)
+
+        self.assertFalse(self.redis.hexists(overview_hash, key))
+
     def test_process_redis_store_system_removes_all_system_metrics_for_chain(
             self) -> None:
         # First set metrics for different chains and check that they were set
@@ -268,6 +268,70 @@ class TestSystemStore(unittest.TestCase):
     def test_mongo_property_returns_mongo_when_store_exists(self) -> None:
         self.assertEqual(type(self.mongo), type(self.test_store.mongo))
 
+    @mock.patch("src.data_store.stores.store.RabbitMQApi.basic_ack",
+                autospec=True)
+    def test_acknowledge_acks_immediately_if_write_behind_disabled(
+            self, mock_ack) -> None:
+        self.test_store._acknowledge(5)
+        mock_ack.assert_called_once_with(self.rabbitmq, 5, False)
+
+    @mock.patch("src.data_store.stores.store.RabbitMQApi.connection",
+                new_callable=mock.PropertyMock)
+    @mock.patch("src.data_store.stores.store.RabbitMQApi.basic_ack",
+                autospec=True)
+    def test_acknowledge_defers_ack_until_writes_flushed_if_write_behind(
+            self, mock_ack, mock_connection) -> None:
+        self.test_store._redis = RedisApi(
+            self.dummy_logger, self.redis_db, self.redis_host,
+            self.redis_port, '', self.redis_namespace,
+            self.connection_check_time_interval,
+            write_behind_interval=timedelta(seconds=3600))
+        self.test_store.redis.flush()
+        self.test_store.redis.hset_multiple(self.parent_id,
+                                            {self.system_id: 'value'})
+
+        self.test_store._acknowledge(5)
+        self.test_store._acknowledge(6)
+
+        # A single flush is scheduled and nothing is acked before it runs
+        mock_ack.assert_not_called()
+        mock_connection.return_value.call_later.assert_called_once_with(
+            3600, self.test_store._flush_redis_and_ack)
+
+        self.test_store._flush_redis_and_ack()
+
+        mock_ack.assert_called_once_with(self.rabbitmq, 6, True)
+        self.assertEqual(0, self.test_store.redis.pending_writes)
+        self.assertEqual(b'value', self.redis.hget(self.parent_id,
+                                                   self.system_id))
+
+    @mock.patch.object(RedisApi, "flush_unsafe")
+    @mock.patch("src.data_store.stores.store.RabbitMQApi.connection",
+                new_callable=mock.PropertyMock)
+    @mock.patch("src.data_store.stores.store.RabbitMQApi.basic_ack",
+                autospec=True)
+    def test_flush_redis_and_ack_keeps_messages_unacked_if_flush_fails(
+            self, mock_ack, mock_connection, mock_flush) -> None:
+        mock_flush.side_effect = Exception('test')
+        self.test_store._redis = RedisApi(
+            self.dummy_logger, self.redis_db, self.redis_host,
+            self.redis_port, '', self.redis_namespace,
+            self.connection_check_time_interval,
+            write_behind_interval=timedelta(seconds=3600))
+        self.test_store.redis.hset_multiple(self.parent_id,
+                                            {self.system_id: 'value'})
+        self.test_store._acknowledge(5)
+
+        self.test_store._flush_redis_and_ack()
+
+        # The messages are not acked and another flush is scheduled
+        mock_ack.assert_not_called()
+        self.assertEqual(1, self.test_store.redis.pending_writes)
+        self.assertEqual(5, self.test_store._unacked_delivery_tag)
+        self.assertEqual(
+            [call(3600, self.test_store._flush_redis_and_ack)] * 2,
+            mock_connection.return_value.call_later.call_args_list)
+
     def test_initialise_rabbitmq_initialises_everything_as_expected(
             self) -> None:
         try:
@@ -385,6 +449,36 @@ class TestSystemStore(unittest.TestCase):
                           self.test_store._process_redis_store,
                           self.system_data_unexpected)
 
+    @parameterized.expand([
+        ("self.system_data_1",),
+        ("self.system_data_error",),
+    ])
+    def test_process_redis_store_registers_the_chain_hash(
+            self, mock_system_data) -> None:
+        self.redis.delete_all_unsafe()
+
+        self.test_store._process_redis_store(eval(mock_system_data))
+
+        self.assertEqual(
+            {Keys.get_hash_parent(self.parent_id)},
+            self.redis.smembers_unsafe(Keys.get_set_chain_hashes()))
+
+    @mock.patch.object(RedisApi, "sadd")
+    def test_process_redis_store_registers_a_chain_once_per_interval(
+            self, mock_sadd) -> None:
+        mock_sadd.return_value = 1
+
+        with freeze_time(datetime.now()) as frozen_time:
+            self.test_store._process_redis_store(self.system_data_1)
+            self.test_store._process_redis_store(self.system_data_2)
+            mock_sadd.assert_called_once_with(
+                Keys.get_set_chain_hashes(),
+                Keys.get_hash_parent(self.parent_id))
+
+            frozen_time.tick(timedelta(minutes=5))
+            self.test_store._process_redis_store(self.system_data_1)
+            self.assertEqual(2, mock_sadd.call_count)
+
     @parameterized.expand([
         ("self.system_data_1",),
         ("self.system_data_2",),
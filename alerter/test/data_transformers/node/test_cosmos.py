@@ -1258,6 +1258,40 @@ class TestCosmosNodeDataTransformer(unittest.TestCase):
             ReceivedUnexpectedDataException,
             self.test_data_transformer._transform_data, raw_data)
 
+    @mock.patch.object(CosmosNodeDataTransformer,
+                       "_process_transformed_data_for_alerting")
+    @mock.patch.object(CosmosNodeDataTransformer,
+                       "_process_transformed_data_for_saving")
+    def test_transform_data_records_missed_heights_only_on_state_update(
+            self, mock_proc_saving, mock_proc_alerting) -> None:
+        mock_proc_saving.return_value = {}
+        mock_proc_alerting.return_value = {}
+        self.node_1.reset()
+        self.test_data_transformer._state = copy.deepcopy(self.test_state)
+        node = self.test_data_transformer.state[self.node_1.node_id]
+
+        # If the state is not updated, for example because processing failed,
+        # the same heights are counted again when they are received again
+        first_transformed_data, _, _ = \
+            self.test_data_transformer._transform_data(
+                self.raw_data_example_result_all)
+        second_transformed_data, _, _ = \
+            self.test_data_transformer._transform_data(
+                self.raw_data_example_result_all)
+        self.assertEqual(0, node.missed_blocks_window.no_of_missed)
+        self.assertEqual(first_transformed_data['tendermint_rpc'],
+                         second_transformed_data['tendermint_rpc'])
+
+        self.test_data_transformer._update_state(second_transformed_data)
+        third_transformed_data, _, _ = \
+            self.test_data_transformer._transform_data(
+                self.raw_data_example_result_all)
+
+        self.assertEqual(2, node.missed_blocks_window.no_of_missed)
+        self.assertEqual({'total_count': 2, 'missed_heights': []},
+                         third_transformed_data['tendermint_rpc']['result'][
+                             'data']['missed_blocks'])
+
     @parameterized.expand([
         ('self.processed_data_example_general_error',
          'self.transformed_data_example_general_error'),
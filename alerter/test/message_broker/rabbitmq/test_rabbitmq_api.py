@@ -1013,6 +1013,37 @@ class TestRabbitMQApi(TestCase):
             [100, True, False], -1
         )
 
+    @parameterized.expand([(0,), (None,), (1,), (-1,)])
+    @mock.patch.object(RabbitMQApi, "channel", new_callable=PropertyMock)
+    @mock.patch.object(RabbitMQApi, "_connection_initialised", autospec=True)
+    @mock.patch.object(RabbitMQApi, "_safe", autospec=True)
+    def test_basic_cancel_returns_same_if_successful(
+            self, expected_output: Optional[int], mock_safe: MagicMock,
+            mock_connection_initialised: MagicMock, mock_channel: PropertyMock
+
+    ):
+        mock_channel.return_value.basic_cancel.return_value = False
+        mock_safe.return_value = expected_output
+        mock_connection_initialised.return_value = True
+        self.assertEqual(expected_output, self.rabbit.basic_cancel(
+            consumer_tag='test_consumer_tag'))
+        mock_connection_initialised.assert_called_once_with(self.rabbit)
+        mock_safe.assert_called_once_with(
+            self.rabbit, mock_channel.return_value.basic_cancel,
+            ['test_consumer_tag'], -1
+        )
+
+    @mock.patch.object(RabbitMQApi, "_connection_initialised", autospec=True)
+    @mock.patch.object(RabbitMQApi, "_safe", autospec=True)
+    def test_basic_cancel_does_nothing_if_not_connection_initialised(
+            self, mock_safe: MagicMock, mock_connection_initialised: MagicMock
+    ):
+        mock_connection_initialised.return_value = False
+        self.assertIsNone(
+            self.rabbit.basic_cancel(consumer_tag='test_consumer_tag'))
+        mock_connection_initialised.assert_called_once_with(self.rabbit)
+        mock_safe.assert_not_called()
+
     @parameterized.expand([(0,), (None,), (1,), (-1,)])
     @mock.patch.object(RabbitMQApi, "channel", new_callable=PropertyMock)
     @mock.patch.object(RabbitMQApi, "_connection_initialised", autospec=True)
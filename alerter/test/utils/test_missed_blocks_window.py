@@ -0,0 +1,86 @@
+import unittest
+
+from parameterized import parameterized
+
+from src.utils.missed_blocks_window import MissedBlocksWindow
+
+
+class TestMissedBlocksWindow(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_size = 5
+        self.window = MissedBlocksWindow(self.test_size)
+
+    @parameterized.expand([(0,), (-1,)])
+    def test_init_raises_value_error_if_size_is_not_positive(
+            self, size: int) -> None:
+        self.assertRaises(ValueError, MissedBlocksWindow, size)
+
+    def test_init_creates_an_empty_window(self) -> None:
+        self.assertEqual(self.test_size, self.window.size)
+        self.assertIsNone(self.window.last_height)
+        self.assertEqual(0, self.window.no_of_missed)
+
+    def test_record_counts_missed_heights_only(self) -> None:
+        self.assertTrue(self.window.record(100, True))
+        self.assertTrue(self.window.record(101, False))
+        self.assertTrue(self.window.record(102, True))
+
+        self.assertEqual(102, self.window.last_height)
+        self.assertEqual(2, self.window.no_of_missed)
+
+    def test_record_accepts_heights_in_decreasing_order_within_window(
+            self) -> None:
+        for height in [104, 103, 102, 101, 100]:
+            self.assertTrue(self.window.record(height, True))
+
+        self.assertEqual(104, self.window.last_height)
+        self.assertEqual(5, self.window.no_of_missed)
+
+    @parameterized.expand([(True,), (False,)])
+    def test_record_returns_false_if_height_already_recorded(
+            self, missed: bool) -> None:
+        self.window.record(100, True)
+        self.window.record(101, False)
+
+        self.assertFalse(self.window.record(100, missed))
+        self.assertFalse(self.window.record(101, missed))
+        self.assertEqual(1, self.window.no_of_missed)
+
+    def test_record_returns_true_for_heights_older_than_window(self) -> None:
+        self.window.record(100, True)
+
+        self.assertTrue(self.window.record(95, True))
+        self.assertEqual(1, self.window.no_of_missed)
+
+    def test_record_drops_heights_which_leave_the_window(self) -> None:
+        for height in range(100, 105):
+            self.window.record(height, True)
+        self.window.record(106, False)
+
+        # Heights 100 and 101 left the window
+        self.assertEqual(3, self.window.no_of_missed)
+        self.assertTrue(self.window.record(101, True))
+        self.assertEqual(3, self.window.no_of_missed)
+
+    def test_record_clears_the_window_after_a_long_catch_up(self) -> None:
+        for height in range(100, 105):
+            self.window.record(height, True)
+
+        self.assertTrue(self.window.record(1000000, False))
+        self.assertEqual(1000000, self.window.last_height)
+        self.assertEqual(0, self.window.no_of_missed)
+
+    def test_reset_empties_the_window(self) -> None:
+        self.window.record(100, True)
+        self.window.reset()
+
+        self.assertEqual(MissedBlocksWindow(self.test_size), self.window)
+        self.assertTrue(self.window.record(100, True))
+
+    def test_windows_equal_if_same_recorded_heights(self) -> None:
+        other_window = MissedBlocksWindow(self.test_size)
+        self.window.record(100, True)
+        self.assertNotEqual(self.window, other_window)
+
+        other_window.record(100, True)
+        self.assertEqual(self.window, other_window)
@@ -0,0 +1,55 @@
+import unittest
+
+from parameterized import parameterized
+
+from src.utils.routing_key import (
+    get_alerter_worker_index, get_alerter_worker_routing_key,
+    get_alerter_worker_queue_name, get_alerter_worker_name)
+
+
+class TestRoutingKey(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_parent_id = 'chain_name_d21d780d-92cb-42de-a7c1-11b751654510'
+        self.test_routing_key = 'transformed_data.node.cosmos'
+        self.test_queue_name = 'cosmos_node_alerter_input_configs_queue'
+        self.test_alerter_name = 'Cosmos Node Alerter'
+
+    @parameterized.expand([(1,), (2,), (5,)])
+    def test_get_alerter_worker_index_returns_a_stable_valid_index(
+            self, no_of_workers: int) -> None:
+        worker_index = get_alerter_worker_index(self.test_parent_id,
+                                                no_of_workers)
+
+        self.assertTrue(0 <= worker_index < no_of_workers)
+        self.assertEqual(worker_index, get_alerter_worker_index(
+            self.test_parent_id, no_of_workers))
+
+    def test_get_alerter_worker_index_spreads_chains_between_workers(
+            self) -> None:
+        worker_indices = {
+            get_alerter_worker_index('chain_{}'.format(i), 4)
+            for i in range(100)
+        }
+        self.assertEqual({0, 1, 2, 3}, worker_indices)
+
+    @parameterized.expand([(0, 1,), (0, 0,)])
+    def test_worker_functions_return_input_if_type_has_a_single_worker(
+            self, worker_index: int, no_of_workers: int) -> None:
+        self.assertEqual(self.test_routing_key, get_alerter_worker_routing_key(
+            self.test_routing_key, worker_index, no_of_workers))
+        self.assertEqual(self.test_queue_name, get_alerter_worker_queue_name(
+            self.test_queue_name, worker_index, no_of_workers))
+        self.assertEqual(self.test_alerter_name, get_alerter_worker_name(
+            self.test_alerter_name, worker_index, no_of_workers))
+
+    def test_worker_functions_identify_worker_if_type_has_many_workers(
+            self) -> None:
+        self.assertEqual(
+            'transformed_data.node.cosmos.1',
+            get_alerter_worker_routing_key(self.test_routing_key, 1, 3))
+        self.assertEqual(
+            'cosmos_node_alerter_input_configs_queue_1',
+            get_alerter_worker_queue_name(self.test_queue_name, 1, 3))
+        self.assertEqual(
+            'Cosmos Node Alerter 1',
+            get_alerter_worker_name(self.test_alerter_name, 1, 3))
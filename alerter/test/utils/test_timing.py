@@ -0,0 +1,147 @@
+import unittest
+from datetime import datetime, timedelta
+
+from parameterized import parameterized
+
+from src.utils.timing import (TimedTaskLimiter, TimedTaskTracker,
+                              TimedOccurrenceTracker,
+                              OccurrencesInTimePeriodTracker)
+
+
+class TestTiming(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_interval = timedelta(seconds=10)
+        self.test_time = datetime(2012, 1, 1)
+
+    def test_limiter_equal_if_same_interval_and_last_time(self) -> None:
+        limiter = TimedTaskLimiter(self.test_interval)
+        other_limiter = TimedTaskLimiter(self.test_interval)
+        self.assertEqual(limiter, other_limiter)
+
+        limiter.set_last_time_that_did_task(self.test_time)
+        self.assertNotEqual(limiter, other_limiter)
+
+        other_limiter.set_last_time_that_did_task(self.test_time)
+        self.assertEqual(limiter, other_limiter)
+
+    def test_tracker_equal_if_same_interval_and_timer_state(self) -> None:
+        tracker = TimedTaskTracker(self.test_interval)
+        other_tracker = TimedTaskTracker(self.test_interval)
+        self.assertEqual(tracker, other_tracker)
+
+        tracker.start_timer(self.test_time)
+        self.assertNotEqual(tracker, other_tracker)
+
+        other_tracker.start_timer(self.test_time)
+        self.assertEqual(tracker, other_tracker)
+
+    def test_limiter_and_tracker_equal_for_datetime_and_timestamp_inputs(
+            self) -> None:
+        limiter = TimedTaskLimiter(self.test_interval)
+        other_limiter = TimedTaskLimiter(self.test_interval)
+        limiter.set_last_time_that_did_task(self.test_time)
+        other_limiter.set_last_time_that_did_task(self.test_time.timestamp())
+        self.assertEqual(limiter, other_limiter)
+        self.assertEqual(self.test_time, other_limiter.last_time_that_did_task)
+
+        tracker = TimedTaskTracker(self.test_interval)
+        other_tracker = TimedTaskTracker(self.test_interval)
+        tracker.start_timer(self.test_time)
+        other_tracker.start_timer(self.test_time.timestamp())
+        self.assertEqual(tracker, other_tracker)
+        self.assertEqual(self.test_time, other_tracker.start_time)
+
+    def test_limiter_last_time_is_datetime_min_if_reset(self) -> None:
+        limiter = TimedTaskLimiter(self.test_interval)
+        limiter.set_last_time_that_did_task(self.test_time)
+
+        limiter.reset()
+
+        self.assertEqual(datetime.min, limiter.last_time_that_did_task)
+        self.assertTrue(limiter.can_do_task(self.test_time))
+
+    @parameterized.expand([
+        (timedelta(seconds=9, microseconds=999999), False),
+        (timedelta(seconds=10), True),
+        (timedelta(seconds=10, microseconds=1), True),
+    ])
+    def test_limiter_can_do_task_once_interval_elapsed(
+            self, elapsed, expected) -> None:
+        start = datetime(2012, 1, 1, 0, 0, 0, 123457)
+        limiter = TimedTaskLimiter(self.test_interval)
+        limiter.set_last_time_that_did_task(start)
+
+        self.assertEqual(expected, limiter.can_do_task(start + elapsed))
+        self.assertEqual(expected, limiter.can_do_task(
+            (start + elapsed).timestamp()))
+
+    @parameterized.expand([
+        (timedelta(seconds=9, microseconds=999999), False),
+        (timedelta(seconds=10), True),
+    ])
+    def test_tracker_can_do_task_once_interval_elapsed_if_not_done(
+            self, elapsed, expected) -> None:
+        start = datetime(2012, 1, 1, 0, 0, 0, 123457)
+        tracker = TimedTaskTracker(self.test_interval)
+        self.assertFalse(tracker.can_do_task(start + elapsed))
+
+        tracker.start_timer(start.timestamp())
+        self.assertEqual(expected, tracker.can_do_task(start + elapsed))
+
+        tracker.do_task()
+        self.assertFalse(tracker.can_do_task(start + elapsed))
+
+    def test_occurrence_tracker_too_many_occurrences_in_interval(
+            self) -> None:
+        tracker = TimedOccurrenceTracker(2, self.test_interval)
+        self.assertFalse(tracker.too_many_occurrences(self.test_time))
+
+        tracker.action_happened(self.test_time)
+        tracker.action_happened(self.test_time + timedelta(seconds=5))
+        self.assertTrue(tracker.too_many_occurrences(
+            self.test_time + timedelta(seconds=9)))
+        self.assertFalse(tracker.too_many_occurrences(
+            self.test_time + timedelta(seconds=10)))
+
+        tracker.action_happened(self.test_time + timedelta(seconds=12))
+        self.assertTrue(tracker.too_many_occurrences(
+            (self.test_time + timedelta(seconds=14)).timestamp()))
+
+        tracker.reset()
+        self.assertFalse(tracker.too_many_occurrences(self.test_time))
+
+    def test_trackers_of_different_types_are_not_equal(self) -> None:
+        self.assertNotEqual(TimedTaskTracker(self.test_interval),
+                            TimedTaskLimiter(self.test_interval))
+
+    def test_occurrences_tracker_equality_ignores_occurrences(self) -> None:
+        tracker = OccurrencesInTimePeriodTracker(self.test_interval)
+        other_tracker = OccurrencesInTimePeriodTracker(self.test_interval)
+        tracker.add_occurrence(self.test_time)
+
+        self.assertEqual(tracker, other_tracker)
+        self.assertNotEqual(
+            tracker, OccurrencesInTimePeriodTracker(timedelta(seconds=5)))
+
+    def test_occurrences_tracker_keeps_occurrences_in_time_period(
+            self) -> None:
+        tracker = OccurrencesInTimePeriodTracker(self.test_interval)
+        tracker.add_occurrence(self.test_time)
+        tracker.add_occurrence(self.test_time + timedelta(seconds=5))
+        self.assertEqual(2, tracker.no_of_occurrences())
+
+        tracker.add_occurrence(self.test_time + timedelta(seconds=11))
+        self.assertEqual(2, tracker.no_of_occurrences())
+
+        tracker.remove_old_occurrences(
+            self.test_time + timedelta(seconds=30))
+        self.assertEqual(0, tracker.no_of_occurrences())
+
+    def test_occurrences_tracker_reset_removes_all_occurrences(self) -> None:
+        tracker = OccurrencesInTimePeriodTracker(self.test_interval)
+        tracker.add_occurrence(self.test_time)
+        tracker.add_occurrence(self.test_time)
+
+        tracker.reset()
+
+        self.assertEqual(0, tracker.no_of_occurrences())
@@ -398,12 +398,25 @@ app.post('/server/mongo/alerts',
             if (mongoInterface.client) {
                 const db = mongoInterface.client.db(mongoDB);
                 if (chains.length > 0) {
-                    let queryList: any = [];
+                    // Alert documents are first selected by their time range
+                    // and origins in each collection, so that the indexes on
+                    // `first`, `last` and `alerts.origin` are used and only
+                    // the matching documents are unwound.
+                    const docsMatch = {
+                        $match: {
+                            doc_type: "alert",
+                            first: {"$lte": parsedMaxTimestamp},
+                            last: {"$gte": parsedMinTimestamp},
+                            "alerts.origin": {$in: sources}
+                        }
+                    };
+                    let queryList: any = [docsMatch];
                     for (let i = 1; i < chains.length; i++) {
-                        queryList.push({$unionWith: chains[i]})
+                        queryList.push({
+                            $unionWith: {coll: chains[i], pipeline: [docsMatch]}
+                        })
                     }
                     queryList.push(
-                        {$match: {doc_type: "alert"}},
                         {$unwind: "$alerts"},
                         {
                             $match: {
@@ -636,8 +649,11 @@ app.post('/server/redis/alertsOverview',
             const redisMulti = redisInterface.client.multi();
 
             for (const [parentId, sourcesObject] of Object.entries(parentIds)) {
-                const parentHash: string =
-                    `${redisHashesPostfix.parent}${parentId}`
+                // The alerts overview hash is maintained by the alert store
+                // and only holds the alerts which are not info alerts, plus
+                // releases and tag changes. Any other alert is info.
+                const alertsOverviewHash: string =
+                    `${redisHashesPostfix.alerts_overview}${parentId}`
                 result.result[parentId] = {
                     "info": 0,
                     "critical": 0,
@@ -648,7 +664,8 @@ app.post('/server/redis/alertsOverview',
                     "tags": {},
                 };
 
-                redisMulti.hgetall(parentHash, (err: Error | null, values: any) => {
+                redisMulti.hgetall(alertsOverviewHash, (err: Error | null,
+                                                        values: any) => {
                     if (err) {
                         console.error(err);
                         // Skip resolve if an error was already encountered
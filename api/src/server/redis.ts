@@ -18,7 +18,8 @@ import {
 import { RedisClientNotInitialised } from "../constant/errors";
 
 export const getRedisHashes = (): RedisHashes => ({
-    parent: 'hash_p1'
+    parent: 'hash_p1',
+    alerts_overview: 'hash_ao1'
 });
 
 export const getUniqueKeys = (): UniqueKeys => ({
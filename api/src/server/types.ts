@@ -9,6 +9,7 @@ export interface HttpsOptions {
 
 export interface RedisHashes {
     parent: string,
+    alerts_overview: string,
 
     [key: string]: string
 }
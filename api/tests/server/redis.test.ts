@@ -39,7 +39,10 @@ import {
 
 describe('getRedisHashes', () => {
     it('Should return redis hashes', () => {
-        const expectedRet: RedisHashes = { parent: 'hash_p1' };
+        const expectedRet: RedisHashes = {
+            parent: 'hash_p1',
+            alerts_overview: 'hash_ao1'
+        };
         const ret: any = getRedisHashes();
         expect(ret).toEqual(expectedRet);
     });
@@ -240,7 +243,7 @@ describe('addPrefixToKeys', () => {
         const keysObjects: RedisKeys[] = [
             getRedisHashes(), getUniqueKeys(), getGitHubKeys()]
         const keysObjectsResults: RedisKeys[] = [
-            { parent: 'test_hash_p1' },
+            { parent: 'test_hash_p1', alerts_overview: 'test_hash_ao1' },
             { mute: 'test_a1' },
             {
                 no_of_releases: 'test_gh1',
@@ -261,7 +264,7 @@ describe('addPostfixToKeys', () => {
         const keysObjects: RedisKeys[] = [getRedisHashes(), getUniqueKeys(),
         getGitHubKeys()]
         const keysObjectsResults: RedisKeys[] = [
-            { parent: 'hash_p1_test' },
+            { parent: 'hash_p1_test', alerts_overview: 'hash_ao1_test' },
             { mute: 'a1_test' },
             {
                 no_of_releases: 'gh1_test',